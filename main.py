@@ -1,19 +1,159 @@
 """
 Main entry point for the console-based quiz game.
+
+Run `python main.py --serve` to serve the game to many players over HTTP
+instead (see src.game.classes.game_server).
 """
+import argparse
+import subprocess
 import sys
-from colorama import init, Fore, Style
+import time
+from pathlib import Path
+
+from colorama import init, Fore
 
-# Initialize colorama for colorful console output
+# Initialize colorama for colorful console output, once for every module
 init(autoreset=True)
 
-from src.config.settings import GAME_DEFAULT_ROUNDS
+from src.config.settings import (
+    GAME_DEFAULT_ROUNDS,
+    LEADERBOARD_TOP,
+    METRICS_EXPORT_PATH,
+    METRICS_EXPORT_INTERVAL,
+    SERVER_HOST,
+    SERVER_PORT,
+    STARTUP_PROFILE_TOP,
+    WIKI_MAX_DISPLAYED_CATEGORIES,
+)
+from src.game.classes.ai_gen import FakeArticlePool
+from src.game.classes.category import Category
+from src.game.classes.category_warmer import CategoryWarmer
 from src.game.classes.game_ui import GameUI
+from src.game.classes.leaderboard import Leaderboard
 
-from src.game.classes.ai_gen import FakeNewsGenerator
+from src.game.classes.round_builder import RoundBuilder
+from src.game.classes.round_prefetcher import RoundPrefetcher
 from src.game.classes.wiki_article import ArticleWiki
-from src.game.classes.local_article import ArticlesLocal
-from src.game.models.article import ArticleModel
+from src.game.models.player import PlayerModel
+from src.game.utils.circuit_breaker import CircuitBreaker
+from src.game.utils.metrics import Metrics
+from src.game.utils.sampler import ArticleSampler
+
+
+def collect_provider_metrics():
+    """Report cache, request coalescing and fake pool statistics as gauges."""
+    if ArticleWiki.cache is not None:
+        for name, value in ArticleWiki.cache.stats().items():
+            yield f"wiki_cache_{name}", {}, value
+    yield "wiki_requests_shared", {}, ArticleWiki.requests_in_flight.shared
+    for category, stats in FakeArticlePool.stats().items():
+        for name, value in stats.items():
+            yield f"fake_pool_{name}", {"category": category}, value
+
+
+def record_score(player: PlayerModel):
+    """Add the score of a finished game to the leaderboard and show the player's rank."""
+    total = Leaderboard.add_score(player.name, player.score)
+    GameUI.print_leaderboard(
+        player, total, Leaderboard.rank(player.name), Leaderboard.size(), Leaderboard.top(LEADERBOARD_TOP)
+    )
+
+
+def register_metric_collectors():
+    """Report the provider statistics and circuit breaker states as gauges."""
+    Metrics.register_collector(collect_provider_metrics)
+    Metrics.register_collector(CircuitBreaker.collect_metrics)
+
+
+def start_metrics_export():
+    """Export metrics periodically if METRICS_EXPORT_PATH is set."""
+    if not METRICS_EXPORT_PATH:
+        return
+    register_metric_collectors()
+    Metrics.start_exporter(Path(METRICS_EXPORT_PATH), METRICS_EXPORT_INTERVAL)
+
+
+def serve(host: str, port: int):
+    """
+    Run the multi-session game server until interrupted.
+
+    Metrics are always recorded, so they can be read from /metrics; they are
+    also exported to a file if METRICS_EXPORT_PATH is set.
+    """
+    # The server is loaded only when serving, with asyncio
+    import asyncio
+    from src.game.classes.game_server import GameServer
+
+    Metrics.enable()
+    register_metric_collectors()
+    if METRICS_EXPORT_PATH:
+        Metrics.start_exporter(Path(METRICS_EXPORT_PATH), METRICS_EXPORT_INTERVAL)
+
+    print(f"{Fore.GREEN}TruthPedia server listening on http://{host}:{port}")
+    try:
+        asyncio.run(GameServer(host, port).serve_forever())
+    except KeyboardInterrupt:
+        print(f"\n{Fore.CYAN}Server stopped. Goodbye!")
+
+
+def _parse_import_times(report: str) -> list[tuple[str, int, int]]:
+    """
+    Parse the `-X importtime` report of an interpreter.
+
+    Returns:
+        list[tuple[str, int, int]]: (module, self, cumulative) per import, in microseconds.
+    """
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            imports.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+        except (IndexError, ValueError):
+            continue  # the header line
+    return imports
+
+
+def profile_startup(top: int = STARTUP_PROFILE_TOP):
+    """
+    Report where the time of a cold start to the welcome screen goes.
+
+    A fresh interpreter imports this module with `-X importtime` and draws
+    the welcome screen. The report lists the import time per top-level
+    package and the slowest imports including their own imports.
+
+    Args:
+        top: The number of packages and imports to list.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main; main.GameUI.draw_welcome()"],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        print(f"{Fore.RED}Error: The startup profile run failed:\n{result.stderr[-2000:]}")
+        return
+
+    imports = _parse_import_times(result.stderr)
+    packages: dict[str, int] = {}
+    for module, self_us, _ in imports:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    print(f"{Fore.GREEN}Cold start to welcome screen: {elapsed * 1000:.1f} ms")
+    print(f"Imports: {sum(self_us for _, self_us, _ in imports) / 1000:.1f} ms in {len(imports)} modules\n")
+
+    print(f"{Fore.CYAN}Import time by top-level package")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"{self_us / 1000:>9.1f} ms  {package}")
+
+    print(f"\n{Fore.CYAN}Slowest imports, including their own imports")
+    for module, _, cumulative_us in sorted(imports, key=lambda item: -item[2])[:top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms  {module}")
 
 
 def main():
@@ -24,101 +164,89 @@ def main():
     that might occur during gameplay, API calls, or user interactions.
     """
     try:
+        start_metrics_export()
+        Leaderboard.preload()
+
         # Initialize game
         GameUI.draw_welcome()
         GameUI.print_basic_info()
 
+        # Pick the categories up front, so they are warmed up while the player types
+        category_list = Category.get_random_categories(WIKI_MAX_DISPLAYED_CATEGORIES)
+        warmer = CategoryWarmer(category_list).start()
+
         # Get player information
         user_name = GameUI.get_player_name()
+        player = PlayerModel(user_name)
+        # Keeps articles from repeating, within this game and across the player's games
+        sampler = ArticleSampler.for_player(user_name)
 
-        # Get and select category
-        category_list = GameUI.print_random_categories(user_name)
+        # Select category
+        GameUI.print_random_categories(user_name, category_list=category_list)
         selected_category = GameUI.get_user_category(category_list)
+        warmer.select(selected_category)
+        chosen_at = time.perf_counter()
+
+        # Build rounds in the background while the player is reading
+        prefetcher = RoundPrefetcher(selected_category, sampler=sampler).start()
 
         # Main game loop
         current_round = 0
-        while current_round < GAME_DEFAULT_ROUNDS:
-            try:
-                # Generate AI fake article
-                ai_article = FakeNewsGenerator.generate(selected_category.name)
-
-                # Debug
-                # ai_article = None
-
-                if not ai_article:
-                    #Get pre-generated fake article
-                    print(f"{Fore.YELLOW}Error: Failed to generate fake article. Using pre-generated.")
-                    ai_article = ArticlesLocal.get_random_article(selected_category, False)
-                    if not ai_article:
-                        print(f"{Fore.RED}Error: Failed to fetch pre-generated fake article.")
-                # Get real articles
-                articles: list[ArticleModel] = []
-                for attempt in range(2):
-                    real_article = None
-
-                    try:
-                        # Get real article from Wikipedia
-                        real_article = ArticleWiki.get_random_article(selected_category)
-
-                        #Debug
-                        # real_article = None
-
-                        if real_article == "":
-                            print(f"{Fore.YELLOW}Error: Failed to fetch real article from Wikipedia.")
-                    except (ValueError, ConnectionError) as e:
-                        print(f"{Fore.YELLOW}Warning: Failed to fetch real article (attempt {attempt + 1}): {e}")
-                        if attempt == 1:  # Last attempt
-                            # Get real article from local
-                            print(f"{Fore.YELLOW}Error: Unable to fetch articles from Wikipedia. Using pre-fetched.")
-                            real_article = ArticlesLocal.get_random_article(selected_category, True)
-                            if not real_article:
-                                print(f"{Fore.RED}Error: Failed to fetch pre-generated real article.")
-                                return
-                    # Add real artice
-                    articles.append(real_article)
-
-                # Add fake article
-                articles.append(ai_article)
-
-                # Shuffle articles
-                shuffled_list = GameUI.shuffle(articles)
-                articles = shuffled_list
-
-                # Display articles and get user answer
-                user_answer = GameUI.print_articles(articles, select_mode=True)
-                if user_answer is None:  # User chose to quit
-                    print(f"{Fore.CYAN}Game ended by user.")
-                    return
+        try:
+            while current_round < GAME_DEFAULT_ROUNDS:
+                try:
+                    with Metrics.span("round_wait"):
+                        articles = prefetcher.next_round()
+                    if chosen_at is not None:
+                        Metrics.observe("first_round_seconds", time.perf_counter() - chosen_at)
+                        chosen_at = None
+                    if not articles:
+                        print(f"{Fore.RED}Error: Unable to assemble a round.")
+                        return
+                    ai_article = RoundBuilder.get_fake_article(articles)
 
-                # Check answer
-                if user_answer < 1 or user_answer > len(articles):
-                    print(f"{Fore.RED}Error: Invalid answer. Please select a number between 1 and {len(articles)}")
-                    continue
+                    # Display articles and get user answer
+                    user_answer = GameUI.print_articles(articles, select_mode=True)
+                    if user_answer is None:  # User chose to quit
+                        print(f"{Fore.CYAN}Game ended by user.")
+                        return
 
-                user_answer_correct = GameUI.check_answer(articles[user_answer - 1])
+                    # Check answer
+                    if user_answer < 1 or user_answer > len(articles):
+                        print(f"{Fore.RED}Error: Invalid answer. Please select a number between 1 and {len(articles)}")
+                        continue
 
-                if not user_answer_correct:
-                    GameUI.print_game_over(user_name, ai_article)
-                    return
+                    user_answer_correct = GameUI.check_answer(articles[user_answer - 1])
 
-                current_round += 1
+                    Metrics.increment("rounds_total", {"result": "correct" if user_answer_correct else "wrong"})
+                    if not user_answer_correct:
+                        GameUI.print_game_over(user_name, ai_article)
+                        record_score(player)
+                        return
 
-                # Show success message if not the last round
-                if current_round < GAME_DEFAULT_ROUNDS:
-                    GameUI.print_answer_correct(user_name)
+                    current_round += 1
+                    player.score += 1
 
-            except (ValueError, IndexError) as e:
-                print(f"{Fore.RED}Error in round {current_round + 1}: {e}")
-                print(f"{Fore.YELLOW}Skipping this round and continuing...")
-                continue
-            except Exception as e:
-                print(f"{Fore.RED}Unexpected error in round {current_round + 1}: {e}")
-                print(f"{Fore.RED}Ending game due to unexpected error.")
-                return
+                    # Show success message if not the last round
+                    if current_round < GAME_DEFAULT_ROUNDS:
+                        GameUI.print_answer_correct(user_name)
+
+                except (ValueError, IndexError) as e:
+                    print(f"{Fore.RED}Error in round {current_round + 1}: {e}")
+                    print(f"{Fore.YELLOW}Skipping this round and continuing...")
+                    continue
+                except Exception as e:
+                    print(f"{Fore.RED}Unexpected error in round {current_round + 1}: {e}")
+                    print(f"{Fore.RED}Ending game due to unexpected error.")
+                    return
+        finally:
+            prefetcher.cancel()
+            sampler.save()
 
         # Game completed successfully
         if current_round >= GAME_DEFAULT_ROUNDS:
             GameUI.print_user_won(user_name)
+            record_score(player)
 
     except KeyboardInterrupt:
         print(f"\n\n{Fore.CYAN}Game interrupted by user. Goodbye!")
@@ -129,7 +257,21 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="TruthPedia: spot the fake article.")
+    parser.add_argument("--serve", action="store_true", help="serve the game to many players over HTTP")
+    parser.add_argument("--host", default=SERVER_HOST, help="address the server listens on")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="port the server listens on")
+    parser.add_argument(
+        "--profile-startup", action="store_true", help="report the import time of a cold start and exit"
+    )
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        profile_startup()
+    elif args.serve:
+        serve(args.host, args.port)
+    else:
+        main()
 
 
 
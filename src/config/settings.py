@@ -8,17 +8,125 @@ environment variables for sensitive information like API keys.
 
 # Game settings and configuration
 import os
-from dotenv import load_dotenv
+from pathlib import Path
 
-load_dotenv()
+# python-dotenv (and the logging module it imports) is only loaded when there
+# is a .env file where load_dotenv() would look for one
+if any((directory / ".env").is_file() for directory in Path(__file__).resolve().parents):
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # Game settings
 GAME_DEFAULT_ROUNDS = 2
 
+# Rounds built ahead of time while the player is reading
+ROUND_PREFETCH_DEPTH = 1
+ROUND_PREFETCH_TIMEOUT = 15  # seconds to wait for a prefetched round
+
+# Latency budget of assembling one round while the player waits; articles
+# not fetched within it come from the local corpus instead
+ROUND_DEADLINE = 0.8  # seconds
+ROUND_ASSEMBLY_WORKERS = 64
+
+# Game server (python main.py --serve)
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8080"))
+SERVER_SESSION_TTL = 15 * 60  # seconds a session is kept without requests
+SERVER_MAX_ROUND_BUILDS = 32  # rounds assembled at the same time, across all sessions
+SERVER_MAX_BODY = 16 * 1024  # bytes per request body
+
+# Hedged requests: a backup request starts when a provider call is slower than
+# HEDGE_PERCENTILE of its recent latency (None disables hedging)
+HEDGE_PERCENTILE = 95
+HEDGE_BUDGET_RATIO = 0.1  # at most this fraction of calls is hedged
+# A hedge started later than HEDGE_MAX_DELAY could not finish within a round
+HEDGE_MAX_DELAY = ROUND_DEADLINE / 2  # seconds
+HEDGE_INITIAL_DELAY = HEDGE_MAX_DELAY  # seconds, used until HEDGE_MIN_SAMPLES latencies are known
+HEDGE_MIN_SAMPLES = 20
+HEDGE_LATENCY_WINDOW = 200  # recent latencies kept per provider
+HEDGE_MAX_WORKERS = 64  # calls running at once; beyond that, calls run unhedged
+
+# Circuit breakers: a provider is skipped for CIRCUIT_OPEN_SECONDS once
+# CIRCUIT_FAILURE_RATE of its last CIRCUIT_WINDOW calls failed or were slow
+CIRCUIT_FAILURE_RATE = 0.5
+CIRCUIT_MIN_CALLS = 5
+CIRCUIT_WINDOW = 20
+CIRCUIT_OPEN_SECONDS = 30
+OPENAI_SLOW_CALL_SECONDS = 20
+WIKI_SLOW_CALL_SECONDS = 5
+
+# OpenAI request timeouts
+OPENAI_API_TIMEOUT = 30  # seconds
+OPENAI_BATCH_TIMEOUT = 60  # seconds, for requests of several articles at once
+
+# Fake articles generated ahead of time per offered category
+FAKE_POOL_LOW_WATERMARK = 1
+FAKE_POOL_HIGH_WATERMARK = 2
+FAKE_POOL_LATENCY_WINDOW = 100  # recent fill latencies kept per category
+
+# Offered categories are warmed up while the player types their name and choice
+WARMUP_SUMMARIES = 4  # summaries cached per offered category, two rounds' worth
+WARMUP_WORKERS = 8
+
 WIKI_MAX_DISPLAYED_CATEGORIES = 3
 WIKI_MAX_SENTENCE_LENGTH = 6
 
+# MediaWiki action API (point it at a stand-in server for local benchmarks)
+WIKI_API_URL = os.getenv("WIKI_API_URL", "https://en.wikipedia.org/w/api.php")
+WIKI_USER_AGENT = "TruthPedia/1.0"
+WIKI_API_TIMEOUT = 10  # seconds per MediaWiki request
+WIKI_EXTRACTS_PER_REQUEST = 20  # MediaWiki's limit for intro extracts per query
+
 # Display settings
-CONSOLE_WIDTH = 80
+STARTUP_PROFILE_TOP = 15  # packages and imports listed by main.py --profile-startup
+CONSOLE_WIDTH = 80  # used when the terminal size cannot be determined
+CONSOLE_MIN_WIDTH = 40
+WRAP_CACHE_SIZE = 512  # wrapped texts kept by the renderer
+
+# Articles at least this similar (estimated Jaccard, 0-1) count as duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.5
+
+# Provider client settings
+PROVIDER_POOL_SIZE = int(os.getenv("PROVIDER_POOL_SIZE", "10"))  # keep-alive connections per provider
+
+# Data settings
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+LOCAL_CORPUS_PATH = DATA_DIR / "responses.json"
+LOCAL_CORPUS_BINARY_PATH = DATA_DIR / "responses.bin"  # compiled from LOCAL_CORPUS_PATH
+LOCAL_CORPUS_SHARD_DIR = DATA_DIR / "shards"  # per-category shards of LOCAL_CORPUS_PATH
+
+# Wikipedia cache settings
+WIKI_CACHE_PATH = DATA_DIR / "wiki_cache.sqlite3"
+WIKI_CACHE_MEMORY_ENTRIES = 2048
+WIKI_CACHE_DISK_ENTRIES = 100000
+WIKI_CACHE_MEMBERS_TTL = 24 * 60 * 60  # seconds
+WIKI_CACHE_PAGE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Category registry, written by `python -m src.game.utils.category_crawler`
+CATEGORY_REGISTRY_PATH = DATA_DIR / "categories.json"
+CATEGORY_MIN_ARTICLES = 10  # playable articles a category needs to be offered
+CRAWLER_MAX_DEPTH = 2  # subcategory levels followed below the seeds
+CRAWLER_MAX_CATEGORIES = 2000
+CRAWLER_WORKERS = 8  # categories fetched at the same time
+CRAWLER_RATE_LIMIT = 10.0  # MediaWiki requests per second
+CRAWLER_RETRIES = 3
+
+# Article sampling: per-player filters of already seen articles
+SAMPLER_SEEN_DIR = DATA_DIR / "seen"
+SAMPLER_SEEN_CAPACITY = 10000  # titles per player before the filter starts over
+SAMPLER_FALSE_POSITIVE_RATE = 0.01
+SAMPLER_MAX_SKIPS = 8  # seen articles skipped per pick before repeating one
+
+# Leaderboard: scores are appended to a log in batches and replayed on startup
+LEADERBOARD_PATH = DATA_DIR / "leaderboard.jsonl"
+LEADERBOARD_FLUSH_INTERVAL = 2  # seconds between batched writes
+LEADERBOARD_BATCH_SIZE = 256  # pending scores that trigger an early write
+LEADERBOARD_COMPACT_FACTOR = 4  # rewrite the log once it has this many lines per player
+LEADERBOARD_TOP = 5  # players shown after a game
+
+# Metrics export (disabled unless a path is set; ".json" for JSON, else Prometheus text)
+METRICS_EXPORT_PATH = os.getenv("METRICS_EXPORT_PATH")
+METRICS_EXPORT_INTERVAL = 10  # seconds between exports
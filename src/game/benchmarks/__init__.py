@@ -0,0 +1,7 @@
+"""
+Benchmarks package.
+
+This package contains standalone benchmark scripts for the TruthPedia game.
+Each module can be run from the project root with `python -m`, e.g.
+python -m src.game.benchmarks.local_lookup
+"""
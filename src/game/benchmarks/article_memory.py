@@ -0,0 +1,79 @@
+"""
+Benchmark for the memory used per article.
+
+Parses a synthetic JSON corpus and measures the memory held by the parsed
+articles, once as plain dictionaries and once as ArticleModel objects.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.article_memory [--count 1000000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from src.game.classes.category import Category
+from src.game.models.article import ArticleModel
+
+DEFAULT_COUNT = 1_000_000
+
+
+def _build_json(count: int) -> str:
+    """Return a JSON corpus of `count` synthetic articles."""
+    return json.dumps(
+        [
+            {
+                "title": f"Article {i}",
+                "summary": f"Summary {i}",
+                "category": Category.categories[i % len(Category.categories)],
+                "is_truth": i % 3 != 0,
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def _measure(load, corpus: str) -> int:
+    """Return the bytes still allocated by the result of `load(corpus)`."""
+    gc.collect()
+    tracemalloc.start()
+    articles = load(corpus)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del articles
+    return current
+
+
+def _load_dicts(corpus: str) -> list[dict]:
+    """Parse the corpus into plain dictionaries."""
+    return json.loads(corpus)
+
+
+def _load_models(corpus: str) -> list[ArticleModel]:
+    """Parse the corpus into ArticleModel objects, dropping the dictionaries."""
+    return [ArticleModel.from_dict(entry) for entry in json.loads(corpus)]
+
+
+def run_benchmark(count: int) -> None:
+    """Run the benchmark and print the memory used per article."""
+    corpus = _build_json(count)
+
+    dict_bytes = _measure(_load_dicts, corpus)
+    model_bytes = _measure(_load_models, corpus)
+
+    print(f"Articles: {count}")
+    print(f"dict:         {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / count:6.1f} bytes/article)")
+    print(f"ArticleModel: {model_bytes / 2**20:8.1f} MiB ({model_bytes / count:6.1f} bytes/article)")
+    print(f"Saved:        {(1 - model_bytes / dict_bytes) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Measure memory used per article.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="number of articles")
+    run_benchmark(parser.parse_args().count)
@@ -0,0 +1,75 @@
+"""
+Benchmark for local corpus startup time.
+
+Writes synthetic corpora of increasing size and compares the time needed to
+parse the JSON file with the time needed to open the compiled binary corpus
+and decode one article from it.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.corpus_startup
+"""
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.game.classes.category import Category
+from src.game.models.article import ArticleModel
+from src.game.utils.binary_corpus import BinaryCorpus, compile_corpus
+
+CORPUS_SIZES = [1_000, 10_000, 100_000, 500_000]
+SUMMARY = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+
+
+def _write_corpus(directory: Path, size: int) -> tuple[Path, Path]:
+    """Write a JSON corpus and its compiled binary, returning both paths."""
+    articles = [
+        ArticleModel(
+            title=f"Article {i}",
+            summary=SUMMARY,
+            category=Category.categories[i % len(Category.categories)],
+            is_truth=i % 3 != 0,
+        )
+        for i in range(size)
+    ]
+    json_path = directory / f"corpus_{size}.json"
+    binary_path = directory / f"corpus_{size}.bin"
+    with open(json_path, "w", encoding="utf-8") as file:
+        json.dump([article.to_dict() for article in articles], file)
+    compile_corpus(articles, binary_path, json_path)
+    return json_path, binary_path
+
+
+def run_benchmark() -> None:
+    """Run the benchmark and print a table of results."""
+    print(f"{'corpus':>10} | {'json load (ms)':>14} | {'mmap open + pick (ms)':>21}")
+    print("-" * 52)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in CORPUS_SIZES:
+            json_path, binary_path = _write_corpus(Path(directory), size)
+
+            started = time.perf_counter()
+            with open(json_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            [ArticleModel.from_dict(entry) for entry in data]
+            json_ms = (time.perf_counter() - started) * 1000
+            del data
+
+            started = time.perf_counter()
+            corpus = BinaryCorpus.open_if_fresh(binary_path, json_path)
+            category = random.choice(Category.categories)
+            corpus.get(category, True, random.randrange(corpus.count(category, True)))
+            binary_ms = (time.perf_counter() - started) * 1000
+            corpus.close()
+
+            print(f"{size:>10} | {json_ms:>14.1f} | {binary_ms:>21.3f}")
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    run_benchmark()
@@ -0,0 +1,375 @@
+"""
+Headless end-to-end benchmark of full game sessions.
+
+Runs the real `main()` game loop many times with a scripted player and stub
+providers in place of Wikipedia and OpenAI. The stubs sleep for a random,
+log-normally distributed latency and fail at a configurable rate, so round
+assembly, prefetching and the local fallbacks behave as they would against
+slow or flaky providers. Console output is discarded, and scores and seen
+filters go to a temporary directory.
+
+The report lists p50/p95/p99 latencies for each phase of a session and for
+each round, i.e. how long the player waited for the round to appear, and the
+time from choosing a category to seeing the first round. Give the player some
+time at the name and category prompts to let the category warm-up work, and
+compare with --no-warmup.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.game_sessions
+python -m src.game.benchmarks.game_sessions --sessions 2000 --wiki-failure-rate 0.1
+python -m src.game.benchmarks.game_sessions --sessions 200 --menu-time 100 [--no-warmup]
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import math
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Optional
+from unittest import mock
+
+import main as game_main
+from src.game.classes.ai_gen import FakeArticlePool, FakeNewsGenerator
+from src.game.classes.category_warmer import CategoryWarmer
+from src.game.classes.game_ui import GameUI
+from src.game.classes.leaderboard import Leaderboard
+from src.game.classes.round_builder import RoundBuilder
+from src.game.classes.round_prefetcher import RoundPrefetcher
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+from src.game.utils.sampler import ArticleSampler
+
+DEFAULT_SESSIONS = 1000
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    Return the q-th percentile of sorted values (nearest-rank method).
+
+    Args:
+        sorted_values: The values, in ascending order.
+        q: The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StubProvider:
+    """
+    Simulated provider latency and failures.
+
+    Attributes:
+        median: Median latency in seconds.
+        sigma: Spread of the log-normal latency distribution.
+        failure_rate: Probability (0-1) that a call fails.
+        calls: Number of calls made.
+        failures: Number of calls that failed.
+    """
+
+    def __init__(self, median: float, sigma: float, failure_rate: float, rng: random.Random):
+        self.median = median
+        self.sigma = sigma
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self.failures = 0
+        self._rng = rng
+
+    def call(self) -> bool:
+        """
+        Sleep for one simulated request.
+
+        Returns:
+            bool: False if the simulated request failed.
+        """
+        self.calls += 1
+        if self.median > 0:
+            time.sleep(self.median * math.exp(self.sigma * self._rng.gauss(0, 1)))
+        if self._rng.random() < self.failure_rate:
+            self.failures += 1
+            return False
+        return True
+
+
+class ScriptedPlayer:
+    """
+    Answers the game's prompts without a keyboard.
+
+    The player picks the first category and names the fake article with
+    probability `accuracy`, otherwise a real one.
+
+    Attributes:
+        accuracy: Probability (0-1) of a correct answer.
+        think_time: Seconds spent reading before each answer.
+        menu_time: Seconds spent at the name prompt and at the category prompt.
+    """
+
+    def __init__(self, accuracy: float, think_time: float, rng: random.Random, menu_time: float = 0.0):
+        self.accuracy = accuracy
+        self.think_time = think_time
+        self.menu_time = menu_time
+        self.current_articles: list[ArticleModel] = []
+        self._rng = rng
+
+    def __call__(self, prompt: str = "") -> str:
+        """Stand-in for `input()`."""
+        if "name" in prompt or "category" in prompt:
+            if self.menu_time:
+                time.sleep(self.menu_time)
+            return "Benchmark" if "name" in prompt else "1"
+
+        if self.think_time:
+            time.sleep(self.think_time)
+        positions = range(1, len(self.current_articles) + 1)
+        fakes = [i for i in positions if not self.current_articles[i - 1].is_truth]
+        reals = [i for i in positions if self.current_articles[i - 1].is_truth]
+        if fakes and (not reals or self._rng.random() < self.accuracy):
+            return str(fakes[0])
+        return str(self._rng.choice(reals)) if reals else "q"
+
+
+class SessionRecorder:
+    """Collects the durations of timed calls, per phase."""
+
+    def __init__(self):
+        self.phases: dict[str, list[float]] = defaultdict(list)
+        self.rounds: dict[int, list[float]] = defaultdict(list)
+        self.counters: dict[str, int] = defaultdict(int)
+        self._round = 0
+
+    def new_session(self) -> None:
+        """Restart the round numbering."""
+        self._round = 0
+
+    def timed(self, phase: str, function: Callable, per_round: bool = False) -> Callable:
+        """
+        Wrap a function so its duration is recorded under `phase`.
+
+        Args:
+            phase: The phase name.
+            function: The function to time.
+            per_round: Also record the duration under the current round number.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                self.phases[phase].append(elapsed)
+                if per_round:
+                    self._round += 1
+                    self.rounds[self._round].append(elapsed)
+
+        return wrapper
+
+
+def make_stubs(args: argparse.Namespace, rng: random.Random) -> tuple[StubProvider, StubProvider]:
+    """Create the Wikipedia and OpenAI stub providers."""
+    wiki = StubProvider(args.wiki_latency / 1000, args.sigma, args.wiki_failure_rate, rng)
+    ai = StubProvider(args.ai_latency / 1000, args.sigma, args.ai_failure_rate, rng)
+    return wiki, ai
+
+
+def stub_fake_generator(ai: StubProvider, counter: list[int]) -> Callable:
+    """Build a stand-in for FakeNewsGenerator.generate."""
+    def generate(category: str) -> Optional[ArticleModel]:
+        if not ai.call():
+            return None
+        counter[0] += 1
+        return ArticleModel(f"Stub fake {counter[0]}", "A fictional summary.", category, False)
+
+    return generate
+
+
+def stub_fake_pool(generate: Callable) -> tuple[Callable, Callable]:
+    """
+    Build stand-ins for FakeArticlePool.offer, which fills the buffer of a
+    category on a thread with a stub generator, up to the high watermark, and
+    for FakeNewsGenerator.generate, which takes buffered articles first.
+    """
+    def fill(category: str) -> None:
+        article = generate(category)
+        if article:
+            FakeArticlePool.give_back(article)
+
+    def offer(category: str) -> None:
+        with FakeArticlePool._lock:
+            if len(FakeArticlePool._buffers.get(category, ())) >= FakeArticlePool.high_watermark:
+                return
+        threading.Thread(target=fill, args=(category,), daemon=True).start()
+
+    def generate_pooled(category: str) -> Optional[ArticleModel]:
+        return FakeArticlePool.take(category) or generate(category)
+
+    return offer, generate_pooled
+
+
+def stub_wiki_fetchers(wiki: StubProvider, counter: list[int]) -> tuple[Callable, Callable, Callable]:
+    """
+    Build stand-ins for ArticleWiki.get_random_article(s) and ArticleWiki.warm_up.
+
+    Articles warmed up for a category are handed out without a simulated request.
+    """
+    warm: dict[str, int] = defaultdict(int)
+    lock = threading.Lock()
+
+    def get_random_articles(category: CategoryModel, count: int, sampler=None) -> list[ArticleModel]:
+        with lock:
+            taken = min(count, warm[category.name])
+            warm[category.name] -= taken
+        if taken < count and not wiki.call():
+            raise ValueError("Simulated Wikipedia failure")
+        articles = []
+        for _ in range(count):
+            counter[0] += 1
+            articles.append(ArticleModel(f"Stub real {counter[0]}", "A true summary.", category.name, True))
+        return articles
+
+    def get_random_article(category: CategoryModel, is_truth: bool = True, sampler=None) -> ArticleModel:
+        return get_random_articles(category, 1)[0]
+
+    def warm_up(category: CategoryModel, count: int, cancelled=None) -> int:
+        if not wiki.call():
+            raise ValueError("Simulated Wikipedia failure")
+        with lock:
+            warm[category.name] = max(warm[category.name], count)
+            return warm[category.name]
+
+    return get_random_articles, get_random_article, warm_up
+
+
+def run_sessions(args: argparse.Namespace) -> tuple[SessionRecorder, StubProvider, StubProvider, float]:
+    """
+    Play `args.sessions` full games with stub providers.
+
+    Returns:
+        tuple: The recorder, the Wikipedia and OpenAI stubs, and the total seconds.
+    """
+    rng = random.Random(args.seed)
+    wiki, ai = make_stubs(args, rng)
+    recorder = SessionRecorder()
+    player = ScriptedPlayer(args.accuracy, args.think_time / 1000, rng, args.menu_time / 1000)
+    get_random_articles, get_random_article, warm_up = stub_wiki_fetchers(wiki, [0])
+    offer, generate = stub_fake_pool(stub_fake_generator(ai, [0]))
+
+    original_print_articles = GameUI.print_articles
+    original_get_user_category = GameUI.get_user_category
+    chosen_at: list[Optional[float]] = [None]
+
+    def get_user_category(category_list):
+        category = original_get_user_category(category_list)
+        chosen_at[0] = time.perf_counter()
+        return category
+
+    def print_articles(articles, select_mode=False):
+        if chosen_at[0] is not None:
+            recorder.phases["choice to first round"].append(time.perf_counter() - chosen_at[0])
+            chosen_at[0] = None
+        player.current_articles = articles
+        return original_print_articles(articles, select_mode)
+
+    def build_local_round(category, sampler=None, background=False):
+        recorder.counters["local rounds"] += 1
+        return original_build_local_round(category, sampler, background)
+
+    original_build_local_round = RoundBuilder.build_local_round
+
+    patches = [
+        mock.patch.object(builtins, "input", player),
+        mock.patch.object(game_main, "GAME_DEFAULT_ROUNDS", args.rounds),
+        mock.patch.object(FakeArticlePool, "offer", staticmethod(offer)),
+        mock.patch.object(FakeNewsGenerator, "generate", staticmethod(generate)),
+        mock.patch.object(ArticleWiki, "get_random_articles", staticmethod(get_random_articles)),
+        mock.patch.object(ArticleWiki, "get_random_article", staticmethod(get_random_article)),
+        mock.patch.object(ArticleWiki, "warm_up", staticmethod(warm_up)),
+        mock.patch.object(GameUI, "get_user_category", staticmethod(get_user_category)),
+        mock.patch.object(GameUI, "print_articles", staticmethod(
+            recorder.timed("render + answer", print_articles))),
+        mock.patch.object(GameUI, "print_random_categories", staticmethod(
+            recorder.timed("category menu", GameUI.print_random_categories))),
+        mock.patch.object(RoundBuilder, "build_round", staticmethod(
+            recorder.timed("build round (background)", RoundBuilder.build_round))),
+        mock.patch.object(RoundBuilder, "build_local_round", staticmethod(build_local_round)),
+        mock.patch.object(RoundPrefetcher, "next_round",
+            recorder.timed("wait for round", RoundPrefetcher.next_round, per_round=True)),
+    ]
+    if args.no_warmup:
+        patches.append(mock.patch.object(CategoryWarmer, "start", lambda warmer: warmer))
+
+    started = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        for patch in patches:
+            stack.enter_context(patch)
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        directory = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(mock.patch.object(Leaderboard, "path", Path(directory) / "leaderboard.jsonl"))
+        stack.enter_context(mock.patch.object(ArticleSampler, "seen_dir", Path(directory) / "seen"))
+        session = recorder.timed("session", game_main.main)
+        for _ in range(args.sessions):
+            recorder.new_session()
+            session()
+        Leaderboard.flush()
+    return recorder, wiki, ai, time.perf_counter() - started
+
+
+def print_report(recorder: SessionRecorder, wiki: StubProvider, ai: StubProvider, elapsed: float) -> None:
+    """Print latency percentiles per phase and per round."""
+    header = f"{'':>26} | {'count':>6} | " + " | ".join(f"{f'p{q} (ms)':>9}" for q in PERCENTILES)
+    print(header)
+    print("-" * len(header))
+
+    def row(label: str, values: list[float]) -> None:
+        ordered = sorted(values)
+        cells = " | ".join(f"{percentile(ordered, q) * 1000:>9.2f}" for q in PERCENTILES)
+        print(f"{label:>26} | {len(values):>6} | {cells}")
+
+    for phase, values in recorder.phases.items():
+        row(phase, values)
+    for number, values in sorted(recorder.rounds.items()):
+        row(f"round {number} wait", values)
+
+    print()
+    print(f"Sessions took {elapsed:.1f}s in total.")
+    print(f"Wikipedia stub: {wiki.calls} calls, {wiki.failures} failed")
+    print(f"OpenAI stub: {ai.calls} calls, {ai.failures} failed")
+    for name, count in recorder.counters.items():
+        print(f"{name.capitalize()}: {count}")
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Benchmark full game sessions with stub providers.")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help="sessions to play")
+    parser.add_argument("--rounds", type=int, default=game_main.GAME_DEFAULT_ROUNDS, help="rounds per session")
+    parser.add_argument("--wiki-latency", type=float, default=10.0, help="median Wikipedia latency (ms)")
+    parser.add_argument("--ai-latency", type=float, default=25.0, help="median OpenAI latency (ms)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal latency spread")
+    parser.add_argument("--wiki-failure-rate", type=float, default=0.02, help="Wikipedia failure rate (0-1)")
+    parser.add_argument("--ai-failure-rate", type=float, default=0.02, help="OpenAI failure rate (0-1)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="player reading time per round (ms)")
+    parser.add_argument("--menu-time", type=float, default=0.0, help="player time per menu prompt (ms)")
+    parser.add_argument("--no-warmup", action="store_true", help="do not warm up the offered categories")
+    parser.add_argument("--accuracy", type=float, default=1.0, help="probability of a correct answer")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+
+    print_report(*run_sessions(args))
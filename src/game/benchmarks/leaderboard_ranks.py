@@ -0,0 +1,82 @@
+"""
+Benchmark for Leaderboard score updates and rank queries.
+
+Fills leaderboards of increasing size with random players and compares the
+skip list ranking with sorting all totals per query, as a plain dictionary
+of totals would need. Update, rank and top-K costs of the skip list should
+grow only logarithmically with the number of players.
+
+The score log is written to a temporary directory.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.leaderboard_ranks
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.config.settings import LEADERBOARD_TOP
+from src.game.classes.leaderboard import Leaderboard
+
+PLAYER_COUNTS = [10_000, 100_000, 1_000_000]
+QUERIES = 2_000
+
+
+def _reset(path: Path) -> None:
+    """Start an empty leaderboard logging to `path`."""
+    Leaderboard.path = path
+    Leaderboard._ranking = None
+    Leaderboard._totals = {}
+    Leaderboard._pending = []
+    path.unlink(missing_ok=True)
+
+
+def _sorted_rank(name: str) -> int:
+    """The rank query without an ordered index: sort every total."""
+    ordered = sorted(Leaderboard._totals.items(), key=lambda item: (-item[1], item[0]))
+    return next(position for position, (other, _) in enumerate(ordered, start=1) if other == name)
+
+
+def _time(function, names: list[str], calls: int) -> float:
+    """Return the average time per call in microseconds."""
+    started = time.perf_counter()
+    for i in range(calls):
+        function(names[i % len(names)])
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def run_benchmark() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(42)
+    print(
+        f"{'players':>10} | {'add (us)':>9} | {'rank (us)':>9} | "
+        f"{f'top {LEADERBOARD_TOP} (us)':>11} | {'sorted rank (us)':>16}"
+    )
+    print("-" * 68)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in PLAYER_COUNTS:
+            _reset(Path(directory) / "leaderboard.jsonl")
+            names = [f"player-{i}" for i in range(count)]
+            for name in names:
+                Leaderboard.add_score(name, rng.randint(0, 1_000))
+            Leaderboard.flush()
+
+            sample = rng.sample(names, min(count, QUERIES))
+            add = _time(lambda name: Leaderboard.add_score(name, rng.randint(0, 5)), sample, QUERIES)
+            rank = _time(Leaderboard.rank, sample, QUERIES)
+            top = _time(lambda name: Leaderboard.top(LEADERBOARD_TOP), sample, QUERIES)
+            # Sorting is slow on big boards, so use fewer queries
+            linear = _time(_sorted_rank, sample, 3)
+            print(f"{count:>10} | {add:>9.2f} | {rank:>9.2f} | {top:>11.2f} | {linear:>16.2f}")
+        Leaderboard.flush()
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    run_benchmark()
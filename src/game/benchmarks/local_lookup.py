@@ -0,0 +1,77 @@
+"""
+Benchmark for ArticlesLocal.get_random_article lookups.
+
+Builds synthetic corpora of increasing size and compares the indexed lookup
+with the previous linear scan over all articles. The indexed lookup cost
+should stay flat as the corpus grows.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.local_lookup
+"""
+
+import random
+import time
+
+from src.game.classes.category import Category
+from src.game.classes.local_article import ArticlesLocal
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+
+CORPUS_SIZES = [1_000, 10_000, 100_000]
+LOOKUPS = 2_000
+
+
+def _build_corpus(size: int) -> None:
+    """Replace the local store with `size` synthetic articles."""
+    ArticlesLocal.local_articles = []
+    ArticlesLocal._index = {}
+    for i in range(size):
+        ArticlesLocal.add_article(
+            ArticleModel(
+                title=f"Article {i}",
+                summary="Lorem ipsum dolor sit amet.",
+                category=Category.categories[i % len(Category.categories)],
+                is_truth=i % 3 != 0,
+            )
+        )
+    ArticlesLocal._loaded = True
+
+
+def _linear_lookup(category: CategoryModel, is_truth: bool) -> ArticleModel:
+    """The lookup as it was before the index: filter the whole corpus."""
+    filtered_list = [
+        article
+        for article in ArticlesLocal.local_articles
+        if article.is_truth == is_truth and article.category == category.name
+    ]
+    return random.choice(filtered_list)
+
+
+def _time_lookups(lookup, categories: list[CategoryModel], lookups: int) -> float:
+    """Return the average time per lookup in microseconds."""
+    started = time.perf_counter()
+    for i in range(lookups):
+        lookup(categories[i % len(categories)], i % 2 == 0)
+    return (time.perf_counter() - started) / lookups * 1_000_000
+
+
+def run_benchmark() -> None:
+    """Run the benchmark and print a table of results."""
+    categories = [CategoryModel(name) for name in Category.categories]
+
+    print(f"{'corpus':>10} | {'indexed (us)':>12} | {'linear (us)':>12}")
+    print("-" * 40)
+    for size in CORPUS_SIZES:
+        _build_corpus(size)
+        indexed = _time_lookups(ArticlesLocal.get_random_article, categories, LOOKUPS)
+        # The linear scan is slow on big corpora, so use fewer lookups
+        linear = _time_lookups(_linear_lookup, categories, max(20, LOOKUPS * 1_000 // size))
+        print(f"{size:>10} | {indexed:>12.2f} | {linear:>12.2f}")
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    run_benchmark()
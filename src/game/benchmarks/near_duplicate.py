@@ -0,0 +1,56 @@
+"""
+Benchmark for NearDuplicateIndex lookups.
+
+Indexes synthetic corpora of increasing size and measures the average time
+of a duplicate check, which should stay under a millisecond.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.near_duplicate
+"""
+
+import random
+import time
+
+from src.game.models.article import ArticleModel
+from src.game.utils.near_duplicate import NearDuplicateIndex
+
+CORPUS_SIZES = [1_000, 10_000, 50_000]
+LOOKUPS = 1_000
+VOCABULARY = [f"word{i}" for i in range(5_000)]
+
+
+def _random_article(rng: random.Random, number: int) -> ArticleModel:
+    """Return an article with a random ~120 word summary."""
+    return ArticleModel(
+        title=f"Article {number}",
+        summary=" ".join(rng.choices(VOCABULARY, k=120)),
+        category="Hoaxes",
+        is_truth=False,
+    )
+
+
+def run_benchmark() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(42)
+    print(f"{'indexed':>10} | {'lookup (us)':>11}")
+    print("-" * 25)
+    for size in CORPUS_SIZES:
+        duplicate_index = NearDuplicateIndex()
+        for number in range(size):
+            duplicate_index.add(_random_article(rng, number))
+
+        queries = [_random_article(rng, size + number) for number in range(LOOKUPS)]
+        started = time.perf_counter()
+        for query in queries:
+            duplicate_index.find_duplicate(query)
+        lookup_us = (time.perf_counter() - started) / LOOKUPS * 1_000_000
+
+        print(f"{size:>10} | {lookup_us:>11.1f}")
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    run_benchmark()
@@ -0,0 +1,251 @@
+"""
+Load test of the multi-session game server.
+
+Starts a GameServer on a free local port, with the stub providers of the
+game_sessions benchmark in place of Wikipedia and OpenAI, and lets many
+simulated players play full games against it at the same time, each over
+its own keep-alive HTTP connection. When a game ends, the player starts a
+new one, until the duration is over. Scores and seen filters go to a
+temporary directory.
+
+The report gives the throughput in rounds per second and p50/p95/p99
+latencies per request type.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.server_load
+python -m src.game.benchmarks.server_load --players 2000 --duration 30 --think-time 500
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Optional
+from unittest import mock
+
+from src.config.settings import GAME_DEFAULT_ROUNDS
+from src.game.benchmarks.game_sessions import (
+    PERCENTILES,
+    make_stubs,
+    percentile,
+    stub_fake_generator,
+    stub_wiki_fetchers,
+)
+from src.game.classes.ai_gen import FakeArticlePool, FakeNewsGenerator
+from src.game.classes.game_server import GameServer
+from src.game.classes.leaderboard import Leaderboard
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.utils.sampler import ArticleSampler
+
+DEFAULT_PLAYERS = 500
+DEFAULT_DURATION = 10.0
+
+
+class Connection:
+    """A minimal keep-alive HTTP/1.1 client connection speaking JSON."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, payload: Any = None) -> tuple[int, Any]:
+        """
+        Send a request and read the response.
+
+        Returns:
+            tuple[int, Any]: The status and the decoded JSON body.
+        """
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self._writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1")
+            + body
+        )
+        await self._writer.drain()
+
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        data = await self._reader.readexactly(length)
+        return status, json.loads(data) if data else None
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+
+
+class LoadRecorder:
+    """Collects request latencies and game counts of all players."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.rounds = 0
+        self.games = 0
+        self.errors = 0
+
+    async def timed(self, kind: str, connection: Connection, method: str, path: str,
+                    payload: Any = None) -> tuple[int, Any]:
+        """Send a request, recording its latency under `kind`."""
+        started = time.perf_counter()
+        status, data = await connection.request(method, path, payload)
+        self.latencies[kind].append(time.perf_counter() - started)
+        if status >= 400:
+            self.errors += 1
+        return status, data
+
+
+async def play(connection: Connection, recorder: LoadRecorder, player: int, ends_at: float,
+               think_time: float, accuracy: float, rng: random.Random) -> None:
+    """
+    Play games until `ends_at`.
+
+    The player recognizes the stub fake articles by their title, and names
+    the fake with probability `accuracy`.
+    """
+    while time.monotonic() < ends_at:
+        status, data = await recorder.timed("create session", connection, "POST", "/sessions",
+                                            {"name": f"player-{player}"})
+        if status != 201:
+            return
+        session = f"/sessions/{data['session']}"
+        await recorder.timed("choose category", connection, "POST", f"{session}/category",
+                             {"category": rng.randint(1, len(data["categories"]))})
+
+        finished = False
+        while not finished:
+            status, data = await recorder.timed("get round", connection, "GET", f"{session}/round")
+            if status != 200:
+                break
+            if think_time:
+                await asyncio.sleep(think_time)
+
+            numbers = [article["number"] for article in data["articles"]]
+            fakes = [a["number"] for a in data["articles"] if a["title"].startswith("Stub fake")]
+            answer = fakes[0] if fakes and rng.random() < accuracy else rng.choice(numbers)
+            status, data = await recorder.timed("answer", connection, "POST", f"{session}/answer",
+                                                {"answer": answer})
+            if status != 200:
+                break
+            recorder.rounds += 1
+            finished = data["finished"]
+        recorder.games += 1
+
+
+def start_server(rounds: int) -> tuple[GameServer, asyncio.AbstractEventLoop]:
+    """Run a GameServer on a free port, on its own event loop thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="game-server", daemon=True).start()
+    server = GameServer("127.0.0.1", 0, rounds=rounds)
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    return server, loop
+
+
+async def run_players(args: argparse.Namespace, port: int, recorder: LoadRecorder) -> float:
+    """
+    Let `args.players` players play until the duration is over.
+
+    Returns:
+        float: The elapsed seconds.
+    """
+    rng = random.Random(args.seed)
+    connections = [Connection("127.0.0.1", port) for _ in range(args.players)]
+    started = time.perf_counter()
+    ends_at = time.monotonic() + args.duration
+    try:
+        await asyncio.gather(*(
+            play(connection, recorder, player, ends_at, args.think_time / 1000, args.accuracy, rng)
+            for player, connection in enumerate(connections)
+        ))
+    finally:
+        for connection in connections:
+            connection.close()
+    return time.perf_counter() - started
+
+
+def run_load(args: argparse.Namespace) -> tuple[LoadRecorder, float]:
+    """Start the server with stub providers and run the players against it."""
+    wiki, ai = make_stubs(args, random.Random(args.seed))
+    get_random_articles, get_random_article, warm_up = stub_wiki_fetchers(wiki, [0])
+    recorder = LoadRecorder()
+
+    patches = [
+        mock.patch.object(FakeArticlePool, "offer", staticmethod(lambda category: None)),
+        mock.patch.object(FakeNewsGenerator, "generate", staticmethod(stub_fake_generator(ai, [0]))),
+        mock.patch.object(ArticleWiki, "get_random_articles", staticmethod(get_random_articles)),
+        mock.patch.object(ArticleWiki, "get_random_article", staticmethod(get_random_article)),
+        mock.patch.object(ArticleWiki, "warm_up", staticmethod(warm_up)),
+    ]
+    with contextlib.ExitStack() as stack:
+        for patch in patches:
+            stack.enter_context(patch)
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        directory = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(mock.patch.object(Leaderboard, "path", Path(directory) / "leaderboard.jsonl"))
+        stack.enter_context(mock.patch.object(ArticleSampler, "seen_dir", Path(directory) / "seen"))
+
+        server, loop = start_server(args.rounds)
+        try:
+            elapsed = asyncio.run(run_players(args, server.port, recorder))
+        finally:
+            asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            Leaderboard.flush()
+    return recorder, elapsed
+
+
+def print_report(recorder: LoadRecorder, elapsed: float, players: int) -> None:
+    """Print the throughput and the latency percentiles per request type."""
+    header = f"{'':>16} | {'count':>7} | " + " | ".join(f"{f'p{q} (ms)':>9}" for q in PERCENTILES)
+    print(header)
+    print("-" * len(header))
+    for kind, values in recorder.latencies.items():
+        ordered = sorted(values)
+        cells = " | ".join(f"{percentile(ordered, q) * 1000:>9.2f}" for q in PERCENTILES)
+        print(f"{kind:>16} | {len(values):>7} | {cells}")
+
+    print()
+    print(f"{players} players, {elapsed:.1f}s")
+    print(f"Rounds: {recorder.rounds} ({recorder.rounds / elapsed:.1f} rounds/sec)")
+    print(f"Games: {recorder.games}")
+    print(f"Error responses: {recorder.errors}")
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Load test the game server with simulated players.")
+    parser.add_argument("--players", type=int, default=DEFAULT_PLAYERS, help="concurrent players")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="seconds to play")
+    parser.add_argument("--rounds", type=int, default=GAME_DEFAULT_ROUNDS, help="rounds per game")
+    parser.add_argument("--wiki-latency", type=float, default=10.0, help="median Wikipedia latency (ms)")
+    parser.add_argument("--ai-latency", type=float, default=25.0, help="median OpenAI latency (ms)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal latency spread")
+    parser.add_argument("--wiki-failure-rate", type=float, default=0.02, help="Wikipedia failure rate (0-1)")
+    parser.add_argument("--ai-failure-rate", type=float, default=0.02, help="OpenAI failure rate (0-1)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="player reading time per round (ms)")
+    parser.add_argument("--accuracy", type=float, default=0.9, help="probability of a correct answer")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+
+    print_report(*run_load(args), args.players)
@@ -0,0 +1,208 @@
+"""
+Local stand-in for the MediaWiki action API.
+
+Serves the small subset of `action=query` used by src.game.utils.mediawiki
+(`list=categorymembers` and `prop=extracts`) from synthetic data, with an
+optional per-request latency and page size. It counts the requests it receives, so
+benchmarks can check how many round trips a code path makes without touching
+Wikipedia.
+
+== HOW TO RUN ==
+Start it on a fixed port:
+python -m src.game.benchmarks.stub_wiki_server --port 8765
+
+Then point the game at it from another shell:
+WIKI_API_URL=http://127.0.0.1:8765/w/api.php python main.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.game.classes.category import Category
+
+MEMBERS_PER_CATEGORY = 60
+SENTENCES_PER_EXTRACT = 10
+
+
+def make_categories(names: list[str], members_per_category: int = MEMBERS_PER_CATEGORY) -> dict:
+    """
+    Build synthetic category data.
+
+    Every category gets article members plus one "List of" page and one
+    subcategory, so client-side and server-side filtering are both exercised.
+
+    Returns:
+        dict: Category name to a list of (namespace, title) members.
+    """
+    categories = {}
+    for name in names:
+        members = [(0, f"{name} topic {number}") for number in range(members_per_category)]
+        members.append((0, f"List of {name.lower()} topics"))
+        members.append((14, f"Category:{name} subtopics"))
+        categories[name] = members
+    return categories
+
+
+def make_extract(title: str, sentences: int = SENTENCES_PER_EXTRACT) -> str:
+    """Return a deterministic plain-text intro for a page."""
+    return " ".join(f"Sentence {number} about {title}." for number in range(1, sentences + 1))
+
+
+class StubWikiServer:
+    """
+    A threaded HTTP server answering MediaWiki queries from synthetic data.
+
+    Attributes:
+        categories: Category name to a list of (namespace, title) members.
+        latency: Seconds slept before answering each request.
+        page_size: Maximum category members or extracts per response, or None
+                   for no limit. Longer results are continued like the real API does.
+        request_count: Number of requests answered so far.
+    """
+
+    def __init__(self, categories: dict, latency: float = 0.0, port: int = 0, page_size: Optional[int] = None):
+        """
+        Create the server. It does not accept requests until `start` is called.
+
+        Args:
+            categories: Category data, see `make_categories`.
+            latency: Seconds slept before answering each request.
+            port: TCP port on 127.0.0.1. 0 picks a free port.
+            page_size: Maximum category members or extracts per response.
+        """
+        self.categories = categories
+        self.latency = latency
+        self.page_size = page_size
+        self.request_count = 0
+        self._pages = {
+            title for members in categories.values() for namespace, title in members if namespace == 0
+        }
+        self._count_lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The api.php URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/w/api.php"
+
+    def start(self) -> "StubWikiServer":
+        """Start serving in a background thread and return self."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_count(self) -> None:
+        """Set the request counter back to zero."""
+        with self._count_lock:
+            self.request_count = 0
+
+    def answer(self, params: dict[str, str]) -> dict:
+        """
+        Build the JSON response of one query.
+
+        Args:
+            params: The query string parameters.
+
+        Returns:
+            dict: The response body, in formatversion=2 layout.
+        """
+        if params.get("action") != "query":
+            return {"error": {"code": "badvalue", "info": "Only action=query is supported"}}
+
+        query: dict = {}
+        continued: dict = {}
+        titles = [title for title in params.get("titles", "").split("|") if title]
+        sentences = int(params.get("exsentences", SENTENCES_PER_EXTRACT))
+        # Pages from excontinue on get their extract, page_size of them at most
+        first_extract = int(params.get("excontinue", 0))
+        extracts = 0
+        pages = []
+        for title in titles:
+            if title.startswith("Category:"):
+                exists = title[len("Category:"):] in self.categories
+                pages.append({"ns": 14, "title": title, **({} if exists else {"missing": True})})
+            elif title in self._pages:
+                page = {"ns": 0, "title": title}
+                if params.get("prop") == "extracts" and len(pages) >= first_extract:
+                    if self.page_size is not None and extracts == self.page_size:
+                        continued.setdefault("excontinue", len(pages))
+                    else:
+                        page["extract"] = make_extract(title, min(sentences, SENTENCES_PER_EXTRACT))
+                        extracts += 1
+                pages.append(page)
+            else:
+                pages.append({"ns": 0, "title": title, "missing": True})
+        if pages:
+            query["pages"] = pages
+
+        if params.get("list") == "categorymembers":
+            category = params.get("cmtitle", "")[len("Category:"):]
+            namespaces = params.get("cmnamespace")
+            members = [
+                {"ns": namespace, "title": title}
+                for namespace, title in self.categories.get(category, [])
+                if namespaces is None or str(namespace) in namespaces.split("|")
+            ]
+            start = int(params.get("cmcontinue", 0))
+            end = len(members) if self.page_size is None else start + self.page_size
+            query["categorymembers"] = members[start:end]
+            if end < len(members):
+                continued["cmcontinue"] = str(end)
+
+        if continued:
+            return {"continue": {**continued, "continue": "||"}, "query": query}
+        return {"batchcomplete": True, "query": query}
+
+    def _make_handler(self):
+        """Return a request handler class bound to this server."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                with stub._count_lock:
+                    stub.request_count += 1
+                params = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+                body = json.dumps(stub.answer(params)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Serve synthetic MediaWiki query responses.")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds of delay per request")
+    args = parser.parse_args()
+
+    server = StubWikiServer(make_categories(Category.categories), args.latency, args.port).start()
+    print(f"Serving stand-in MediaWiki API at {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
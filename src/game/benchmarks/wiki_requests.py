@@ -0,0 +1,71 @@
+"""
+Benchmark for the number of MediaWiki requests per article batch.
+
+Runs the stand-in MediaWiki server with a fixed per-request latency and
+compares fetching articles one at a time with `get_random_article` against
+one batched `get_random_articles` call, for a game round (2 articles) and a
+helper fill (8 articles). Every scenario starts from an empty cache.
+
+== HOW TO RUN ==
+python -m src.game.benchmarks.wiki_requests
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from src.game.benchmarks.stub_wiki_server import StubWikiServer, make_categories
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.models.category import CategoryModel
+from src.game.utils.cache import TwoTierCache
+
+LATENCY = 0.05  # seconds per request, roughly a Wikipedia round trip
+SCENARIOS = [("round", 2), ("helper fill", 8)]
+CATEGORY = "Hoaxes"
+
+
+def _measure(server: StubWikiServer, fetch) -> tuple[int, float, int]:
+    """Run `fetch` on a cold cache, returning (requests, milliseconds, articles)."""
+    ArticleWiki.get_cache().clear()
+    server.reset_count()
+    started = time.perf_counter()
+    articles = fetch()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return server.request_count, elapsed_ms, len(articles)
+
+
+def run_benchmark() -> None:
+    """Run the benchmark and print a table of results."""
+    server = StubWikiServer(make_categories([CATEGORY]), latency=LATENCY).start()
+    category = CategoryModel(CATEGORY)
+
+    api_url = ArticleWiki.api_url
+    with tempfile.TemporaryDirectory() as directory:
+        ArticleWiki.cache = TwoTierCache(Path(directory) / "wiki_cache.sqlite3")
+        ArticleWiki.api_url = server.url
+        try:
+            print(f"Stand-in server latency: {LATENCY * 1000:.0f} ms per request\n")
+            print(f"{'scenario':>12} | {'mode':>8} | {'requests':>8} | {'time (ms)':>9} | {'articles':>8}")
+            print("-" * 58)
+            for label, count in SCENARIOS:
+                single = _measure(
+                    server,
+                    lambda: [ArticleWiki.get_random_article(category) for _ in range(count)],
+                )
+                batched = _measure(
+                    server, lambda: ArticleWiki.get_random_articles(category, count)
+                )
+                for mode, (requests, elapsed_ms, articles) in (("single", single), ("batched", batched)):
+                    print(f"{label:>12} | {mode:>8} | {requests:>8} | {elapsed_ms:>9.1f} | {articles:>8}")
+        finally:
+            ArticleWiki.cache = None
+            ArticleWiki.api_url = api_url
+            server.stop()
+
+
+if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    run_benchmark()
@@ -6,17 +6,40 @@ fictional articles that fit within specified categories, designed to be used
 in a trivia game setting.
 """
 
+import concurrent.futures
 import json
-from typing import Optional
-from colorama import init, Fore, Style
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+from colorama import Fore
 
-# Initialize colorama for colorful console output
-init(autoreset=True)
+from src.config.settings import (
+    OPENAI_API_KEY,
+    WIKI_MAX_SENTENCE_LENGTH,
+    FAKE_POOL_LOW_WATERMARK,
+    FAKE_POOL_HIGH_WATERMARK,
+    FAKE_POOL_LATENCY_WINDOW,
+    OPENAI_SLOW_CALL_SECONDS,
+    OPENAI_API_TIMEOUT,
+    OPENAI_BATCH_TIMEOUT,
+)
+from src.game.classes.local_article import ArticlesLocal
+from src.game.models.article import ArticleModel
+from src.game.utils.circuit_breaker import CircuitBreaker
+from src.game.utils.clients import ClientRegistry
+from src.game.utils.metrics import Metrics
+from src.game.utils.near_duplicate import NearDuplicateIndex
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    # openai is imported by ClientRegistry and asyncio by FakeArticlePool on
+    # first use, so the game starts without them
+    import asyncio
+    from openai import OpenAI, AsyncOpenAI
 
-from src.config.settings import OPENAI_API_KEY, WIKI_MAX_SENTENCE_LENGTH
-from src.game.models.article import ArticleModel
+# custom_id prefix of batch file requests; the category name follows the index
+BATCH_CUSTOM_ID_PREFIX = "fake-"
 
 
 class FakeNewsGenerator:
@@ -26,10 +49,96 @@ class FakeNewsGenerator:
     This class provides methods to generate fake news articles that are
     plausible-sounding but entirely fictional, designed to be used as
     distractors in a trivia game.
+
+    Class Attributes:
+        duplicate_index: Near-duplicate index of the local articles of every
+                         category generated for, plus all generated articles.
+                         Generated articles that are too similar to an indexed
+                         one are discarded.
+        breaker: Circuit breaker of the OpenAI API. While it is open, no
+                 request is sent and generation returns nothing right away.
     """
 
+    breaker: CircuitBreaker = CircuitBreaker("openai", slow_call_seconds=OPENAI_SLOW_CALL_SECONDS)
+    duplicate_index: NearDuplicateIndex = NearDuplicateIndex()
+    _indexed_categories: set[str] = set()
+    _category_index_locks: dict[str, threading.Lock] = {}
+    _index_lock = threading.Lock()
+
+    @staticmethod
+    def _report(message: str, category: str, reason: str, background: bool) -> None:
+        """
+        Print a generation problem, or record it if it happened during a
+        background fill of the FakeArticlePool, where printing would garble
+        the prompt the player is typing at.
+
+        Args:
+            message: The message to print.
+            category: The category generated for.
+            reason: Short label of the problem, for the recorded error counts.
+            background: Whether the problem happened during a background fill.
+        """
+        if background:
+            FakeArticlePool.record_error(category, reason)
+        else:
+            print(message)
+
+    @staticmethod
+    def _is_new(article: ArticleModel, background: bool = False) -> bool:
+        """
+        Check a generated article against the duplicate index and add it if new.
+
+        The local articles of the article's category are indexed on first use,
+        which reads and hashes the category's corpus. Call it from a worker
+        thread, not from an event loop.
+
+        Args:
+            article: A freshly generated article.
+            background: Whether the article was generated by a background fill.
+
+        Returns:
+            bool: True if the article is not a near-duplicate of a known one.
+        """
+        FakeNewsGenerator._index_category(article.category, background)
+
+        duplicate = FakeNewsGenerator.duplicate_index.add_if_unique(article)
+        if duplicate is not None:
+            FakeNewsGenerator._report(
+                f"{Fore.YELLOW}Warning: Discarding generated article too similar to '{duplicate}'",
+                article.category, "duplicate", background,
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _index_category(category: str, background: bool = False) -> None:
+        """
+        Add the local articles of a category to the duplicate index, once.
+
+        Only callers for the same category wait for each other; indexing one
+        category does not hold up checks for the others.
+        """
+        with FakeNewsGenerator._index_lock:
+            if category in FakeNewsGenerator._indexed_categories:
+                return
+            lock = FakeNewsGenerator._category_index_locks.setdefault(category, threading.Lock())
+
+        with lock:
+            if category in FakeNewsGenerator._indexed_categories:
+                return
+            try:
+                for local_article in ArticlesLocal.iter_articles(category):
+                    FakeNewsGenerator.duplicate_index.add(local_article)
+            except (ValueError, IndexError) as e:
+                FakeNewsGenerator._report(
+                    f"{Fore.YELLOW}Warning: Could not index local articles: {e}",
+                    category, "local_index", background,
+                )
+            with FakeNewsGenerator._index_lock:
+                FakeNewsGenerator._indexed_categories.add(category)
+
     @staticmethod
-    def _generate_from_api(client: OpenAI, category: str) -> Optional[ArticleModel]:
+    def _generate_from_api(client: "OpenAI", category: str) -> Optional[ArticleModel]:
         """
         Generate a fake news article using the OpenAI API.
 
@@ -38,13 +147,85 @@ class FakeNewsGenerator:
             category: The category for which to generate a fake article.
 
         Returns:
-            ArticleModel: A dictionary containing the generated article's title,
-                        summary, category, and truth status, or None if an error occurs.
+            ArticleModel: The generated article with its title, summary, category,
+                        and truth status, or None if an error occurs.
 
         Note:
             This is an internal method and should not be called directly.
             Use the `generate()` method instead.
         """
+        token = FakeNewsGenerator.breaker.allow_request()
+        if token is None:
+            return None
+
+        started = time.perf_counter()
+        try:
+            response = client.chat.completions.create(
+                **FakeNewsGenerator._build_request(category),
+                timeout=OPENAI_API_TIMEOUT,
+            )
+        except Exception as e:
+            FakeNewsGenerator.breaker.record_failure(token)
+            print(f"{Fore.RED}API Error: {e}")
+            Metrics.increment("errors_total", {"span": "openai", "type": type(e).__name__})
+            return None
+
+        FakeNewsGenerator.breaker.record_success(token, time.perf_counter() - started)
+        return FakeNewsGenerator._parse_response(response, category)
+
+    @staticmethod
+    async def _generate_from_api_async(
+        client: "AsyncOpenAI", category: str
+    ) -> Optional[ArticleModel]:
+        """
+        Generate a fake news article using the asynchronous OpenAI client.
+
+        Args:
+            client: An instance of the asynchronous OpenAI client.
+            category: The category for which to generate a fake article.
+
+        Returns:
+            ArticleModel: The generated article, or None if an error occurs.
+
+        Note:
+            This is an internal method used by FakeArticlePool to fill its buffers.
+            Errors are recorded with FakeArticlePool.record_error, not printed.
+        """
+        import asyncio
+
+        token = FakeNewsGenerator.breaker.allow_request()
+        if token is None:
+            return None
+
+        started = time.perf_counter()
+        try:
+            response = await client.chat.completions.create(
+                **FakeNewsGenerator._build_request(category),
+                timeout=OPENAI_API_TIMEOUT,
+            )
+        except asyncio.CancelledError:
+            # The fill was cancelled, the API did not fail
+            FakeNewsGenerator.breaker.release(token)
+            raise
+        except Exception as e:
+            FakeNewsGenerator.breaker.record_failure(token)
+            FakeArticlePool.record_error(category, type(e).__name__)
+            return None
+
+        FakeNewsGenerator.breaker.record_success(token, time.perf_counter() - started)
+        return FakeNewsGenerator._parse_response(response, category, background=True)
+
+    @staticmethod
+    def _build_request(category: str) -> dict:
+        """
+        Build the chat completion arguments for a fake article request.
+
+        Args:
+            category: The category for which to generate a fake article.
+
+        Returns:
+            dict: Keyword arguments for `chat.completions.create`.
+        """
         system_prompt = f"""
         You are an AI assistant for a trivia game. You will create a plausible-sounding
         but entirely fictional subject that fits a given category.
@@ -54,64 +235,87 @@ class FakeNewsGenerator:
         """
         user_prompt = f"Category: {category}"
 
-        try:
-            response = client.chat.completions.create(
-                model="gpt-5-nano",
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=1,
-                timeout=30,  # Add timeout for API calls
-            )
-
-            if not response.choices or not response.choices[0].message.content:
-                print(f"{Fore.YELLOW}Warning: Empty response from OpenAI API")
-                return None
+        return {
+            "model": "gpt-5-nano",
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 1,
+        }
 
-            data = json.loads(response.choices[0].message.content)
+    @staticmethod
+    def _parse_response(response, category: str, background: bool = False) -> Optional[ArticleModel]:
+        """
+        Turn a chat completion response into an article.
 
-            # Validate required fields
-            if not data.get("title") or not data.get("summary"):
-                print(
-                    f"{Fore.YELLOW}Warning: Incomplete response from OpenAI API - missing title or summary"
-                )
-                return None
+        Args:
+            response: The chat completion returned by the OpenAI API.
+            category: The category the article was generated for.
+            background: Whether the response belongs to a background fill.
 
-            article: ArticleModel = {
-                "title": data.get("title"),
-                "summary": data.get("summary"),
-                "category": category,
-                "is_truth": False,
-            }
-            return article
+        Returns:
+            ArticleModel: The parsed article, or None if the response is unusable.
+        """
+        if not response.choices or not response.choices[0].message.content:
+            FakeNewsGenerator._report(
+                f"{Fore.YELLOW}Warning: Empty response from OpenAI API", category, "empty", background
+            )
+            return None
 
+        try:
+            data = json.loads(response.choices[0].message.content)
         except json.JSONDecodeError as e:
-            print(f"{Fore.RED}Error: Failed to parse JSON response from OpenAI API: {e}")
+            FakeNewsGenerator._report(
+                f"{Fore.RED}Error: Failed to parse JSON response from OpenAI API: {e}",
+                category, "invalid_json", background,
+            )
             return None
-        except Exception as e:
-            print(f"{Fore.RED}API Error: {e}")
+
+        # Validate required fields
+        if not data.get("title") or not data.get("summary"):
+            FakeNewsGenerator._report(
+                f"{Fore.YELLOW}Warning: Incomplete response from OpenAI API - missing title or summary",
+                category, "incomplete", background,
+            )
             return None
 
+        return ArticleModel(
+            title=data.get("title"),
+            summary=data.get("summary"),
+            category=category,
+            is_truth=False,
+        )
+
     @staticmethod
-    def generate(category: str) -> Optional[ArticleModel]:
+    @Metrics.timed("fake_generate")
+    def generate(category: str, use_pool: bool = True) -> Optional[ArticleModel]:
         """
         Generate a fake news article for the specified category.
 
         Args:
             category: The category for which to generate a fake article.
+            use_pool: Whether to serve the article from the FakeArticlePool and
+                      let it refill in the background. Bulk generation passes
+                      False, so every request goes through its own rate limit.
 
         Returns:
-            Optional[ArticleModel]: A dictionary containing the generated article's
-                                 details, or None if generation fails or if the
+            Optional[ArticleModel]: The generated article, or None if generation fails or if the
                                  API key is not configured.
 
+        Note:
+            Unless `use_pool` is False, articles already waiting in the
+            FakeArticlePool buffer for this category are returned immediately
+            without calling the API.
+            Generated articles that are near-duplicates of a local or earlier
+            generated article are discarded (None is returned).
+
         Example:
             >>> article = FakeNewsGenerator.generate("Science")
             >>> if article:
-            ...     print(article['title'])
-            ...     print(article['summary'])
+            ...     print(article.title)
+            ...     print(article.summary)
         """
         # Input validation
         if not category or not isinstance(category, str):
@@ -126,9 +330,476 @@ class FakeNewsGenerator:
             )
             return None
 
+        if use_pool:
+            pooled_article = FakeArticlePool.take(category)
+            if pooled_article:
+                Metrics.increment("fake_pool_hits_total")
+                return pooled_article
+
         try:
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            return FakeNewsGenerator._generate_from_api(client, category)
+            client = ClientRegistry.get_openai()
+            article = FakeNewsGenerator._generate_from_api(client, category)
+            if article and not FakeNewsGenerator._is_new(article):
+                return None
+            return article
         except Exception as e:
             print(f"{Fore.RED}Error: Failed to initialize OpenAI client: {e}")
             return None
+
+    @staticmethod
+    def _build_batch_request(category: str, count: int) -> dict:
+        """
+        Build the chat completion arguments for a request of several fake articles.
+
+        Args:
+            category: The category for which to generate fake articles.
+            count: How many articles to ask for.
+
+        Returns:
+            dict: Keyword arguments for `chat.completions.create`.
+        """
+        system_prompt = f"""
+        You are an AI assistant for a trivia game. You will create {count} plausible-sounding
+        but entirely fictional subjects that fit a given category. The subjects must be
+        clearly different from each other.
+        For each one, generate a fake Wikipedia article "title" and a one-paragraph "summary".
+        Each summary must be about {WIKI_MAX_SENTENCE_LENGTH} sentences long and sound encyclopedic.
+        Respond ONLY with a valid JSON object with an "articles" key holding a list of
+        objects with "title" and "summary" keys. Respond only in English.
+        """
+        user_prompt = f"Category: {category}\nNumber of articles: {count}"
+
+        return {
+            "model": "gpt-5-nano",
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 1,
+        }
+
+    @staticmethod
+    def _parse_batch_content(content: Optional[str], category: str) -> list[ArticleModel]:
+        """
+        Turn the content of a batched response into articles.
+
+        Every element is validated on its own, so one malformed entry does not
+        discard the others.
+
+        Args:
+            content: The message content of the chat completion.
+            category: The category the articles were generated for.
+
+        Returns:
+            list[ArticleModel]: The valid articles, possibly empty.
+        """
+        if not content:
+            print(f"{Fore.YELLOW}Warning: Empty response from OpenAI API")
+            return []
+
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            print(f"{Fore.RED}Error: Failed to parse JSON response from OpenAI API: {e}")
+            return []
+
+        entries = data.get("articles") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            print(f"{Fore.YELLOW}Warning: Batched response from OpenAI API has no 'articles' list")
+            return []
+
+        articles = []
+        for entry in entries:
+            if (
+                not isinstance(entry, dict)
+                or not isinstance(entry.get("title"), str)
+                or not isinstance(entry.get("summary"), str)
+                or not entry["title"].strip()
+                or not entry["summary"].strip()
+            ):
+                print(f"{Fore.YELLOW}Warning: Skipping malformed entry in batched response: {entry}")
+                continue
+            articles.append(
+                ArticleModel(
+                    title=entry["title"].strip(),
+                    summary=entry["summary"].strip(),
+                    category=category,
+                    is_truth=False,
+                )
+            )
+        return articles
+
+    @staticmethod
+    def generate_batch(category: str, count: int) -> list[ArticleModel]:
+        """
+        Generate several fake news articles with a single API call.
+
+        Args:
+            category: The category for which to generate fake articles.
+            count: How many articles to ask for.
+
+        Returns:
+            list[ArticleModel]: The valid, non-duplicate articles. This can hold
+                                fewer than `count` articles, or none if the
+                                request fails.
+
+        Example:
+            >>> for article in FakeNewsGenerator.generate_batch("Science", 4):
+            ...     print(article.title)
+        """
+        if not category or not isinstance(category, str):
+            print(
+                f"{Fore.RED}Error: Invalid category provided. Category must be a non-empty string."
+            )
+            return []
+
+        if count < 1:
+            return []
+
+        if not OPENAI_API_KEY:
+            print(
+                f"{Fore.RED}Error: OPENAI_API_KEY not found. Please configure your OpenAI API key."
+            )
+            return []
+
+        try:
+            client = ClientRegistry.get_openai()
+            response = FakeNewsGenerator.breaker.call(
+                lambda: client.chat.completions.create(
+                    **FakeNewsGenerator._build_batch_request(category, count),
+                    timeout=OPENAI_BATCH_TIMEOUT,
+                )
+            )
+        except Exception as e:
+            print(f"{Fore.RED}API Error: {e}")
+            return []
+
+        content = response.choices[0].message.content if response.choices else None
+        articles = FakeNewsGenerator._parse_batch_content(content, category)
+        return [article for article in articles if FakeNewsGenerator._is_new(article)]
+
+    @staticmethod
+    def write_batch_file(requests: dict[str, int], path: Path) -> int:
+        """
+        Write batched generation requests to a JSON Lines file for offline processing.
+
+        Each line is one request in the OpenAI Batch API input format, so the
+        file can be submitted as a single batch job.
+
+        Args:
+            requests: Number of fake articles wanted per category name.
+            path: Destination of the request file.
+
+        Returns:
+            int: The number of requests written.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with open(path, "w", encoding="utf-8") as file:
+            for category, count in requests.items():
+                if count < 1:
+                    continue
+                line = {
+                    "custom_id": f"{BATCH_CUSTOM_ID_PREFIX}{written}:{category}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": FakeNewsGenerator._build_batch_request(category, count),
+                }
+                file.write(json.dumps(line, ensure_ascii=False) + "\n")
+                written += 1
+        return written
+
+    @staticmethod
+    def read_batch_file(path: Path) -> list[ArticleModel]:
+        """
+        Read the articles from an OpenAI Batch API output file.
+
+        The category of each response is recovered from its custom_id. Failed
+        requests and malformed lines are skipped with a warning. Articles are
+        not checked for duplicates here.
+
+        Args:
+            path: The JSON Lines output file of a batch job.
+
+        Returns:
+            list[ArticleModel]: The valid articles of all responses.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        articles: list[ArticleModel] = []
+        with open(path, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    result = json.loads(line)
+                    custom_id = result["custom_id"]
+                    response = result.get("response") or {}
+                    body = response.get("body") or {}
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    print(f"{Fore.YELLOW}Warning: Skipping malformed batch line {line_number}")
+                    continue
+
+                if not custom_id.startswith(BATCH_CUSTOM_ID_PREFIX) or ":" not in custom_id:
+                    print(f"{Fore.YELLOW}Warning: Skipping unknown batch request '{custom_id}'")
+                    continue
+                category = custom_id[len(BATCH_CUSTOM_ID_PREFIX):].split(":", 1)[1]
+
+                if result.get("error") or response.get("status_code") != 200:
+                    print(f"{Fore.YELLOW}Warning: Batch request '{custom_id}' failed: {result.get('error')}")
+                    continue
+
+                try:
+                    content = body["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    content = None
+                articles.extend(FakeNewsGenerator._parse_batch_content(content, category))
+        return articles
+
+
+class FakeArticlePool:
+    """
+    Per-category buffers of pre-generated fake articles.
+
+    Buffers are filled in the background with the asynchronous OpenAI client
+    on a dedicated event loop thread. A buffer is topped up to the high
+    watermark whenever it drops below the low watermark, so a round can
+    usually take a fake article without waiting for the API.
+
+    Fills run while the player is typing, so their errors are not printed
+    but counted per category (see `stats`) and as the
+    `fake_pool_errors_total` metric.
+
+    Class Attributes:
+        low_watermark: Buffer size below which a refill is started.
+        high_watermark: Buffer size a refill stops at.
+    """
+
+    low_watermark: int = FAKE_POOL_LOW_WATERMARK
+    high_watermark: int = FAKE_POOL_HIGH_WATERMARK
+
+    _buffers: dict[str, deque[ArticleModel]] = {}
+    _filling: set[str] = set()
+    _fills: dict[str, concurrent.futures.Future] = {}
+    _starvations: dict[str, int] = {}
+    # The most recent fill latencies and the totals of a category
+    _fill_latencies: dict[str, deque[float]] = {}
+    _filled: dict[str, int] = {}
+    _errors: dict[str, int] = {}
+    _lock = threading.Lock()
+    _loop: Optional["asyncio.AbstractEventLoop"] = None
+
+    @staticmethod
+    def offer(category: str) -> None:
+        """
+        Start filling the buffer of a category in the background.
+
+        Does nothing if the buffer is already being filled, is at or above
+        the low watermark, or if no API key is configured.
+
+        Args:
+            category: The category to generate fake articles for.
+        """
+        if not category or not OPENAI_API_KEY:
+            return
+
+        with FakeArticlePool._lock:
+            buffer = FakeArticlePool._buffers.setdefault(category, deque())
+            if category in FakeArticlePool._filling:
+                return
+            if len(buffer) >= max(1, FakeArticlePool.low_watermark):
+                return
+            FakeArticlePool._filling.add(category)
+
+        try:
+            import asyncio
+
+            loop = FakeArticlePool._get_loop()
+            fill = asyncio.run_coroutine_threadsafe(FakeArticlePool._fill(category), loop)
+            with FakeArticlePool._lock:
+                FakeArticlePool._fills[category] = fill
+            # Also runs for a fill cancelled before the loop started it
+            fill.add_done_callback(lambda done: FakeArticlePool._fill_done(category, done))
+        except Exception as e:
+            FakeArticlePool.record_error(category, type(e).__name__)
+            with FakeArticlePool._lock:
+                FakeArticlePool._filling.discard(category)
+
+    @staticmethod
+    def cancel(category: str) -> None:
+        """
+        Stop filling the buffer of a category, e.g. one the player did not choose.
+
+        Requests in flight are abandoned; articles already buffered are kept.
+        The category can be offered again right away.
+
+        Args:
+            category: The category to stop generating fake articles for.
+        """
+        with FakeArticlePool._lock:
+            fill = FakeArticlePool._fills.pop(category, None)
+            if fill is not None:
+                FakeArticlePool._filling.discard(category)
+        if fill is not None:
+            fill.cancel()
+
+    @staticmethod
+    def _fill_done(category: str, fill: concurrent.futures.Future) -> None:
+        """Mark a category as no longer filling once its current fill is over."""
+        with FakeArticlePool._lock:
+            if FakeArticlePool._fills.get(category) is fill:
+                del FakeArticlePool._fills[category]
+                FakeArticlePool._filling.discard(category)
+
+    @staticmethod
+    def take(category: str) -> Optional[ArticleModel]:
+        """
+        Take a ready fake article from the buffer of a category.
+
+        A refill is started when the buffer drops below the low watermark.
+
+        Args:
+            category: The category of the requested article.
+
+        Returns:
+            Optional[ArticleModel]: A buffered article, or None if the buffer is empty.
+        """
+        with FakeArticlePool._lock:
+            buffer = FakeArticlePool._buffers.get(category)
+            article = buffer.popleft() if buffer else None
+            if article is None:
+                FakeArticlePool._starvations[category] = (
+                    FakeArticlePool._starvations.get(category, 0) + 1
+                )
+
+        FakeArticlePool.offer(category)
+        return article
+
+    @staticmethod
+    def give_back(article: ArticleModel) -> None:
+        """
+        Put an unused fake article at the front of its category's buffer.
+
+        The article is dropped if the buffer is already at the high watermark.
+
+        Args:
+            article: The article, e.g. one that was generated too late for its round.
+        """
+        with FakeArticlePool._lock:
+            buffer = FakeArticlePool._buffers.setdefault(article.category, deque())
+            if len(buffer) >= FakeArticlePool.high_watermark:
+                return
+            buffer.appendleft(article)
+
+    @staticmethod
+    def record_error(category: str, reason: str) -> None:
+        """
+        Count a failed background generation instead of printing it.
+
+        Args:
+            category: The category generated for.
+            reason: Short label of the problem, e.g. the exception type.
+        """
+        with FakeArticlePool._lock:
+            FakeArticlePool._errors[category] = FakeArticlePool._errors.get(category, 0) + 1
+        Metrics.increment("fake_pool_errors_total", {"reason": reason})
+
+    @staticmethod
+    def stats() -> dict[str, dict[str, float]]:
+        """
+        Return buffer statistics per category.
+
+        Returns:
+            dict[str, dict[str, float]]: For each category, the queue depth, the
+                                         number of starved takes, of generated
+                                         articles and of failed generations,
+                                         and the average of the recent and the
+                                         last fill latency in seconds.
+        """
+        with FakeArticlePool._lock:
+            categories = (
+                set(FakeArticlePool._buffers)
+                | set(FakeArticlePool._starvations)
+                | set(FakeArticlePool._errors)
+            )
+            result = {}
+            for category in categories:
+                latencies = FakeArticlePool._fill_latencies.get(category, ())
+                result[category] = {
+                    "depth": len(FakeArticlePool._buffers.get(category, ())),
+                    "starvations": FakeArticlePool._starvations.get(category, 0),
+                    "filled": FakeArticlePool._filled.get(category, 0),
+                    "errors": FakeArticlePool._errors.get(category, 0),
+                    "avg_fill_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+                    "last_fill_latency": latencies[-1] if latencies else 0.0,
+                }
+            return result
+
+    @staticmethod
+    def _get_loop() -> "asyncio.AbstractEventLoop":
+        """Return the background event loop, starting its thread on first use."""
+        import asyncio
+
+        with FakeArticlePool._lock:
+            if FakeArticlePool._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="fake-article-pool", daemon=True
+                )
+                thread.start()
+                FakeArticlePool._loop = loop
+            return FakeArticlePool._loop
+
+    @staticmethod
+    async def _fill(category: str) -> None:
+        """
+        Generate articles concurrently until the buffer reaches the high watermark.
+
+        Stops early if a whole batch of requests fails.
+        """
+        import asyncio
+
+        try:
+            while True:
+                with FakeArticlePool._lock:
+                    missing = FakeArticlePool.high_watermark - len(
+                        FakeArticlePool._buffers[category]
+                    )
+                if missing <= 0:
+                    return
+
+                results = await asyncio.gather(
+                    *(FakeArticlePool._generate_timed(category) for _ in range(missing))
+                )
+                generated = [article for article in results if article]
+                if not generated:
+                    return
+
+                with FakeArticlePool._lock:
+                    FakeArticlePool._buffers[category].extend(generated)
+        except Exception as e:
+            FakeArticlePool.record_error(category, type(e).__name__)
+
+    @staticmethod
+    async def _generate_timed(category: str) -> Optional[ArticleModel]:
+        """Generate one article and record how long it took."""
+        import asyncio
+
+        started = time.perf_counter()
+        article = await FakeNewsGenerator._generate_from_api_async(
+            ClientRegistry.get_async_openai(), category
+        )
+        # The first check of a category indexes its corpus; keep that off the loop
+        if article and not await asyncio.get_running_loop().run_in_executor(
+            None, FakeNewsGenerator._is_new, article, True
+        ):
+            return None
+        if article:
+            with FakeArticlePool._lock:
+                FakeArticlePool._fill_latencies.setdefault(
+                    category, deque(maxlen=FAKE_POOL_LATENCY_WINDOW)
+                ).append(time.perf_counter() - started)
+                FakeArticlePool._filled[category] = FakeArticlePool._filled.get(category, 0) + 1
+        return article
@@ -4,10 +4,23 @@ Category management functionality.
 This module provides functionality for managing game categories,
 including predefined categories and methods for selecting random
 categories or finding categories by name.
+
+When a category registry has been crawled (see
+src.game.utils.category_crawler), the categories come from it and only
+those with enough playable articles are offered. Otherwise the predefined
+categories are used.
 """
 
 import random
+import threading
+from pathlib import Path
+from typing import Optional
+
+from colorama import Fore
+
+from src.config.settings import CATEGORY_REGISTRY_PATH, CATEGORY_MIN_ARTICLES
 from src.game.models.category import CategoryModel
+from src.game.utils.category_crawler import load_registry
 
 
 class Category:
@@ -19,7 +32,10 @@ class Category:
     Categories are used to organize articles by topic.
 
     Class Attributes:
-        categories: A list of predefined category names as strings.
+        categories: A list of predefined category names as strings. They are
+                    offered when there is no category registry, and they seed
+                    the crawler.
+        registry_path: The category registry written by the crawler.
     """
 
     categories: list[str] = [
@@ -44,6 +60,59 @@ class Category:
         "Fake_news",
         "Prophecy",
     ]
+    registry_path: Path = CATEGORY_REGISTRY_PATH
+
+    _index: Optional[dict[str, CategoryModel]] = None
+    _playable: list[CategoryModel] = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def load() -> None:
+        """
+        Load the category registry, if that has not happened yet.
+
+        The predefined categories are used if the registry is missing, cannot
+        be read or has no playable category.
+        """
+        with Category._lock:
+            if Category._index is not None:
+                return
+
+            try:
+                index = load_registry(Category.registry_path)
+            except FileNotFoundError:
+                index = {}
+            except (OSError, ValueError) as e:
+                print(f"{Fore.YELLOW}Warning: Could not read the category registry: {e}")
+                index = {}
+
+            playable = [category for category in index.values() if Category.is_playable(category)]
+            if not playable:
+                index = {name: CategoryModel(name) for name in Category.categories}
+                playable = list(index.values())
+            Category._playable = playable
+            Category._index = index
+
+    @staticmethod
+    def is_playable(category: CategoryModel) -> bool:
+        """
+        Return whether a category can be offered.
+
+        Categories that were not crawled are assumed to be playable.
+        """
+        return category.article_count is None or category.article_count >= CATEGORY_MIN_ARTICLES
+
+    @staticmethod
+    def get_playable_categories() -> list[CategoryModel]:
+        """
+        Return every category that can be offered.
+
+        Returns:
+            list[CategoryModel]: The playable categories of the registry, or
+                                 the predefined categories without one.
+        """
+        Category.load()
+        return list(Category._playable)
 
     @staticmethod
     def get_category_by_name(category_name: str) -> CategoryModel | None:
@@ -55,25 +124,24 @@ class Category:
 
         Returns:
             CategoryModel or None: The category object if found, None otherwise.
+                                   Unplayable categories of the registry are
+                                   found too.
+
+        Note:
+            The lookup uses a dictionary keyed by name, so it takes constant time.
 
         Example:
             >>> category = Category.get_category_by_name("Science")
             >>> if category:
             ...     print(f"Found category: {category.name}")
         """
-        return next(
-            (
-                category
-                for category in Category.categories
-                if category.name == category_name
-            ),
-            None,
-        )
+        Category.load()
+        return Category._index.get(category_name)
 
     @staticmethod
     def get_random_category() -> CategoryModel:
         """
-        Get a random category from the predefined list.
+        Get a random playable category.
 
         Returns:
             CategoryModel: A randomly selected category.
@@ -82,4 +150,19 @@ class Category:
             >>> random_cat = Category.get_random_category()
             >>> print(f"Random category: {random_cat.name}")
         """
-        return CategoryModel(random.choice(Category.categories))
+        Category.load()
+        return random.choice(Category._playable)
+
+    @staticmethod
+    def get_random_categories(count: int) -> list[CategoryModel]:
+        """
+        Get distinct random playable categories.
+
+        Args:
+            count: How many categories to return.
+
+        Returns:
+            list[CategoryModel]: Up to `count` categories, without repetitions.
+        """
+        Category.load()
+        return random.sample(Category._playable, min(count, len(Category._playable)))
@@ -0,0 +1,109 @@
+"""
+Speculative warm-up of the offered categories.
+
+While the player types their name and picks one of the offered categories,
+the game would otherwise sit idle in `input()`. This module uses that time
+to fetch the member list and a few summaries of every offered category into
+the Wikipedia cache, and to start generating fake articles for them. Once
+the player has chosen, the warm-up of the other categories is cancelled.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.config.settings import WARMUP_SUMMARIES, WARMUP_WORKERS
+from src.game.classes.ai_gen import FakeArticlePool
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.models.category import CategoryModel
+from src.game.utils.circuit_breaker import OPEN
+from src.game.utils.metrics import Metrics
+
+_executor = ThreadPoolExecutor(max_workers=WARMUP_WORKERS, thread_name_prefix="warmup")
+
+
+class CategoryWarmer:
+    """
+    Warms up the caches of several categories in the background.
+
+    Attributes:
+        categories: The categories being warmed up.
+        summaries: Summaries fetched per category.
+        cancel_fakes: Whether fake article generation for unchosen categories
+                      is stopped too. Turn it off when other players may be
+                      waiting for the same categories.
+    """
+
+    def __init__(
+        self,
+        categories: list[CategoryModel],
+        summaries: int = WARMUP_SUMMARIES,
+        cancel_fakes: bool = True,
+    ):
+        """
+        Initialize the warmer. Call start() to begin warming up.
+
+        Args:
+            categories: The categories to warm up.
+            summaries: Summaries fetched per category.
+            cancel_fakes: Whether `select` also stops fake article generation
+                          for the other categories.
+        """
+        self.categories = categories
+        self.summaries = summaries
+        self.cancel_fakes = cancel_fakes
+        self._cancelled = {category.name: threading.Event() for category in categories}
+        self._tasks: dict[str, Future] = {}
+
+    def start(self) -> "CategoryWarmer":
+        """
+        Start generating fake articles and fetching Wikipedia data for every category.
+
+        Returns:
+            CategoryWarmer: The warmer itself, for chaining.
+        """
+        for category in self.categories:
+            FakeArticlePool.offer(category.name)
+            if ArticleWiki.breaker.state == OPEN:
+                continue
+            self._tasks[category.name] = _executor.submit(
+                self._warm, category, self._cancelled[category.name]
+            )
+        return self
+
+    def select(self, category: CategoryModel) -> None:
+        """
+        Keep warming up the chosen category and cancel the others.
+
+        Args:
+            category: The category the player chose.
+        """
+        for other in self.categories:
+            if other.name != category.name:
+                self._cancel(other.name)
+
+    def cancel(self) -> None:
+        """Cancel the warm-up of every category."""
+        for category in self.categories:
+            self._cancel(category.name)
+
+    def _cancel(self, name: str) -> None:
+        """Cancel the warm-up of one category. A request in flight is left to finish."""
+        self._cancelled[name].set()
+        task = self._tasks.get(name)
+        if task is not None and task.cancel():
+            Metrics.increment("warmups_total", {"result": "cancelled"})
+        if self.cancel_fakes:
+            FakeArticlePool.cancel(name)
+
+    def _warm(self, category: CategoryModel, cancelled: threading.Event) -> None:
+        """Worker body: fetch the member list and summaries of one category."""
+        if cancelled.is_set():
+            Metrics.increment("warmups_total", {"result": "cancelled"})
+            return
+        try:
+            with Metrics.span("warmup"):
+                ArticleWiki.warm_up(category, self.summaries, cancelled)
+        except ValueError:
+            Metrics.increment("warmups_total", {"result": "failed"})
+            return
+        Metrics.increment("warmups_total", {"result": "cancelled" if cancelled.is_set() else "done"})
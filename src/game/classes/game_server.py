@@ -0,0 +1,440 @@
+"""
+Asynchronous multi-session game server.
+
+The console game serves one player per process, and every process has its
+own caches. GameServer plays the same rounds with many players in a single
+process, over a small JSON API on plain HTTP/1.1 built with asyncio streams.
+All sessions share the Wikipedia cache, the fake article pool and the
+provider clients; each session only keeps a compact SessionModel and the
+player's article sampler, whose seen filter is saved when the game ends.
+
+Rounds are assembled by RoundBuilder on worker threads, at most
+SERVER_MAX_ROUND_BUILDS at a time, and the next round of a session is built
+while the player is still reading the current one.
+
+== API ==
+POST /sessions                  {"name": str}      Start a game; returns the session
+                                                   id and the offered categories
+GET  /sessions/<id>                                The state of a game
+POST /sessions/<id>/category    {"category": int}  Choose one of the offered categories
+GET  /sessions/<id>/round                          The articles of the current round
+POST /sessions/<id>/answer      {"answer": int}    Name the fake article; the score of a
+                                                   finished game goes to the leaderboard
+GET  /leaderboard                                  The best players
+GET  /metrics                                      Metrics in Prometheus text format
+GET  /health                                       Liveness check
+"""
+
+import asyncio
+import json
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from src.config.settings import (
+    GAME_DEFAULT_ROUNDS,
+    LEADERBOARD_TOP,
+    ROUND_DEADLINE,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_SESSION_TTL,
+    SERVER_MAX_ROUND_BUILDS,
+    SERVER_MAX_BODY,
+    WIKI_MAX_DISPLAYED_CATEGORIES,
+)
+from src.game.classes.category import Category
+from src.game.classes.category_warmer import CategoryWarmer
+from src.game.classes.leaderboard import Leaderboard
+from src.game.classes.round_builder import RoundBuilder
+from src.game.models.article import ArticleModel
+from src.game.models.session import SessionModel
+from src.game.utils.metrics import Metrics
+from src.game.utils.sampler import ArticleSampler
+
+MAX_NAME_LENGTH = 50
+
+# Pending connections the listening socket queues, so bursts of new players are not refused
+LISTEN_BACKLOG = 1024
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    """An error answered with an HTTP status and a JSON message."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class GameServer:
+    """
+    Serves the game to many players at once.
+
+    Attributes:
+        host: The address the server listens on.
+        port: The port the server listens on. Port 0 picks a free port, which
+              is stored here once the server has started.
+        rounds: Rounds a player must win to win the game.
+        session_ttl: Seconds a session is kept without requests.
+        sessions: The live sessions by id.
+        rounds_played: Number of rounds answered since the server started.
+    """
+
+    def __init__(
+        self,
+        host: str = SERVER_HOST,
+        port: int = SERVER_PORT,
+        rounds: int = GAME_DEFAULT_ROUNDS,
+        session_ttl: float = SERVER_SESSION_TTL,
+    ):
+        self.host = host
+        self.port = port
+        self.rounds = rounds
+        self.session_ttl = session_ttl
+        self.sessions: dict[str, SessionModel] = {}
+        self.rounds_played = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=SERVER_MAX_ROUND_BUILDS, thread_name_prefix="server-round"
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._janitor: Optional[asyncio.Task] = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> "GameServer":
+        """
+        Start accepting connections.
+
+        Returns:
+            GameServer: The server itself, for chaining.
+        """
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, backlog=LISTEN_BACKLOG
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._janitor = asyncio.create_task(self._expire_sessions())
+        Metrics.register_collector(self.collect_metrics)
+        Leaderboard.preload()
+        return self
+
+    async def serve_forever(self) -> None:
+        """Start the server and serve until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Stop accepting connections and drop all sessions."""
+        if self._janitor is not None:
+            self._janitor.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.sleep(0)  # let the connection handlers see the closed streams
+        for session in self.sessions.values():
+            session.cancel()
+            if not session.finished:
+                session.sampler.save()
+        self.sessions.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def collect_metrics(self):
+        """Report the number of live sessions and rounds played as gauges."""
+        yield "server_sessions", {}, len(self.sessions)
+        yield "server_rounds_played", {}, self.rounds_played
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one keep-alive connection."""
+        self._connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    return
+                method, target, version = request_line.decode("latin-1").split()
+
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (
+                    version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                )
+                length = int(headers.get("content-length", 0))
+                if length > SERVER_MAX_BODY:
+                    status, payload, keep_alive = 413, {"error": "Request body too large"}, False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self._dispatch(method, target, body)
+
+                writer.write(self._response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _response(status: int, payload: Any, keep_alive: bool) -> bytes:
+        """Encode a response. Strings are sent as plain text, anything else as JSON."""
+        if isinstance(payload, str):
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            content_type = "application/json"
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> tuple[int, Any]:
+        """
+        Route a request to its handler.
+
+        Returns:
+            tuple[int, Any]: The status and the payload of the response.
+        """
+        try:
+            status, payload = await self._route(method, target.split("?", 1)[0], body)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            Metrics.increment("errors_total", {"span": "server", "type": type(e).__name__})
+            status, payload = 500, {"error": "Internal server error"}
+        Metrics.increment("server_requests_total", {"status": str(status)})
+        return status, payload
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[int, Any]:
+        """Find and run the handler of a path."""
+        parts = [part for part in path.split("/") if part]
+
+        if parts == ["health"]:
+            self._require(method, "GET")
+            return 200, {"status": "ok", "sessions": len(self.sessions)}
+        if parts == ["metrics"]:
+            self._require(method, "GET")
+            return 200, Metrics.to_prometheus(Metrics.snapshot())
+        if parts == ["leaderboard"]:
+            self._require(method, "GET")
+            return 200, {
+                "players": Leaderboard.size(),
+                "top": [{"name": name, "score": score} for name, score in Leaderboard.top(LEADERBOARD_TOP)],
+            }
+        if parts == ["sessions"]:
+            self._require(method, "POST")
+            return 201, self._create_session(self._json(body))
+
+        if len(parts) in (2, 3) and parts[0] == "sessions":
+            session = self.sessions.get(parts[1])
+            if session is None:
+                raise HTTPError(404, "Unknown session")
+            session.last_seen = time.monotonic()
+
+            action = parts[2] if len(parts) == 3 else None
+            if action is None:
+                self._require(method, "GET")
+                return 200, self._session_state(session)
+            if action == "category":
+                self._require(method, "POST")
+                return 200, self._select_category(session, self._json(body))
+            if action == "round":
+                self._require(method, "GET")
+                return 200, await self._get_round(session)
+            if action == "answer":
+                self._require(method, "POST")
+                return 200, self._answer(session, self._json(body))
+
+        raise HTTPError(404, "Not found")
+
+    @staticmethod
+    def _require(method: str, expected: str) -> None:
+        """Reject requests with the wrong method."""
+        if method != expected:
+            raise HTTPError(405, f"Use {expected}")
+
+    @staticmethod
+    def _json(body: bytes) -> dict[str, Any]:
+        """Decode a JSON object request body. An empty body is an empty object."""
+        if not body:
+            return {}
+        try:
+            data = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise HTTPError(400, "The request body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "The request body must be a JSON object")
+        return data
+
+    @staticmethod
+    def _choice(data: dict[str, Any], key: str, count: int) -> int:
+        """Read a 1-based choice among `count` options from a request body."""
+        value = data.get(key)
+        if not isinstance(value, int) or isinstance(value, bool) or not 1 <= value <= count:
+            raise HTTPError(400, f"'{key}' must be a number between 1 and {count}")
+        return value
+
+    def _create_session(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Start a game and offer it random categories."""
+        name = data.get("name")
+        if not isinstance(name, str) or not name.strip() or len(name) > MAX_NAME_LENGTH:
+            raise HTTPError(400, f"'name' must be 1 to {MAX_NAME_LENGTH} characters")
+
+        categories = Category.get_random_categories(WIKI_MAX_DISPLAYED_CATEGORIES)
+        session = SessionModel(
+            secrets.token_urlsafe(12), name.strip(), categories, ArticleSampler.for_player(name.strip())
+        )
+        # Other sessions may be waiting for fakes of the same categories
+        session.warmer = CategoryWarmer(categories, cancel_fakes=False).start()
+        self.sessions[session.session_id] = session
+        return {
+            "session": session.session_id,
+            "categories": [category.name for category in categories],
+        }
+
+    def _session_state(self, session: SessionModel) -> dict[str, Any]:
+        """Describe the state of a game."""
+        return {
+            "name": session.player_name,
+            "category": session.category.name if session.category else None,
+            "round": session.round,
+            "rounds": self.rounds,
+            "finished": session.finished,
+        }
+
+    def _select_category(self, session: SessionModel, data: dict[str, Any]) -> dict[str, Any]:
+        """Choose the category and start building the first round."""
+        if session.category is not None:
+            raise HTTPError(409, "The category was already chosen")
+
+        choice = self._choice(data, "category", len(session.categories))
+        session.category = session.categories[choice - 1]
+        session.warmer.select(session.category)
+        session.warmer = None
+        session.next_round = self._build_round(session, ROUND_DEADLINE)
+        return {"category": session.category.name, "rounds": self.rounds}
+
+    def _build_round(self, session: SessionModel, deadline_seconds: Optional[float]) -> asyncio.Future:
+        """
+        Start assembling a round of a session on a worker thread.
+
+        Rounds the player is about to wait for get ROUND_DEADLINE; rounds built
+        while the player is still playing pass None and wait for the providers.
+        """
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(
+            self._executor, RoundBuilder.build_round, session.category, deadline_seconds, session.sampler
+        )
+
+    @staticmethod
+    def _save_sampler(session: SessionModel) -> None:
+        """Save the player's seen articles on a worker thread."""
+        asyncio.get_running_loop().run_in_executor(None, session.sampler.save)
+
+    async def _get_round(self, session: SessionModel) -> dict[str, Any]:
+        """Hand out the current round, waiting for it to be built if necessary."""
+        if session.category is None:
+            raise HTTPError(409, "Choose a category first")
+        if session.finished:
+            raise HTTPError(409, "The game is over")
+
+        if session.articles is None:
+            if session.next_round is None:
+                session.next_round = self._build_round(session, ROUND_DEADLINE)
+            pending = session.next_round
+            with Metrics.span("round_wait"):
+                # Shielded, so a dropped connection does not discard the round
+                articles = await asyncio.shield(pending)
+
+            # Concurrent requests for the same round all wait for the same build
+            if session.articles is None and session.next_round is pending:
+                session.next_round = None
+                if not articles:
+                    raise HTTPError(503, "Unable to assemble a round")
+                session.articles = articles
+                if session.round + 1 < self.rounds:
+                    session.next_round = self._build_round(session, None)
+
+            if session.articles is None:
+                raise HTTPError(503, "Unable to assemble a round")
+
+        return {
+            "round": session.round + 1,
+            "rounds": self.rounds,
+            "articles": [
+                {"number": number, "title": article.title, "summary": article.summary}
+                for number, article in enumerate(session.articles, start=1)
+            ],
+        }
+
+    def _answer(self, session: SessionModel, data: dict[str, Any]) -> dict[str, Any]:
+        """Check the player's answer and end the round."""
+        if session.articles is None:
+            raise HTTPError(409, "No round is being played")
+
+        articles: list[ArticleModel] = session.articles
+        choice = self._choice(data, "answer", len(articles))
+        correct = not articles[choice - 1].is_truth
+        session.articles = None
+        self.rounds_played += 1
+        Metrics.increment("rounds_total", {"result": "correct" if correct else "wrong"})
+
+        result: dict[str, Any] = {"correct": correct}
+        if correct:
+            session.round += 1
+        else:
+            fake_article = RoundBuilder.get_fake_article(articles)
+            result["fake"] = {"title": fake_article.title, "summary": fake_article.summary}
+
+        session.finished = not correct or session.round >= self.rounds
+        if session.finished:
+            session.cancel()
+            self._save_sampler(session)
+            result["total"] = Leaderboard.add_score(session.player_name, session.round)
+            result["rank"] = Leaderboard.rank(session.player_name)
+        result.update(round=session.round, finished=session.finished, won=correct and session.finished)
+        return result
+
+    async def _expire_sessions(self) -> None:
+        """Drop sessions that have not been used for `session_ttl` seconds."""
+        while True:
+            await asyncio.sleep(min(60, self.session_ttl))
+            cutoff = time.monotonic() - self.session_ttl
+            expired = [
+                session_id
+                for session_id, session in self.sessions.items()
+                if session.last_seen < cutoff
+            ]
+            for session_id in expired:
+                session = self.sessions.pop(session_id)
+                session.cancel()
+                if not session.finished:
+                    self._save_sampler(session)
@@ -1,14 +1,13 @@
 import random
-import textwrap
-from colorama import init, Fore, Style
+from typing import Optional
+from colorama import Fore
 
-# Initialize colorama for colorful console output
-init(autoreset=True)
-
-from src.config.settings import WIKI_MAX_DISPLAYED_CATEGORIES, CONSOLE_WIDTH
+from src.config.settings import WIKI_MAX_DISPLAYED_CATEGORIES
 from src.game.classes.category import Category
 from src.game.models.article import ArticleModel
 from src.game.models.category import CategoryModel
+from src.game.models.player import PlayerModel
+from src.game.utils.renderer import CLEAR_SEQUENCE, Screen, terminal_width, wrap_text
 
 
 class GameUI:
@@ -19,37 +18,33 @@ class GameUI:
 
         Args:
             text: The text to wrap.
-            width: The width to wrap to. If None, uses CONSOLE_WIDTH.
+            width: The width to wrap to. If None, uses the terminal width.
 
         Returns:
             str: The wrapped text.
+
+        Note:
+            Wrapped texts are cached per (text, width) by the renderer.
         """
         if width is None:
-            width = CONSOLE_WIDTH
-        return textwrap.fill(text, width=width - 4)  # -4 for indentation
+            width = terminal_width()
+        return wrap_text(text, width)
 
     @staticmethod
     def draw_welcome() -> None:
-        GameUI.clear_screen()
-        print("""
+        Screen().add("""
         \x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;128;32;32mU\x1b[38;2;97;145;89mx\x1b[38;2;159;190;106mF\x1b[38;2;144;183;86m}\x1b[38;2;146;184;66mf\x1b[38;2;165;197;66mF\x1b[38;2;175;205;71m7\x1b[38;2;186;213;80mv\x1b[38;2;168;200;71m|\x1b[38;2;122;163;53me\x1b[38;2;104;148;35mx\x1b[38;2;129;169;49m[\x1b[38;2;171;201;64m|\x1b[38;2;169;201;59m|\x1b[38;2;163;196;61mi\x1b[38;2;159;193;83mi\x1b[38;2;114;156;154m[\x1b[38;2;91;109;164m2\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;30;45;30mR\x1b[38;2;34;54;37mm\x1b[38;2;52;90;51mV\x1b[38;2;55;93;59m4\x1b[38;2;43;74;40mb\x1b[38;2;30;55;38mm\x1b[38;2;50;86;45mp\x1b[38;2;72;114;54mk\x1b[38;2;100;141;45my\x1b[38;2;125;164;48mn\x1b[38;2;176;206;73m7\x1b[38;2;177;207;64m7\x1b[38;2;124;163;53me\x1b[38;2;121;162;45me\x1b[38;2;191;215;83mT\x1b[38;2;239;247;160m=\x1b[38;2;192;214;109mL\x1b[38;2;234;246;137m;\x1b[38;2;100;133;57ma\x1b[38;2;83;124;26mw\x1b[38;2;110;155;21mY\x1b[38;2;185;213;59m)\x1b[38;2;194;220;68mL\x1b[38;2;82;113;32mk\x1b[38;2;179;206;63m7\x1b[38;2;167;200;75m|\x1b[38;2;110;152;58m5\x1b[38;2;78;94;63mh\x1b[38;2;128;128;128m5\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;85;0;0mg\x1b[38;2;98;135;49ma\x1b[38;2;100;134;42ma\x1b[38;2;106;144;54mx\x1b[38;2;102;140;45my\x1b[38;2;113;154;53m5\x1b[38;2;116;156;50mZ\x1b[38;2;115;156;48mZ\x1b[38;2;109;146;49mx\x1b[38;2;90;126;38mE\x1b[38;2;112;151;33mY\x1b[38;2;80;116;31mk\x1b[38;2;79;113;27mk\x1b[38;2;90;131;24mE\x1b[38;2;90;129;31mE\x1b[38;2;76;114;27mP\x1b[38;2;146;182;46mI\x1b[38;2;158;189;49mC\x1b[38;2;139;175;63m3\x1b[38;2;181;210;69mJ\x1b[38;2;208;228;102m/\x1b[38;2;195;217;106ms\x1b[38;2;139;174;79m3\x1b[38;2;191;212;123mL\x1b[38;2;251;254;188m:\x1b[38;2;195;217;117ms\x1b[38;2;113;145;69mY\x1b[38;2;78;108;32mP\x1b[38;2;181;210;63mJ\x1b[38;2;220;239;103m!\x1b[38;2;96;121;45mE\x1b[38;2;173;196;71m|\x1b[38;2;123;154;53mZ\x1b[38;2;161;191;76mi\x1b[38;2;166;194;76mF\x1b[38;2;117;148;65m5\x1b[38;2;68;100;87m6\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;42;0;0mW\x1b[38;2;32;60;37mH\x1b[38;2;60;96;42md\x1b[38;2;100;142;47my\x1b[38;2;123;165;58mn\x1b[38;2;145;182;62mf\x1b[38;2;111;145;45mx\x1b[38;2;139;174;54m1\x1b[38;2;157;191;59m{\x1b[38;2;153;188;52m}\x1b[38;2;128;164;43mn\x1b[38;2;129;169;46m[\x1b[38;2;155;191;46mC\x1b[38;2;163;195;56mi\x1b[38;2;102;143;37my\x1b[38;2;146;178;41m3\x1b[38;2;128;167;38mn\x1b[38;2;176;205;55m(\x1b[38;2;144;178;47m3\x1b[38;2;96;133;27m2\x1b[38;2;132;169;42m[\x1b[38;2;151;187;49m}\x1b[38;2;152;182;52mf\x1b[38;2;140;173;48m1\x1b[38;2;149;183;58mf\x1b[38;2;191;214;89mT\x1b[38;2;198;222;85ms\x1b[38;2;190;210;103mT\x1b[38;2;207;224;123m/\x1b[38;2;177;199;109m7\x1b[38;2;236;246;152m=\x1b[38;2;179;200;135m)\x1b[38;2;200;221;117mz\x1b[38;2;251;254;208m_\x1b[38;2;160;180;92mC\x1b[38;2;75;108;30m6\x1b[38;2;199;221;83ms\x1b[38;2;235;248;131m;\x1b[38;2;128;152;64mo\x1b[38;2;176;200;91m7\x1b[38;2;108;150;76m5\x1b[38;2;200;220;138mz\x1b[38;2;250;254;185m:\x1b[38;2;223;236;157m+\x1b[38;2;156;184;125mi\x1b[38;2;146;171;104mI\x1b[38;2;105;146;174me\x1b[38;2;128;0;0mR\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;144;191;169m|\x1b[38;2;170;205;199mT\x1b[38;2;93;137;111mj\x1b[38;2;88;126;113ma\x1b[38;2;60;99;73mh\x1b[38;2;44;64;50mA\x1b[38;2;88;124;43mS\x1b[38;2;31;48;25mR\x1b[38;2;101;142;21my\x1b[38;2;63;91;29m4\x1b[38;2;82;111;30mk\x1b[38;2;48;80;33mG\x1b[38;2;75;112;32mP\x1b[38;2;128;169;35mn\x1b[38;2;131;167;31mn\x1b[38;2;68;107;36m6\x1b[38;2;97;135;27m]\x1b[38;2;121;159;30mZ\x1b[38;2;134;165;41mn\x1b[38;2;74;110;25m6\x1b[38;2;104;145;29mj\x1b[38;2;153;188;47m}\x1b[38;2;149;183;42mf\x1b[38;2;78;117;23mk\x1b[38;2;107;147;25mj\x1b[38;2;151;188;40m}\x1b[38;2;110;151;52mY\x1b[38;2;151;183;43mf\x1b[38;2;142;182;39mI\x1b[38;2;207;229;94m/\x1b[38;2;189;215;89mT\x1b[38;2;221;236;124m!\x1b[38;2;235;244;158m;\x1b[38;2;199;221;103m?\x1b[38;2;206;224;121m/\x1b[38;2;154;176;121mC\x1b[38;2;250;252;210m_\x1b[38;2;167;186;130m|\x1b[38;2;252;253;206m_\x1b[38;2;247;251;190m'\x1b[38;2;206;224;124m/\x1b[38;2;195;212;116mL\x1b[38;2;87;127;53mE\x1b[38;2;193;216;92mL\x1b[38;2;238;248;151m=\x1b[38;2;159;191;93mi\x1b[38;2;110;153;90mZ\x1b[38;2;129;169;103m1\x1b[38;2;220;233;158m+\x1b[38;2;253;255;216m-\x1b[38;2;253;254;222m-\x1b[38;2;253;255;219m-\x1b[38;2;249;253;206m_\x1b[38;2;238;247;172m^\x1b[38;2;237;248;160m=\x1b[38;2;128;201;226m7\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;65;94;74m9\x1b[38;2;177;212;183ms\x1b[38;2;97;136;75my\x1b[38;2;96;136;27m]\x1b[38;2;62;74;32mG\x1b[38;2;36;60;31mX\x1b[38;2;87;127;22mS\x1b[38;2;52;76;28mb\x1b[38;2;117;163;21mZ\x1b[38;2;50;71;32mU\x1b[38;2;76;114;24mP\x1b[38;2;70;105;24mh\x1b[38;2;44;75;25mU\x1b[38;2;123;170;17me\x1b[38;2;47;63;19mK\x1b[38;2;79;118;25mq\x1b[38;2;135;177;25mt\x1b[38;2;152;189;32m}\x1b[38;2;31;55;20mm\x1b[38;2;125;168;24me\x1b[38;2;119;161;52mo\x1b[38;2;176;205;56m(\x1b[38;2;112;143;40mx\x1b[38;2;62;98;24md\x1b[38;2;104;147;24mj\x1b[38;2;155;191;41mC\x1b[38;2;172;203;47m|\x1b[38;2;151;185;54m}\x1b[38;2;116;157;51mZ\x1b[38;2;206;228;81mz\x1b[38;2;176;200;85m7\x1b[38;2;89;127;31mE\x1b[38;2;249;253;183m:\x1b[38;2;219;235;127m!\x1b[38;2;193;212;133ms\x1b[38;2;253;255;216m-\x1b[38;2;213;232;117mc\x1b[38;2;140;167;107m3\x1b[38;2;212;231;114mc\x1b[38;2;249;252;210m_\x1b[38;2;134;167;64mt\x1b[38;2;248;252;205m:\x1b[38;2;204;223;132m/\x1b[38;2;225;239;130m+\x1b[38;2;95;127;52m2\x1b[38;2;142;174;79mI\x1b[38;2;249;254;172m'\x1b[38;2;175;202;117mJ\x1b[38;2;77;120;74mS\x1b[38;2;106;149;82m5\x1b[38;2;178;207;113m)\x1b[38;2;163;198;108m(\x1b[38;2;165;196;89m|\x1b[38;2;152;188;114mi\x1b[38;2;165;197;123m(\x1b[38;2;176;204;128m)\x1b[38;2;165;198;135m7\x1b[38;2;187;183;116m|\x1b[38;2;23;35;41m#\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;63;55;57mA\x1b[38;2;58;92;49m4\x1b[38;2;116;158;38mZ\x1b[38;2;61;91;33m4\x1b[38;2;101;136;34ma\x1b[38;2;69;106;25mh\x1b[38;2;101;142;23my\x1b[38;2;81;118;23mq\x1b[38;2;40;60;27mX\x1b[38;2;78;113;26mP\x1b[38;2;71;109;39m6\x1b[38;2;93;132;20m2\x1b[38;2;42;59;21mX\x1b[38;2;99;139;19ma\x1b[38;2;76;105;24m6\x1b[38;2;124;164;31me\x1b[38;2;45;65;19mK\x1b[38;2;82;117;25mq\x1b[38;2;148;186;30mf\x1b[38;2;153;191;31m}\x1b[38;2;70;102;27m9\x1b[38;2;98;140;29ma\x1b[38;2;172;204;52m(\x1b[38;2;191;219;71mT\x1b[38;2;189;216;60mv\x1b[38;2;95;129;50m2\x1b[38;2;166;196;62mF\x1b[38;2;189;217;72mT\x1b[38;2;137;175;50m1\x1b[38;2;206;226;105m/\x1b[38;2;218;236;109mr\x1b[38;2;187;211;101mT\x1b[38;2;230;242;137m>\x1b[38;2;171;201;82m(\x1b[38;2;223;234;146m+\x1b[38;2;97;123;60m2\x1b[38;2;210;224;138m*\x1b[38;2;242;248;174m,\x1b[38;2;197;218;119m?\x1b[38;2;202;223;112mz\x1b[38;2;222;237;124m!\x1b[38;2;171;193;98m|\x1b[38;2;125;161;47me\x1b[38;2;224;236;138m+\x1b[38;2;172;201;83m(\x1b[38;2;172;202;65m(\x1b[38;2;96;124;34mE\x1b[38;2;213;225;133m*\x1b[38;2;208;229;109m*\x1b[38;2;99;138;64my\x1b[38;2;76;115;49mq\x1b[38;2;76;115;44mk\x1b[38;2;122;158;52mo\x1b[38;2;62;97;46md\x1b[38;2;101;142;46my\x1b[38;2;95;140;49my\x1b[38;2;77;117;52mq\x1b[38;2;82;123;59mS\x1b[38;2;101;144;81mx\x1b[38;2;101;135;56ma\x1b[38;2;102;136;110mx\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;51;0;0mN\x1b[38;2;116;125;139mx\x1b[38;2;68;77;89m4\x1b[38;2;57;66;71mG\x1b[38;2;70;99;61mh\x1b[38;2;83;120;42mw\x1b[38;2;80;111;42mk\x1b[38;2;88;123;33mS\x1b[38;2;51;74;28mb\x1b[38;2;70;100;31m9\x1b[38;2;74;113;32mP\x1b[38;2;87;118;22mq\x1b[38;2;71;99;28m9\x1b[38;2;51;76;25mb\x1b[38;2;48;77;26mb\x1b[38;2;80;114;23mk\x1b[38;2;71;91;24m4\x1b[38;2;70;104;23mh\x1b[38;2;85;127;36mS\x1b[38;2;100;139;25ma\x1b[38;2;85;115;28mq\x1b[38;2;112;152;24mY\x1b[38;2;147;184;35mI\x1b[38;2;165;199;43mF\x1b[38;2;165;199;41mi\x1b[38;2;115;149;47mY\x1b[38;2;162;193;68mi\x1b[38;2;181;206;81mJ\x1b[38;2;213;233;101mc\x1b[38;2;217;237;97mr\x1b[38;2;177;204;95mJ\x1b[38;2;200;222;103m?\x1b[38;2;170;197;89m|\x1b[38;2;189;212;108mT\x1b[38;2;211;229;122m*\x1b[38;2;199;219;112m?\x1b[38;2;229;242;135m<\x1b[38;2;211;229;124mc\x1b[38;2;206;225;108m/\x1b[38;2;127;162;50me\x1b[38;2;183;198;129m)\x1b[38;2;159;182;102m{\x1b[38;2;191;210;116mT\x1b[38;2;230;242;136m>\x1b[38;2;192;215;97mL\x1b[38;2;108;143;53mx\x1b[38;2;108;135;36ma\x1b[38;2;177;201;82m7\x1b[38;2;186;213;77mv\x1b[38;2;106;133;46ma\x1b[38;2;103;134;43ma\x1b[38;2;142;175;54m3\x1b[38;2;150;185;72m}\x1b[38;2;58;90;28mV\x1b[38;2;53;86;31mp\x1b[38;2;83;121;46mw\x1b[38;2;52;83;26mO\x1b[38;2;47;75;32mb\x1b[38;2;57;92;31mV\x1b[38;2;65;99;52m9\x1b[38;2;70;109;48mP\x1b[38;2;54;90;40mV\x1b[38;2;99;142;83mx\x1b[38;2;96;138;128mx\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;53;57;67mA\x1b[38;2;132;161;173mI\x1b[38;2;100;121;138my\x1b[38;2;86;112;115mE\x1b[38;2;22;30;30mB\x1b[38;2;1;1;2m@\x1b[38;2;23;36;30m$\x1b[38;2;52;76;32mG\x1b[38;2;56;83;35mO\x1b[38;2;89;130;36mE\x1b[38;2;55;89;40mV\x1b[38;2;37;59;23mH\x1b[38;2;72;104;33mh\x1b[38;2;46;76;24mb\x1b[38;2;73;110;27m6\x1b[38;2;68;101;38m9\x1b[38;2;102;145;23my\x1b[38;2;54;80;32mO\x1b[38;2;91;132;25m2\x1b[38;2;61;92;36m4\x1b[38;2;89;131;31mE\x1b[38;2;69;101;38mh\x1b[38;2;125;165;55mn\x1b[38;2;141;180;56mI\x1b[38;2;141;179;59mI\x1b[38;2;195;219;92ms\x1b[38;2;198;219;111m?\x1b[38;2;184;210;89mv\x1b[38;2;146;179;81mf\x1b[38;2;189;212;105mT\x1b[38;2;196;218;108ms\x1b[38;2;218;233;125mr\x1b[38;2;223;238;128m+\x1b[38;2;175;201;98m7\x1b[38;2;240;250;146m^\x1b[38;2;202;222;118mz\x1b[38;2;147;175;93mf\x1b[38;2;204;224;111mz\x1b[38;2;183;203;114m)\x1b[38;2;148;170;97mI\x1b[38;2;199;220;109m?\x1b[38;2;223;236;137m+\x1b[38;2;167;191;89mF\x1b[38;2;117;142;80mY\x1b[38;2;163;187;89mi\x1b[38;2;166;191;82mF\x1b[38;2;159;188;74m{\x1b[38;2;191;213;92mT\x1b[38;2;111;146;50mx\x1b[38;2;86;118;38mw\x1b[38;2;128;163;63mn\x1b[38;2;170;201;77m(\x1b[38;2;97;129;52m]\x1b[38;2;68;105;37mh\x1b[38;2;80;116;40mq\x1b[38;2;94;135;36m]\x1b[38;2;80;115;27mk\x1b[38;2;44;71;35mU\x1b[38;2;86;124;69mE\x1b[38;2;75;111;57mk\x1b[38;2;52;86;37mp\x1b[38;2;70;111;49mP\x1b[38;2;100;140;86mx\x1b[38;2;116;151;106mo\x1b[38;2;136;34;34mG\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;97;107;121mE\x1b[38;2;136;158;173m3\x1b[38;2;45;50;53mH\x1b[38;2;32;44;43mR\x1b[38;2;57;90;74md\x1b[38;2;98;128;122my\x1b[38;2;10;16;14mW\x1b[38;2;6;11;9mQ\x1b[38;2;14;21;19mM\x1b[38;2;6;8;8m%\x1b[38;2;13;17;16mN\x1b[38;2;42;56;56mX\x1b[38;2;64;100;83m6\x1b[38;2;41;66;52mA\x1b[38;2;24;31;29mB\x1b[38;2;65;60;53mU\x1b[38;2;62;56;57mA\x1b[38;2;108;71;60md\x1b[38;2;108;62;46mV\x1b[38;2;93;50;39mb\x1b[38;2;98;46;41mb\x1b[38;2;100;40;38mA\x1b[38;2;121;49;42mp\x1b[38;2;128;51;42mV\x1b[38;2;150;62;45mh\x1b[38;2;180;71;45mw\x1b[38;2;199;74;46m2\x1b[38;2;199;76;47m2\x1b[38;2;197;78;48m]\x1b[38;2;170;72;49mw\x1b[38;2;184;95;68my\x1b[38;2;179;127;109mn\x1b[38;2;238;241;222m,\x1b[38;2;159;189;82m{\x1b[38;2;232;239;194m;\x1b[38;2;130;154;91mn\x1b[38;2;196;221;91ms\x1b[38;2;163;195;79mF\x1b[38;2;87;122;61mE\x1b[38;2;190;216;72mT\x1b[38;2;198;219;97ms\x1b[38;2;155;177;81m}\x1b[38;2;66;94;62m9\x1b[38;2;155;186;88m{\x1b[38;2;177;201;89m7\x1b[38;2;52;70;47mb\x1b[38;2;155;189;74m{\x1b[38;2;134;174;80m3\x1b[38;2;80;116;60mw\x1b[38;2;97;139;62my\x1b[38;2;110;151;80mZ\x1b[38;2;86;127;80m2\x1b[38;2;58;95;60md\x1b[38;2;117;158;66mo\x1b[38;2;66;101;48mh\x1b[38;2;82;123;69mE\x1b[38;2;96;138;72my\x1b[38;2;69;110;84mk\x1b[38;2;94;93;82mP\x1b[38;2;139;93;78mE\x1b[38;2;114;154;181mt\x1b[38;2;95;73;87m9\x1b[38;2;129;104;104m]\x1b[38;2;126;105;101m]\x1b[38;2;158;109;121mY\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;166;191;204mJ\x1b[38;2;50;58;62mA\x1b[38;2;64;81;88m4\x1b[38;2;12;16;17mN\x1b[38;2;6;9;9m%\x1b[38;2;84;128;108m]\x1b[38;2;45;78;54mG\x1b[38;2;33;62;41mX\x1b[38;2;33;59;46mX\x1b[38;2;61;91;79md\x1b[38;2;50;84;68mp\x1b[38;2;61;100;79mh\x1b[38;2;32;48;57mm\x1b[38;2;7;8;11m%\x1b[38;2;84;62;74mp\x1b[38;2;115;58;59mV\x1b[38;2;101;44;38mU\x1b[38;2;119;50;42mp\x1b[38;2;99;38;36mA\x1b[38;2;104;36;32mA\x1b[38;2;179;87;72m]\x1b[38;2;232;156;157m(\x1b[38;2;245;217;234m>\x1b[38;2;228;156;191m7\x1b[38;2;250;235;229m,\x1b[38;2;242;158;122m(\x1b[38;2;204;108;79mo\x1b[38;2;171;80;64mE\x1b[38;2;182;78;67m2\x1b[38;2;192;77;59m2\x1b[38;2;196;76;52m2\x1b[38;2;175;72;53mw\x1b[38;2;148;63;49mh\x1b[38;2;116;51;43mO\x1b[38;2;107;47;41mG\x1b[38;2;110;49;41mG\x1b[38;2;104;37;35mA\x1b[38;2;138;55;46md\x1b[38;2;60;55;53mA\x1b[38;2;57;85;64mV\x1b[38;2;97;120;85m2\x1b[38;2;63;55;63mU\x1b[38;2;64;45;50mX\x1b[38;2;118;62;64md\x1b[38;2;125;59;54m4\x1b[38;2;93;43;40mA\x1b[38;2;69;44;47mX\x1b[38;2;89;37;35mK\x1b[38;2;116;50;43mO\x1b[38;2;117;53;47mp\x1b[38;2;121;64;61md\x1b[38;2;130;113;122mj\x1b[38;2;159;170;180m{\x1b[38;2;127;153;172mt\x1b[38;2;149;205;221mv\x1b[38;2;177;224;237m*\x1b[38;2;218;242;248m^\x1b[38;2;183;200;209mL\x1b[38;2;108;83;89mP\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;50;55;60mK\x1b[38;2;121;151;157m[\x1b[38;2;64;84;82m4\x1b[38;2;46;71;60mb\x1b[38;2;14;19;23mM\x1b[38;2;34;48;41m8\x1b[38;2;34;49;51mm\x1b[38;2;18;32;25mB\x1b[38;2;8;13;13mQ\x1b[38;2;1;1;2m@\x1b[38;2;5;4;6m&\x1b[38;2;10;8;12mQ\x1b[38;2;81;61;99mp\x1b[38;2;123;95;132m2\x1b[38;2;129;82;92mq\x1b[38;2;114;55;51mp\x1b[38;2;101;46;41mb\x1b[38;2;128;57;47m4\x1b[38;2;201;106;77mZ\x1b[38;2;202;152;158m{\x1b[38;2;114;94;126mS\x1b[38;2;91;91;107mk\x1b[38;2;35;36;48mD\x1b[38;2;22;18;22mM\x1b[38;2;42;48;80mX\x1b[38;2;162;143;168m3\x1b[38;2;202;174;207m)\x1b[38;2;241;217;229m<\x1b[38;2;234;176;180mT\x1b[38;2;204;121;114mt\x1b[38;2;188;84;77ma\x1b[38;2;187;79;71m]\x1b[38;2;185;78;69m2\x1b[38;2;170;78;63mS\x1b[38;2;153;67;52mP\x1b[38;2;146;61;48mh\x1b[38;2;134;54;44m4\x1b[38;2;115;45;39mG\x1b[38;2;144;61;47mh\x1b[38;2;151;62;45mh\x1b[38;2;150;65;52m6\x1b[38;2;143;64;51mh\x1b[38;2;141;61;50m9\x1b[38;2;143;64;54mh\x1b[38;2;184;81;59m2\x1b[38;2;194;77;45m2\x1b[38;2;125;51;39mp\x1b[38;2;94;42;38mA\x1b[38;2;208;99;63mY\x1b[38;2;125;65;59m9\x1b[38;2;223;130;89m3\x1b[38;2;115;94;102mw\x1b[38;2;120;107;120m]\x1b[38;2;234;140;65m}\x1b[38;2;182;202;75m7\x1b[38;2;204;232;231m<\x1b[38;2;221;244;251m,\x1b[38;2;208;230;238m<\x1b[38;2;153;102;102my\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;66;95;116m6\x1b[38;2;70;87;98m9\x1b[38;2;62;76;87mV\x1b[38;2;46;59;58mK\x1b[38;2;28;35;39m#\x1b[38;2;41;60;51mK\x1b[38;2;60;85;79m4\x1b[38;2;52;67;69mb\x1b[38;2;56;63;74mb\x1b[38;2;56;67;88mG\x1b[38;2;51;59;91mU\x1b[38;2;100;98;106mw\x1b[38;2;154;151;158m3\x1b[38;2;197;172;206mJ\x1b[38;2;120;91;114mS\x1b[38;2;84;49;54mU\x1b[38;2;121;58;52m4\x1b[38;2;202;104;77m5\x1b[38;2;238;142;91mC\x1b[38;2;233;137;86m}\x1b[38;2;221;176;113m7\x1b[38;2;196;157;123mC\x1b[38;2;202;157;120m{\x1b[38;2;162;92;66m2\x1b[38;2;64;41;45mH\x1b[38;2;31;25;28mB\x1b[38;2;14;16;18mN\x1b[38;2;34;34;44mD\x1b[38;2;115;105;122m2\x1b[38;2;188;163;213m|\x1b[38;2;212;165;188m7\x1b[38;2;230;130;137m}\x1b[38;2;221;111;120mt\x1b[38;2;42;26;30m$\x1b[38;2;221;113;122mt\x1b[38;2;212;94;103m5\x1b[38;2;223;113;122mt\x1b[38;2;66;31;34m8\x1b[38;2;221;112;121mt\x1b[38;2;216;120;126m1\x1b[38;2;180;164;182mi\x1b[38;2;132;130;165mo\x1b[38;2;179;153;167mC\x1b[38;2;168;154;160mf\x1b[38;2;172;90;92ma\x1b[38;2;219;102;69mZ\x1b[38;2;210;86;46my\x1b[38;2;153;59;41mh\x1b[38;2;163;67;46mk\x1b[38;2;226;137;83mf\x1b[38;2;103;67;74md\x1b[38;2;199;102;65mY\x1b[38;2;189;117;91mo\x1b[38;2;214;103;54mZ\x1b[38;2;217;182;78m7\x1b[38;2;199;221;127mz\x1b[38;2;220;242;250m^\x1b[38;2;193;226;236mr\x1b[38;2;178;151;155m}\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;51;78;102mV\x1b[38;2;54;63;66mU\x1b[38;2;5;4;5m&\x1b[38;2;104;136;138mY\x1b[38;2;64;93;93mh\x1b[38;2;70;107;91mk\x1b[38;2;57;75;70mO\x1b[38;2;55;69;73mG\x1b[38;2;90;102;111mw\x1b[38;2;139;155;168m3\x1b[38;2;166;168;190mi\x1b[38;2;106;70;85m9\x1b[38;2;199;174;200mJ\x1b[38;2;188;163;185mF\x1b[38;2;180;151;176mC\x1b[38;2;142;103;115my\x1b[38;2;101;54;59mO\x1b[38;2;147;63;47mh\x1b[38;2;196;128;93m[\x1b[38;2;194;217;171mz\x1b[38;2;215;235;189m<\x1b[38;2;205;228;185mr\x1b[38;2;120;154;121mn\x1b[38;2;178;208;171mL\x1b[38;2;200;225;187mc\x1b[38;2;176;206;160mT\x1b[38;2;157;184;119mi\x1b[38;2;205;229;192m!\x1b[38;2;201;224;199mc\x1b[38;2;189;220;188m/\x1b[38;2;202;221;183m*\x1b[38;2;230;216;230m+\x1b[38;2;228;206;225mr\x1b[38;2;245;203;224m!\x1b[38;2;35;29;33m$\x1b[38;2;245;213;232m<\x1b[38;2;245;183;212mz\x1b[38;2;245;189;215m*\x1b[38;2;74;54;64mb\x1b[38;2;244;205;225m!\x1b[38;2;179;173;191m(\x1b[38;2;234;245;207m^\x1b[38;2;185;217;192mz\x1b[38;2;204;223;152m*\x1b[38;2;138;167;156mf\x1b[38;2;209;225;152mc\x1b[38;2;149;178;135mC\x1b[38;2;210;216;172m*\x1b[38;2;162;195;161m7\x1b[38;2;178;208;188mL\x1b[38;2;171;177;142mF\x1b[38;2;248;189;119ms\x1b[38;2;113;81;70m6\x1b[38;2;169;93;74ma\x1b[38;2;211;90;51mx\x1b[38;2;214;190;77mJ\x1b[38;2;237;231;167m<\x1b[38;2;219;242;249m^\x1b[38;2;161;200;162mJ\x1b[38;2;74;115;78mw\x1b[38;2;128;0;128mK\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;176;209;222m?\x1b[38;2;9;10;12mQ\x1b[38;2;67;97;86mh\x1b[38;2;63;102;82m6\x1b[38;2;81;123;102m2\x1b[38;2;50;85;64mp\x1b[38;2;70;106;87mk\x1b[38;2;154;165;172mC\x1b[38;2;140;152;159m1\x1b[38;2;90;128;112ma\x1b[38;2;165;148;183mf\x1b[38;2;75;73;96m4\x1b[38;2;170;137;163m1\x1b[38;2;122;87;100mw\x1b[38;2;156;107;113mx\x1b[38;2;203;136;137mI\x1b[38;2;196;112;92mo\x1b[38;2;210;106;64mZ\x1b[38;2;206;228;194m!\x1b[38;2;167;204;164mv\x1b[38;2;161;183;168m|\x1b[38;2;149;135;156mn\x1b[38;2;121;112;145my\x1b[38;2;80;72;103m4\x1b[38;2;41;44;59mm\x1b[38;2;15;17;16mN\x1b[38;2;51;65;64mU\x1b[38;2;88;132;108my\x1b[38;2;93;133;113my\x1b[38;2;181;210;166mL\x1b[38;2;142;185;156mi\x1b[38;2;187;207;200m?\x1b[38;2;148;107;151mx\x1b[38;2;206;135;173m}\x1b[38;2;22;18;23mM\x1b[38;2;226;151;187m(\x1b[38;2;220;138;176m{\x1b[38;2;207;124;161m3\x1b[38;2;62;37;49mm\x1b[38;2;212;130;166mf\x1b[38;2;152;163;171m}\x1b[38;2;145;182;196mF\x1b[38;2;146;164;171m}\x1b[38;2;148;181;158mi\x1b[38;2;175;196;174m)\x1b[38;2;146;179;145m{\x1b[38;2;94;137;116mx\x1b[38;2;132;176;146m}\x1b[38;2;186;220;182mz\x1b[38;2;128;176;156mf\x1b[38;2;198;224;187mc\x1b[38;2;111;160;172mt\x1b[38;2;221;202;134ms\x1b[38;2;218;145;95m}\x1b[38;2;198;82;49m]\x1b[38;2;190;144;93m3\x1b[38;2;192;222;231mc\x1b[38;2;221;244;251m,\x1b[38;2;107;147;95m5\x1b[38;2;48;82;34mG\x1b[38;2;59;17;17m$\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;128;128;149m5\x1b[38;2;118;152;166m[\x1b[38;2;7;10;10mQ\x1b[38;2;13;21;19mM\x1b[38;2;43;66;55mA\x1b[38;2;24;34;33m$\x1b[38;2;38;55;55mX\x1b[38;2;67;90;85m9\x1b[38;2;70;101;88mP\x1b[38;2;106;148;137mo\x1b[38;2;79;94;116mP\x1b[38;2;95;116;139m]\x1b[38;2;126;141;164mn\x1b[38;2;165;125;152mn\x1b[38;2;107;75;88mh\x1b[38;2;123;79;89mk\x1b[38;2;208;143;145mC\x1b[38;2;98;60;57mp\x1b[38;2;133;102;102m]\x1b[38;2;149;153;161m3\x1b[38;2;145;116;135mY\x1b[38;2;142;110;135mx\x1b[38;2;91;74;106m9\x1b[38;2;58;55;58mA\x1b[38;2;90;90;93mP\x1b[38;2;244;246;247m:\x1b[38;2;234;235;237m^\x1b[38;2;49;50;52mX\x1b[38;2;35;36;37mD\x1b[38;2;65;73;89mp\x1b[38;2;23;25;31mg\x1b[38;2;3;4;6m&\x1b[38;2;1;1;2m@\x1b[38;2;1;1;2m@\x1b[38;2;34;25;41m$\x1b[38;2;193;161;197m|\x1b[38;2;247;232;242m,\x1b[38;2;254;254;254m.\x1b[38;2;250;234;241m,\x1b[38;2;156;118;121m5\x1b[38;2;1;1;2m@\x1b[38;2;1;1;2m@\x1b[38;2;1;2;3m@\x1b[38;2;23;29;37mB\x1b[38;2;59;55;76mU\x1b[38;2;70;56;91mG\x1b[38;2;95;86;110mP\x1b[38;2;86;77;83md\x1b[38;2;78;57;66mG\x1b[38;2;73;60;71mG\x1b[38;2;79;88;105m6\x1b[38;2;105;136;133mY\x1b[38;2;123;165;139m1\x1b[38;2;169;176;159mF\x1b[38;2;204;153;117mC\x1b[38;2;81;87;104m6\x1b[38;2;120;115;137mj\x1b[38;2;157;163;170m}\x1b[38;2;218;240;247m=\x1b[38;2;62;98;35md\x1b[38;2;18;32;18mB\x1b[38;2;35;40;30mD\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;44;110;153mk\x1b[38;2;25;26;29mg\x1b[38;2;43;63;56mA\x1b[38;2;43;71;54mU\x1b[38;2;44;78;55mG\x1b[38;2;23;25;25mg\x1b[38;2;27;42;37mD\x1b[38;2;63;82;83m4\x1b[38;2;41;49;58mH\x1b[38;2;56;64;78mb\x1b[38;2;77;93;117mP\x1b[38;2;105;122;144mj\x1b[38;2;160;146;183mI\x1b[38;2;172;132;159mt\x1b[38;2;123;89;103mw\x1b[38;2;91;63;74mV\x1b[38;2;77;47;52mA\x1b[38;2;94;54;54mG\x1b[38;2;148;126;120mZ\x1b[38;2;151;139;139m[\x1b[38;2;94;72;67m4\x1b[38;2;37;28;31m$\x1b[38;2;106;106;106mE\x1b[38;2;97;97;98mq\x1b[38;2;100;100;101mw\x1b[38;2;100;100;101mw\x1b[38;2;96;96;97mq\x1b[38;2;91;91;93mP\x1b[38;2;61;61;65mb\x1b[38;2;21;22;28m0\x1b[38;2;113;119;131my\x1b[38;2;70;74;78mV\x1b[38;2;10;10;13mQ\x1b[38;2;50;42;58mm\x1b[38;2;149;122;165mo\x1b[38;2;218;188;218m?\x1b[38;2;250;238;246m'\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;236;231;231m=\x1b[38;2;20;19;20mM\x1b[38;2;4;4;5m&\x1b[38;2;89;93;95mP\x1b[38;2;130;134;136mZ\x1b[38;2;139;146;148m[\x1b[38;2;15;18;19mN\x1b[38;2;1;1;2m@\x1b[38;2;3;4;6m&\x1b[38;2;114;118;123my\x1b[38;2;134;139;146me\x1b[38;2;42;37;43mR\x1b[38;2;99;99;106mw\x1b[38;2;101;95;94mq\x1b[38;2;210;193;182mL\x1b[38;2;249;186;140ms\x1b[38;2;91;94;104mk\x1b[38;2;93;114;135m]\x1b[38;2;188;198;208mL\x1b[38;2;193;220;198m*\x1b[38;2;17;21;22mM\x1b[38;2;9;12;11mQ\x1b[38;2;18;28;22mg\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;153;204;204mv\x1b[38;2;104;118;121ma\x1b[38;2;41;57;57mK\x1b[38;2;106;156;162mn\x1b[38;2;21;31;28mB\x1b[38;2;26;40;35mD\x1b[38;2;100;142;130m5\x1b[38;2;66;101;85m6\x1b[38;2;52;76;67mO\x1b[38;2;53;71;71mG\x1b[38;2;70;88;107mh\x1b[38;2;99;126;147mj\x1b[38;2;106;124;144mj\x1b[38;2;152;134;174m[\x1b[38;2;154;118;138mZ\x1b[38;2;131;94;105mE\x1b[38;2;91;64;75mV\x1b[38;2;92;58;65mO\x1b[38;2;137;76;76mk\x1b[38;2;89;52;52mb\x1b[38;2;111;84;85mP\x1b[38;2;194;169;168m|\x1b[38;2;203;196;198ms\x1b[38;2;114;124;143mx\x1b[38;2;135;123;154m5\x1b[38;2;208;201;221mz\x1b[38;2;234;232;238m=\x1b[38;2;241;239;243m,\x1b[38;2;236;236;239m^\x1b[38;2;223;206;223mc\x1b[38;2;193;174;197m7\x1b[38;2;176;156;188m{\x1b[38;2;209;196;218m?\x1b[38;2;248;248;250m_\x1b[38;2;238;219;234m>\x1b[38;2;216;187;216ms\x1b[38;2;199;172;194mJ\x1b[38;2;234;214;219m+\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;251;220;201m>\x1b[38;2;248;181;136mL\x1b[38;2;253;253;253m.\x1b[38;2;242;244;246m:\x1b[38;2;246;246;249m_\x1b[38;2;253;253;253m.\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;251;242;248m:\x1b[38;2;253;251;253m-\x1b[38;2;233;232;235m=\x1b[38;2;67;55;52mU\x1b[38;2;118;100;97mE\x1b[38;2;175;92;71ma\x1b[38;2;214;99;57m5\x1b[38;2;60;61;65mb\x1b[38;2;72;94;119mP\x1b[38;2;144;162;176mf\x1b[38;2;168;196;116m(\x1b[38;2;14;15;17mN\x1b[38;2;13;16;15mN\x1b[38;2;29;14;16mM\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;130;188;219m|\x1b[38;2;59;75;87mp\x1b[38;2;1;1;2m@\x1b[38;2;3;3;4m&\x1b[38;2;31;36;46mD\x1b[38;2;89;121;117m]\x1b[38;2;88;124;139ma\x1b[38;2;50;60;68mA\x1b[38;2;71;82;93md\x1b[38;2;71;85;93m9\x1b[38;2;78;85;99mh\x1b[38;2;71;87;111mh\x1b[38;2;126;126;156m5\x1b[38;2;164;133;159mt\x1b[38;2;139;100;110m]\x1b[38;2;133;95;105m2\x1b[38;2;125;84;95mq\x1b[38;2;139;101;113ma\x1b[38;2;179;133;142mt\x1b[38;2;203;147;154mC\x1b[38;2;245;219;216m>\x1b[38;2;253;250;248m-\x1b[38;2;254;254;254m.\x1b[38;2;255;255;255m`\x1b[38;2;235;235;236m^\x1b[38;2;211;211;212m*\x1b[38;2;211;211;211m*\x1b[38;2;141;140;146mn\x1b[38;2;134;132;139mo\x1b[38;2;208;208;210m/\x1b[38;2;206;206;208m/\x1b[38;2;222;199;222m/\x1b[38;2;218;188;216m?\x1b[38;2;236;205;229mr\x1b[38;2;228;198;224m*\x1b[38;2;203;174;203m)\x1b[38;2;171;137;161m1\x1b[38;2;224;191;192m?\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;247;198;174m*\x1b[38;2;215;101;62mZ\x1b[38;2;245;167;128m)\x1b[38;2;251;249;245m_\x1b[38;2;84;81;88m9\x1b[38;2;34;32;39m#\x1b[38;2;53;56;68mA\x1b[38;2;58;62;72mb\x1b[38;2;48;47;52mH\x1b[38;2;35;33;38m#\x1b[38;2;95;93;99mk\x1b[38;2;244;243;246m:\x1b[38;2;240;234;235m^\x1b[38;2;126;104;99m2\x1b[38;2;247;191;163mz\x1b[38;2;134;41;36mO\x1b[38;2;23;14;13mN\x1b[38;2;62;77;104m4\x1b[38;2;186;199;209mL\x1b[38;2;89;110;82mw\x1b[38;2;18;27;16m0\x1b[38;2;27;40;29mD\x1b[38;2;81;115;89mS\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;98;174;215mI\x1b[38;2;21;28;32mB\x1b[38;2;53;82;97mV\x1b[38;2;24;28;30mB\x1b[38;2;55;69;71mG\x1b[38;2;70;85;96m9\x1b[38;2;1;1;2m@\x1b[38;2;2;1;3m@\x1b[38;2;5;7;10m%\x1b[38;2;31;37;49mD\x1b[38;2;74;63;107mp\x1b[38;2;109;140;172mo\x1b[38;2;155;124;152me\x1b[38;2;135;99;112m]\x1b[38;2;117;83;96mk\x1b[38;2;111;77;90m6\x1b[38;2;102;71;82m9\x1b[38;2;108;76;89m6\x1b[38;2;131;86;95mw\x1b[38;2;156;97;97ma\x1b[38;2;195;127;119mt\x1b[38;2;237;158;144m7\x1b[38;2;249;210;198m+\x1b[38;2;255;254;253m.\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;240;246;250m:\x1b[38;2;203;185;205mT\x1b[38;2;207;178;208mv\x1b[38;2;190;162;188mF\x1b[38;2;96;74;86m9\x1b[38;2;21;20;22m0\x1b[38;2;250;213;196m+\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;253;227;204m=\x1b[38;2;153;72;52mk\x1b[38;2;198;102;73mY\x1b[38;2;251;205;178mr\x1b[38;2;254;244;238m:\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;254;254m.\x1b[38;2;255;246;237m_\x1b[38;2;254;245;237m_\x1b[38;2;251;214;194m+\x1b[38;2;95;22;22mm\x1b[38;2;19;9;9mW\x1b[38;2;124;158;177m1\x1b[38;2;180;202;205mL\x1b[38;2;41;51;30mm\x1b[38;2;50;81;31mG\x1b[38;2;19;24;18m0\x1b[38;2;105;145;59mx\x1b[38;2;91;125;69m2\x1b[38;2;51;0;0mN\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;145;196;214mJ\x1b[38;2;85;107;116mS\x1b[38;2;17;22;22m0\x1b[38;2;34;49;43mm\x1b[38;2;108;118;126my\x1b[38;2;67;39;42mH\x1b[38;2;139;77;88mq\x1b[38;2;176;110;129mZ\x1b[38;2;95;53;56mG\x1b[38;2;65;58;76mb\x1b[38;2;136;132;168me\x1b[38;2;127;163;198mI\x1b[38;2;160;141;171m1\x1b[38;2;155;125;145me\x1b[38;2;143;110;130mx\x1b[38;2;111;80;93mP\x1b[38;2;83;57;65mG\x1b[38;2;75;53;60mU\x1b[38;2;67;47;52mK\x1b[38;2;72;50;56mA\x1b[38;2;72;50;56mA\x1b[38;2;95;55;62mO\x1b[38;2;134;64;57mh\x1b[38;2;204;109;79mo\x1b[38;2;242;162;128m7\x1b[38;2;251;219;202m>\x1b[38;2;254;246;242m_\x1b[38;2;255;253;252m.\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;254;249;246m-\x1b[38;2;213;182;188mT\x1b[38;2;45;33;40mD\x1b[38;2;8;6;7m%\x1b[38;2;47;43;47mm\x1b[38;2;233;154;121mF\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;249;233;173m;\x1b[38;2;70;33;27m8\x1b[38;2;243;166;134mJ\x1b[38;2;254;248;243m-\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;254m.\x1b[38;2;254;244;236m:\x1b[38;2;249;198;173m*\x1b[38;2;240;149;109mF\x1b[38;2;234;131;84mI\x1b[38;2;233;128;81mI\x1b[38;2;234;145;110m{\x1b[38;2;124;53;49mV\x1b[38;2;23;15;14mN\x1b[38;2;106;140;159mZ\x1b[38;2;102;142;130m5\x1b[38;2;64;101;29m9\x1b[38;2;27;43;24mD\x1b[38;2;36;59;30mH\x1b[38;2;33;55;33mm\x1b[38;2;118;159;112mn\x1b[38;2;153;0;51mX\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;142;181;200mF\x1b[38;2;78;112;125mS\x1b[38;2;1;1;2m@\x1b[38;2;6;8;10m%\x1b[38;2;145;148;152mt\x1b[38;2;150;91;93m2\x1b[38;2;220;151;178m|\x1b[38;2;217;187;209ms\x1b[38;2;107;81;106mP\x1b[38;2;27;24;29mg\x1b[38;2;114;121;126mj\x1b[38;2;134;176;210m{\x1b[38;2;153;169;196m{\x1b[38;2;184;166;186mF\x1b[38;2;191;166;191m|\x1b[38;2;179;150;176m}\x1b[38;2;140;105;121my\x1b[38;2;96;67;78m4\x1b[38;2;73;51;56mU\x1b[38;2;77;51;57mU\x1b[38;2;70;49;55mA\x1b[38;2;48;36;41mR\x1b[38;2;44;33;37mD\x1b[38;2;73;36;36mH\x1b[38;2;145;56;39md\x1b[38;2;212;93;55mx\x1b[38;2;240;145;101mi\x1b[38;2;249;200;179mc\x1b[38;2;253;239;230m'\x1b[38;2;253;246;242m_\x1b[38;2;251;208;187m!\x1b[38;2;220;137;110mf\x1b[38;2;95;39;33mA\x1b[38;2;12;10;11mQ\x1b[38;2;157;98;92ma\x1b[38;2;113;45;38mG\x1b[38;2;54;12;13mg\x1b[38;2;231;164;162mJ\x1b[38;2;244;195;199m*\x1b[38;2;232;158;159m7\x1b[38;2;197;127;116mt\x1b[38;2;49;19;20mB\x1b[38;2;179;135;122mt\x1b[38;2;87;42;35mK\x1b[38;2;242;182;157ms\x1b[38;2;253;237;227m'\x1b[38;2;255;255;255m`\x1b[38;2;254;252;250m.\x1b[38;2;253;225;209m;\x1b[38;2;245;157;106m(\x1b[38;2;230;109;54me\x1b[38;2;214;89;47mj\x1b[38;2;181;71;45mw\x1b[38;2;159;68;51mk\x1b[38;2;100;54;51mO\x1b[38;2;188;111;92mZ\x1b[38;2;81;62;62mO\x1b[38;2;105;142;167mo\x1b[38;2;105;153;130mo\x1b[38;2;79;108;64mk\x1b[38;2;106;146;88mY\x1b[38;2;95;138;94mj\x1b[38;2;104;102;74mw\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;128;0;0mR\x1b[38;2;87;106;124mS\x1b[38;2;8;8;10m%\x1b[38;2;18;23;28m0\x1b[38;2;189;194;198mT\x1b[38;2;199;178;184mJ\x1b[38;2;237;221;228m>\x1b[38;2;191;143;176m}\x1b[38;2;93;52;84mO\x1b[38;2;27;24;27mg\x1b[38;2;218;225;246m<\x1b[38;2;206;229;242m<\x1b[38;2;145;161;197m}\x1b[38;2;179;174;195m(\x1b[38;2;201;181;203mv\x1b[38;2;202;182;203mv\x1b[38;2;191;164;189m|\x1b[38;2;146;113;133mY\x1b[38;2;108;76;89m6\x1b[38;2;128;91;101mS\x1b[38;2;149;108;119mj\x1b[38;2;133;92;101mE\x1b[38;2;86;51;55mb\x1b[38;2;74;41;41mX\x1b[38;2;102;47;41mb\x1b[38;2;164;67;48mk\x1b[38;2;211;96;60mY\x1b[38;2;240;145;104mi\x1b[38;2;246;170;138mv\x1b[38;2;245;163;128mJ\x1b[38;2;198;102;72mY\x1b[38;2;90;23;22m8\x1b[38;2;210;145;118m}\x1b[38;2;29;23;26mg\x1b[38;2;26;11;11mN\x1b[38;2;1;1;2m@\x1b[38;2;1;1;2m@\x1b[38;2;2;3;4m@\x1b[38;2;1;1;2m@\x1b[38;2;4;5;6m&\x1b[38;2;1;1;2m@\x1b[38;2;1;1;2m@\x1b[38;2;48;23;25m$\x1b[38;2;188;150;137m}\x1b[38;2;100;46;42mb\x1b[38;2;224;133;105mf\x1b[38;2;250;197;173m*\x1b[38;2;246;183;161ms\x1b[38;2;246;166;118mJ\x1b[38;2;235;121;62m1\x1b[38;2;217;92;47mx\x1b[38;2;187;74;44mE\x1b[38;2;145;57;43m9\x1b[38;2;107;48;42mG\x1b[38;2;121;56;48mV\x1b[38;2;217;108;74me\x1b[38;2;251;221;202m>\x1b[38;2;3;3;4m&\x1b[38;2;17;15;17mN\x1b[38;2;95;63;86mV\x1b[38;2;188;206;216m?\x1b[38;2;81;107;121mw\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;31;12;13mM\x1b[38;2;127;156;176m1\x1b[38;2;12;12;16mW\x1b[38;2;212;191;190ms\x1b[38;2;240;233;233m^\x1b[38;2;241;200;220mr\x1b[38;2;224;144;181mF\x1b[38;2;108;73;97mh\x1b[38;2;71;72;85mV\x1b[38;2;177;155;203m{\x1b[38;2;198;207;224m/\x1b[38;2;168;161;194m{\x1b[38;2;185;161;187mF\x1b[38;2;195;171;197m7\x1b[38;2;192;168;193m(\x1b[38;2;174;143;168mI\x1b[38;2;130;99;117m]\x1b[38;2;136;97;106m2\x1b[38;2;171;122;127me\x1b[38;2;188;127;124mt\x1b[38;2;172;105;103mY\x1b[38;2;119;57;53mV\x1b[38;2;115;52;45mp\x1b[38;2;168;70;53mq\x1b[38;2;223;112;72mn\x1b[38;2;235;143;106m{\x1b[38;2;224;120;82mt\x1b[38;2;176;75;49mS\x1b[38;2;220;143;116mC\x1b[38;2;255;255;254m.\x1b[38;2;253;239;230m'\x1b[38;2;248;164;90m7\x1b[38;2;203;83;48ma\x1b[38;2;137;53;41m4\x1b[38;2;69;28;28mR\x1b[38;2;22;13;14mN\x1b[38;2;1;1;2m@\x1b[38;2;99;35;23mK\x1b[38;2;223;114;61mn\x1b[38;2;251;204;172mc\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;248;243;242m:\x1b[38;2;78;26;22m8\x1b[38;2;210;101;67m5\x1b[38;2;233;137;97m}\x1b[38;2;238;136;84m}\x1b[38;2;227;107;54me\x1b[38;2;213;89;47mj\x1b[38;2;168;69;47mq\x1b[38;2;134;60;51md\x1b[38;2;124;59;53m4\x1b[38;2;194;85;53ma\x1b[38;2;221;97;48m5\x1b[38;2;246;171;138mv\x1b[38;2;3;3;4m&\x1b[38;2;83;57;67mG\x1b[38;2;205;165;193m7\x1b[38;2;188;191;196mv\x1b[38;2;46;46;64mH\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;70;91;105mh\x1b[38;2;122;137;147mo\x1b[38;2;7;9;10m%\x1b[38;2;77;77;78m4\x1b[38;2;65;64;65mG\x1b[38;2;210;194;209m?\x1b[38;2;252;251;252m-\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;238;206;226m!\x1b[38;2;113;120;127my\x1b[38;2;155;145;179m3\x1b[38;2;162;140;166m1\x1b[38;2;178;148;173m}\x1b[38;2;185;158;182mi\x1b[38;2;179;150;176m}\x1b[38;2;155;120;143mZ\x1b[38;2;132;96;108m2\x1b[38;2;150;106;114mj\x1b[38;2;184;124;124mn\x1b[38;2;202;130;119m1\x1b[38;2;201;122;106m[\x1b[38;2;181;87;70ma\x1b[38;2;190;93;71mj\x1b[38;2;194;98;71mx\x1b[38;2;191;88;63my\x1b[38;2;171;81;64mE\x1b[38;2;254;252;234m-\x1b[38;2;254;253;251m.\x1b[38;2;254;248;241m_\x1b[38;2;253;220;183m<\x1b[38;2;250;166;88m7\x1b[38;2;237;123;55m1\x1b[38;2;200;93;66mx\x1b[38;2;241;164;114m7\x1b[38;2;250;222;200m>\x1b[38;2;251;185;120ms\x1b[38;2;252;217;189m<\x1b[38;2;252;226;200m;\x1b[38;2;252;209;149mr\x1b[38;2;252;225;196m;\x1b[38;2;255;253;251m.\x1b[38;2;255;255;255m`\x1b[38;2;255;254;254m.\x1b[38;2;77;49;48mA\x1b[38;2;205;92;58mx\x1b[38;2;237;141;102m{\x1b[38;2;235;133;89mf\x1b[38;2;220;109;69me\x1b[38;2;192;89;69my\x1b[38;2;179;86;67m]\x1b[38;2;192;93;70mj\x1b[38;2;217;97;53m5\x1b[38;2;210;78;45ma\x1b[38;2;237;135;93m}\x1b[38;2;97;81;95m6\x1b[38;2;135;79;100mq\x1b[38;2;248;225;237m=\x1b[38;2;190;192;199mT\x1b[38;2;31;41;61mR\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;152;186;202m(\x1b[38;2;125;175;178m}\x1b[38;2;15;19;22mM\x1b[38;2;48;59;69mA\x1b[38;2;135;119;135mY\x1b[38;2;202;168;206m7\x1b[38;2;228;195;222m/\x1b[38;2;236;221;236m>\x1b[38;2;249;239;246m'\x1b[38;2;253;252;253m.\x1b[38;2;180;162;180mi\x1b[38;2;149;142;167mt\x1b[38;2;138;109;129mj\x1b[38;2;153;118;139mZ\x1b[38;2;164;129;153m[\x1b[38;2;167;132;157mt\x1b[38;2;157;123;147mo\x1b[38;2;135;99;112m]\x1b[38;2;144;101;107ma\x1b[38;2;172;114;113mZ\x1b[38;2;202;128;114m1\x1b[38;2;219;142;123mC\x1b[38;2;234;157;131m(\x1b[38;2;231;144;113m{\x1b[38;2;198;100;71mY\x1b[38;2;230;165;139m7\x1b[38;2;252;221;204m>\x1b[38;2;249;202;179mc\x1b[38;2;232;159;121m|\x1b[38;2;180;87;60m]\x1b[38;2;176;114;106mZ\x1b[38;2;180;185;234mv\x1b[38;2;102;113;186my\x1b[38;2;81;91;177mq\x1b[38;2;54;64;159mp\x1b[38;2;44;54;126mU\x1b[38;2;129;135;221m[\x1b[38;2;64;73;165md\x1b[38;2;65;69;158m4\x1b[38;2;92;98;170mE\x1b[38;2;111;118;186mx\x1b[38;2;153;125;131mo\x1b[38;2;210;147;115m}\x1b[38;2;251;216;198m<\x1b[38;2;253;240;231m'\x1b[38;2;181;129;118m[\x1b[38;2;220;112;75mn\x1b[38;2;242;151;109mF\x1b[38;2;240;143;97m{\x1b[38;2;221;119;81mt\x1b[38;2;211;108;73mo\x1b[38;2;213;96;57mY\x1b[38;2;208;84;47my\x1b[38;2;184;72;45mS\x1b[38;2;96;45;40mU\x1b[38;2;255;255;255m`\x1b[38;2;254;252;253m.\x1b[38;2;252;244;248m_\x1b[38;2;164;166;173m{\x1b[38;2;128;0;0mR\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;119;168;191mI\x1b[38;2;22;23;27m0\x1b[38;2;75;91;99m6\x1b[38;2;84;99;114mq\x1b[38;2;177;200;211mL\x1b[38;2;108;129;142mx\x1b[38;2;35;31;46m#\x1b[38;2;33;25;36mB\x1b[38;2;82;62;80mp\x1b[38;2;75;59;74mG\x1b[38;2;112;121;125my\x1b[38;2;137;134;146me\x1b[38;2;125;90;103mS\x1b[38;2;132;91;101mE\x1b[38;2;135;99;111m]\x1b[38;2;136;100;113m]\x1b[38;2;133;100;117m]\x1b[38;2;120;86;99mq\x1b[38;2;122;83;94mq\x1b[38;2;144;92;97m2\x1b[38;2;177;108;102m5\x1b[38;2;206;128;112m1\x1b[38;2;239;172;149mv\x1b[38;2;253;230;216m^\x1b[38;2;254;254;253m.\x1b[38;2;251;214;196m+\x1b[38;2;142;64;50mh\x1b[38;2;91;83;84mh\x1b[38;2;177;118;82mZ\x1b[38;2;238;165;131mJ\x1b[38;2;168;112;109m5\x1b[38;2;114;94;102mw\x1b[38;2;115;101;109mE\x1b[38;2;134;115;125mx\x1b[38;2;238;205;210mr\x1b[38;2;239;194;203m/\x1b[38;2;249;223;226m;\x1b[38;2;243;191;194m/\x1b[38;2;220;173;174m)\x1b[38;2;113;99;101mS\x1b[38;2;120;105;102m2\x1b[38;2;240;168;133m)\x1b[38;2;239;178;132mv\x1b[38;2;114;87;63mP\x1b[38;2;102;37;26mA\x1b[38;2;252;224;209m;\x1b[38;2;253;249;245m-\x1b[38;2;249;200;178mc\x1b[38;2;240;144;102m{\x1b[38;2;230;117;69mt\x1b[38;2;222;100;52mZ\x1b[38;2;205;82;46ma\x1b[38;2;179;71;45mw\x1b[38;2;136;57;46md\x1b[38;2;53;52;56mK\x1b[38;2;255;255;255m`\x1b[38;2;254;254;254m.\x1b[38;2;174;178;180m(\x1b[38;2;255;0;0m4\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;25;30;32mB\x1b[38;2;59;68;79mG\x1b[38;2;92;127;148mj\x1b[38;2;151;181;195mF\x1b[38;2;107;142;169mo\x1b[38;2;127;155;177m1\x1b[38;2;202;221;232mr\x1b[38;2;108;141;170mo\x1b[38;2;112;144;172me\x1b[38;2;79;135;169mx\x1b[38;2;115;125;130mx\x1b[38;2;140;129;143mo\x1b[38;2;86;60;68mO\x1b[38;2;85;59;66mO\x1b[38;2;91;64;74mV\x1b[38;2;88;62;71mp\x1b[38;2;90;63;74mp\x1b[38;2;86;60;70mO\x1b[38;2;74;52;58mU\x1b[38;2;105;65;74m4\x1b[38;2;130;74;81mP\x1b[38;2;156;90;90m2\x1b[38;2;194;112;94mo\x1b[38;2;234;147;114mi\x1b[38;2;238;165;137mJ\x1b[38;2;234;134;91mf\x1b[38;2;219;102;55mZ\x1b[38;2;191;78;45m2\x1b[38;2;158;56;37mh\x1b[38;2;179;70;43mw\x1b[38;2;156;59;37mh\x1b[38;2;136;45;33mp\x1b[38;2;68;13;15m$\x1b[38;2;149;132;137me\x1b[38;2;206;206;206m/\x1b[38;2;206;206;207m/\x1b[38;2;206;206;207m/\x1b[38;2;206;206;207m/\x1b[38;2;181;172;173m|\x1b[38;2;91;22;25m8\x1b[38;2;125;39;34mG\x1b[38;2;151;55;33m9\x1b[38;2;162;63;40mP\x1b[38;2;165;65;38mP\x1b[38;2;200;95;65mx\x1b[38;2;223;119;80mt\x1b[38;2;242;151;108mF\x1b[38;2;234;131;89mf\x1b[38;2;220;103;60mZ\x1b[38;2;215;91;48mx\x1b[38;2;197;79;46m]\x1b[38;2;169;69;46mq\x1b[38;2;136;56;46md\x1b[38;2;86;42;40mK\x1b[38;2;120;84;129mw\x1b[38;2;127;101;150ma\x1b[38;2;50;44;51mH\x1b[38;2;36;18;18mg\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;64;105;86mP\x1b[38;2;108;129;152mY\x1b[38;2;122;149;172m[\x1b[38;2;113;135;155mZ\x1b[38;2;70;89;116mh\x1b[38;2;172;196;211mv\x1b[38;2;229;241;246m,\x1b[38;2;178;189;199m)\x1b[38;2;197;202;212m?\x1b[38;2;41;43;45m8\x1b[38;2;126;170;193m}\x1b[38;2;170;158;174mC\x1b[38;2;82;58;66mG\x1b[38;2;46;36;41mR\x1b[38;2;50;38;42m8\x1b[38;2;48;37;41m8\x1b[38;2;55;39;44mm\x1b[38;2;43;34;38mD\x1b[38;2;41;32;36mD\x1b[38;2;55;39;43mm\x1b[38;2;75;47;49mA\x1b[38;2;82;53;59mb\x1b[38;2;102;51;51mG\x1b[38;2;133;60;51md\x1b[38;2;126;61;54md\x1b[38;2;208;144;114m}\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;251;247m-\x1b[38;2;255;252;247m.\x1b[38;2;254;252;250m.\x1b[38;2;248;196;175m*\x1b[38;2;253;238;230m'\x1b[38;2;254;254;254m.\x1b[38;2;255;255;255m`\x1b[38;2;255;254;254m.\x1b[38;2;255;254;253m.\x1b[38;2;251;207;181mr\x1b[38;2;253;250;246m-\x1b[38;2;255;251;244m-\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;255;255;255m`\x1b[38;2;144;135;132me\x1b[38;2;127;47;40mp\x1b[38;2;151;56;34m9\x1b[38;2;166;68;47mk\x1b[38;2;160;67;48mP\x1b[38;2;146;63;49mh\x1b[38;2;114;54;47mp\x1b[38;2;82;42;40mK\x1b[38;2;62;34;35m8\x1b[38;2;170;42;42md\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;85;12;12m#\x1b[38;2;85;21;21mR\x1b[38;2;93;0;23m$\x1b[38;2;49;39;59mm\x1b[38;2;82;87;89mh\x1b[38;2;172;184;192m7\x1b[38;2;172;170;188mF\x1b[38;2;239;238;242m,\x1b[38;2;127;140;145me\x1b[38;2;162;159;192mC\x1b[38;2;152;118;140mZ\x1b[38;2;94;67;77m4\x1b[38;2;52;39;45mm\x1b[38;2;40;30;34m#\x1b[38;2;32;25;27mB\x1b[38;2;32;25;27mB\x1b[38;2;31;24;26mB\x1b[38;2;31;24;26mB\x1b[38;2;47;34;38mR\x1b[38;2;111;61;66m4\x1b[38;2;96;61;61mp\x1b[38;2;29;17;16m0\x1b[38;2;184;123;129mn\x1b[38;2;199;149;156mC\x1b[38;2;191;139;146mI\x1b[38;2;207;163;174m(\x1b[38;2;243;211;210m+\x1b[38;2;251;239;242m'\x1b[38;2;253;247;246m_\x1b[38;2;231;184;168mL\x1b[38;2;237;189;182m?\x1b[38;2;231;165;171mJ\x1b[38;2;250;243;244m:\x1b[38;2;238;156;164m7\x1b[38;2;230;127;136mf\x1b[38;2;236;149;158m|\x1b[38;2;185;139;140m3\x1b[38;2;242;192;194m/\x1b[38;2;243;190;187mz\x1b[38;2;253;243;246m_\x1b[38;2;255;255;255m`\x1b[38;2;254;252;251m.\x1b[38;2;245;227;222m;\x1b[38;2;246;215;202m+\x1b[38;2;238;171;144m)\x1b[38;2;123;58;46m4\x1b[38;2;92;54;56mG\x1b[38;2;163;88;83m2\x1b[38;2;103;49;45mG\x1b[38;2;72;40;40mX\x1b[38;2;34;25;27mB\x1b[38;2;157;29;39mO\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;58;108;143mq\x1b[38;2;28;40;50mD\x1b[38;2;242;252;254m-\x1b[38;2;230;245;250m'\x1b[38;2;146;184;196m|\x1b[38;2;92;77;91m9\x1b[38;2;145;130;143mo\x1b[38;2;105;148;179me\x1b[38;2;162;141;172m3\x1b[38;2;155;120;144mZ\x1b[38;2;110;79;92m6\x1b[38;2;68;49;54mA\x1b[38;2;37;29;32m$\x1b[38;2;32;25;27mB\x1b[38;2;33;26;28mB\x1b[38;2;31;24;26mB\x1b[38;2;37;28;32m$\x1b[38;2;80;55;63mb\x1b[38;2;136;90;97mE\x1b[38;2;193;149;165mC\x1b[38;2;226;212;225m!\x1b[38;2;104;91;104mq\x1b[38;2;2;2;3m@\x1b[38;2;1;1;2m@\x1b[38;2;5;5;6m&\x1b[38;2;69;39;53mX\x1b[38;2;149;85;101mE\x1b[38;2;219;173;181m)\x1b[38;2;40;37;37mR\x1b[38;2;63;37;45mm\x1b[38;2;121;68;87mh\x1b[38;2;130;73;93mP\x1b[38;2;154;83;118m2\x1b[38;2;109;61;77m4\x1b[38;2;168;111;125m5\x1b[38;2;108;63;81md\x1b[38;2;66;66;67mG\x1b[38;2;229;192;204mz\x1b[38;2;178;120;134me\x1b[38;2;71;41;47mX\x1b[38;2;3;2;3m@\x1b[38;2;1;1;2m@\x1b[38;2;111;96;106mS\x1b[38;2;192;143;146mf\x1b[38;2;184;102;88mY\x1b[38;2;107;59;59mV\x1b[38;2;57;38;41mm\x1b[38;2;47;35;39mR\x1b[38;2;10;3;7m&\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;85;161;198m[\x1b[38;2;65;95;120m6\x1b[38;2;20;29;33mB\x1b[38;2;18;25;27m0\x1b[38;2;26;35;39m#\x1b[38;2;198;208;214mz\x1b[38;2;235;245;250m'\x1b[38;2;192;226;238mr\x1b[38;2;92;126;151my\x1b[38;2;73;54;63mU\x1b[38;2;89;81;121m6\x1b[38;2;131;100;119m]\x1b[38;2;115;82;94mk\x1b[38;2;87;60;69mO\x1b[38;2;56;40;45mm\x1b[38;2;29;24;26mg\x1b[38;2;33;26;28mB\x1b[38;2;31;24;26mB\x1b[38;2;37;29;32m$\x1b[38;2;70;49;55mA\x1b[38;2;109;78;90m6\x1b[38;2;152;116;135m5\x1b[38;2;177;147;172mf\x1b[38;2;176;144;170mf\x1b[38;2;165;132;157m[\x1b[38;2;130;96;113m2\x1b[38;2;67;48;55mK\x1b[38;2;8;6;8m%\x1b[38;2;7;6;7m%\x1b[38;2;11;11;12mQ\x1b[38;2;18;18;19mM\x1b[38;2;30;25;27mB\x1b[38;2;39;30;34m#\x1b[38;2;46;36;42mR\x1b[38;2;46;35;40mR\x1b[38;2;45;37;44mR\x1b[38;2;37;34;40mD\x1b[38;2;39;37;46mR\x1b[38;2;36;36;46mD\x1b[38;2;9;9;10mQ\x1b[38;2;24;20;23m0\x1b[38;2;76;56;71mb\x1b[38;2;157;123;145mo\x1b[38;2;175;144;168mI\x1b[38;2;169;137;162m1\x1b[38;2;132;100;118m]\x1b[38;2;84;59;67mO\x1b[38;2;56;40;44mm\x1b[38;2;39;31;35m#\x1b[38;2;48;15;17mg\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;51;51;76mK\x1b[38;2;28;40;54mR\x1b[38;2;19;28;31mg\x1b[38;2;17;21;23mM\x1b[38;2;17;20;22mM\x1b[38;2;16;20;22mM\x1b[38;2;18;25;28mg\x1b[38;2;109;122;137mj\x1b[38;2;238;247;251m:\x1b[38;2;231;244;249m'\x1b[38;2;129;197;226m7\x1b[38;2;40;63;79mA\x1b[38;2;49;45;63mH\x1b[38;2;66;48;61mK\x1b[38;2;48;35;39mR\x1b[38;2;47;36;41mR\x1b[38;2;23;21;23m0\x1b[38;2;26;20;22m0\x1b[38;2;37;28;32m$\x1b[38;2;35;27;30m$\x1b[38;2;59;41;46mH\x1b[38;2;95;67;77m4\x1b[38;2;137;104;122my\x1b[38;2;151;115;136m5\x1b[38;2;150;114;134mY\x1b[38;2;131;100;118m]\x1b[38;2;100;71;82md\x1b[38;2;67;47;52mK\x1b[38;2;39;30;33m#\x1b[38;2;30;24;26mg\x1b[38;2;38;29;33m#\x1b[38;2;57;43;57mH\x1b[38;2;69;49;77mU\x1b[38;2;77;56;95mO\x1b[38;2;76;56;93mG\x1b[38;2;68;59;102mG\x1b[38;2;49;40;50mm\x1b[38;2;42;33;37mD\x1b[38;2;44;34;39mD\x1b[38;2;52;40;47mm\x1b[38;2;58;46;63mX\x1b[38;2;76;54;85mG\x1b[38;2;105;75;104m6\x1b[38;2;121;88;116mw\x1b[38;2;109;78;91m6\x1b[38;2;77;53;59mb\x1b[38;2;59;42;46mH\x1b[38;2;56;39;44mm\x1b[38;2;44;34;38mD\x1b[38;2;11;8;9mQ\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;27;27;40mB\x1b[38;2;15;18;20mN\x1b[38;2;10;10;11mQ\x1b[38;2;8;8;9m%\x1b[38;2;8;8;9m%\x1b[38;2;11;11;12mQ\x1b[38;2;12;13;14mW\x1b[38;2;18;24;27m0\x1b[38;2;20;29;33mB\x1b[38;2;201;218;225mc\x1b[38;2;234;245;249m'\x1b[38;2;223;240;246m^\x1b[38;2;130;192;224m(\x1b[38;2;66;143;187mY\x1b[38;2;12;22;29mM\x1b[38;2;18;19;21mM\x1b[38;2;28;23;25mg\x1b[38;2;9;9;10mQ\x1b[38;2;33;26;29mB\x1b[38;2;34;26;29mB\x1b[38;2;39;30;33m#\x1b[38;2;74;53;66mU\x1b[38;2;87;62;77mp\x1b[38;2;94;67;87m4\x1b[38;2;104;74;87mh\x1b[38;2;110;78;91m6\x1b[38;2;94;66;76m4\x1b[38;2;65;45;51mX\x1b[38;2;55;39;43mm\x1b[38;2;59;43;53mH\x1b[38;2;71;51;82mU\x1b[38;2;82;61;103mp\x1b[38;2;89;67;119md\x1b[38;2;89;74;128mh\x1b[38;2;69;56;88mb\x1b[38;2;72;52;86mb\x1b[38;2;70;50;79mU\x1b[38;2;70;50;78mU\x1b[38;2;82;60;95mp\x1b[38;2;83;61;107mV\x1b[38;2;92;68;120md\x1b[38;2;101;74;128m6\x1b[38;2;90;65;102m4\x1b[38;2;67;48;71mA\x1b[38;2;54;40;45mm\x1b[38;2;53;40;47mm\x1b[38;2;61;45;57mX\x1b[38;2;42;33;37mD\x1b[38;2;45;25;25m$\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;23;28;34mB\x1b[38;2;14;16;18mN\x1b[38;2;14;15;17mN\x1b[38;2;10;10;11mQ\x1b[38;2;12;12;13mW\x1b[38;2;7;6;7m%\x1b[38;2;10;10;11mQ\x1b[38;2;14;15;16mN\x1b[38;2;17;21;24mM\x1b[38;2;47;62;77mU\x1b[38;2;217;228;234m<\x1b[38;2;236;246;250m:\x1b[38;2;235;245;249m'\x1b[38;2;188;222;237mc\x1b[38;2;119;184;215mi\x1b[38;2;67;145;189mY\x1b[38;2;35;78;109mO\x1b[38;2;6;10;14mQ\x1b[38;2;37;29;38m#\x1b[38;2;43;34;47mR\x1b[38;2;52;40;56mm\x1b[38;2;72;54;89mb\x1b[38;2;71;51;81mU\x1b[38;2;66;48;67mA\x1b[38;2;68;48;73mA\x1b[38;2;72;51;75mU\x1b[38;2;71;51;79mU\x1b[38;2;73;52;76mb\x1b[38;2;80;59;100mp\x1b[38;2;96;70;124m9\x1b[38;2;96;75;130m6\x1b[38;2;88;66;117md\x1b[38;2;77;61;104mp\x1b[38;2;78;58;97mO\x1b[38;2;79;58;98mO\x1b[38;2;84;62;107mV\x1b[38;2;92;68;120md\x1b[38;2;104;78;135mP\x1b[38;2;109;82;141mq\x1b[38;2;108;82;141mq\x1b[38;2;91;68;120md\x1b[38;2;76;55;93mG\x1b[38;2;75;53;81mb\x1b[38;2;69;49;77mU\x1b[38;2;55;46;63mX\x1b[38;2;38;32;37m#\x1b[38;2;30;6;10mW\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;41;51;73mX\x1b[38;2;32;42;56m8\x1b[38;2;31;42;55mR\x1b[38;2;24;33;40m$\x1b[38;2;17;23;25m0\x1b[38;2;15;17;19mN\x1b[38;2;12;13;14mW\x1b[38;2;7;6;7m%\x1b[38;2;8;7;8m%\x1b[38;2;10;11;12mQ\x1b[38;2;16;19;21mM\x1b[38;2;88;110;125mE\x1b[38;2;230;241;246m,\x1b[38;2;235;245;249m'\x1b[38;2;234;244;248m'\x1b[38;2;234;244;248m'\x1b[38;2;221;237;244m=\x1b[38;2;169;207;227ms\x1b[38;2;83;159;200mn\x1b[38;2;43;105;147mP\x1b[38;2;30;49;97mH\x1b[38;2;21;24;36mg\x1b[38;2;90;96;167mS\x1b[38;2;69;58;96mG\x1b[38;2;59;44;59mX\x1b[38;2;70;52;82mU\x1b[38;2;83;61;107mV\x1b[38;2;98;71;125mh\x1b[38;2;102;77;133mP\x1b[38;2;105;83;142mq\x1b[38;2;78;63;103mp\x1b[38;2;57;43;60mH\x1b[38;2;69;49;78mU\x1b[38;2;73;53;87mb\x1b[38;2;81;60;102mp\x1b[38;2;86;64;112m4\x1b[38;2;90;67;116md\x1b[38;2;102;74;129m6\x1b[38;2;112;85;143mw\x1b[38;2;111;84;143mw\x1b[38;2;100;73;128m6\x1b[38;2;87;64;114m4\x1b[38;2;74;54;88mG\x1b[38;2;60;47;66mK\x1b[38;2;28;27;32mB\x1b[38;2;160;195;207m)\x1b[38;2;182;36;36md\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;128;0;64mm\x1b[38;2;37;49;73mH\x1b[38;2;43;56;90mA\x1b[38;2;46;57;94mA\x1b[38;2;40;52;79mX\x1b[38;2;35;45;62mm\x1b[38;2;28;38;47mD\x1b[38;2;21;29;34mB\x1b[38;2;14;17;18mN\x1b[38;2;11;12;13mW\x1b[38;2;7;6;7m%\x1b[38;2;7;6;7m%\x1b[38;2;13;16;17mN\x1b[38;2;142;156;164m3\x1b[38;2;238;247;251m:\x1b[38;2;234;245;249m'\x1b[38;2;235;245;249m'\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;234;245;249m'\x1b[38;2;202;227;240m+\x1b[38;2;92;168;208m1\x1b[38;2;55;129;173m]\x1b[38;2;38;76;108mO\x1b[38;2;28;31;60m#\x1b[38;2;73;78;133m9\x1b[38;2;69;72;113m4\x1b[38;2;112;88;150mS\x1b[38;2;124;76;130mq\x1b[38;2;128;70;122mk\x1b[38;2;133;71;121mk\x1b[38;2;132;68;118mk\x1b[38;2;131;74;127mq\x1b[38;2;129;108;155mj\x1b[38;2;26;28;48m$\x1b[38;2;80;78;136mh\x1b[38;2;89;66;117md\x1b[38;2;97;71;125mh\x1b[38;2;108;80;138mk\x1b[38;2;113;94;134mS\x1b[38;2;58;43;66mX\x1b[38;2;60;45;64mX\x1b[38;2;40;33;39mD\x1b[38;2;66;98;114mP\x1b[38;2;218;240;247m=\x1b[38;2;237;247;251m:\x1b[38;2;112;37;37mU\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;45;57;92mA\x1b[38;2;44;57;92mA\x1b[38;2;56;63;115mO\x1b[38;2;45;58;95mU\x1b[38;2;56;63;115mO\x1b[38;2;50;60;104mb\x1b[38;2;45;57;93mA\x1b[38;2;40;50;69mH\x1b[38;2;32;42;55mR\x1b[38;2;24;34;40m$\x1b[38;2;16;18;20mM\x1b[38;2;12;13;14mW\x1b[38;2;9;8;9m%\x1b[38;2;21;28;32mB\x1b[38;2;187;205;215m?\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;224;241;247m^\x1b[38;2;91;166;207m1\x1b[38;2;65;142;185mx\x1b[38;2;23;82;124mO\x1b[38;2;6;7;9m%\x1b[38;2;99;104;135mE\x1b[38;2;145;105;153mx\x1b[38;2;139;79;129mS\x1b[38;2;135;73;124mq\x1b[38;2;126;61;109mh\x1b[38;2;130;67;116mP\x1b[38;2;129;65;114m6\x1b[38;2;124;84;121mw\x1b[38;2;32;32;52m#\x1b[38;2;95;72;128mh\x1b[38;2;107;79;136mk\x1b[38;2;147;89;137m]\x1b[38;2;214;189;208ms\x1b[38;2;64;79;94m4\x1b[38;2;116;181;214m{\x1b[38;2;227;243;248m,\x1b[38;2;237;246;250m:\x1b[38;2;239;248;252m:\x1b[38;2;36;42;55m8\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;61;64;112mO\x1b[38;2;56;63;114mO\x1b[38;2;55;63;113mG\x1b[38;2;56;63;115mO\x1b[38;2;56;63;115mO\x1b[38;2;57;64;118mO\x1b[38;2;56;63;116mO\x1b[38;2;56;64;116mO\x1b[38;2;47;58;97mU\x1b[38;2;45;57;93mA\x1b[38;2;41;52;73mX\x1b[38;2;30;40;52mR\x1b[38;2;20;27;31mg\x1b[38;2;13;14;16mW\x1b[38;2;14;16;17mN\x1b[38;2;61;69;73mO\x1b[38;2;232;242;247m,\x1b[38;2;235;246;250m'\x1b[38;2;237;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;213;236;245m;\x1b[38;2;121;183;214m{\x1b[38;2;68;146;189m5\x1b[38;2;30;88;131m4\x1b[38;2;42;55;69mK\x1b[38;2;117;82;122mq\x1b[38;2;86;45;59mU\x1b[38;2;124;96;128m2\x1b[38;2;152;102;148mx\x1b[38;2;99;70;89md\x1b[38;2;84;50;63mb\x1b[38;2;96;72;102m9\x1b[38;2;140;105;150mj\x1b[38;2;140;92;134m]\x1b[38;2;65;85;108m9\x1b[38;2;175;218;238m/\x1b[38;2;236;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;243;251;253m_\x1b[38;2;19;13;13mN\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;66;66;123mV\x1b[38;2;62;71;130mV\x1b[38;2;57;65;118mO\x1b[38;2;57;64;117mO\x1b[38;2;58;66;121mp\x1b[38;2;60;69;127mV\x1b[38;2;62;71;130mV\x1b[38;2;61;70;128mV\x1b[38;2;57;64;117mO\x1b[38;2;56;63;114mO\x1b[38;2;50;60;104mb\x1b[38;2;43;56;88mA\x1b[38;2;40;52;80mX\x1b[38;2;33;44;61m8\x1b[38;2;23;32;39m$\x1b[38;2;18;23;26m0\x1b[38;2;17;21;23mM\x1b[38;2;128;152;166mt\x1b[38;2;239;248;252m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;235;245;249m'\x1b[38;2;216;237;245m;\x1b[38;2;127;191;222m|\x1b[38;2;82;158;200mn\x1b[38;2;49;114;159mw\x1b[38;2;26;62;83mK\x1b[38;2;21;53;72mm\x1b[38;2;29;15;14mM\x1b[38;2;90;39;49mA\x1b[38;2;63;33;36m8\x1b[38;2;145;193;219m7\x1b[38;2;222;241;247m^\x1b[38;2;233;245;249m'\x1b[38;2;234;245;249m'\x1b[38;2;234;245;249m'\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;244;251;253m_\x1b[38;2;128;0;0mR\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;170;85;85m]\x1b[38;2;83;112;177m]\x1b[38;2;84;99;169mS\x1b[38;2;69;82;146mh\x1b[38;2;62;72;131m4\x1b[38;2;64;75;136md\x1b[38;2;68;79;143m9\x1b[38;2;67;79;142m9\x1b[38;2;65;76;139md\x1b[38;2;65;76;137md\x1b[38;2;58;67;122mp\x1b[38;2;54;63;105mG\x1b[38;2;46;58;84mA\x1b[38;2;40;48;70mH\x1b[38;2;35;47;67mm\x1b[38;2;33;43;58m8\x1b[38;2;23;33;39m$\x1b[38;2;18;25;28mg\x1b[38;2;27;33;37m$\x1b[38;2;201;211;216m/\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;236;245;249m'\x1b[38;2;237;246;250m:\x1b[38;2;235;245;249m'\x1b[38;2;234;245;249m'\x1b[38;2;235;245;249m'\x1b[38;2;235;246;250m'\x1b[38;2;237;246;250m:\x1b[38;2;237;247;251m:\x1b[38;2;225;243;248m,\x1b[38;2;223;50;72mS\x1b[38;2;211;13;26mV\x1b[38;2;207;13;26mV\x1b[38;2;204;14;26mp\x1b[38;2;183;15;24mG\x1b[38;2;198;25;45md\x1b[38;2;210;84;126mY\x1b[38;2;227;237;242m=\x1b[38;2;234;245;249m'\x1b[38;2;237;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;240;248;251m:\x1b[38;2;228;225;225m<\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;6;6;10m%\x1b[38;2;9;11;18mQ\x1b[38;2;21;24;39mg\x1b[38;2;73;87;153mP\x1b[38;2;84;99;169mS\x1b[38;2;70;82;146mh\x1b[38;2;71;84;149m6\x1b[38;2;76;90;157mk\x1b[38;2;72;86;152m6\x1b[38;2;68;80;143m9\x1b[38;2;64;75;137md\x1b[38;2;62;71;130mV\x1b[38;2;54;62;110mG\x1b[38;2;39;51;78mX\x1b[38;2;34;45;64mm\x1b[38;2;27;38;47mD\x1b[38;2;29;39;50mD\x1b[38;2;23;33;40m$\x1b[38;2;19;27;30mg\x1b[38;2;87;102;109mq\x1b[38;2;238;248;253m:\x1b[38;2;237;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;236;246;250m:\x1b[38;2;237;246;250m:\x1b[38;2;242;250;253m_\x1b[38;2;113;50;43mO\x1b[38;2;3;2;3m@\x1b[38;2;1;1;2m@\x1b[38;2;6;2;3m&\x1b[38;2;166;12;27mU\x1b[38;2;243;83;105mo\x1b[38;2;240;41;67mS\x1b[38;2;159;15;22mU\x1b[38;2;131;17;23mX\x1b[38;2;9;9;11mQ\x1b[38;2;240;250;253m_\x1b[38;2;237;246;250m:\x1b[38;2;240;248;252m:\x1b[38;2;85;98;111mk\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\x1b[38;2;0;0;0m@\n\x1b[0m
-        """)
-        print()
-        print(f"{Fore.CYAN}Welcome to TruthPedia!\n")
+        """).add().add(f"{Fore.CYAN}Welcome to TruthPedia!\n").show()
 
     @staticmethod
-    def clear_screen(lines: int = 100) -> None:
+    def clear_screen() -> None:
         """
-        Clear the console screen by printing a specified number of blank lines.
-
-        Args:
-            lines (int): The number of blank lines to print. Defaults to 100.
+        Clear the console screen with a single ANSI escape sequence.
 
         Returns:
             None
         """
-        for x in range(lines):
-            print("")
+        print(CLEAR_SEQUENCE, end="", flush=True)
 
     @staticmethod
     def get_player_name() -> str:
@@ -103,57 +98,54 @@ class GameUI:
             This method clears the screen, prints the game over message,
             and displays the title and summary of the Fakenews article.
         """
-        GameUI.clear_screen()
+        console_width = terminal_width()
+        screen = Screen()
 
         # Display the fake article with consistent formatting
-        print(f"{Fore.CYAN}{'=' * CONSOLE_WIDTH}")
-        print(f"{Fore.CYAN}Fake Article")
-        print(f"{Fore.CYAN}{'=' * CONSOLE_WIDTH}")
-
-        # Wrap and print title with consistent formatting
-        wrapped_title = GameUI._wrap_text(ai_article['title'])
-        print(f"{Fore.WHITE}Title: {wrapped_title}")
-
-        print()  # Empty line
-
-        # Wrap and print summary with consistent formatting
-        wrapped_summary = GameUI._wrap_text(ai_article['summary'])
-        print(f"{Fore.WHITE}Summary: {wrapped_summary}")
-        print(f"{Fore.CYAN}{'=' * CONSOLE_WIDTH}\n")
+        screen.add(f"{Fore.CYAN}{'=' * console_width}")
+        screen.add(f"{Fore.CYAN}Fake Article")
+        screen.add(f"{Fore.CYAN}{'=' * console_width}")
+        GameUI._add_article_body(screen, ai_article, console_width)
+        screen.add(f"{Fore.CYAN}{'=' * console_width}\n")
 
         message = f"{Fore.RED}Well {user_name}, you are pretty brainwashed...\nYou've lost!"
-        print(message)
-        print(f"{Fore.YELLOW}The following summary was the Fakenews:\n")
+        screen.add(message)
+        screen.add(f"{Fore.YELLOW}The following summary was the Fakenews:\n")
+        screen.show()
 
         return message
 
     @staticmethod
     def print_random_categories(
-        user_name: str, category_count: int = WIKI_MAX_DISPLAYED_CATEGORIES
+        user_name: str,
+        category_count: int = WIKI_MAX_DISPLAYED_CATEGORIES,
+        category_list: Optional[list[CategoryModel]] = None,
     ) -> list[CategoryModel]:
         """
         Display and return a list of random categories for the player to choose from.
 
         Args:
-            category_count: The number of categories to display. Defaults to WIKI_MAX_DISPLAYED_CATEGORIES.
+            user_name: The player's name.
+            category_count: The number of random categories to display. Defaults to WIKI_MAX_DISPLAYED_CATEGORIES.
+            category_list: The categories to offer, e.g. ones already being warmed up.
+                           Random categories are chosen if omitted.
 
         Returns:
-            list[CategoryModel]: A list of randomly selected categories.
+            list[CategoryModel]: The displayed categories.
 
         Note:
             Categories are selected without replacement to ensure variety.
         """
-        GameUI.clear_screen()
-        print(f"{Fore.GREEN}Hello, {user_name}!")
-        category_list: list[CategoryModel] = []
-        print(f"{Fore.WHITE}Here you have your choices:")
+        screen = Screen()
+        screen.add(f"{Fore.GREEN}Hello, {user_name}!")
+        if category_list is None:
+            category_list = Category.get_random_categories(category_count)
+        screen.add(f"{Fore.WHITE}Here you have your choices:")
 
-        while len(category_list) < category_count:
-            random_cat = Category.get_random_category()
-            if random_cat.name not in [cat.name for cat in category_list]:
-                category_list.append(random_cat)
-                print(f"{len(category_list)}) {random_cat.name}")
+        for index, random_cat in enumerate(category_list, start=1):
+            screen.add(f"{index}) {random_cat.name}")
 
+        screen.show()
         return category_list
 
     @staticmethod
@@ -261,43 +253,49 @@ class GameUI:
             bool: True if the article is fake news, False if it's real.
 
         Raises:
-            ValueError: If the article doesn't have the required 'is_truth' field.
+            ValueError: If the article is not an ArticleModel.
         """
         GameUI.clear_screen()
-        if not isinstance(article, dict) or "is_truth" not in article:
+        if not isinstance(article, ArticleModel):
             raise ValueError(
-                "Invalid article provided. Article must be a dictionary with 'is_truth' field."
+                "Invalid article provided. Article must be an ArticleModel."
             )
 
-        return not article["is_truth"]
+        return not article.is_truth
+
+    @staticmethod
+    def _add_article_body(screen: Screen, article: ArticleModel, console_width: int) -> None:
+        """
+        Add the wrapped title and summary of an article to a screen.
+
+        Args:
+            screen: The screen being built.
+            article: The article to add.
+            console_width: Width of the console for formatting.
+        """
+        screen.add(f"{Fore.WHITE}Title: {GameUI._wrap_text(article.title, console_width)}")
+        screen.add()  # Empty line
+        screen.add(f"{Fore.WHITE}Summary: {GameUI._wrap_text(article.summary, console_width)}")
 
     @staticmethod
     def _display_article(
-        article: ArticleModel, index: int, total: int, console_width: int
+        screen: Screen, article: ArticleModel, index: int, total: int, console_width: int
     ) -> None:
         """
-        Display a single article with proper formatting.
+        Add a single article with proper formatting to a screen.
 
         Args:
+            screen: The screen being built
             article: The article to display
             index: The 1-based index of the article
             total: Total number of articles
             console_width: Width of the console for formatting
         """
-        print(f"\n{Fore.CYAN}{'=' * console_width}")
-        print(f"{Fore.CYAN}Article {index} of {total}")
-        print(f"{Fore.CYAN}{'=' * console_width}")
-
-        # Wrap and print title
-        wrapped_title = GameUI._wrap_text(article["title"])
-        print(f"{Fore.WHITE}Title: {wrapped_title}")
-
-        print()  # Empty line
-
-        # Wrap and print summary
-        wrapped_summary = GameUI._wrap_text(article["summary"])
-        print(f"{Fore.WHITE}Summary: {wrapped_summary}")
-        print(f"{Fore.CYAN}{'=' * console_width}\n")
+        screen.add(f"\n{Fore.CYAN}{'=' * console_width}")
+        screen.add(f"{Fore.CYAN}Article {index} of {total}")
+        screen.add(f"{Fore.CYAN}{'=' * console_width}")
+        GameUI._add_article_body(screen, article, console_width)
+        screen.add(f"{Fore.CYAN}{'=' * console_width}\n")
 
     @staticmethod
     def print_articles(
@@ -329,10 +327,10 @@ class GameUI:
         # Filter out invalid articles
         valid_articles = []
         for i, article in enumerate(my_articles):
-            if not isinstance(article, dict):
+            if not isinstance(article, ArticleModel):
                 print(f"{Fore.YELLOW}Warning: Skipping invalid article at position {i + 1}")
                 continue
-            if "title" not in article or "summary" not in article:
+            if not article.title or not article.summary:
                 print(f"{Fore.YELLOW}Warning: Skipping article {i + 1} - missing title or summary")
                 continue
             valid_articles.append(article)
@@ -341,21 +339,22 @@ class GameUI:
             print(f"{Fore.YELLOW}No valid articles to display.")
             return None
 
-        console_width = CONSOLE_WIDTH
         current_index = 0
         total_articles = len(valid_articles)
 
         while True:
-            GameUI.clear_screen()
+            # Build the whole page and write it at once, at the current terminal width
+            screen = Screen()
             GameUI._display_article(
+                screen,
                 valid_articles[current_index],
                 current_index + 1,
                 total_articles,
-                console_width,
+                terminal_width(),
             )
 
             # Show navigation/selection instructions
-            print(f"\n{Fore.WHITE}Navigation:")
+            screen.add(f"\n{Fore.WHITE}Navigation:")
             available_answers: list[str] = []
             if current_index > 0:
                 available_answers.append("(P)revious")
@@ -367,8 +366,9 @@ class GameUI:
                 available_answers.append(f"(1-{total_articles}) Select this article")
                 # print(f"  (1-{total_articles}) Select this article")
             available_answers.append("(Q)uit")
-            print(f"{Fore.WHITE} | ".join(available_answers))
+            screen.add(f"{Fore.WHITE} | ".join(available_answers))
             # print("  (Q)uit")
+            screen.show()
 
             # Get user input
             while True:
@@ -424,7 +424,6 @@ class GameUI:
         Note:
             Uses humorous Trump-inspired messages to celebrate correct answers.
         """
-        GameUI.clear_screen()
         trump_praise = [
             f"{Fore.GREEN}TRUMPMENDOUS! {user_name}, you found the fake — nobody finds fakes better than you, believe me.",
             f"{Fore.GREEN}YUGE win, {user_name}! Correct answer. The other options? Total disasters.",
@@ -437,8 +436,7 @@ class GameUI:
             f"{Fore.YELLOW}15 seconds and we roll again. Many, many people are saying it'll be the best yet.",
         ]
 
-        print(random.choice(trump_praise))
-        print(random.choice(trump_inform))
+        Screen().add(random.choice(trump_praise)).add(random.choice(trump_inform)).show()
 
     @staticmethod
     def print_user_won(user_name: str) -> None:
@@ -458,14 +456,35 @@ class GameUI:
             f"{Fore.GREEN}Legendary finish {user_name}. People are amazed. I'm impressed. That's rare.",
             f"{Fore.GREEN}Victory! Massive. You and I—real winners. The best.",
         ]
-        GameUI.clear_screen()
-        print(random.choice(trump_praise))
+        Screen().add(random.choice(trump_praise)).show()
+
+    @staticmethod
+    def print_leaderboard(
+        player: PlayerModel, total: int, rank: int, players: int, top: list[tuple[str, int]]
+    ) -> None:
+        """
+        Display the player's score below the end-of-game message, and the best players.
+
+        Args:
+            player: The player, with the score of the finished game.
+            total: The player's total score over all games.
+            rank: The player's rank on the leaderboard.
+            players: The number of ranked players.
+            top: The best players as (name, total) pairs, best first.
+        """
+        screen = Screen(clear=False)
+        screen.add()
+        screen.add(f"{Fore.CYAN}You scored {player.score} this game, {total} in total.")
+        screen.add(f"{Fore.CYAN}You are #{rank} of {players} on the leaderboard.")
+        screen.add()
+        screen.add(f"{Fore.WHITE}Leaderboard:")
+        for position, (name, score) in enumerate(top, start=1):
+            color = Fore.GREEN if name == player.name else Fore.WHITE
+            screen.add(f"{color}{position:>3}. {name:<30} {score:>6}")
+        screen.show()
 
     @staticmethod
-    def shuffle(articles: list[ArticleModel]):
-        shuffled_list = []
-        while articles:
-            random_article = random.randint(0, len(articles) - 1)
-            popped_article = articles.pop(random_article)
-            shuffled_list.append(popped_article)
-        return shuffled_list
+    def shuffle(articles: list[ArticleModel]) -> list[ArticleModel]:
+        """Shuffle the articles of a round in place, in linear time, and return them."""
+        random.shuffle(articles)
+        return articles
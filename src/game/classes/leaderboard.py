@@ -0,0 +1,243 @@
+"""
+Persistent leaderboard of player scores.
+
+Every finished game adds its score to the player's total. Totals are ranked
+in an indexable skip list, so a player's rank and the top of the board are
+answered in O(log n) time even with millions of players, instead of sorting
+all totals for every query.
+
+Scores are recorded in memory right away and appended to a JSON Lines log
+by a background writer, in batches, so finishing a game never waits for the
+disk. On first use the log is replayed to rebuild the totals. Once the log
+holds LEADERBOARD_COMPACT_FACTOR lines per player, it is rewritten with one
+line per player, using write-to-temp-and-rename.
+"""
+
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from colorama import Fore
+
+from src.config.settings import (
+    LEADERBOARD_PATH,
+    LEADERBOARD_FLUSH_INTERVAL,
+    LEADERBOARD_BATCH_SIZE,
+    LEADERBOARD_COMPACT_FACTOR,
+)
+from src.game.utils.skip_list import RankedSkipList
+
+
+class Leaderboard:
+    """
+    Ranks players by their total score.
+
+    Players with equal totals are ordered by name.
+
+    Class Attributes:
+        path: The append-only score log.
+    """
+
+    path: Path = LEADERBOARD_PATH
+
+    _totals: dict[str, int] = {}
+    _ranking: Optional[RankedSkipList] = None
+    _pending: list[str] = []
+    _log_lines: int = 0
+    _lock = threading.Lock()
+    _file_lock = threading.Lock()
+    _writer: Optional[threading.Thread] = None
+    _flush_requested = threading.Event()
+
+    @staticmethod
+    def _key(name: str, total: int) -> tuple[int, str]:
+        """Ranking key: highest total first, then by name."""
+        return -total, name
+
+    @staticmethod
+    def load() -> None:
+        """
+        Replay the score log into memory, if that has not happened yet.
+
+        Lines that cannot be parsed, such as a torn last line left by a crash
+        during a write, are skipped.
+        """
+        with Leaderboard._lock:
+            Leaderboard._load()
+
+    @staticmethod
+    def preload() -> None:
+        """Replay the score log on a background thread, so the first query does not wait."""
+        threading.Thread(target=Leaderboard.load, name="leaderboard-load", daemon=True).start()
+
+    @staticmethod
+    def _load() -> None:
+        """Replay the score log. Must be called with the lock held."""
+        if Leaderboard._ranking is not None:
+            return
+
+        totals: dict[str, int] = {}
+        lines = 0
+        try:
+            with open(Leaderboard.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        name, points = entry["name"], int(entry["points"])
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                        continue
+                    totals[name] = totals.get(name, 0) + points
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"{Fore.YELLOW}Warning: Could not read the leaderboard: {e}")
+
+        ranking = RankedSkipList()
+        for name, total in totals.items():
+            ranking.insert(Leaderboard._key(name, total))
+        Leaderboard._totals = totals
+        Leaderboard._ranking = ranking
+        Leaderboard._log_lines = lines
+
+    @staticmethod
+    def add_score(name: str, points: int) -> int:
+        """
+        Add the points of a finished game to a player's total.
+
+        The ranking is updated immediately; the log is written in the background.
+
+        Args:
+            name: The player's name.
+            points: The points scored in the game.
+
+        Returns:
+            int: The player's new total.
+        """
+        with Leaderboard._lock:
+            Leaderboard._load()
+            previous = Leaderboard._totals.get(name)
+            if previous is not None:
+                Leaderboard._ranking.remove(Leaderboard._key(name, previous))
+            total = (previous or 0) + points
+            Leaderboard._totals[name] = total
+            Leaderboard._ranking.insert(Leaderboard._key(name, total))
+
+            Leaderboard._pending.append(
+                json.dumps({"name": name, "points": points}, ensure_ascii=False) + "\n"
+            )
+            Leaderboard._log_lines += 1
+            if len(Leaderboard._pending) >= LEADERBOARD_BATCH_SIZE:
+                Leaderboard._flush_requested.set()
+            Leaderboard._start_writer()
+        return total
+
+    @staticmethod
+    def score(name: str) -> Optional[int]:
+        """Return a player's total, or None if they have not finished a game."""
+        with Leaderboard._lock:
+            Leaderboard._load()
+            return Leaderboard._totals.get(name)
+
+    @staticmethod
+    def rank(name: str) -> Optional[int]:
+        """
+        Return a player's 1-based rank.
+
+        Returns:
+            Optional[int]: The rank, or None if the player has not finished a game.
+        """
+        with Leaderboard._lock:
+            Leaderboard._load()
+            total = Leaderboard._totals.get(name)
+            if total is None:
+                return None
+            return Leaderboard._ranking.rank(Leaderboard._key(name, total))
+
+    @staticmethod
+    def top(count: int) -> list[tuple[str, int]]:
+        """
+        Return the best players.
+
+        Args:
+            count: How many players to return.
+
+        Returns:
+            list[tuple[str, int]]: Up to `count` (name, total) pairs, best first.
+        """
+        with Leaderboard._lock:
+            Leaderboard._load()
+            return [(name, -key) for key, name in Leaderboard._ranking.first(count)]
+
+    @staticmethod
+    def size() -> int:
+        """Return the number of ranked players."""
+        with Leaderboard._lock:
+            Leaderboard._load()
+            return len(Leaderboard._totals)
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Write the pending scores to the log, compacting it if it grew too long.
+
+        Write errors are reported and the scores are kept for the next attempt.
+        """
+        with Leaderboard._file_lock:
+            with Leaderboard._lock:
+                pending, Leaderboard._pending = Leaderboard._pending, []
+                lines = pending
+                compact = Leaderboard._log_lines > (
+                    LEADERBOARD_COMPACT_FACTOR * max(1, len(Leaderboard._totals))
+                )
+                if compact:
+                    # The totals already include the pending scores
+                    lines = [
+                        json.dumps({"name": name, "points": total}, ensure_ascii=False) + "\n"
+                        for name, total in Leaderboard._totals.items()
+                    ]
+            if not lines:
+                return
+
+            try:
+                Leaderboard.path.parent.mkdir(parents=True, exist_ok=True)
+                if compact:
+                    temp_path = Leaderboard.path.with_suffix(Leaderboard.path.suffix + ".tmp")
+                    with open(temp_path, "w", encoding="utf-8") as file:
+                        file.writelines(lines)
+                        file.flush()
+                        os.fsync(file.fileno())
+                    os.replace(temp_path, Leaderboard.path)
+                    with Leaderboard._lock:
+                        Leaderboard._log_lines = len(lines) + len(Leaderboard._pending)
+                else:
+                    with open(Leaderboard.path, "a", encoding="utf-8") as file:
+                        file.writelines(lines)
+                        file.flush()
+                        os.fsync(file.fileno())
+            except OSError as e:
+                print(f"{Fore.YELLOW}Warning: Could not save the leaderboard: {e}")
+                with Leaderboard._lock:
+                    Leaderboard._pending[:0] = pending
+
+    @staticmethod
+    def _start_writer() -> None:
+        """Start the background writer. Must be called with the lock held."""
+        if Leaderboard._writer is not None:
+            return
+        Leaderboard._writer = threading.Thread(
+            target=Leaderboard._write_loop, name="leaderboard-writer", daemon=True
+        )
+        Leaderboard._writer.start()
+        atexit.register(Leaderboard.flush)
+
+    @staticmethod
+    def _write_loop() -> None:
+        """Writer thread body: flush every LEADERBOARD_FLUSH_INTERVAL seconds or when a batch is full."""
+        while True:
+            Leaderboard._flush_requested.wait(LEADERBOARD_FLUSH_INTERVAL)
+            Leaderboard._flush_requested.clear()
+            Leaderboard.flush()
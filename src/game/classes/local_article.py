@@ -6,17 +6,22 @@ store them in memory, and retrieve random articles based on specified
 criteria such as category and truth status.
 """
 
-import random
 import json
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
 from pathlib import Path
-from colorama import init, Fore, Style
-
-# Initialize colorama for colorful console output
-init(autoreset=True)
+from colorama import Fore
 
+from src.config.settings import (
+    LOCAL_CORPUS_PATH,
+    LOCAL_CORPUS_BINARY_PATH,
+    LOCAL_CORPUS_SHARD_DIR,
+)
 from src.game.models.category import CategoryModel
 from src.game.models.article import ArticleModel
+from src.game.utils.binary_corpus import BinaryCorpus
+from src.game.utils.corpus_shards import fresh_shard_categories, iter_shard
+from src.game.utils.metrics import Metrics
+from src.game.utils.sampler import ArticleSampler
 
 
 class ArticlesLocal:
@@ -28,36 +33,197 @@ class ArticlesLocal:
     an in-memory cache of articles for efficient access.
 
     Class Attributes:
-        local_articles: A list of ArticleModel dictionaries stored in memory.
+        local_articles: A list of ArticleModel objects stored in memory. Articles
+                        served from the memory-mapped binary corpus are not
+                        part of this list.
     """
 
     local_articles: list[ArticleModel] = []
 
+    # Articles bucketed by (category, is_truth) for constant-time sampling
+    _index: dict[tuple[str, bool], list[ArticleModel]] = {}
+    _loaded: bool = False
+    _corpus: Optional[BinaryCorpus] = None
+
+    # Categories streamed from their shard when no binary corpus is available
+    _loaded_categories: set[str] = set()
+    _use_shards: Optional[bool] = None
+    # Categories listed in the shard manifest; only these are read from shards
+    _shard_categories: set[str] = set()
+
+    @staticmethod
+    def add_article(article: ArticleModel) -> None:
+        """
+        Add an article to the in-memory store and its lookup index.
+
+        Args:
+            article: The article to add.
+        """
+        ArticlesLocal.local_articles.append(article)
+        ArticlesLocal._index.setdefault(
+            (article.category, article.is_truth), []
+        ).append(article)
+
+    @staticmethod
+    def parse_article(article: Any) -> Optional[ArticleModel]:
+        """
+        Validate one JSON article entry and convert it to an ArticleModel.
+
+        Args:
+            article: A decoded JSON value.
+
+        Returns:
+            Optional[ArticleModel]: The article, or None (with a warning) if the
+                                    entry is invalid.
+        """
+        # Validate required fields
+        if not isinstance(article, dict):
+            print(
+                f"{Fore.YELLOW}Warning: Skipping invalid article (not a dictionary): {article}"
+            )
+            return None
+
+        if not all(
+            key in article
+            for key in ["title", "summary", "category", "is_truth"]
+        ):
+            print(
+                f"{Fore.YELLOW}Warning: Skipping article with missing required fields: {article}"
+            )
+            return None
+
+        # Validate field types
+        if not isinstance(article["title"], str) or not isinstance(
+            article["summary"], str
+        ):
+            print(
+                f"{Fore.YELLOW}Warning: Skipping article with invalid title/summary types: {article}"
+            )
+            return None
+
+        if not isinstance(article["category"], str):
+            print(
+                f"{Fore.YELLOW}Warning: Skipping article with invalid category type: {article}"
+            )
+            return None
+
+        if not isinstance(article["is_truth"], bool):
+            print(
+                f"{Fore.YELLOW}Warning: Skipping article with invalid is_truth type: {article}"
+            )
+            return None
+
+        return ArticleModel.from_dict(article)
+
     @staticmethod
     def load_articles() -> bool:
         """
-        Load articles from a JSON file into the local_articles list.
+        Load the local article corpus.
 
-        This method reads articles from a predefined JSON file path, parses them,
-        and stores them in the class-level local_articles list. If articles have
-        already been loaded, it returns immediately without reloading.
+        If a compiled binary corpus that matches the current JSON file exists,
+        it is memory-mapped and articles are decoded only when picked, so this
+        takes nearly constant time. Otherwise the JSON file is parsed into the
+        class-level local_articles list. If articles have already been loaded,
+        it returns immediately without reloading.
 
         Returns:
             bool: True if articles were loaded successfully or were already loaded,
                  False if an error occurred during loading.
 
         Note:
-            The JSON file is expected to be in the ../../data/responses.json path
-            relative to this file. The file should contain an array of article
-            objects with 'title', 'summary', 'category', and 'is_truth' fields.
+            The JSON file at LOCAL_CORPUS_PATH is the source of truth. It should
+            contain an array of article objects with 'title', 'summary',
+            'category', and 'is_truth' fields. The binary corpus is built from
+            it with `python -m src.game.utils.binary_corpus`.
         """
-        if len(ArticlesLocal.local_articles) > 0:
+        if ArticlesLocal._loaded:
+            return True
+
+        corpus = BinaryCorpus.open_if_fresh(LOCAL_CORPUS_BINARY_PATH, LOCAL_CORPUS_PATH)
+        if corpus is not None:
+            ArticlesLocal._corpus = corpus
+            ArticlesLocal._loaded = True
             return True
 
+        return ArticlesLocal._load_json()
+
+    @staticmethod
+    def load_category(category_name: str) -> bool:
+        """
+        Make the articles of one category available, loading as little as possible.
+
+        The memory-mapped binary corpus is used if it is fresh. Otherwise, if
+        per-category shards built from the current JSON file exist, only the
+        category's shard is streamed line by line. As a last resort the whole
+        JSON file is loaded.
+
+        Args:
+            category_name: The category about to be played.
+
+        Returns:
+            bool: True if the category's articles (if any) are available.
+        """
+        if ArticlesLocal._loaded or category_name in ArticlesLocal._loaded_categories:
+            return True
+
+        if ArticlesLocal._use_shards is None:
+            corpus = BinaryCorpus.open_if_fresh(LOCAL_CORPUS_BINARY_PATH, LOCAL_CORPUS_PATH)
+            if corpus is not None:
+                ArticlesLocal._corpus = corpus
+                ArticlesLocal._loaded = True
+                return True
+            shard_categories = fresh_shard_categories(LOCAL_CORPUS_SHARD_DIR, LOCAL_CORPUS_PATH)
+            ArticlesLocal._use_shards = shard_categories is not None
+            ArticlesLocal._shard_categories = set(shard_categories or ())
+
+        if not ArticlesLocal._use_shards:
+            return ArticlesLocal.load_articles()
+
+        articles: list[ArticleModel] = []
+        if category_name in ArticlesLocal._shard_categories:
+            try:
+                for entry in iter_shard(LOCAL_CORPUS_SHARD_DIR, category_name):
+                    parsed_article = ArticlesLocal.parse_article(entry)
+                    if parsed_article and parsed_article.category == category_name:
+                        articles.append(parsed_article)
+            except OSError as e:
+                print(f"{Fore.YELLOW}Warning: Could not read shard for '{category_name}': {e}")
+                ArticlesLocal._discard_shard_articles()
+                return ArticlesLocal.load_articles()
+
+        # Only a completely read shard is added
+        for article in articles:
+            ArticlesLocal.add_article(article)
+        ArticlesLocal._loaded_categories.add(category_name)
+        return True
+
+    @staticmethod
+    def _discard_shard_articles() -> None:
+        """
+        Remove the articles loaded from shards and stop using shards.
+
+        Called before falling back to the whole JSON file, which holds the
+        same articles again.
+        """
+        loaded = ArticlesLocal._loaded_categories
+        ArticlesLocal.local_articles = [
+            article for article in ArticlesLocal.local_articles if article.category not in loaded
+        ]
+        for key in [key for key in ArticlesLocal._index if key[0] in loaded]:
+            del ArticlesLocal._index[key]
+        ArticlesLocal._loaded_categories = set()
+        ArticlesLocal._use_shards = False
+
+    @staticmethod
+    def _load_json() -> bool:
+        """
+        Parse the JSON corpus into local_articles and the lookup index.
+
+        Returns:
+            bool: True if at least one valid article was loaded.
+        """
         try:
-            current_dir = Path(__file__).parent
-            file_path = (current_dir / "../../data/responses.json").resolve()
-            with open(file_path, "r", encoding="utf-8") as file:
+            with open(LOCAL_CORPUS_PATH, "r", encoding="utf-8") as file:
                 data = json.load(file)
 
                 if not isinstance(data, list):
@@ -65,50 +231,15 @@ class ArticlesLocal:
                     return False
 
                 for article in data:
-                    # Validate required fields
-                    if not isinstance(article, dict):
-                        print(
-                            f"{Fore.YELLOW}Warning: Skipping invalid article (not a dictionary): {article}"
-                        )
-                        continue
-
-                    if not all(
-                        key in article
-                        for key in ["title", "summary", "category", "is_truth"]
-                    ):
-                        print(
-                            f"{Fore.YELLOW}Warning: Skipping article with missing required fields: {article}"
-                        )
-                        continue
-
-                    # Validate field types
-                    if not isinstance(article["title"], str) or not isinstance(
-                        article["summary"], str
-                    ):
-                        print(
-                            f"{Fore.YELLOW}Warning: Skipping article with invalid title/summary types: {article}"
-                        )
-                        continue
-
-                    if not isinstance(article["category"], str):
-                        print(
-                            f"{Fore.YELLOW}Warning: Skipping article with invalid category type: {article}"
-                        )
-                        continue
-
-                    if not isinstance(article["is_truth"], bool):
-                        print(
-                            f"{Fore.YELLOW}Warning: Skipping article with invalid is_truth type: {article}"
-                        )
-                        continue
-
-                    current_article: ArticleModel = article
-                    ArticlesLocal.local_articles.append(current_article)
+                    parsed_article = ArticlesLocal.parse_article(article)
+                    if parsed_article:
+                        ArticlesLocal.add_article(parsed_article)
 
                 if not ArticlesLocal.local_articles:
                     print(f"{Fore.RED}Error: No valid articles found in JSON file")
                     return False
 
+                ArticlesLocal._loaded = True
                 return True
 
         except FileNotFoundError:
@@ -127,8 +258,29 @@ class ArticlesLocal:
             return False
 
     @staticmethod
+    def iter_articles(category_name: str) -> Iterator[ArticleModel]:
+        """
+        Iterate over all local articles of a category, real ones first.
+
+        Args:
+            category_name: The category name.
+
+        Yields:
+            ArticleModel: Every article of the category.
+        """
+        if not ArticlesLocal.load_category(category_name):
+            return
+
+        for is_truth in (True, False):
+            if ArticlesLocal._corpus:
+                for position in range(ArticlesLocal._corpus.count(category_name, is_truth)):
+                    yield ArticlesLocal._corpus.get(category_name, is_truth, position)
+            yield from list(ArticlesLocal._index.get((category_name, is_truth), []))
+
+    @staticmethod
+    @Metrics.timed("local_article")
     def get_random_article(
-        category: CategoryModel, is_truth: bool = True
+        category: CategoryModel, is_truth: bool = True, sampler: Optional[ArticleSampler] = None
     ) -> ArticleModel:
         """
         Retrieve a random article matching the specified criteria.
@@ -137,9 +289,14 @@ class ArticlesLocal:
         that matches the given category and truth status. If no matching articles
         are found, it may raise an IndexError.
 
+        Articles are drawn through the sampler's shuffle bag of the category
+        and truth status, so none repeats until all were drawn, and articles
+        the sampler's player saw in earlier games are skipped.
+
         Args:
             category: The category model containing the category name to filter by.
             is_truth: Whether to return true or false articles. Defaults to True.
+            sampler: The player's sampler. Defaults to the shared sampler.
 
         Returns:
             ArticleModel: A random article matching the specified criteria.
@@ -149,9 +306,10 @@ class ArticlesLocal:
             ValueError: If articles fail to load or if invalid parameters are provided.
 
         Note:
-            This method will automatically load articles from the JSON file if
-            they haven't been loaded yet. The method uses the category's name
-            for comparison with the article's category field.
+            This method will automatically load the selected category's articles
+            if they haven't been loaded yet (see load_category). Lookups use an index keyed by the
+            category's name and the truth status, so they take constant time
+            regardless of corpus size.
         """
         # Input validation
         if not category or not hasattr(category, "name"):
@@ -162,23 +320,27 @@ class ArticlesLocal:
         if not isinstance(is_truth, bool):
             raise ValueError(f"{Fore.RED}is_truth parameter must be a boolean value.")
 
-        if len(ArticlesLocal.local_articles) == 0:
-            success = ArticlesLocal.load_articles()
-            if not success:
-                raise ValueError(f"{Fore.RED}Failed to load articles from file.")
-
-        # Generate a new list and filter truth and category
-        filtered_list: list[ArticleModel] = []
-        for article in ArticlesLocal.local_articles:
-            if (
-                article.get("is_truth") == is_truth
-                and article.get("category") == category.name
-            ):
-                filtered_list.append(article)
-
-        if not filtered_list:
+        if not ArticlesLocal.load_category(category.name):
+            raise ValueError(f"{Fore.RED}Failed to load articles from file.")
+
+        bucket = ArticlesLocal._index.get((category.name, is_truth), [])
+        corpus_count = (
+            ArticlesLocal._corpus.count(category.name, is_truth)
+            if ArticlesLocal._corpus
+            else 0
+        )
+        total = corpus_count + len(bucket)
+        if total == 0:
             raise IndexError(
                 f"{Fore.RED}No articles found for category '{category.name}' with is_truth={is_truth}"
             )
 
-        return random.choice(filtered_list)
+        def get(position: int) -> ArticleModel:
+            if position < corpus_count:
+                return ArticlesLocal._corpus.get(category.name, is_truth, position)
+            return bucket[position - corpus_count]
+
+        sampler = sampler or ArticleSampler.shared()
+        return sampler.sample(
+            ("local", category.name, is_truth), total, get, 1, title=lambda article: article.title
+        )[0]
@@ -0,0 +1,285 @@
+"""
+Round assembly for the TruthPedia game.
+
+This module builds the articles shown in a single round: one AI-generated
+fake article and two real articles, falling back to the local article store
+whenever a live provider fails or cannot answer within the round's deadline.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from colorama import Fore
+
+from src.config.settings import ROUND_DEADLINE, ROUND_ASSEMBLY_WORKERS
+from src.game.classes.ai_gen import FakeArticlePool, FakeNewsGenerator
+from src.game.classes.game_ui import GameUI
+from src.game.classes.local_article import ArticlesLocal
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+from src.game.utils.circuit_breaker import OPEN
+from src.game.utils.deadline import Deadline
+from src.game.utils.hedging import Hedger
+from src.game.utils.metrics import Metrics
+from src.game.utils.sampler import ArticleSampler
+
+REAL_ARTICLES_PER_ROUND = 2
+
+_executor = ThreadPoolExecutor(max_workers=ROUND_ASSEMBLY_WORKERS, thread_name_prefix="round")
+
+
+class RoundBuilder:
+    """
+    Builds the shuffled list of articles for a game round.
+
+    Class Attributes:
+        wiki_hedger: Hedges slow Wikipedia requests with local real articles.
+        fake_hedger: Hedges slow fake article generation with a local fake article.
+    """
+
+    wiki_hedger: Hedger = Hedger("wikipedia")
+    fake_hedger: Hedger = Hedger("openai")
+
+    @staticmethod
+    def _report(message: str, background: bool) -> None:
+        """
+        Print a round assembly problem, unless the round is built in the
+        background, where printing would garble the prompt the player is
+        typing at. Problems are counted in the metrics either way.
+        """
+        if not background:
+            print(message)
+
+    @staticmethod
+    @Metrics.timed("round_build")
+    def build_round(
+        category: CategoryModel,
+        deadline_seconds: Optional[float] = ROUND_DEADLINE,
+        sampler: Optional[ArticleSampler] = None,
+    ) -> Optional[list[ArticleModel]]:
+        """
+        Build a round using the live providers, falling back to local articles.
+
+        The fake and the real articles are fetched concurrently within a
+        latency budget. Provider calls keep their usual timeouts and go on in
+        the background; only the waiting for them stops at the deadline, and
+        whatever is not ready by then is taken from the local store. Late
+        results are not wasted: Wikipedia pages land in the cache and a late
+        fake article goes to the fake article pool, so later rounds can use them.
+
+        Args:
+            category: The category selected by the player.
+            deadline_seconds: The latency budget of the round, or None to wait
+                              for the providers, for rounds built in the
+                              background while the player is busy. Background
+                              builds print nothing.
+            sampler: The player's sampler, which keeps articles from repeating.
+
+        Returns:
+            Optional[list[ArticleModel]]: The shuffled articles of the round, or None
+                                          if not enough articles could be found.
+        """
+        deadline = Deadline(deadline_seconds)
+        background = deadline_seconds is None
+        try:
+            fake_future = _executor.submit(RoundBuilder._fetch_fake_article, category, sampler, background)
+            real_future = _executor.submit(RoundBuilder._fetch_real_articles, category, deadline, sampler)
+        except RuntimeError:
+            # The interpreter is shutting down; daemon callers may still be running
+            return RoundBuilder.build_local_round(category, sampler, background)
+
+        ai_article, _ = deadline.result(fake_future) or (None, False)
+        if not fake_future.done():
+            Metrics.increment("deadline_misses_total", {"source": "fake"})
+            fake_future.add_done_callback(RoundBuilder._keep_late_fake_article)
+
+        articles = deadline.result(real_future)
+        if articles is None:
+            Metrics.increment("deadline_misses_total", {"source": "real"})
+            articles = []
+
+        if not ai_article:
+            # Get pre-generated fake article
+            RoundBuilder._report(
+                f"{Fore.YELLOW}Error: Failed to generate fake article. Using pre-generated.", background
+            )
+            Metrics.increment("fallbacks_total", {"kind": "fake"})
+            ai_article = RoundBuilder._get_local_article(category, False, sampler, background)
+            if not ai_article:
+                RoundBuilder._report(f"{Fore.RED}Error: Failed to fetch pre-generated fake article.", background)
+                return None
+
+        for _ in range(REAL_ARTICLES_PER_ROUND - len(articles)):
+            # Get real article from local
+            RoundBuilder._report(
+                f"{Fore.YELLOW}Error: Unable to fetch articles from Wikipedia. Using pre-fetched.", background
+            )
+            Metrics.increment("fallbacks_total", {"kind": "real"})
+            real_article = RoundBuilder._get_local_article(category, True, sampler, background)
+            if not real_article:
+                RoundBuilder._report(f"{Fore.RED}Error: Failed to fetch pre-generated real article.", background)
+                return None
+            articles.append(real_article)
+
+        # Add fake article
+        articles.append(ai_article)
+
+        return GameUI.shuffle(articles)
+
+    @staticmethod
+    def _fetch_fake_article(
+        category: CategoryModel, sampler: Optional[ArticleSampler] = None, background: bool = False
+    ) -> tuple[Optional[ArticleModel], bool]:
+        """
+        Generate the fake article of a round, racing a local one if generation is slow.
+
+        A generated article that loses the race goes to the fake article pool.
+
+        Returns:
+            tuple[Optional[ArticleModel], bool]: The article, and whether it was
+                                                 generated rather than local.
+        """
+        return RoundBuilder.fake_hedger.call(
+            lambda: (FakeNewsGenerator.generate(category.name), True),
+            lambda: (RoundBuilder._get_local_article(category, False, sampler, background), False),
+            is_valid=lambda result: result[0] is not None,
+            on_late=lambda result: FakeArticlePool.give_back(result[0]),
+        )
+
+    @staticmethod
+    def _fetch_real_articles(
+        category: CategoryModel, deadline: Deadline, sampler: Optional[ArticleSampler] = None
+    ) -> list[ArticleModel]:
+        """
+        Fetch the real articles of a round from Wikipedia.
+
+        All articles are fetched in one batched request when possible, racing
+        local ones if Wikipedia is slow. Missing articles are retried one by
+        one until the deadline has passed. While Wikipedia's circuit breaker
+        is open, nothing is fetched.
+
+        Returns:
+            list[ArticleModel]: Up to REAL_ARTICLES_PER_ROUND articles.
+        """
+        articles: list[ArticleModel] = []
+        if ArticleWiki.breaker.state == OPEN:
+            return articles
+
+        background = deadline.expires_at is None
+        try:
+            articles = RoundBuilder.wiki_hedger.call(
+                lambda: ArticleWiki.get_random_articles(
+                    category, REAL_ARTICLES_PER_ROUND, sampler=sampler
+                ),
+                lambda: RoundBuilder._get_local_articles(
+                    category, True, REAL_ARTICLES_PER_ROUND, sampler, background
+                ),
+                is_valid=bool,
+            )
+        except (ValueError, ConnectionError) as e:
+            Metrics.increment("errors_total", {"span": "round_build", "type": type(e).__name__})
+            RoundBuilder._report(f"{Fore.YELLOW}Warning: Failed to fetch real articles: {e}", background)
+
+        for _ in range(REAL_ARTICLES_PER_ROUND - len(articles)):
+            for attempt in range(2):
+                if deadline.expired():
+                    # Nobody waits for the result any more
+                    return articles
+                try:
+                    # Get real article from Wikipedia
+                    articles.append(ArticleWiki.get_random_article(category, sampler=sampler))
+                    break
+                except (ValueError, ConnectionError) as e:
+                    Metrics.increment("errors_total", {"span": "round_build", "type": type(e).__name__})
+                    RoundBuilder._report(
+                        f"{Fore.YELLOW}Warning: Failed to fetch real article (attempt {attempt + 1}): {e}",
+                        background,
+                    )
+        return articles
+
+    @staticmethod
+    def _keep_late_fake_article(future: "Future[tuple[Optional[ArticleModel], bool]]") -> None:
+        """Put a fake article generated after its round's deadline into the pool."""
+        if future.exception() is not None:
+            return
+        article, generated = future.result()
+        if article and generated:
+            FakeArticlePool.give_back(article)
+
+    @staticmethod
+    def build_local_round(
+        category: CategoryModel, sampler: Optional[ArticleSampler] = None, background: bool = False
+    ) -> Optional[list[ArticleModel]]:
+        """
+        Build a round from the local article store only.
+
+        Args:
+            category: The category selected by the player.
+            sampler: The player's sampler, which keeps articles from repeating.
+            background: Whether the round is built in the background, which prints nothing.
+
+        Returns:
+            Optional[list[ArticleModel]]: The shuffled articles of the round, or None
+                                          if the local store has too few articles.
+        """
+        articles: list[ArticleModel] = []
+        for _ in range(REAL_ARTICLES_PER_ROUND):
+            real_article = RoundBuilder._get_local_article(category, True, sampler, background)
+            if not real_article:
+                RoundBuilder._report(f"{Fore.RED}Error: Failed to fetch pre-generated real article.", background)
+                return None
+            articles.append(real_article)
+
+        ai_article = RoundBuilder._get_local_article(category, False, sampler, background)
+        if not ai_article:
+            RoundBuilder._report(f"{Fore.RED}Error: Failed to fetch pre-generated fake article.", background)
+            return None
+        articles.append(ai_article)
+
+        return GameUI.shuffle(articles)
+
+    @staticmethod
+    def get_fake_article(articles: list[ArticleModel]) -> Optional[ArticleModel]:
+        """
+        Return the fake article of a round.
+
+        Args:
+            articles: The articles of the round.
+
+        Returns:
+            Optional[ArticleModel]: The first article that is not true, if any.
+        """
+        return next((article for article in articles if not article.is_truth), None)
+
+    @staticmethod
+    def _get_local_article(
+        category: CategoryModel,
+        is_truth: bool,
+        sampler: Optional[ArticleSampler] = None,
+        background: bool = False,
+    ) -> Optional[ArticleModel]:
+        """
+        Fetch an article from the local store, returning None instead of raising.
+        """
+        try:
+            return ArticlesLocal.get_random_article(category, is_truth, sampler)
+        except (ValueError, IndexError) as e:
+            Metrics.increment("errors_total", {"span": "local_article", "type": type(e).__name__})
+            RoundBuilder._report(f"{Fore.YELLOW}Warning: {e}", background)
+            return None
+
+    @staticmethod
+    def _get_local_articles(
+        category: CategoryModel,
+        is_truth: bool,
+        count: int,
+        sampler: Optional[ArticleSampler] = None,
+        background: bool = False,
+    ) -> list[ArticleModel]:
+        """
+        Fetch up to `count` articles from the local store, skipping failures.
+        """
+        articles = [
+            RoundBuilder._get_local_article(category, is_truth, sampler, background) for _ in range(count)
+        ]
+        return [article for article in articles if article]
@@ -0,0 +1,124 @@
+"""
+Background prefetching of game rounds.
+
+This module assembles upcoming rounds on a worker thread while the player
+is still reading the current one, so a new round can usually start without
+waiting for the live providers.
+"""
+
+import queue
+import threading
+from typing import Optional
+
+from src.config.settings import ROUND_PREFETCH_DEPTH, ROUND_PREFETCH_TIMEOUT
+from src.game.classes.round_builder import RoundBuilder
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+from src.game.utils.metrics import Metrics
+from src.game.utils.sampler import ArticleSampler
+
+
+class RoundPrefetcher:
+    """
+    Builds rounds ahead of time on a background thread.
+
+    At most `depth` finished rounds are kept waiting; the worker blocks once
+    the look-ahead is full and resumes when the game takes a round.
+
+    Attributes:
+        category: The category rounds are built for.
+        depth: Maximum number of rounds built ahead of time.
+        sampler: The player's sampler, which keeps articles from repeating.
+    """
+
+    def __init__(
+        self,
+        category: CategoryModel,
+        depth: int = ROUND_PREFETCH_DEPTH,
+        sampler: Optional[ArticleSampler] = None,
+    ):
+        """
+        Initialize the prefetcher. Call start() to begin building rounds.
+
+        Args:
+            category: The category rounds are built for.
+            depth: Maximum number of rounds built ahead of time.
+            sampler: The player's sampler, which keeps articles from repeating.
+        """
+        self.category = category
+        self.depth = max(1, depth)
+        self.sampler = sampler
+        self._rounds: queue.Queue[list[ArticleModel]] = queue.Queue(maxsize=self.depth)
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="round-prefetcher", daemon=True
+        )
+
+    def start(self) -> "RoundPrefetcher":
+        """
+        Start the background worker.
+
+        Returns:
+            RoundPrefetcher: The prefetcher itself, for chaining.
+        """
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stop building rounds. Rounds that are still being built are discarded."""
+        self._cancelled.set()
+
+    def next_round(self, timeout: float = ROUND_PREFETCH_TIMEOUT) -> list[ArticleModel] | None:
+        """
+        Return the next prefetched round, falling back to the local store.
+
+        Args:
+            timeout: Seconds to wait for a prefetched round before falling back.
+
+        Returns:
+            list[ArticleModel] | None: The articles of the round, or None if neither
+                                       a prefetched nor a local round is available.
+        """
+        try:
+            return self._rounds.get(timeout=timeout)
+        except queue.Empty:
+            Metrics.increment("fallbacks_total", {"kind": "round"})
+            return RoundBuilder.build_local_round(self.category, self.sampler)
+
+    def _run(self) -> None:
+        """Worker loop building rounds until cancelled."""
+        while not self._cancelled.is_set():
+            try:
+                # Nobody waits for this round yet, so the providers get all the time they need
+                articles = RoundBuilder.build_round(self.category, deadline_seconds=None, sampler=self.sampler)
+            except Exception as e:
+                # Keep the worker alive; a dead one would make every next_round wait for its timeout
+                Metrics.increment("errors_total", {"span": "round_prefetch", "type": type(e).__name__})
+                articles = None
+            if articles is None:
+                # Let the game fall back to the local store for this round
+                self._cancelled.wait(1)
+                continue
+            if not self._put(articles):
+                return
+
+    def _put(self, articles: list[ArticleModel]) -> bool:
+        """
+        Queue a finished round, waiting while the look-ahead is full.
+
+        Returns:
+            bool: False if the prefetcher was cancelled while waiting.
+        """
+        while not self._cancelled.is_set():
+            try:
+                self._rounds.put(articles, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @property
+    def ready_rounds(self) -> int:
+        """Number of finished rounds waiting to be played."""
+        return self._rounds.qsize()
+
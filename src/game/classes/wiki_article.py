@@ -6,13 +6,31 @@ categories and process them for use in the game.
 """
 
 import random
-from typing import List, Dict, Any
-import wikipediaapi
+import threading
+from collections import deque
+from typing import List, Dict, Any, Optional
 
-from src.config.settings import WIKI_MAX_SENTENCE_LENGTH
+from src.config.settings import (
+    WIKI_API_URL,
+    WIKI_EXTRACTS_PER_REQUEST,
+    WIKI_MAX_SENTENCE_LENGTH,
+    WIKI_SLOW_CALL_SECONDS,
+    WIKI_CACHE_PATH,
+    WIKI_CACHE_MEMORY_ENTRIES,
+    WIKI_CACHE_DISK_ENTRIES,
+    WIKI_CACHE_MEMBERS_TTL,
+    WIKI_CACHE_PAGE_TTL,
+)
 from src.game.classes.local_article import ArticlesLocal
 from src.game.models.article import ArticleModel
 from src.game.models.category import CategoryModel
+from src.game.utils.cache import TwoTierCache
+from src.game.utils.circuit_breaker import CircuitBreaker
+from src.game.utils.clients import ClientRegistry
+from src.game.utils.mediawiki import fetch_category_members, fetch_extracts, is_playable_title
+from src.game.utils.metrics import Metrics
+from src.game.utils.sampler import ArticleSampler
+from src.game.utils.single_flight import SingleFlight
 
 
 class ArticleWiki(ArticlesLocal):
@@ -22,8 +40,281 @@ class ArticleWiki(ArticlesLocal):
     This class extends ArticlesLocal and provides methods to fetch random
     articles from Wikipedia categories, process their content, and format
     them for use in the game.
+
+    Class Attributes:
+        cache: The shared two-tier cache for category member lists and pages.
+               Created on first use.
+        requests_in_flight: Coalesces concurrent identical Wikipedia requests.
+        api_url: URL of the MediaWiki api.php endpoint.
+        breaker: Circuit breaker of the MediaWiki API. While it is open, cache
+                 misses fail right away with CircuitOpenError.
+        warm_titles: Per category, titles whose summaries were cached by
+                     `warm_up` and are handed out first by `get_random_articles`.
     """
 
+    cache: Optional[TwoTierCache] = None
+    requests_in_flight: SingleFlight = SingleFlight()
+    api_url: str = WIKI_API_URL
+    breaker: CircuitBreaker = CircuitBreaker("wikipedia", slow_call_seconds=WIKI_SLOW_CALL_SECONDS)
+    warm_titles: dict[str, deque[str]] = {}
+
+    _warm_lock = threading.Lock()
+
+    @staticmethod
+    def get_cache() -> TwoTierCache:
+        """
+        Return the shared Wikipedia cache, creating it on first use.
+
+        Returns:
+            TwoTierCache: The cache holding category member lists and pages.
+        """
+        if ArticleWiki.cache is None:
+            ArticleWiki.cache = TwoTierCache(
+                WIKI_CACHE_PATH,
+                max_memory_entries=WIKI_CACHE_MEMORY_ENTRIES,
+                max_disk_entries=WIKI_CACHE_DISK_ENTRIES,
+            )
+        return ArticleWiki.cache
+
+    @staticmethod
+    def _get_category_members(category_name: str) -> Optional[list[str]]:
+        """
+        Return the member titles of a Wikipedia category, using the cache.
+
+        Args:
+            category_name: The category name without the "Category:" prefix.
+
+        Returns:
+            Optional[list[str]]: The member titles, or None if the category
+                                 does not exist.
+        """
+        cached = ArticleWiki.get_cache().get("category_members", category_name)
+        if cached is None:
+            cached = ArticleWiki.requests_in_flight.do(
+                ("category_members", category_name),
+                lambda: ArticleWiki._fetch_category_members(category_name),
+            )
+        return cached["members"] if cached["exists"] else None
+
+    @staticmethod
+    def _fetch_category_members(category_name: str) -> dict[str, Any]:
+        """
+        Download the article members of a category and store them in the cache.
+
+        Args:
+            category_name: The category name without the "Category:" prefix.
+
+        Returns:
+            dict[str, Any]: A dictionary with 'exists' and 'members' keys.
+        """
+        members = ArticleWiki.breaker.call(
+            lambda: fetch_category_members(
+                ClientRegistry.get_wiki_session(), ArticleWiki.api_url, category_name
+            )
+        )
+        entry = {"exists": members is not None, "members": members or []}
+
+        ArticleWiki.get_cache().set(
+            "category_members", category_name, entry, ttl=WIKI_CACHE_MEMBERS_TTL
+        )
+        return entry
+
+    @staticmethod
+    def _get_pages(titles: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Return the existence flag, canonical title and summary of several pages.
+
+        Pages missing from the cache are downloaded together in one batched
+        request.
+
+        Args:
+            titles: The page titles.
+
+        Returns:
+            dict[str, dict[str, Any]]: For each title, a dictionary with 'exists',
+                                       'title' and 'summary' keys.
+        """
+        cache = ArticleWiki.get_cache()
+        pages: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for title in titles:
+            cached = cache.get("page", title)
+            if cached is None:
+                missing.append(title)
+            else:
+                pages[title] = cached
+
+        if missing:
+            pages.update(
+                ArticleWiki.requests_in_flight.do(
+                    ("pages", tuple(missing)), lambda: ArticleWiki._fetch_pages(missing)
+                )
+            )
+        return pages
+
+    @staticmethod
+    def _get_page(title: str) -> dict[str, Any]:
+        """
+        Return the existence flag, canonical title and summary of a page, using the cache.
+
+        Args:
+            title: The page title.
+
+        Returns:
+            dict[str, Any]: A dictionary with 'exists', 'title' and 'summary' keys.
+        """
+        return ArticleWiki._get_pages([title])[title]
+
+    @staticmethod
+    def _fetch_pages(titles: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Download the intros of several pages and cache them.
+
+        One sentence more than WIKI_MAX_SENTENCE_LENGTH is requested because
+        `_to_article` drops the first sentence of long summaries.
+
+        Args:
+            titles: The page titles.
+
+        Returns:
+            dict[str, dict[str, Any]]: For each title, a dictionary with 'exists',
+                                       'title' and 'summary' keys.
+        """
+        pages = ArticleWiki.breaker.call(
+            lambda: fetch_extracts(
+                ClientRegistry.get_wiki_session(),
+                ArticleWiki.api_url,
+                titles,
+                WIKI_MAX_SENTENCE_LENGTH + 1,
+            )
+        )
+        cache = ArticleWiki.get_cache()
+        for title, entry in pages.items():
+            cache.set("page", title, entry, ttl=WIKI_CACHE_PAGE_TTL)
+        return pages
+
+    @staticmethod
+    def _article_titles(category: CategoryModel) -> list[str]:
+        """
+        Return the titles of a category's members that can be played.
+
+        Raises:
+            ValueError: If the category does not exist or has no playable articles.
+        """
+        members = ArticleWiki._get_category_members(category.name)
+
+        if members is None:
+            raise ValueError(
+                f"Category '{category.name}' does not exist on Wikipedia"
+            )
+
+        article_list = [entry_name for entry_name in members if is_playable_title(entry_name)]
+
+        if not article_list:
+            raise ValueError(f"No articles found in category '{category.name}'")
+        return article_list
+
+    @staticmethod
+    def _to_article(page: dict[str, Any], category: CategoryModel) -> ArticleModel:
+        """
+        Turn a cached page into an article, trimming long summaries.
+
+        Raises:
+            ValueError: If the page does not exist or has no summary.
+        """
+        if not page["exists"]:
+            raise ValueError(
+                f"Article '{page['title']}' does not exist on Wikipedia"
+            )
+
+        if not page["summary"] or len(page["summary"].strip()) == 0:
+            raise ValueError(f"Article '{page['title']}' has no summary content")
+
+        split_summary = page["summary"].split(".")
+        concatenated_summary = []
+        if len(split_summary) > 6:
+            for i in range(1, WIKI_MAX_SENTENCE_LENGTH + 1):
+                if i < len(split_summary):
+                    concatenated_summary.append(
+                        split_summary[i].strip("\n").strip("\\")
+                    )
+                else:
+                    break
+
+            return ArticleModel(
+                title=page["title"],
+                summary=". ".join(concatenated_summary),
+                category=category.name,
+                is_truth=True,
+            )
+
+        return ArticleModel(
+            title=page["title"],
+            summary=page["summary"],
+            category=category.name,
+            is_truth=True,
+        )
+
+    @staticmethod
+    def _take_warm_titles(category_name: str, count: int) -> list[str]:
+        """Remove and return up to `count` warmed titles of a category."""
+        with ArticleWiki._warm_lock:
+            titles = ArticleWiki.warm_titles.get(category_name)
+            if not titles:
+                return []
+            return [titles.popleft() for _ in range(min(count, len(titles)))]
+
+    @staticmethod
+    def warm_up(
+        category: CategoryModel, count: int, cancelled: Optional[threading.Event] = None
+    ) -> int:
+        """
+        Fetch a category's member list and `count` random summaries into the cache.
+
+        The warmed titles are handed out first by the next `get_random_articles`
+        calls for the category, so its first rounds need no network access.
+        Does nothing if enough titles are already warm.
+
+        Args:
+            category: The category to warm up.
+            count: How many summaries to fetch.
+            cancelled: Optional event. Once it is set, no further request is started.
+
+        Returns:
+            int: The number of warm titles of the category.
+
+        Raises:
+            ValueError: If the category has no articles or a request fails.
+        """
+        with ArticleWiki._warm_lock:
+            warm = len(ArticleWiki.warm_titles.get(category.name, ()))
+        if warm >= count:
+            return warm
+
+        try:
+            article_list = ArticleWiki._article_titles(category)
+            if cancelled is not None and cancelled.is_set():
+                return warm
+            titles = random.sample(article_list, min(len(article_list), count - warm))
+            pages = ArticleWiki._get_pages(titles)
+        except Exception as e:
+            raise ValueError(f"Unexpected error while warming up Wikipedia category: {e}")
+
+        usable = []
+        for title in titles:
+            try:
+                ArticleWiki._to_article(pages[title], category)
+            except (KeyError, ValueError):
+                continue
+            usable.append(title)
+
+        with ArticleWiki._warm_lock:
+            titles = ArticleWiki.warm_titles.setdefault(
+                category.name, deque(maxlen=WIKI_EXTRACTS_PER_REQUEST)
+            )
+            titles.extend(title for title in usable if title not in titles)
+            return len(titles)
+
     @staticmethod
     def load_articles() -> bool:
         """
@@ -40,8 +331,11 @@ class ArticleWiki(ArticlesLocal):
         raise NotImplementedError("You can not call load_article() on ArticleWiki")
 
     @staticmethod
+    @Metrics.timed("wiki_article")
     def get_random_article(
-        category: CategoryModel, is_truth: bool = True
+        category: CategoryModel,
+        is_truth: bool = True,
+        sampler: Optional[ArticleSampler] = None,
     ) -> ArticleModel:
         """
         Retrieve a random article from the specified Wikipedia category.
@@ -49,10 +343,12 @@ class ArticleWiki(ArticlesLocal):
         Args:
             category: The category from which to fetch a random article.
             is_truth: Whether the article is considered true (always True for Wikipedia articles).
+            sampler: The player's sampler, which keeps articles from repeating.
+                     Defaults to the shared sampler.
 
         Returns:
-            ArticleModel: A dictionary containing the article's title, summary,
-                        category, and truth status.
+            ArticleModel: The article with its title, summary, category, and
+                        truth status.
 
         Raises:
             ValueError: If no articles are found in the specified category.
@@ -60,70 +356,95 @@ class ArticleWiki(ArticlesLocal):
         Note:
             The method processes the article summary to ensure it's an appropriate
             length for the game, typically limiting it to WIKI_MAX_SENTENCE_LENGTH
-            sentences.
+            sentences. Category member lists and page summaries are served from
+            the shared cache when available, so a warm cache needs no network access.
         """
         try:
-            wiki_handle = wikipediaapi.Wikipedia(
-                user_agent="TruthPedia/1.0", language="en"
-            )
-            wiki_page = wiki_handle.page(f"Category:{category.name}")
+            article_list = ArticleWiki._article_titles(category)
+            sampler = sampler or ArticleSampler.shared()
+            random_article = sampler.sample(
+                ("wiki", category.name), len(article_list), article_list.__getitem__, 1
+            )[0]
+            return ArticleWiki._to_article(ArticleWiki._get_page(random_article), category)
 
-            if not wiki_page.exists():
-                raise ValueError(
-                    f"Category '{category.name}' does not exist on Wikipedia"
-                )
+        except Exception as e:
+            raise ValueError(f"Unexpected error while fetching Wikipedia article: {e}")
 
-            article_list = []
-            for entry in wiki_page.categorymembers.values():
-                entry_name = entry.title
-                if entry_name.startswith("Category") or entry_name.startswith("List"):
-                    continue
+    @staticmethod
+    @Metrics.timed("wiki_articles")
+    def get_random_articles(
+        category: CategoryModel,
+        count: int,
+        sampler: Optional[ArticleSampler] = None,
+    ) -> list[ArticleModel]:
+        """
+        Retrieve several distinct random articles from a Wikipedia category at once.
 
-                article_list.append(entry_name)
+        Titles prepared by `warm_up` are used first. Otherwise a few spare
+        titles are requested alongside, so pages without a usable summary
+        rarely leave the result short. With a warm member list this takes a
+        single request for up to WIKI_EXTRACTS_PER_REQUEST titles.
 
-            if not article_list:
-                raise ValueError(f"No articles found in category '{category.name}'")
+        Titles are drawn through the sampler's shuffle bag of the category,
+        and warm titles the sampler's player has already seen are skipped.
+        Only the returned articles are marked as seen, not the spare titles.
 
-            chosen_article: ArticleModel
-            random_article = random.choice(article_list)
-            article_page = wiki_handle.page(random_article)
+        Args:
+            category: The category from which to fetch articles.
+            count: How many articles to return.
+            sampler: The player's sampler, which keeps articles from repeating.
+                     Defaults to the shared sampler.
 
-            if not article_page.exists():
-                raise ValueError(
-                    f"Article '{random_article}' does not exist on Wikipedia"
-                )
+        Returns:
+            list[ArticleModel]: Up to `count` articles. Fewer are returned if the
+                                category has too few usable articles.
 
-            if not article_page.summary or len(article_page.summary.strip()) == 0:
-                raise ValueError(f"Article '{random_article}' has no summary content")
-
-            split_summary = article_page.summary.split(".")
-            concatenated_summary = []
-            if len(split_summary) > 6:
-                for i in range(1, WIKI_MAX_SENTENCE_LENGTH + 1):
-                    if i < len(split_summary):
-                        concatenated_summary.append(
-                            split_summary[i].strip("\n").strip("\\")
-                        )
-                    else:
-                        break
-
-                chosen_article = {
-                    "title": article_page.title,
-                    "summary": ". ".join(concatenated_summary),
-                    "category": category.name,
-                    "is_truth": True,
-                }
-            else:
-                chosen_article: ArticleModel = {
-                    "title": article_page.title,
-                    "summary": article_page.summary,
-                    "category": category.name,
-                    "is_truth": True,
-                }
+        Raises:
+            ValueError: If the category has no articles or the request fails.
+        """
+        if count < 1:
+            return []
 
-            return chosen_article
+        try:
+            article_list = ArticleWiki._article_titles(category)
+            sampler = sampler or ArticleSampler.shared()
+            titles = [
+                title
+                for title in ArticleWiki._take_warm_titles(category.name, count)
+                if not sampler.has_seen(title)
+            ]
+            if len(titles) < count:
+                sample_size = min(
+                    len(article_list), max(count, min(2 * count, WIKI_EXTRACTS_PER_REQUEST))
+                )
+                warm = set(titles)
+                titles += [
+                    title
+                    for title in sampler.sample(
+                        ("wiki", category.name),
+                        len(article_list),
+                        article_list.__getitem__,
+                        sample_size,
+                        mark=False,
+                    )
+                    if title not in warm
+                ][:max(0, sample_size - len(titles))]
+            pages = ArticleWiki._get_pages(titles)
+
+            articles: list[ArticleModel] = []
+            for title in titles:
+                page = pages.get(title)
+                if page is None:
+                    # Not in the response, e.g. an invalid title
+                    continue
+                try:
+                    articles.append(ArticleWiki._to_article(page, category))
+                except ValueError:
+                    continue
+                sampler.mark_seen(title)
+                if len(articles) == count:
+                    break
+            return articles
 
-        # except wikipediaapi.exceptions.PageError as e:
-        #    raise ValueError(f"Wikipedia API error for category '{category.name}': {e}")
         except Exception as e:
-            raise ValueError(f"Unexpected error while fetching Wikipedia article: {e}")
+            raise ValueError(f"Unexpected error while fetching Wikipedia articles: {e}")
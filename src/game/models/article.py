@@ -5,6 +5,9 @@ This module defines the data structures used for representing articles
 in the TruthPedia game, including both real and AI-generated articles.
 """
 
+import sys
+from typing import Any
+
 
 # Article model definition
 class ArticleModel:
@@ -13,6 +16,10 @@ class ArticleModel:
 
     This class defines the structure of articles used throughout the game,
     including real articles from Wikipedia and AI-generated fake articles.
+    It uses __slots__ instead of a per-instance dictionary, and category
+    names are interned so that all articles of a category share one string,
+    which keeps large corpora compact in memory. Dictionaries are only used
+    at the JSON boundary, through from_dict() and to_dict().
 
     Attributes:
         title (str): The title of the article.
@@ -22,7 +29,68 @@ class ArticleModel:
                         or is AI-generated fake news (False).
     """
 
-    title: str
-    summary: str
-    category: str
-    is_truth: bool
+    __slots__ = ("title", "summary", "category", "is_truth")
+
+    def __init__(self, title: str, summary: str, category: str, is_truth: bool):
+        """
+        Initialize a new article.
+
+        Args:
+            title: The title of the article.
+            summary: A brief summary of the article content.
+            category: The category this article belongs to.
+            is_truth: Whether this article is real (True) or fake (False).
+        """
+        self.title = title
+        self.summary = summary
+        self.category = sys.intern(category)
+        self.is_truth = is_truth
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArticleModel":
+        """
+        Create an article from its JSON representation.
+
+        Args:
+            data: A dictionary with 'title', 'summary', 'category' and 'is_truth' keys.
+
+        Returns:
+            ArticleModel: The article.
+
+        Raises:
+            KeyError: If a required key is missing.
+        """
+        return cls(data["title"], data["summary"], data["category"], data["is_truth"])
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the JSON representation of the article.
+
+        Returns:
+            dict[str, Any]: A dictionary with 'title', 'summary', 'category' and 'is_truth' keys.
+        """
+        return {
+            "title": self.title,
+            "summary": self.summary,
+            "category": self.category,
+            "is_truth": self.is_truth,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArticleModel):
+            return NotImplemented
+        return (
+            self.title == other.title
+            and self.summary == other.summary
+            and self.category == other.category
+            and self.is_truth == other.is_truth
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.title, self.category, self.is_truth))
+
+    def __repr__(self) -> str:
+        return (
+            f"ArticleModel(title={self.title!r}, category={self.category!r}, "
+            f"is_truth={self.is_truth!r})"
+        )
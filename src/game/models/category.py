@@ -5,6 +5,8 @@ This module defines the data structures used for representing categories
 in the TruthPedia game, which are used to organize articles by topic.
 """
 
+from typing import Optional
+
 
 class CategoryModel:
     """
@@ -14,16 +16,34 @@ class CategoryModel:
     choose which type of content they want to test their fake news
     detection skills on.
 
+    It uses __slots__, since the category registry may hold thousands of
+    categories.
+
     Attributes:
         name (str): The name of the category (e.g., "Science", "History").
+        depth (int | None): Distance from the nearest crawl seed in the
+                            Wikipedia category graph, if crawled.
+        member_count (int | None): Number of articles and subcategories, if crawled.
+        article_count (int | None): Number of playable articles, if crawled.
     """
 
-    def __init__(self, name: str):
+    __slots__ = ("name", "depth", "member_count", "article_count")
+
+    def __init__(
+        self,
+        name: str,
+        depth: Optional[int] = None,
+        member_count: Optional[int] = None,
+        article_count: Optional[int] = None,
+    ):
         """
         Initialize a new category.
 
         Args:
             name: The name of the category.
+            depth: Distance from the nearest crawl seed, if crawled.
+            member_count: Number of articles and subcategories, if crawled.
+            article_count: Number of playable articles, if crawled.
 
         Raises:
             ValueError: If the category name is empty or invalid.
@@ -32,3 +52,9 @@ class CategoryModel:
             raise ValueError("Category name must be a non-empty string.")
 
         self.name = name
+        self.depth = depth
+        self.member_count = member_count
+        self.article_count = article_count
+
+    def __repr__(self) -> str:
+        return f"CategoryModel(name={self.name!r}, article_count={self.article_count!r})"
@@ -1,4 +1,33 @@
+"""
+Player data model definitions.
+
+This module defines the data structure used for representing a player and
+the score of the game they are playing.
+"""
+
+
 # Player model definition
 class PlayerModel:
-    name: str
-    score: int
+    """
+    Data model for representing a player in the game.
+
+    Attributes:
+        name (str): The name the player chose.
+        score (int): Points scored in the current game, one per fake article spotted.
+    """
+
+    __slots__ = ("name", "score")
+
+    def __init__(self, name: str, score: int = 0):
+        """
+        Initialize a new player.
+
+        Args:
+            name: The name the player chose.
+            score: Points already scored in the current game.
+        """
+        self.name = name
+        self.score = score
+
+    def __repr__(self) -> str:
+        return f"PlayerModel(name={self.name!r}, score={self.score!r})"
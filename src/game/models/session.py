@@ -0,0 +1,82 @@
+"""
+Game session data model definitions.
+
+This module defines the state the game server keeps for each player, which
+is everything main() keeps in local variables for the single console player.
+"""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+
+
+class SessionModel:
+    """
+    Data model for one player's game on the game server.
+
+    It uses __slots__, since a server may hold thousands of sessions.
+
+    Attributes:
+        session_id (str): The unguessable id the player addresses the session by.
+        player_name (str): The name the player chose.
+        categories (list[CategoryModel]): The categories offered to the player.
+        category (CategoryModel | None): The selected category, once chosen.
+        round (int): Number of rounds answered correctly so far.
+        articles (list[ArticleModel] | None): The articles of the round being
+                                              played, once it was handed out.
+        next_round (asyncio.Future | None): The round being built in the background.
+        warmer (CategoryWarmer | None): Warms up the offered categories until one is chosen.
+        sampler (ArticleSampler): Keeps the player's articles from repeating.
+        finished (bool): Whether the game is over.
+        last_seen (float): `time.monotonic()` of the last request.
+    """
+
+    __slots__ = (
+        "session_id",
+        "player_name",
+        "categories",
+        "category",
+        "round",
+        "articles",
+        "next_round",
+        "warmer",
+        "sampler",
+        "finished",
+        "last_seen",
+    )
+
+    def __init__(
+        self, session_id: str, player_name: str, categories: list[CategoryModel], sampler: Any = None
+    ):
+        """
+        Initialize a new session.
+
+        Args:
+            session_id: The session id.
+            player_name: The name the player chose.
+            categories: The categories offered to the player.
+            sampler: The player's article sampler.
+        """
+        self.session_id = session_id
+        self.player_name = player_name
+        self.categories = categories
+        self.category: Optional[CategoryModel] = None
+        self.round = 0
+        self.articles: Optional[list[ArticleModel]] = None
+        self.next_round: Optional[asyncio.Future] = None
+        self.warmer: Optional[Any] = None
+        self.sampler = sampler
+        self.finished = False
+        self.last_seen = time.monotonic()
+
+    def cancel(self) -> None:
+        """Stop building the next round and warming up categories."""
+        if self.warmer is not None:
+            self.warmer.cancel()
+            self.warmer = None
+        if self.next_round is not None:
+            self.next_round.cancel()
+            self.next_round = None
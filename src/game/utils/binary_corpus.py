@@ -0,0 +1,238 @@
+"""
+Compiled binary format for the local article corpus.
+
+The editable source of truth stays 'src/data/responses.json'. This module
+compiles it into 'src/data/responses.bin', which the game memory-maps so
+startup does not depend on the size of the corpus: only the header and the
+bucket table are read on open, and an article is decoded only when it is
+picked.
+
+File layout (all integers little-endian):
+
+    header        magic "TPCORP01", u32 version, u32 bucket count,
+                  u64 source mtime (ns), u64 source size
+    bucket table  per bucket: u16 category length, category (UTF-8),
+                  u8 is_truth, u32 record count, u64 offset of the bucket's
+                  record offset array
+    offset arrays per bucket: one u64 file offset per record
+    records       u32 title length, title (UTF-8),
+                  u32 summary length, summary (UTF-8)
+
+== HOW TO RUN ==
+From the project's root directory:
+python -m src.game.utils.binary_corpus
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Optional
+
+from src.config.settings import LOCAL_CORPUS_PATH, LOCAL_CORPUS_BINARY_PATH
+from src.game.models.article import ArticleModel
+
+MAGIC = b"TPCORP01"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQ")
+_BUCKET = struct.Struct("<BIQ")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+def source_stamp(json_path: Path) -> tuple[int, int]:
+    """Return the (mtime in ns, size) pair identifying a version of the JSON source."""
+    stat = os.stat(json_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def compile_corpus(articles: list[ArticleModel], binary_path: Path, source_path: Path) -> int:
+    """
+    Write articles to the binary corpus format.
+
+    The file is written to a temporary path and then renamed, so readers
+    never see a partially written corpus.
+
+    Args:
+        articles: The articles to compile.
+        binary_path: Destination of the binary corpus.
+        source_path: The JSON file the articles came from, recorded in the header
+                     so stale binaries can be detected.
+
+    Returns:
+        int: The number of articles written.
+    """
+    buckets: dict[tuple[str, bool], list[ArticleModel]] = {}
+    for article in articles:
+        buckets.setdefault((article.category, article.is_truth), []).append(article)
+
+    encoded_keys = [(category.encode("utf-8"), is_truth) for category, is_truth in buckets]
+    table_size = sum(_U16.size + len(name) + _BUCKET.size for name, _ in encoded_keys)
+    offsets_start = _HEADER.size + table_size
+    records_start = offsets_start + _U64.size * len(articles)
+
+    table = bytearray()
+    offset_arrays = bytearray()
+    records = bytearray()
+    offsets_pos = offsets_start
+
+    for (name, is_truth), bucket in zip(encoded_keys, buckets.values()):
+        table += _U16.pack(len(name)) + name + _BUCKET.pack(is_truth, len(bucket), offsets_pos)
+        offsets_pos += _U64.size * len(bucket)
+        for article in bucket:
+            offset_arrays += _U64.pack(records_start + len(records))
+            title = article.title.encode("utf-8")
+            summary = article.summary.encode("utf-8")
+            records += _U32.pack(len(title)) + title + _U32.pack(len(summary)) + summary
+
+    mtime_ns, size = source_stamp(source_path)
+    header = _HEADER.pack(MAGIC, VERSION, len(buckets), mtime_ns, size)
+
+    binary_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = binary_path.with_suffix(binary_path.suffix + ".tmp")
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(table)
+        file.write(offset_arrays)
+        file.write(records)
+    os.replace(temp_path, binary_path)
+
+    return len(articles)
+
+
+class BinaryCorpus:
+    """
+    Read-only, memory-mapped view of a compiled corpus.
+
+    Only the header and bucket table are parsed when the corpus is opened;
+    records are decoded on demand.
+    """
+
+    def __init__(self, binary_path: Path):
+        """
+        Memory-map a compiled corpus.
+
+        Args:
+            binary_path: Path of the binary corpus.
+
+        Raises:
+            ValueError: If the file is not a valid compiled corpus.
+            OSError: If the file cannot be opened.
+        """
+        with open(binary_path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{binary_path} is too small to be a compiled corpus")
+
+        magic, version, bucket_count, self.source_mtime_ns, self.source_size = (
+            _HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{binary_path} is not a compiled corpus (version {VERSION})")
+
+        self._buckets: dict[tuple[str, bool], tuple[int, int]] = {}
+        position = _HEADER.size
+        for _ in range(bucket_count):
+            (name_length,) = _U16.unpack_from(self._map, position)
+            position += _U16.size
+            category = sys.intern(self._map[position:position + name_length].decode("utf-8"))
+            position += name_length
+            is_truth, count, offsets_pos = _BUCKET.unpack_from(self._map, position)
+            position += _BUCKET.size
+            self._buckets[(category, bool(is_truth))] = (count, offsets_pos)
+
+    @staticmethod
+    def open_if_fresh(binary_path: Path, source_path: Path) -> Optional["BinaryCorpus"]:
+        """
+        Open a compiled corpus if it was built from the current JSON source.
+
+        Args:
+            binary_path: Path of the binary corpus.
+            source_path: Path of the JSON source.
+
+        Returns:
+            Optional[BinaryCorpus]: The corpus, or None if it is missing, invalid
+                                    or older than the JSON source.
+        """
+        if not binary_path.exists():
+            return None
+        try:
+            corpus = BinaryCorpus(binary_path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+        if source_path.exists() and source_stamp(source_path) != (
+            corpus.source_mtime_ns,
+            corpus.source_size,
+        ):
+            corpus.close()
+            return None
+        return corpus
+
+    def count(self, category: str, is_truth: bool) -> int:
+        """
+        Return the number of articles in a (category, is_truth) bucket.
+        """
+        bucket = self._buckets.get((category, is_truth))
+        return bucket[0] if bucket else 0
+
+    def get(self, category: str, is_truth: bool, index: int) -> ArticleModel:
+        """
+        Decode one article of a bucket.
+
+        Args:
+            category: The category name.
+            is_truth: The truth status.
+            index: Position of the article within the bucket.
+
+        Returns:
+            ArticleModel: The decoded article.
+
+        Raises:
+            IndexError: If the bucket does not exist or the index is out of range.
+        """
+        bucket = self._buckets.get((category, is_truth))
+        if bucket is None or not 0 <= index < bucket[0]:
+            raise IndexError(f"No article {index} for category '{category}' with is_truth={is_truth}")
+
+        (offset,) = _U64.unpack_from(self._map, bucket[1] + _U64.size * index)
+        (title_length,) = _U32.unpack_from(self._map, offset)
+        offset += _U32.size
+        title = self._map[offset:offset + title_length].decode("utf-8")
+        offset += title_length
+        (summary_length,) = _U32.unpack_from(self._map, offset)
+        offset += _U32.size
+        summary = self._map[offset:offset + summary_length].decode("utf-8")
+
+        return ArticleModel(title, summary, category, is_truth)
+
+    def keys(self) -> list[tuple[str, bool]]:
+        """Return the (category, is_truth) keys of all buckets."""
+        return list(self._buckets)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+
+
+if __name__ == "__main__":
+    from colorama import init
+    from src.game.classes.local_article import ArticlesLocal
+
+    init(autoreset=True)
+
+    print(f"Compiling {LOCAL_CORPUS_PATH} -> {LOCAL_CORPUS_BINARY_PATH}")
+    with open(LOCAL_CORPUS_PATH, "r", encoding="utf-8") as source:
+        data = json.load(source)
+    parsed = [ArticlesLocal.parse_article(entry) for entry in data]
+    written = compile_corpus(
+        [article for article in parsed if article],
+        LOCAL_CORPUS_BINARY_PATH,
+        LOCAL_CORPUS_PATH,
+    )
+    print(f"Wrote {written} articles.")
@@ -0,0 +1,242 @@
+"""
+Two-tier cache for provider responses.
+
+This module provides a small cache with an in-memory LRU tier backed by an
+on-disk SQLite store. It is used to keep Wikipedia category member lists and
+page summaries between rounds and between game sessions, so a warm cache can
+answer a round without any network round trip.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+from colorama import Fore
+
+
+class TwoTierCache:
+    """
+    An LRU memory cache in front of a persistent SQLite store.
+
+    Entries are addressed by a (namespace, key) pair and hold any JSON
+    serializable value. Every entry carries its own expiry time, both tiers
+    are bounded in size, and hit/miss counters are kept for each lookup.
+
+    Attributes:
+        db_path: Path of the SQLite file, or None for a memory-only cache.
+        max_memory_entries: Maximum number of entries kept in the LRU tier.
+        max_disk_entries: Maximum number of entries kept in the SQLite store.
+        default_ttl: Lifetime in seconds for entries stored without a TTL.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path],
+        max_memory_entries: int = 1024,
+        max_disk_entries: int = 50000,
+        default_ttl: float = 86400,
+    ):
+        """
+        Initialize the cache and open (or create) the on-disk store.
+
+        Args:
+            db_path: Path of the SQLite file. If None, only the memory tier is used.
+            max_memory_entries: Maximum number of entries kept in memory.
+            max_disk_entries: Maximum number of entries kept on disk.
+            default_ttl: Default entry lifetime in seconds.
+        """
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.default_ttl = default_ttl
+
+        self._memory: OrderedDict[tuple[str, str], tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disk_writes = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path is not None:
+            self._open_store(db_path)
+
+    def _open_store(self, db_path: Path) -> None:
+        """
+        Open the SQLite store, falling back to memory-only mode on failure.
+
+        Args:
+            db_path: Path of the SQLite file.
+        """
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(db_path), check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)"
+            )
+            connection.commit()
+            self._connection = connection
+        except (sqlite3.Error, OSError) as e:
+            print(f"{Fore.YELLOW}Warning: Could not open cache file {db_path}: {e}. Using memory only.")
+            self._connection = None
+
+    def get(self, namespace: str, key: str) -> Any:
+        """
+        Look up an entry, checking the memory tier before the disk tier.
+
+        Args:
+            namespace: The entry namespace (e.g. "category_members").
+            key: The entry key within the namespace.
+
+        Returns:
+            Any: The cached value, or None if the entry is missing or expired.
+        """
+        cache_key = (namespace, key)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(cache_key)
+                    self.memory_hits += 1
+                    return value
+                del self._memory[cache_key]
+
+            if self._connection is not None:
+                try:
+                    row = self._connection.execute(
+                        "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                        cache_key,
+                    ).fetchone()
+                    if row is not None:
+                        if row[1] > now:
+                            value = json.loads(row[0])
+                            self._connection.execute(
+                                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                                (now, namespace, key),
+                            )
+                            self._connection.commit()
+                            self._remember(cache_key, value, row[1])
+                            self.disk_hits += 1
+                            return value
+                        self._connection.execute(
+                            "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                            cache_key,
+                        )
+                        self._connection.commit()
+                except (sqlite3.Error, json.JSONDecodeError) as e:
+                    print(f"{Fore.YELLOW}Warning: Cache read failed: {e}")
+
+            self.misses += 1
+            return None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store an entry in both tiers.
+
+        Args:
+            namespace: The entry namespace.
+            key: The entry key within the namespace.
+            value: A JSON serializable value. None values are not cached.
+            ttl: Lifetime of the entry in seconds. Defaults to default_ttl.
+        """
+        if value is None:
+            return
+
+        cache_key = (namespace, key)
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._remember(cache_key, value, expires_at)
+
+            if self._connection is None:
+                return
+
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, json.dumps(value, ensure_ascii=False), expires_at, now),
+                )
+                self._disk_writes += 1
+                # Trimming needs a COUNT(*), so only do it every few writes
+                if self._disk_writes % 64 == 0:
+                    self._trim_disk()
+                self._connection.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"{Fore.YELLOW}Warning: Cache write failed: {e}")
+
+    def _remember(self, cache_key: tuple[str, str], value: Any, expires_at: float) -> None:
+        """
+        Put an entry into the memory tier and evict the least recently used ones.
+
+        Must be called with the lock held.
+        """
+        self._memory[cache_key] = (value, expires_at)
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _trim_disk(self) -> None:
+        """
+        Drop expired entries and the least recently used ones above the size limit.
+
+        Must be called with the lock held.
+        """
+        self._connection.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        count = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            self._connection.execute(
+                "DELETE FROM entries WHERE rowid IN"
+                " (SELECT rowid FROM entries ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            self.evictions += overflow
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                try:
+                    self._connection.execute("DELETE FROM entries")
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    print(f"{Fore.YELLOW}Warning: Cache clear failed: {e}")
+            self.memory_hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict[str, int]: Hits per tier, misses, evictions and memory size.
+        """
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "hits": self.memory_hits + self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+            }
@@ -0,0 +1,248 @@
+"""
+Offline crawler of the Wikipedia category graph.
+
+The game used to learn only at play time that a category is missing or has
+no usable articles. This crawler walks the category graph breadth-first from
+seed categories, one depth level at a time, with a bounded number of
+concurrent requests behind a shared rate limit. For every category it
+records the number of members and of playable articles.
+
+The result is written to a category registry (CATEGORY_REGISTRY_PATH), a
+compact JSON file with one row per category, sorted by name:
+
+    {"version": 1, "seeds": [...], "max_depth": 2,
+     "fields": ["name", "depth", "members", "articles"],
+     "categories": [["Hoaxes", 0, 412, 380], ...]}
+
+`Category` loads it into a dictionary keyed by name and offers only the
+categories with at least CATEGORY_MIN_ARTICLES playable articles.
+
+== HOW TO RUN ==
+From the project's root directory:
+python -m src.game.utils.category_crawler
+python -m src.game.utils.category_crawler --depth 1 --workers 4 Hoaxes Cryptids
+
+Then fill the local fallback corpus for the new categories:
+python -m src.game.utils.helpers --parallel
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from colorama import Fore, init
+
+from src.config.settings import (
+    WIKI_API_URL,
+    CATEGORY_REGISTRY_PATH,
+    CRAWLER_MAX_DEPTH,
+    CRAWLER_MAX_CATEGORIES,
+    CRAWLER_WORKERS,
+    CRAWLER_RATE_LIMIT,
+    CRAWLER_RETRIES,
+)
+from src.game.models.category import CategoryModel
+from src.game.utils.clients import ClientRegistry
+from src.game.utils.mediawiki import fetch_category_listing, is_playable_title
+from src.game.utils.rate_limit import TokenBucket, backoff_delay
+
+REGISTRY_VERSION = 1
+REGISTRY_FIELDS = ["name", "depth", "members", "articles"]
+
+
+def load_registry(path: Path) -> dict[str, CategoryModel]:
+    """
+    Read a category registry.
+
+    Args:
+        path: The registry file.
+
+    Returns:
+        dict[str, CategoryModel]: The crawled categories, keyed by name.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a registry of a known version.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    if not isinstance(data, dict) or data.get("version") != REGISTRY_VERSION:
+        raise ValueError(f"Unsupported category registry version in {path}")
+
+    categories: dict[str, CategoryModel] = {}
+    for row in data.get("categories", []):
+        try:
+            name, depth, members, articles = row
+            categories[name] = CategoryModel(name, int(depth), int(members), int(articles))
+        except (TypeError, ValueError):
+            continue
+    return categories
+
+
+def save_registry(
+    path: Path, categories: Iterable[CategoryModel], seeds: list[str], max_depth: int
+) -> None:
+    """
+    Write a category registry, replacing the old one atomically.
+
+    Args:
+        path: The registry file.
+        categories: The crawled categories.
+        seeds: The categories the crawl started from.
+        max_depth: The depth limit of the crawl.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    rows = [
+        json.dumps(
+            [category.name, category.depth, category.member_count, category.article_count],
+            ensure_ascii=False,
+        )
+        for category in sorted(categories, key=lambda category: category.name)
+    ]
+    header = json.dumps({
+        "version": REGISTRY_VERSION,
+        "seeds": seeds,
+        "max_depth": max_depth,
+        "fields": REGISTRY_FIELDS,
+    }, ensure_ascii=False)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as file:
+        # One row per line keeps the file compact and its diffs readable
+        file.write(header[:-1] + ', "categories": [\n' + ",\n".join(rows) + "\n]}\n")
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+class CategoryCrawler:
+    """
+    Breadth-first crawler of the Wikipedia category graph.
+
+    Attributes:
+        api_url: URL of the MediaWiki api.php endpoint.
+        max_depth: Subcategory levels followed below the seeds.
+        max_categories: The crawl stops after this many categories.
+        workers: Maximum number of categories fetched at the same time.
+        limiter: Shared rate limit of all workers.
+        failures: Categories that could not be fetched after all retries.
+    """
+
+    def __init__(
+        self,
+        api_url: str = WIKI_API_URL,
+        max_depth: int = CRAWLER_MAX_DEPTH,
+        max_categories: int = CRAWLER_MAX_CATEGORIES,
+        workers: int = CRAWLER_WORKERS,
+        rate_limit: float = CRAWLER_RATE_LIMIT,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            api_url: URL of the MediaWiki api.php endpoint.
+            max_depth: Subcategory levels followed below the seeds.
+            max_categories: The crawl stops after this many categories.
+            workers: Maximum number of categories fetched at the same time.
+            rate_limit: MediaWiki requests per second across all workers.
+        """
+        self.api_url = api_url
+        self.max_depth = max(0, max_depth)
+        self.max_categories = max_categories
+        self.workers = max(1, workers)
+        self.limiter = TokenBucket(rate_limit)
+        self.failures: list[str] = []
+
+    def crawl(self, seeds: list[str]) -> list[CategoryModel]:
+        """
+        Crawl the category graph from the seeds.
+
+        Every category is fetched once, at the depth it is first reached.
+        Categories that do not exist are left out.
+
+        Args:
+            seeds: The category names to start from, without the "Category:" prefix.
+
+        Returns:
+            list[CategoryModel]: The crawled categories with their counts.
+        """
+        crawled: list[CategoryModel] = []
+        seen = set(seeds)
+        frontier = list(dict.fromkeys(seeds))
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawler") as executor:
+            for depth in range(self.max_depth + 1):
+                frontier = frontier[:max(0, self.max_categories - len(crawled))]
+                if not frontier:
+                    break
+
+                next_frontier: list[str] = []
+                for name, listing in zip(frontier, executor.map(self._fetch, frontier)):
+                    if listing is None:
+                        continue
+                    articles = sum(1 for title in listing["articles"] if is_playable_title(title))
+                    members = len(listing["articles"]) + len(listing["subcategories"])
+                    crawled.append(CategoryModel(name, depth, members, articles))
+
+                    for subcategory in listing["subcategories"]:
+                        if subcategory not in seen:
+                            seen.add(subcategory)
+                            next_frontier.append(subcategory)
+
+                print(f"Depth {depth}: {len(frontier)} categories fetched, {len(crawled)} in total")
+                frontier = next_frontier
+        return crawled
+
+    def _fetch(self, name: str) -> Optional[dict[str, list[str]]]:
+        """Fetch one category's listing, retrying failed requests with backoff."""
+        session = ClientRegistry.get_wiki_session()
+        for attempt in range(1, CRAWLER_RETRIES + 1):
+            self.limiter.acquire()
+            try:
+                return fetch_category_listing(session, self.api_url, name)
+            except ConnectionError as e:
+                if attempt == CRAWLER_RETRIES:
+                    print(f"{Fore.YELLOW}Warning: Could not crawl category '{name}': {e}")
+                    self.failures.append(name)
+                    return None
+                time.sleep(backoff_delay(attempt))
+        return None
+
+
+if __name__ == "__main__":
+    from src.game.classes.category import Category
+
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Crawl the Wikipedia category graph into the category registry.")
+    parser.add_argument("seeds", nargs="*", help="seed categories (default: the predefined categories)")
+    parser.add_argument("--depth", type=int, default=CRAWLER_MAX_DEPTH, help="subcategory levels to follow")
+    parser.add_argument("--max-categories", type=int, default=CRAWLER_MAX_CATEGORIES, help="crawl size limit")
+    parser.add_argument("--workers", type=int, default=CRAWLER_WORKERS, help="concurrent requests")
+    parser.add_argument("--rate", type=float, default=CRAWLER_RATE_LIMIT, help="requests per second")
+    parser.add_argument("--api-url", default=WIKI_API_URL, help="MediaWiki api.php endpoint")
+    parser.add_argument("--output", type=Path, default=CATEGORY_REGISTRY_PATH, help="registry file")
+    args = parser.parse_args()
+
+    seeds = args.seeds or Category.categories
+    crawler = CategoryCrawler(args.api_url, args.depth, args.max_categories, args.workers, args.rate)
+    started = time.perf_counter()
+    categories = crawler.crawl(seeds)
+    if not categories:
+        print(f"{Fore.RED}Error: No category could be crawled. The registry was not changed.")
+        raise SystemExit(1)
+    save_registry(args.output, categories, seeds, args.depth)
+
+    playable = sum(1 for category in categories if Category.is_playable(category))
+    print(
+        f"Crawled {len(categories)} categories in {time.perf_counter() - started:.1f}s: "
+        f"{playable} playable, {len(crawler.failures)} failed. Registry: {args.output}"
+    )
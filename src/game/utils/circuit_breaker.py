@@ -0,0 +1,216 @@
+"""
+Circuit breakers for the external providers.
+
+When a provider is down, every call to it still waits for its timeout
+before the game falls back to the local corpus. A circuit breaker watches
+the outcome of recent calls and, once too many of them fail or are too slow,
+"opens": calls are rejected immediately until a cool-down has passed. Then a
+single probe call is let through ("half-open"). If it succeeds the breaker
+closes again, otherwise it stays open for another cool-down.
+"""
+
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Optional
+
+from src.config.settings import (
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_WINDOW,
+    CIRCUIT_OPEN_SECONDS,
+)
+from src.game.utils.metrics import Metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Numeric state values exported as the circuit_state gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised when a call is rejected because the provider's breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    A thread-safe circuit breaker for one provider.
+
+    A call counts as failed if it raises or takes longer than
+    `slow_call_seconds`. The breaker opens when at least `min_calls` of the
+    last `window` calls are known and `failure_rate` of them failed.
+
+    Attributes:
+        name: Provider name, used as a metrics label.
+        slow_call_seconds: Latency above which a successful call counts as failed.
+        failure_rate: Fraction of failed calls (0-1) that opens the breaker.
+        min_calls: Minimum number of recorded calls before the breaker can open.
+        open_seconds: How long the breaker stays open before probing.
+    """
+
+    # Weak, so breakers that are no longer used (e.g. in tests) drop out
+    _breakers: "weakref.WeakSet[CircuitBreaker]" = weakref.WeakSet()
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str,
+        slow_call_seconds: float,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        window: int = CIRCUIT_WINDOW,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+    ):
+        self.name = name
+        self.slow_call_seconds = slow_call_seconds
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe: Optional[object] = None
+        self._lock = threading.Lock()
+
+        with CircuitBreaker._registry_lock:
+            CircuitBreaker._breakers.add(self)
+
+    @property
+    def state(self) -> str:
+        """
+        The current state. An open breaker whose cool-down has passed reports
+        HALF_OPEN, since the next call will be let through as a probe.
+        """
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                return HALF_OPEN
+            return self._state
+
+    def _transition(self, state: str) -> None:
+        """Change state. Must be called with the lock held."""
+        if state == self._state:
+            return
+        self._state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        if state == CLOSED:
+            self._outcomes.clear()
+        Metrics.increment("circuit_transitions_total", {"provider": self.name, "to": state})
+
+    def allow_request(self) -> Optional[object]:
+        """
+        Decide whether a call may go to the provider.
+
+        Every allowed call must be followed by `record_success`,
+        `record_failure` or `release`, passed the token returned here. While
+        the breaker is half-open only the probe's outcome settles its state;
+        calls admitted before it opened finish without effect.
+
+        Returns:
+            Optional[object]: A token for the call, or None if the breaker is
+                              open, or half-open with its probe already in flight.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return object()
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    Metrics.increment("circuit_rejections_total", {"provider": self.name})
+                    return None
+                self._transition(HALF_OPEN)
+            if self._probe is not None:
+                Metrics.increment("circuit_rejections_total", {"provider": self.name})
+                return None
+            self._probe = object()
+            return self._probe
+
+    def record_success(self, token: object, seconds: float) -> None:
+        """
+        Record a call that returned.
+
+        Args:
+            token: The token `allow_request` returned for the call.
+            seconds: How long the call took. Slow calls count as failures.
+        """
+        if seconds > self.slow_call_seconds:
+            self.record_failure(token)
+            return
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if token is self._probe:
+                    self._probe = None
+                    self._transition(CLOSED)
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self, token: object) -> None:
+        """
+        Record a call that raised, timed out or was too slow.
+
+        Args:
+            token: The token `allow_request` returned for the call.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if token is self._probe:
+                    self._probe = None
+                    self._transition(OPEN)
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if (
+                self._state == CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._transition(OPEN)
+
+    def release(self, token: object) -> None:
+        """
+        Give back an allowed call without recording an outcome, e.g. when the
+        caller cancelled it.
+
+        Args:
+            token: The token `allow_request` returned for the call.
+        """
+        with self._lock:
+            if token is self._probe:
+                self._probe = None
+
+    def call(self, function: Callable[[], Any]) -> Any:
+        """
+        Run a provider call through the breaker.
+
+        Args:
+            function: The call. Raising counts as a failure.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call.
+            Exception: Whatever the call raised.
+        """
+        token = self.allow_request()
+        if token is None:
+            raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+
+        started = time.perf_counter()
+        try:
+            result = function()
+        except Exception:
+            self.record_failure(token)
+            raise
+        self.record_success(token, time.perf_counter() - started)
+        return result
+
+    @staticmethod
+    def collect_metrics():
+        """Report the state of every breaker as the circuit_state gauge."""
+        with CircuitBreaker._registry_lock:
+            breakers = list(CircuitBreaker._breakers)
+        for breaker in breakers:
+            yield "circuit_state", {"provider": breaker.name}, STATE_VALUES[breaker.state]
@@ -0,0 +1,114 @@
+"""
+Shared, long-lived clients for the external providers.
+
+Creating a new OpenAI client or Wikipedia session for every request throws
+away its connection pool and TLS sessions. This module keeps one client per
+provider for the whole process, each with a keep-alive pool sized by
+PROVIDER_POOL_SIZE.
+
+The client libraries are imported when their client is first requested.
+`openai` alone takes longer to import than the rest of the game, and a
+session that only plays local articles never needs it.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from src.config.settings import OPENAI_API_KEY, PROVIDER_POOL_SIZE, WIKI_USER_AGENT
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+    from openai import OpenAI, AsyncOpenAI
+
+
+class ClientRegistry:
+    """
+    Process-wide registry of provider clients.
+
+    Clients are created lazily on first use and then reused by every caller.
+
+    Class Attributes:
+        pool_size: Maximum number of pooled keep-alive connections per provider.
+    """
+
+    pool_size: int = PROVIDER_POOL_SIZE
+
+    _openai: Optional["OpenAI"] = None
+    _async_openai: Optional["AsyncOpenAI"] = None
+    _wiki_session: Optional["requests.Session"] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _limits() -> "httpx.Limits":
+        """Connection pool limits shared by the OpenAI clients."""
+        import httpx
+
+        return httpx.Limits(
+            max_connections=ClientRegistry.pool_size,
+            max_keepalive_connections=ClientRegistry.pool_size,
+        )
+
+    @staticmethod
+    def get_openai() -> "OpenAI":
+        """
+        Return the shared synchronous OpenAI client.
+
+        Returns:
+            OpenAI: The client, created on first call.
+        """
+        from openai import OpenAI, DefaultHttpxClient
+
+        with ClientRegistry._lock:
+            if ClientRegistry._openai is None:
+                ClientRegistry._openai = OpenAI(
+                    api_key=OPENAI_API_KEY,
+                    http_client=DefaultHttpxClient(limits=ClientRegistry._limits()),
+                )
+            return ClientRegistry._openai
+
+    @staticmethod
+    def get_async_openai() -> "AsyncOpenAI":
+        """
+        Return the shared asynchronous OpenAI client.
+
+        Note:
+            The underlying connection pool is bound to the event loop that first
+            uses it, so the client must only be awaited on that loop.
+
+        Returns:
+            AsyncOpenAI: The client, created on first call.
+        """
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        with ClientRegistry._lock:
+            if ClientRegistry._async_openai is None:
+                ClientRegistry._async_openai = AsyncOpenAI(
+                    api_key=OPENAI_API_KEY,
+                    http_client=DefaultAsyncHttpxClient(limits=ClientRegistry._limits()),
+                )
+            return ClientRegistry._async_openai
+
+    @staticmethod
+    def get_wiki_session() -> "requests.Session":
+        """
+        Return the shared HTTP session for the MediaWiki API.
+
+        Returns:
+            requests.Session: The session, created on first call.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with ClientRegistry._lock:
+            if ClientRegistry._wiki_session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = WIKI_USER_AGENT
+                adapter = HTTPAdapter(
+                    pool_connections=ClientRegistry.pool_size,
+                    pool_maxsize=ClientRegistry.pool_size,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                ClientRegistry._wiki_session = session
+            return ClientRegistry._wiki_session
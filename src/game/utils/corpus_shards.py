@@ -0,0 +1,168 @@
+"""
+Per-category shards of the local article corpus.
+
+The corpus in 'src/data/responses.json' is split into one JSON Lines file
+per category under 'src/data/shards/'. A game session only plays a single
+category, so ArticlesLocal streams just that category's shard instead of
+parsing the whole corpus. The single JSON file remains the source the shards
+are imported from.
+
+A manifest records the JSON file the shards were built from, so shards that
+are older than the JSON source are ignored, and the categories that have a
+shard. Shards of categories that are no longer in the corpus are deleted
+when the shards are rebuilt.
+
+== HOW TO RUN ==
+From the project's root directory:
+python -m src.game.utils.corpus_shards
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from urllib.parse import quote
+
+from src.config.settings import LOCAL_CORPUS_PATH, LOCAL_CORPUS_SHARD_DIR
+from src.game.models.article import ArticleModel
+from src.game.utils.binary_corpus import source_stamp
+
+MANIFEST_NAME = "manifest.json"
+
+
+def shard_path(shard_dir: Path, category: str) -> Path:
+    """
+    Return the shard file of a category.
+
+    Category names are percent-encoded so any name is a safe file name.
+    """
+    return shard_dir / f"{quote(category, safe='')}.jsonl"
+
+
+def write_shards(articles: list[ArticleModel], shard_dir: Path, source_path: Path) -> int:
+    """
+    Split articles into one JSON Lines file per category.
+
+    Each shard is written to a temporary file and renamed into place. Shards
+    of categories without articles are deleted. The manifest is written
+    last, so shards only count as fresh once all of them are complete.
+
+    Args:
+        articles: The articles to write.
+        shard_dir: Destination directory of the shards.
+        source_path: The JSON file the articles came from.
+
+    Returns:
+        int: The number of shards written.
+    """
+    by_category: dict[str, list[ArticleModel]] = {}
+    for article in articles:
+        by_category.setdefault(article.category, []).append(article)
+
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = shard_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    for category, category_articles in by_category.items():
+        path = shard_path(shard_dir, category)
+        temp_path = path.with_suffix(".jsonl.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            for article in category_articles:
+                file.write(json.dumps(article.to_dict(), ensure_ascii=False))
+                file.write("\n")
+        os.replace(temp_path, path)
+
+    current = {shard_path(shard_dir, category).name for category in by_category}
+    for stale_path in shard_dir.glob("*.jsonl"):
+        if stale_path.name not in current:
+            stale_path.unlink()
+
+    mtime_ns, size = source_stamp(source_path)
+    manifest = {
+        "source_mtime_ns": mtime_ns,
+        "source_size": size,
+        "categories": {category: len(items) for category, items in by_category.items()},
+    }
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+    return len(by_category)
+
+
+def fresh_shard_categories(shard_dir: Path, source_path: Path) -> Optional[dict[str, int]]:
+    """
+    Return the categories of the shards, if they were built from the current JSON source.
+
+    Args:
+        shard_dir: Directory of the shards.
+        source_path: Path of the JSON source.
+
+    Returns:
+        Optional[dict[str, int]]: The number of articles per category listed in
+                                  the manifest, or None if there is no complete
+                                  set of shards matching the source.
+    """
+    manifest_path = shard_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    categories = manifest.get("categories") if isinstance(manifest, dict) else None
+    if not isinstance(categories, dict):
+        return None
+    if source_path.exists() and source_stamp(source_path) != (
+        manifest.get("source_mtime_ns"),
+        manifest.get("source_size"),
+    ):
+        return None
+    return categories
+
+
+def iter_shard(shard_dir: Path, category: str) -> Iterator[Any]:
+    """
+    Stream the decoded entries of a category's shard, one line at a time.
+
+    Args:
+        shard_dir: Directory of the shards.
+        category: The category name.
+
+    Yields:
+        Any: The decoded JSON value of each non-empty line. Lines that are not
+             valid JSON are skipped.
+    """
+    path = shard_path(shard_dir, category)
+    if not path.exists():
+        return
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+if __name__ == "__main__":
+    from colorama import init
+    from src.game.classes.local_article import ArticlesLocal
+
+    init(autoreset=True)
+
+    print(f"Sharding {LOCAL_CORPUS_PATH} -> {LOCAL_CORPUS_SHARD_DIR}")
+    with open(LOCAL_CORPUS_PATH, "r", encoding="utf-8") as source:
+        data = json.load(source)
+    parsed = [ArticlesLocal.parse_article(entry) for entry in data]
+    written = write_shards(
+        [article for article in parsed if article],
+        LOCAL_CORPUS_SHARD_DIR,
+        LOCAL_CORPUS_PATH,
+    )
+    print(f"Wrote {written} shards.")
@@ -0,0 +1,68 @@
+"""
+Latency budgets for round assembly.
+
+A round is assembled from several provider calls, each with its own timeout
+and retries, so without an overall budget a slow provider can keep the
+player waiting for a minute. A Deadline is started when assembly begins and
+bounds only the waiting: provider calls run on worker threads with their
+usual timeouts, and whatever is not ready by the deadline is filled from the
+local corpus. Calls that finish late are not wasted, their results still
+reach the caches and pools, and a provider that times out still counts as
+failed in its circuit breaker.
+"""
+
+import time
+from concurrent.futures import Future, wait
+from typing import Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """
+    A point in time by which a piece of work must be done.
+
+    Attributes:
+        expires_at: The deadline, in `time.monotonic()` seconds, or None if
+                    there is none.
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: Optional[float]):
+        """
+        Start a deadline.
+
+        Args:
+            seconds: The budget, counted from now, or None for no deadline,
+                     e.g. for work done in the background.
+        """
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> Optional[float]:
+        """Return the seconds left, 0.0 once the deadline has passed, or None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Return whether the deadline has passed."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def result(self, future: "Future[T]") -> Optional[T]:
+        """
+        Wait for a future until the deadline.
+
+        Args:
+            future: The future to wait for.
+
+        Returns:
+            Optional[T]: Its result, or None if it is not done by the deadline.
+                         The future keeps running. Without a deadline, this
+                         waits until the future is done.
+
+        Raises:
+            Exception: Whatever the future raised.
+        """
+        done, _ = wait([future], timeout=self.remaining())
+        return future.result() if done else None
@@ -0,0 +1,227 @@
+"""
+Hedged requests for slow providers.
+
+A provider call that is slower than usual often is not failing, just stuck
+behind a slow server. Instead of waiting for it (or for its timeout), a
+Hedger starts a second, backup request once the call has taken longer than
+a percentile of the provider's recent latency, but no later than
+HEDGE_MAX_DELAY. Whichever valid result comes first wins; the other one is
+cancelled if it has not started, and otherwise ignored.
+
+A running call cannot be stopped, so a stuck loser keeps its worker until
+the provider's own timeout. At most HEDGE_MAX_WORKERS calls run at once:
+when all workers are busy, a call runs in the caller's thread without a
+hedge instead of queueing behind the stuck ones.
+
+Hedges are paid for out of a budget that grows by `budget_ratio` with every
+call, so at most that fraction of calls is ever hedged and a slow provider
+never sees its load doubled.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional, TypeVar
+
+from src.config.settings import (
+    HEDGE_PERCENTILE,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_INITIAL_DELAY,
+    HEDGE_MAX_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MAX_WORKERS,
+)
+from src.game.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+# Most hedges that can be saved up while a provider is fast
+MAX_HEDGE_CREDITS = 5.0
+
+_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hedge")
+# One slot per worker, so submitted calls never wait in the executor's queue
+_slots = threading.BoundedSemaphore(HEDGE_MAX_WORKERS)
+
+
+def _submit(call: Callable[[], T]) -> Optional[Future]:
+    """Run a call on a free worker, or return None if none is free."""
+    if not _slots.acquire(blocking=False):
+        return None
+    try:
+        future = _executor.submit(call)
+    except RuntimeError:
+        # The interpreter is shutting down; daemon callers may still be running
+        _slots.release()
+        return None
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
+class LatencyTracker:
+    """
+    Thread-safe sliding window of recent call latencies.
+
+    Attributes:
+        window: Number of latencies kept.
+    """
+
+    def __init__(self, window: int = HEDGE_LATENCY_WINDOW):
+        self.window = window
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency to the window."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return the q-th percentile of the window (nearest rank).
+
+        Args:
+            q: The percentile, between 0 and 100.
+
+        Returns:
+            Optional[float]: The percentile in seconds, or None if the window is empty.
+        """
+        with self._lock:
+            ordered = sorted(self._latencies)
+        if not ordered:
+            return None
+        rank = min(len(ordered), max(1, math.ceil(q / 100 * len(ordered))))
+        return ordered[rank - 1]
+
+
+class Hedger:
+    """
+    Issues a backup request when a provider call is slow.
+
+    Attributes:
+        name: Provider name, used as a metrics label.
+        percentile: Latency percentile after which a hedge starts, or None to
+                    disable hedging.
+        budget_ratio: Fraction of calls that may be hedged.
+        latencies: Recent latencies of the primary calls.
+        hedges: Number of hedges started.
+        hedge_wins: Number of calls answered by the hedge.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: Optional[float] = HEDGE_PERCENTILE,
+        budget_ratio: float = HEDGE_BUDGET_RATIO,
+    ):
+        self.name = name
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.latencies = LatencyTracker()
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._credits = 1.0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> float:
+        """
+        Return how long a primary call may take before it is hedged.
+
+        Until HEDGE_MIN_SAMPLES latencies are known, HEDGE_INITIAL_DELAY is used.
+        The delay never exceeds HEDGE_MAX_DELAY.
+        """
+        if len(self.latencies) < HEDGE_MIN_SAMPLES:
+            return HEDGE_INITIAL_DELAY
+        return min(self.latencies.percentile(self.percentile), HEDGE_MAX_DELAY)
+
+    def _take_credit(self) -> bool:
+        """Pay for a hedge out of the budget, if it allows one."""
+        with self._lock:
+            if self._credits >= 1:
+                self._credits -= 1
+                self.hedges += 1
+                return True
+            return False
+
+    def _earn_credit(self) -> None:
+        """Grow the budget by one call's worth."""
+        with self._lock:
+            self._credits = min(MAX_HEDGE_CREDITS, self._credits + self.budget_ratio)
+
+    def call(
+        self,
+        primary: Callable[[], T],
+        hedge: Callable[[], T],
+        is_valid: Callable[[T], bool] = lambda result: result is not None,
+        on_late: Optional[Callable[[T], None]] = None,
+    ) -> T:
+        """
+        Run `primary`, starting `hedge` in parallel if it is too slow.
+
+        Args:
+            primary: The provider call.
+            hedge: The backup call (e.g. the local corpus or a second live request).
+            is_valid: Tells whether a result is usable.
+            on_late: Called with the primary call's result if the hedge won
+                     and the primary call later produces a valid result, so
+                     that result is not wasted.
+
+        Returns:
+            T: The first valid result. If neither result is valid, the primary
+               call's result.
+
+        Raises:
+            Exception: Whatever `primary` raised, if the hedge did not produce a
+                       valid result either.
+        """
+        if self.percentile is None:
+            return primary()
+
+        self._earn_credit()
+        started = time.perf_counter()
+        primary_future = _submit(primary)
+        if primary_future is None:
+            Metrics.increment("hedge_skips_total", {"provider": self.name})
+            return primary()
+        primary_future.add_done_callback(
+            lambda _: self.latencies.record(time.perf_counter() - started)
+        )
+
+        done, _ = wait([primary_future], timeout=self.hedge_delay())
+        if done or not self._take_credit():
+            return primary_future.result()
+
+        hedge_future = _submit(hedge)
+        if hedge_future is None:
+            Metrics.increment("hedge_skips_total", {"provider": self.name})
+            return primary_future.result()
+        Metrics.increment("hedges_total", {"provider": self.name})
+        pending: set[Future] = {primary_future, hedge_future}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and is_valid(future.result()):
+                    if future is hedge_future:
+                        with self._lock:
+                            self.hedge_wins += 1
+                        Metrics.increment("hedge_wins_total", {"provider": self.name})
+                    for loser in pending:
+                        loser.cancel()
+                    if on_late is not None and primary_future in pending:
+                        primary_future.add_done_callback(
+                            lambda late: Hedger._hand_over(late, is_valid, on_late)
+                        )
+                    return future.result()
+
+        return primary_future.result()
+
+    @staticmethod
+    def _hand_over(future: Future, is_valid: Callable[[T], bool], on_late: Callable[[T], None]) -> None:
+        """Pass the valid result of a call that finished after losing to `on_late`."""
+        if not future.cancelled() and future.exception() is None and is_valid(future.result()):
+            on_late(future.result())
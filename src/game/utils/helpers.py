@@ -5,19 +5,44 @@ This script fetches real articles from Wikipedia and generates fake articles
 using the OpenAI API to fill 'src/data/responses.json'. This JSON file is used
 as a fallback by ArticlesLocal when live API calls fail.
 
-This script is designed to be resumable. It checks the existing JSON
-data before fetching new content for each category.
+This script is designed to be resumable. Every accepted article is appended
+to a journal ('src/data/responses.journal.jsonl') and fsynced right away.
+At the end of a run the journal is compacted into the JSON file with an
+atomic rename, and the article counts per category are saved next to it
+('src/data/responses.status.json'). An interrupted run leaves its journal
+behind, and the next run replays it instead of fetching those articles
+again. The counts of the next run come from the saved counts plus the
+journal, so the JSON file is only read if there are articles to add.
 
 == HOW TO RUN ==
 From the project's root directory (the one containing the 'src' folder):
 python -m src.game.utils.helpers
+
+To work on several categories at once, with per-provider rate limits and
+exponential backoff instead of fixed sleeps:
+python -m src.game.utils.helpers --parallel --workers 8
+
+Real articles are fetched REAL_BATCH_SIZE at a time with one batched
+MediaWiki query, and fake articles FAKE_BATCH_SIZE at a time in a single
+OpenAI call. Use --fake-batch-size 1 to request fakes one by one.
+
+To generate the missing fake articles offline as one OpenAI Batch API job,
+write the request file, submit it, then import the job's output file:
+python -m src.game.utils.helpers --write-batch fake_requests.jsonl
+python -m src.game.utils.helpers --read-batch fake_results.jsonl
 """
 
+import os
 import sys
 import json
 import time
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Set, Callable, Union
+from typing import Any, List, Callable, Union, Optional
 
 
 try:
@@ -26,6 +51,8 @@ try:
         sys.path.insert(0, str(PROJECT_ROOT))
 
     JSON_FILE_PATH = PROJECT_ROOT / "src" / "data" / "responses.json"
+    JOURNAL_FILE_PATH = PROJECT_ROOT / "src" / "data" / "responses.journal.jsonl"
+    STATUS_FILE_PATH = PROJECT_ROOT / "src" / "data" / "responses.status.json"
 except IndexError:
     print("Error: Could not determine project root.")
     print("Please ensure this script is located at 'src/game/utils/helpers.py'")
@@ -39,6 +66,11 @@ try:
     from src.game.classes.category import Category
     from src.game.classes.wiki_article import ArticleWiki
     from src.game.classes.ai_gen import FakeNewsGenerator
+    from src.game.utils.rate_limit import TokenBucket, backoff_delay
+    from src.game.utils.binary_corpus import compile_corpus, source_stamp
+    from src.game.utils.corpus_shards import write_shards
+    from src.game.utils.journal import ArticleJournal
+    from src.game.utils.near_duplicate import NearDuplicateIndex
 except ImportError as e:
     print(f"Error: Failed to import project modules: {e}")
     print("Please ensure you are running this script from the project root, e.g.:")
@@ -49,166 +81,644 @@ except ImportError as e:
 TARGET_REAL_ARTICLES_PER_CAT = 8
 TARGET_FAKE_ARTICLES_PER_CAT = 4
 API_RETRY_DELAY = 5  # seconds to wait after a failed API call
-WIKI_API_DELAY = 1   # seconds to wait between successful Wikipedia API calls
 AI_API_DELAY = 2     # seconds to wait between successful OpenAI API calls
 
+# Parallel mode configuration
+PARALLEL_WORKERS = 8      # categories processed at the same time
+WIKI_RATE_LIMIT = 5.0     # Wikipedia requests per second across all workers
+AI_RATE_LIMIT = 2.0       # OpenAI requests per second across all workers
+BACKOFF_BASE_DELAY = 1.0  # seconds, first retry delay ceiling
+BACKOFF_MAX_DELAY = 30.0  # seconds, maximum retry delay ceiling
+
+STATUS_VERSION = 1
+
+# Batched request configuration
+REAL_BATCH_SIZE = TARGET_REAL_ARTICLES_PER_CAT  # real articles per MediaWiki extracts query
+FAKE_BATCH_SIZE = TARGET_FAKE_ARTICLES_PER_CAT  # fake articles per OpenAI request
+
 
-def _load_existing_articles() -> List[ArticleModel]:
-    """Loads the existing articles from the JSON file."""
+def _load_existing_articles() -> tuple[List[ArticleModel], List[Any]]:
+    """
+    Loads the existing articles from the JSON file.
+
+    Entries that are not valid articles (e.g. legacy entries without
+    'is_truth') are neither counted nor served, but returned as they are, so
+    compaction can write them back unchanged instead of dropping them.
+
+    Returns:
+        tuple: The valid articles and the invalid raw entries.
+    """
     if not JSON_FILE_PATH.exists():
         print("No existing 'responses.json' file found. Starting fresh.")
-        return []
+        return [], []
     try:
         with open(JSON_FILE_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
             if isinstance(data, list):
-                print(f"Loaded {len(data)} existing articles.")
-                return data
+                articles: List[ArticleModel] = []
+                invalid_entries: List[Any] = []
+                for entry in data:
+                    try:
+                        articles.append(ArticleModel.from_dict(entry))
+                    except (KeyError, TypeError):
+                        invalid_entries.append(entry)
+                print(f"Loaded {len(articles)} existing articles.")
+                if invalid_entries:
+                    print(f"Warning: Keeping {len(invalid_entries)} invalid article entries unchanged.")
+                return articles, invalid_entries
             print("Warning: 'responses.json' does not contain a list. Starting fresh.")
-            return []  # File contained invalid data
+            return [], []  # File contained invalid data
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Could not read existing JSON file: {e}. Starting fresh.")
-        return []
+        return [], []
+
+def _replay_journal(journaled: List[ArticleModel], all_articles: List[ArticleModel]) -> int:
+    """
+    Add the articles of an interrupted run's journal to the loaded articles.
+
+    Articles that are already in the corpus (e.g. when a crash happened after
+    compaction but before the journal was removed) are skipped.
+
+    Args:
+        journaled: The articles read back from the journal.
+        all_articles: The articles of the JSON file, extended in place.
+
+    Returns:
+        int: The number of replayed articles.
+    """
+    known = {(article.category, article.title) for article in all_articles}
+    replayed = 0
+    for article in journaled:
+        if (article.category, article.title) not in known:
+            known.add((article.category, article.title))
+            all_articles.append(article)
+            replayed += 1
+    if replayed:
+        print(f"Replayed {replayed} articles from the journal of a previous run.")
+    return replayed
+
+
+def _load_corpus(journaled: List[ArticleModel]) -> tuple[List[ArticleModel], List[Any], int]:
+    """
+    Load the whole JSON file and replay the journal on top of it.
+
+    Returns:
+        tuple: All articles, the invalid raw entries of the JSON file and the
+               number of replayed journal articles.
+    """
+    all_articles, invalid_entries = _load_existing_articles()
+    replayed = _replay_journal(journaled, all_articles)
+    return all_articles, invalid_entries, replayed
+
+
+def _load_status_snapshot() -> Optional[dict[str, tuple[int, int]]]:
+    """
+    Return the counts per category saved by the last compaction.
 
-def _save_articles(articles: List[ArticleModel]):
-    """Saves the complete list of articles to the JSON file."""
+    Returns:
+        Optional[dict[str, tuple[int, int]]]: Real count and fake count per
+            category, or None if there are no saved counts or the JSON file
+            changed since they were saved.
+    """
+    try:
+        with open(STATUS_FILE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != STATUS_VERSION
+            or not JSON_FILE_PATH.exists()
+            or (data.get("source_mtime_ns"), data.get("source_size")) != source_stamp(JSON_FILE_PATH)
+        ):
+            return None
+        return {category: (int(real), int(fake)) for category, (real, fake) in data["counts"].items()}
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _save_status_snapshot(status: dict[str, tuple[int, int]]):
+    """Save the counts per category of the current JSON file, replacing the old ones atomically."""
+    mtime_ns, size = source_stamp(JSON_FILE_PATH)
+    snapshot = {
+        "version": STATUS_VERSION,
+        "source_mtime_ns": mtime_ns,
+        "source_size": size,
+        "counts": {category: list(counts) for category, counts in sorted(status.items())},
+    }
     try:
-        JSON_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(JSON_FILE_PATH, "w", encoding="utf-8") as f:
-            json.dump(articles, f, indent=2, ensure_ascii=False)
+        temp_path = STATUS_FILE_PATH.with_suffix(".json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, STATUS_FILE_PATH)
+    except OSError as e:
+        # Only costs the next run a full read of the JSON file
+        print(f"Warning: Could not save the article counts: {e}")
+
+
+def _resume_status(journaled: List[ArticleModel]) -> Optional[dict[str, tuple[int, int]]]:
+    """
+    Count the articles of every category from the saved counts and the journal.
+
+    Returns:
+        Optional[dict[str, tuple[int, int]]]: Real count and fake count per
+            category, or None if the saved counts are missing or outdated.
+    """
+    status = _load_status_snapshot()
+    if status is None:
+        return None
+
+    seen = set()
+    for article in journaled:
+        if (article.category, article.title) in seen:
+            continue
+        seen.add((article.category, article.title))
+        real_count, fake_count = status.get(article.category, (0, 0))
+        if article.is_truth:
+            real_count += 1
+        else:
+            fake_count += 1
+        status[article.category] = (real_count, fake_count)
+    print(f"Resumed article counts from {STATUS_FILE_PATH.name} and {len(seen)} journaled articles.")
+    return status
+
+
+def _save_articles(articles: List[ArticleModel], journal: ArticleJournal, invalid_entries: List[Any]):
+    """Compacts the journal into the JSON file, replacing it atomically."""
+    try:
+        journal.compact(articles, JSON_FILE_PATH, invalid_entries)
     except IOError as e:
         print(f"FATAL ERROR: Could not write to JSON file: {e}")
         raise
 
+
+def _category_status(all_articles: List[ArticleModel]) -> dict[str, tuple[int, int]]:
+    """
+    Count the articles of every category in a single pass.
+
+    Returns:
+        dict[str, tuple[int, int]]: Real count and fake count per category.
+    """
+    status: dict[str, tuple[int, int]] = {}
+    for article in all_articles:
+        real_count, fake_count = status.get(article.category, (0, 0))
+        if article.is_truth:
+            real_count += 1
+        else:
+            fake_count += 1
+        status[article.category] = (real_count, fake_count)
+    return status
+
+
+def _build_duplicate_index(all_articles: List[ArticleModel]) -> NearDuplicateIndex:
+    """Index the titles and summaries of the whole corpus for duplicate checks."""
+    duplicate_index = NearDuplicateIndex()
+    for article in all_articles:
+        duplicate_index.add(article)
+    return duplicate_index
+
+
 def _fetch_and_add_articles(
     num_needed: int,
     fetch_function: Callable,
     category_arg: Union[CategoryModel, str],
-    existing_titles: Set[str],
+    duplicate_index: NearDuplicateIndex,
     all_articles_list: List[ArticleModel],
+    journal: ArticleJournal,
     api_delay: int,
-    article_type_label: str
-):
+    article_type_label: str,
+    limiter: Optional[TokenBucket] = None,
+    lock: Optional[threading.Lock] = None,
+    backoff: bool = False,
+) -> int:
     """
     A generic helper to fetch/generate articles, check duplicates, and handle retries.
+
+    An article is a duplicate if it has the same title as, or a similar
+    title and summary to, any article of the corpus (see NearDuplicateIndex).
+
+    Without a limiter, it sleeps a fixed `api_delay` after every success and
+    API_RETRY_DELAY after every failure. With a limiter, every call waits for
+    a token instead, and failures back off exponentially with jitter.
+
+    Batched fetch functions wait for their limiter themselves, so they are
+    passed without one and with `backoff` set instead, which keeps the
+    exponential backoff for their failed batches.
+
+    Returns:
+        int: The number of articles added.
     """
+    backoff = backoff or limiter is not None
     if num_needed <= 0:
-        return  # Nothing to do
+        return 0  # Nothing to do
 
     print(f"Fetching {num_needed} new {article_type_label} articles...")
 
     max_consecutive_duplicates = 20
+    added = 0
 
     for i in range(num_needed):
         consecutive_duplicates_found = 0
+        consecutive_failures = 0
 
         while True:
             try:
+                if limiter is not None:
+                    limiter.acquire()
                 new_article = fetch_function(category_arg)
 
                 # Validate the response
-                if not new_article or not new_article.get('title'):
-                    print(f"  ! Failed to get valid article data. Retrying in {API_RETRY_DELAY}s...")
-                    time.sleep(API_RETRY_DELAY)
+                if not new_article or not new_article.title:
+                    consecutive_failures += 1
+                    delay = _retry_delay(backoff, consecutive_failures)
+                    print(f"  ! Failed to get valid article data. Retrying in {delay:.1f}s...")
+                    time.sleep(delay)
                     continue
 
                 # Check for duplicates
-                if new_article['title'] not in existing_titles:
-                    all_articles_list.append(new_article)
-                    existing_titles.add(new_article['title'])
-                    print(f"  [{i+1}/{num_needed}] Added {article_type_label}: {new_article['title'][:50]}...")
-                    time.sleep(api_delay)
+                duplicate_of = duplicate_index.add_if_unique(new_article)
+                if duplicate_of is None:
+                    journal.append(new_article)
+                    if lock is not None:
+                        with lock:
+                            all_articles_list.append(new_article)
+                    else:
+                        all_articles_list.append(new_article)
+                    added += 1
+                    print(f"  [{i+1}/{num_needed}] Added {article_type_label}: {new_article.title[:50]}...")
+                    if limiter is None:
+                        time.sleep(api_delay)
                     break
                 else:
-                    print(f"  ! Duplicate found, retrying: {new_article['title'][:50]}...")
+                    print(f"  ! Duplicate of '{duplicate_of[:40]}' found, retrying: {new_article.title[:50]}...")
                     consecutive_duplicates_found += 1
-                    time.sleep(0.5)
+                    if limiter is None:
+                        time.sleep(0.5)
 
                     if consecutive_duplicates_found > max_consecutive_duplicates:
                         print(f"  ! Found {max_consecutive_duplicates}+ duplicates in a row.")
                         print(f"  ! Assuming category is exhausted of new {article_type_label} articles. Moving on.")
-                        return
+                        return added
 
             except Exception as e:
-                print(f"  ! Error fetching {article_type_label} article: {e}. Retrying in {API_RETRY_DELAY}s...")
-                time.sleep(API_RETRY_DELAY)
+                consecutive_failures += 1
+                delay = _retry_delay(backoff, consecutive_failures)
+                print(f"  ! Error fetching {article_type_label} article: {e}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+    return added
 
 
-def populate_fallback_data():
+def _retry_delay(backoff: bool, attempt: int) -> float:
+    """Return the delay before the next retry: exponential with `backoff`, else fixed."""
+    if not backoff:
+        return API_RETRY_DELAY
+    return backoff_delay(attempt, BACKOFF_BASE_DELAY, BACKOFF_MAX_DELAY)
+
+
+def _batched_fetcher(
+    fetch_batch: Callable, batch_size: int, limiter: Optional[TokenBucket] = None
+) -> Callable:
     """
-    Fetches and generates articles to meet the target counts for each category.
+    Build a fetch function that gets articles `batch_size` at a time.
+
+    Articles of a batch are handed out one by one, so the function can be used
+    with `_fetch_and_add_articles` like a single-article fetch function. Only
+    the batched API calls wait for the limiter.
+
+    Args:
+        fetch_batch: Called with the category argument and `batch_size`, returns
+                     a list of articles.
+        batch_size: Articles requested per call.
+        limiter: Rate limiter for the batched calls.
+
+    Returns:
+        Callable: A function taking the category argument and returning an
+                  article or None.
     """
-    print("Starting fallback data population utility...")
-    print(f"Target file: {JSON_FILE_PATH}")
-    print(f"Targets: {TARGET_REAL_ARTICLES_PER_CAT} REAL, {TARGET_FAKE_ARTICLES_PER_CAT} FAKE per category\n")
+    buffer: deque[ArticleModel] = deque()
+
+    def fetch(category_arg: Union[CategoryModel, str]) -> Optional[ArticleModel]:
+        if not buffer:
+            if limiter is not None:
+                limiter.acquire()
+            buffer.extend(fetch_batch(category_arg, batch_size))
+        return buffer.popleft() if buffer else None
+
+    return fetch
+
+
+def _process_category(
+    category_name: str,
+    status: tuple[int, int],
+    all_articles: List[ArticleModel],
+    journal: ArticleJournal,
+    duplicate_index: NearDuplicateIndex,
+    wiki_limiter: Optional[TokenBucket] = None,
+    ai_limiter: Optional[TokenBucket] = None,
+    lock: Optional[threading.Lock] = None,
+    fake_batch_size: int = FAKE_BATCH_SIZE,
+) -> int:
+    """
+    Fetch and generate the missing articles of one category.
+
+    Progress is saved article by article through the journal.
+
+    Args:
+        category_name: The category to fill.
+        status: Real count and fake count of the category.
+        all_articles: The shared list of all articles.
+        journal: The journal every accepted article is appended to.
+        duplicate_index: Near-duplicate index over the whole corpus.
+        wiki_limiter: Rate limiter for Wikipedia calls (parallel mode only).
+        ai_limiter: Rate limiter for OpenAI calls (parallel mode only).
+        lock: Guards `all_articles` (parallel mode only).
+        fake_batch_size: Fake articles requested per API call. 1 disables batching.
+
+    Returns:
+        int: The number of articles added.
+    """
+    category_model = CategoryModel(category_name)
+    print(f"--- Processing Category: {category_name} ---")
+
+    # 1. Get current counts
+    current_real_count, current_fake_count = status
+
+    needed_real = TARGET_REAL_ARTICLES_PER_CAT - current_real_count
+    needed_fake = TARGET_FAKE_ARTICLES_PER_CAT - current_fake_count
+
+    print(f"Status: {current_real_count} real (need {needed_real}), {current_fake_count} fake (need {needed_fake})")
+
+    # 2. Fetch missing REAL articles, one batched query per REAL_BATCH_SIZE
+    added = _fetch_and_add_articles(
+        num_needed=needed_real,
+        fetch_function=_batched_fetcher(
+            ArticleWiki.get_random_articles, max(1, min(REAL_BATCH_SIZE, needed_real)), wiki_limiter
+        ),
+        category_arg=category_model,
+        duplicate_index=duplicate_index,
+        all_articles_list=all_articles,
+        journal=journal,
+        api_delay=0,
+        article_type_label="REAL",
+        lock=lock,
+        backoff=wiki_limiter is not None,
+    )
+
+    # 3. Generate missing FAKE articles
+    if fake_batch_size > 1 and needed_fake > 1:
+        # One request per batch: the fetcher waits for the limiter itself and
+        # articles served from a batch need no delay
+        fake_fetch = _batched_fetcher(
+            FakeNewsGenerator.generate_batch, min(fake_batch_size, needed_fake), ai_limiter
+        )
+        fake_delay, fake_limiter, fake_backoff = 0, None, ai_limiter is not None
+    else:
+        # Bypass the FakeArticlePool: its background refills would not wait for the limiter
+        fake_fetch = partial(FakeNewsGenerator.generate, use_pool=False)
+        fake_delay, fake_limiter, fake_backoff = AI_API_DELAY, ai_limiter, False
+
+    added += _fetch_and_add_articles(
+        num_needed=needed_fake,
+        fetch_function=fake_fetch,
+        category_arg=category_name,
+        duplicate_index=duplicate_index,
+        all_articles_list=all_articles,
+        journal=journal,
+        api_delay=fake_delay,
+        article_type_label="FAKE",
+        limiter=fake_limiter,
+        lock=lock,
+        backoff=fake_backoff,
+    )
+
+    if needed_real <= 0 and needed_fake <= 0:
+        print(f"Category '{category_name}' is already complete.")
+
+    print(f"--- Finished Category: {category_name} ---\n")
+    return added
+
+
+def _finish_corpus(all_articles: List[ArticleModel], journal: ArticleJournal, invalid_entries: List[Any]):
+    """
+    Compact the journal into the JSON file and rebuild the binary corpus.
 
-    all_articles = _load_existing_articles()
+    The game prefers a fresh binary corpus over the category shards, so the
+    shards are only written when the binary corpus could not be compiled.
+    """
+    print(f"Compacting journal into: {JSON_FILE_PATH}")
+    _save_articles(all_articles, journal, invalid_entries)
+    binary_path = JSON_FILE_PATH.with_suffix(".bin")
+    print(f"Compiling binary corpus: {binary_path}")
+    try:
+        compile_corpus(all_articles, binary_path, JSON_FILE_PATH)
+    except OSError as e:
+        shard_dir = JSON_FILE_PATH.parent / "shards"
+        print(f"Warning: Could not compile the binary corpus: {e}. Writing category shards: {shard_dir}")
+        write_shards(all_articles, shard_dir, JSON_FILE_PATH)
+    _save_status_snapshot(_category_status(all_articles))
 
-    for category_name in Category.categories:
-        category_model = CategoryModel(category_name)
-        print(f"--- Processing Category: {category_name} ---")
 
-        # 1. Get current counts and existing titles
-        existing_titles_in_cat: Set[str] = set()
-        current_real_count = 0
-        current_fake_count = 0
+def _category_names() -> List[str]:
+    """The categories the game offers: the playable ones of the category registry, if crawled."""
+    return [category.name for category in Category.get_playable_categories()]
 
-        for article in all_articles:
-            if article.get("category") == category_name:
-                if article.get("title"):
-                    existing_titles_in_cat.add(article["title"])
 
-                # Default to False (fake) if 'is_truth' key is missing or False
-                if article.get("is_truth", False):
-                    current_real_count += 1
-                else:
-                    current_fake_count += 1
-
-        needed_real = TARGET_REAL_ARTICLES_PER_CAT - current_real_count
-        needed_fake = TARGET_FAKE_ARTICLES_PER_CAT - current_fake_count
-
-        print(f"Status: {current_real_count} real (need {needed_real}), {current_fake_count} fake (need {needed_fake})")
-
-        # 2. Fetch missing REAL articles
-        _fetch_and_add_articles(
-            num_needed=needed_real,
-            fetch_function=ArticleWiki.get_random_article,
-            category_arg=category_model,
-            existing_titles=existing_titles_in_cat,
-            all_articles_list=all_articles,
-            api_delay=WIKI_API_DELAY,
-            article_type_label="REAL"
-        )
+def write_fake_batch(batch_path: Path):
+    """
+    Write one batched generation request per category that lacks fake articles.
 
-        # 3. Generate missing FAKE articles
-        _fetch_and_add_articles(
-            num_needed=needed_fake,
-            fetch_function=FakeNewsGenerator.generate,
-            category_arg=category_name,
-            existing_titles=existing_titles_in_cat,
-            all_articles_list=all_articles,
-            api_delay=AI_API_DELAY,
-            article_type_label="FAKE"
-        )
+    The file is in the OpenAI Batch API input format. Submit it as a batch job
+    and import the job's output file with `import_fake_batch`.
 
-        # 4. Save progress after each category
-        if needed_real > 0 or needed_fake > 0:
-            print(f"Saving progress for '{category_name}'...")
-            _save_articles(all_articles)
-        else:
-            print(f"Category '{category_name}' is already complete.")
+    Args:
+        batch_path: Destination of the JSON Lines request file.
+    """
+    journaled = ArticleJournal(JOURNAL_FILE_PATH).replay()
+    status = _resume_status(journaled)
+    if status is None:
+        all_articles, _, _ = _load_corpus(journaled)
+        status = _category_status(all_articles)
+
+    requests = {}
+    for category_name in _category_names():
+        needed_fake = TARGET_FAKE_ARTICLES_PER_CAT - status.get(category_name, (0, 0))[1]
+        if needed_fake > 0:
+            requests[category_name] = needed_fake
+
+    written = FakeNewsGenerator.write_batch_file(requests, batch_path)
+    print(f"Wrote {written} batch requests for {sum(requests.values())} fake articles to: {batch_path}")
+
+
+def import_fake_batch(batch_path: Path):
+    """
+    Add the fake articles of an OpenAI Batch API output file to the corpus.
+
+    Duplicates are skipped and no category gets more than the target number
+    of fake articles.
+
+    Args:
+        batch_path: The JSON Lines output file of the batch job.
+    """
+    journal = ArticleJournal(JOURNAL_FILE_PATH)
+    all_articles, invalid_entries, replayed = _load_corpus(journal.replay())
+    status = _category_status(all_articles)
+    duplicate_index = _build_duplicate_index(all_articles)
+
+    try:
+        generated = FakeNewsGenerator.read_batch_file(batch_path)
+    except OSError as e:
+        print(f"Error: Could not read batch file: {e}")
+        return
+
+    added = 0
+    fake_counts = {category: counts[1] for category, counts in status.items()}
+    for article in generated:
+        if fake_counts.get(article.category, 0) >= TARGET_FAKE_ARTICLES_PER_CAT:
+            continue
+        duplicate_of = duplicate_index.add_if_unique(article)
+        if duplicate_of is not None:
+            print(f"  ! Duplicate of '{duplicate_of[:40]}' skipped: {article.title[:50]}...")
+            continue
+        journal.append(article)
+        all_articles.append(article)
+        fake_counts[article.category] = fake_counts.get(article.category, 0) + 1
+        added += 1
+
+    print(f"Imported {added} of {len(generated)} generated articles from: {batch_path}")
+    if added > 0 or replayed > 0:
+        _finish_corpus(all_articles, journal, invalid_entries)
+
+
+def populate_fallback_data(
+    parallel: bool = False,
+    workers: int = PARALLEL_WORKERS,
+    fake_batch_size: int = FAKE_BATCH_SIZE,
+):
+    """
+    Fetches and generates articles to meet the target counts for each category.
 
-        print(f"--- Finished Category: {category_name} ---\n")
+    Args:
+        parallel: If True, process several categories at once behind shared
+                  per-provider rate limiters.
+        workers: Number of categories processed at the same time in parallel mode.
+        fake_batch_size: Fake articles requested per API call. 1 disables batching.
+    """
+    print("Starting fallback data population utility...")
+    print(f"Target file: {JSON_FILE_PATH}")
+    print(f"Targets: {TARGET_REAL_ARTICLES_PER_CAT} REAL, {TARGET_FAKE_ARTICLES_PER_CAT} FAKE per category\n")
+
+    journal = ArticleJournal(JOURNAL_FILE_PATH)
+    journaled = journal.replay()
+    category_names = _category_names()
+    status = _resume_status(journaled)
+    if status is None:
+        all_articles, invalid_entries, replayed = _load_corpus(journaled)
+        status = _category_status(all_articles)
+        if not replayed and JSON_FILE_PATH.exists():
+            _save_status_snapshot(status)
+    elif journaled or any(
+        status.get(name, (0, 0))[0] < TARGET_REAL_ARTICLES_PER_CAT
+        or status.get(name, (0, 0))[1] < TARGET_FAKE_ARTICLES_PER_CAT
+        for name in category_names
+    ):
+        # Duplicate checks and the compaction need the whole corpus
+        all_articles, invalid_entries, replayed = _load_corpus(journaled)
+    else:
+        print("All categories are complete. Nothing to do.")
+        return
+
+    duplicate_index = _build_duplicate_index(all_articles)
+    started = time.perf_counter()
+    added = 0
+
+    if parallel:
+        print(f"Parallel mode: {workers} workers, {WIKI_RATE_LIMIT} Wikipedia req/s, {AI_RATE_LIMIT} OpenAI req/s\n")
+        wiki_limiter = TokenBucket(WIKI_RATE_LIMIT)
+        ai_limiter = TokenBucket(AI_RATE_LIMIT)
+        lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _process_category,
+                    category_name,
+                    status.get(category_name, (0, 0)),
+                    all_articles,
+                    journal,
+                    duplicate_index,
+                    wiki_limiter,
+                    ai_limiter,
+                    lock,
+                    fake_batch_size,
+                )
+                for category_name in category_names
+            ]
+            for future in futures:
+                added += future.result()
+    else:
+        for category_name in category_names:
+            added += _process_category(
+                category_name,
+                status.get(category_name, (0, 0)),
+                all_articles,
+                journal,
+                duplicate_index,
+                fake_batch_size=fake_batch_size,
+            )
+
+    elapsed = time.perf_counter() - started
+
+    if added > 0 or replayed > 0:
+        _finish_corpus(all_articles, journal, invalid_entries)
 
     print("======================================================")
     print("All categories processed. Data population complete.")
     print(f"Total articles saved: {len(all_articles)}")
+    print(f"New articles: {added} in {elapsed:.1f}s ({added / elapsed if elapsed > 0 else 0:.2f} articles/sec)")
     print("======================================================")
 
 
 if __name__ == "__main__":
+    from colorama import init
+
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Populate the local fallback article data.")
+    parser.add_argument(
+        "--parallel", action="store_true",
+        help="process several categories at once behind per-provider rate limits",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=PARALLEL_WORKERS,
+        help=f"categories processed at the same time in parallel mode (default: {PARALLEL_WORKERS})",
+    )
+    parser.add_argument(
+        "--fake-batch-size", type=int, default=FAKE_BATCH_SIZE,
+        help=f"fake articles requested per OpenAI call, 1 disables batching (default: {FAKE_BATCH_SIZE})",
+    )
+    batch_group = parser.add_mutually_exclusive_group()
+    batch_group.add_argument(
+        "--write-batch", type=Path, metavar="PATH",
+        help="only write an OpenAI Batch API request file for the missing fake articles",
+    )
+    batch_group.add_argument(
+        "--read-batch", type=Path, metavar="PATH",
+        help="only import the fake articles of an OpenAI Batch API output file",
+    )
+    args = parser.parse_args()
+
     try:
-        populate_fallback_data()
+        if args.write_batch:
+            write_fake_batch(args.write_batch)
+        elif args.read_batch:
+            import_fake_batch(args.read_batch)
+        else:
+            populate_fallback_data(
+                parallel=args.parallel,
+                workers=args.workers,
+                fake_batch_size=args.fake_batch_size,
+            )
     except KeyboardInterrupt:
         print("\n\nProcess interrupted by user. Exiting gracefully.")
         try:
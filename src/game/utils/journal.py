@@ -0,0 +1,129 @@
+"""
+Append-only journal for articles added to the local corpus.
+
+Rewriting the whole corpus after every category costs more as the corpus
+grows, and a crash mid-write can corrupt it. Instead, every accepted article
+is appended to a JSON Lines journal and fsynced. A compaction step then
+folds the journal into the corpus with write-to-temp-and-rename, so the
+corpus file is always either the old or the new version.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.game.models.article import ArticleModel
+
+
+def write_corpus_atomically(
+    articles: Iterable[ArticleModel], corpus_path: Path, raw_entries: Iterable[Any] = ()
+) -> None:
+    """
+    Replace the JSON corpus with `articles` without ever leaving a partial file.
+
+    Args:
+        articles: The complete list of articles.
+        corpus_path: Path of the JSON corpus.
+        raw_entries: Entries of the old corpus that are not valid articles
+                     (e.g. legacy entries without 'is_truth'). They are written
+                     back unchanged, after the articles, so they are never lost.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    corpus_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = corpus_path.with_suffix(corpus_path.suffix + ".tmp")
+    entries = [article.to_dict() for article in articles]
+    entries.extend(raw_entries)
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(entries, file, indent=2, ensure_ascii=False)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, corpus_path)
+
+
+class ArticleJournal:
+    """
+    A durable, append-only log of new articles.
+
+    Attributes:
+        path: Path of the JSON Lines journal file.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the journal. The file is created on the first append.
+
+        Args:
+            path: Path of the journal file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, article: ArticleModel) -> None:
+        """
+        Append an article and fsync it before returning.
+
+        If the journal ends with a torn line, left by a crash during an
+        append, the article starts on a new line, so it is not merged into
+        the torn one and lost on replay.
+
+        Args:
+            article: The accepted article.
+
+        Raises:
+            OSError: If the journal cannot be written.
+        """
+        line = (json.dumps(article.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a+b") as file:
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        line = b"\n" + line
+                file.write(line)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def replay(self) -> list[ArticleModel]:
+        """
+        Read back the articles recorded in the journal.
+
+        Torn lines, left by a crash during an append, are ignored.
+
+        Returns:
+            list[ArticleModel]: The journaled articles, in append order.
+        """
+        if not self.path.exists():
+            return []
+
+        articles: list[ArticleModel] = []
+        with self._lock, open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    articles.append(ArticleModel.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+        return articles
+
+    def compact(
+        self, articles: Iterable[ArticleModel], corpus_path: Path, raw_entries: Iterable[Any] = ()
+    ) -> None:
+        """
+        Fold the journal into the corpus and empty the journal.
+
+        Args:
+            articles: The complete list of articles (corpus plus journal).
+            corpus_path: Path of the JSON corpus.
+            raw_entries: Invalid entries of the old corpus, written back unchanged.
+
+        Raises:
+            OSError: If the corpus cannot be written. The journal is kept.
+        """
+        with self._lock:
+            write_corpus_atomically(articles, corpus_path, raw_entries)
+            if self.path.exists():
+                self.path.unlink()
@@ -0,0 +1,229 @@
+"""
+Minimal client for the MediaWiki action API.
+
+Fetching a page's summary through a page-at-a-time library costs one request
+for the existence check and another for the content, for every article.
+The queries here batch that work instead:
+
+- `fetch_category_members` gets a category's existence flag and its article
+  members in one query. `cmnamespace=0` makes the server drop subcategories
+  and other non-article members.
+- `fetch_extracts` gets the plain-text intro of up to
+  WIKI_EXTRACTS_PER_REQUEST pages in one query, already cut to a number of
+  sentences by the server.
+- `fetch_category_listing` gets a category's articles and subcategories
+  together, for crawling the category graph.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from src.config.settings import WIKI_API_TIMEOUT, WIKI_EXTRACTS_PER_REQUEST
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _query(
+    session: "requests.Session",
+    api_url: str,
+    params: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Run one action=query request and return the decoded response.
+
+    Raises:
+        ConnectionError: If the request fails or the API reports an error.
+    """
+    # Imported here so the game starts without loading requests
+    import requests
+
+    params = {"action": "query", "format": "json", "formatversion": "2", **params}
+    try:
+        response = session.get(api_url, params=params, timeout=WIKI_API_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise ConnectionError(f"MediaWiki request failed: {e}") from e
+
+    if "error" in data:
+        raise ConnectionError(f"MediaWiki API error: {data['error'].get('info', data['error'])}")
+    return data
+
+
+def fetch_category_members(
+    session: "requests.Session",
+    api_url: str,
+    category_name: str,
+) -> Optional[list[str]]:
+    """
+    Return the titles of the articles in a category.
+
+    Args:
+        session: The HTTP session to use.
+        api_url: URL of the MediaWiki api.php endpoint.
+        category_name: The category name without the "Category:" prefix.
+
+    Returns:
+        Optional[list[str]]: The article titles, or None if the category does
+                             not exist.
+
+    Raises:
+        ConnectionError: If a request fails.
+    """
+    category_title = f"Category:{category_name}"
+    params: dict[str, Any] = {
+        "titles": category_title,
+        "list": "categorymembers",
+        "cmtitle": category_title,
+        "cmnamespace": "0",
+        "cmtype": "page",
+        "cmlimit": "max",
+    }
+
+    members: list[str] = []
+    while True:
+        data = _query(session, api_url, params)
+        query = data.get("query", {})
+
+        pages = query.get("pages", [])
+        if pages and pages[0].get("missing") and not query.get("categorymembers"):
+            return None
+
+        members.extend(member["title"] for member in query.get("categorymembers", []))
+
+        if "continue" not in data:
+            return members
+        params = {**params, **data["continue"]}
+
+
+def is_playable_title(title: str) -> bool:
+    """Return whether an article member can be played, i.e. is not a list or category page."""
+    return not title.startswith("Category") and not title.startswith("List")
+
+
+def fetch_category_listing(
+    session: "requests.Session",
+    api_url: str,
+    category_name: str,
+) -> Optional[dict[str, list[str]]]:
+    """
+    Return the articles and the subcategories of a category.
+
+    Args:
+        session: The HTTP session to use.
+        api_url: URL of the MediaWiki api.php endpoint.
+        category_name: The category name without the "Category:" prefix.
+
+    Returns:
+        Optional[dict[str, list[str]]]: A dictionary with 'articles' (titles)
+                                        and 'subcategories' (names without the
+                                        prefix), or None if the category does
+                                        not exist.
+
+    Raises:
+        ConnectionError: If a request fails.
+    """
+    category_title = f"Category:{category_name}"
+    params: dict[str, Any] = {
+        "titles": category_title,
+        "list": "categorymembers",
+        "cmtitle": category_title,
+        "cmnamespace": "0|14",
+        "cmtype": "page|subcat",
+        "cmlimit": "max",
+    }
+
+    listing: dict[str, list[str]] = {"articles": [], "subcategories": []}
+    while True:
+        data = _query(session, api_url, params)
+        query = data.get("query", {})
+
+        pages = query.get("pages", [])
+        if pages and pages[0].get("missing") and not query.get("categorymembers"):
+            return None
+
+        for member in query.get("categorymembers", []):
+            if member.get("ns") == 14:
+                listing["subcategories"].append(member["title"].split(":", 1)[-1])
+            else:
+                listing["articles"].append(member["title"])
+
+        if "continue" not in data:
+            return listing
+        params = {**params, **data["continue"]}
+
+
+def fetch_extracts(
+    session: "requests.Session",
+    api_url: str,
+    titles: Iterable[str],
+    sentences: int,
+) -> dict[str, dict[str, Any]]:
+    """
+    Return the plain-text intros of several pages.
+
+    Titles are sent WIKI_EXTRACTS_PER_REQUEST at a time, and a batch whose
+    extracts do not fit in one response is continued. Redirects are followed
+    and title normalization is undone, so the result is keyed by the titles
+    that were asked for.
+
+    Args:
+        session: The HTTP session to use.
+        api_url: URL of the MediaWiki api.php endpoint.
+        titles: The page titles.
+        sentences: Maximum number of sentences per intro.
+
+    Returns:
+        dict[str, dict[str, Any]]: For each requested title, a dictionary with
+                                   'exists', 'title' (the canonical title) and
+                                   'summary' keys.
+
+    Raises:
+        ConnectionError: If a request fails.
+    """
+    titles = list(dict.fromkeys(titles))
+    results: dict[str, dict[str, Any]] = {}
+
+    for start in range(0, len(titles), WIKI_EXTRACTS_PER_REQUEST):
+        chunk = titles[start:start + WIKI_EXTRACTS_PER_REQUEST]
+        params: dict[str, Any] = {
+            "titles": "|".join(chunk),
+            "prop": "extracts",
+            "exintro": "1",
+            "explaintext": "1",
+            "exsentences": str(sentences),
+            "exlimit": "max",
+            "redirects": "1",
+        }
+
+        # Every continued response lists all pages, but only some with their extract
+        pages: dict[str, dict[str, Any]] = {}
+        renames: dict[str, dict[str, str]] = {"normalized": {}, "redirects": {}}
+        while True:
+            data = _query(session, api_url, params)
+            query = data.get("query", {})
+            for step, step_renames in renames.items():
+                step_renames.update((entry["from"], entry["to"]) for entry in query.get(step, []))
+            for page in query.get("pages", []):
+                pages.setdefault(page["title"], {}).update(page)
+
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+        # Map every requested title to the title the pages are listed under
+        resolved = {title: title for title in chunk}
+        for step_renames in renames.values():
+            resolved = {title: step_renames.get(target, target) for title, target in resolved.items()}
+
+        for title, target in resolved.items():
+            page = pages.get(target)
+            if page is None or page.get("missing") or page.get("invalid"):
+                results[title] = {"exists": False, "title": title, "summary": ""}
+            else:
+                results[title] = {
+                    "exists": True,
+                    "title": page["title"],
+                    "summary": page.get("extract", ""),
+                }
+    return results
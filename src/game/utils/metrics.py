@@ -0,0 +1,343 @@
+"""
+Lightweight timing spans, counters and histograms with periodic file export.
+
+Hot-path functions are wrapped with `Metrics.timed`, which records their
+duration in a latency histogram and counts the exceptions they raise by
+type. Other code counts events such as fallbacks with `Metrics.increment`.
+Statistics that already live elsewhere (cache hits, pool depths) are pulled
+in as gauges by collector functions when a snapshot is exported.
+
+Nothing is recorded until `Metrics.start_exporter` (or `Metrics.enable`) is
+called. While disabled, a timed call costs a single flag check.
+
+Set METRICS_EXPORT_PATH to enable the export. A path ending in ".json" gets
+a JSON snapshot, any other path the Prometheus text exposition format.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = "truthpedia_"
+
+Labels = tuple[tuple[str, str], ...]
+Collector = Callable[[], Iterable[tuple[str, dict[str, str], float]]]
+
+
+def _labels(labels: Optional[dict[str, str]]) -> Labels:
+    """Turn a label dictionary into a hashable, ordered key."""
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Histogram:
+    """Cumulative latency histogram of one series."""
+
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for position, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.buckets[position] += 1
+                break
+
+
+class _Span:
+    """Context manager recording the duration of a block."""
+
+    __slots__ = ("name", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None and issubclass(exc_type, Exception):
+            Metrics.increment("errors_total", {"span": self.name, "type": exc_type.__name__})
+        Metrics.observe("span_seconds", time.perf_counter() - self.started, {"span": self.name})
+
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+class Metrics:
+    """
+    Process-wide metrics registry.
+
+    Class Attributes:
+        enabled: Whether spans and counters are recorded.
+    """
+
+    enabled: bool = False
+
+    _counters: dict[tuple[str, Labels], float] = {}
+    _histograms: dict[tuple[str, Labels], _Histogram] = {}
+    _collectors: list[Collector] = []
+    _lock = threading.Lock()
+    _exporter: Optional[threading.Thread] = None
+    _stop = threading.Event()
+
+    @staticmethod
+    def enable() -> None:
+        """Start recording spans and counters without exporting them."""
+        Metrics.enabled = True
+
+    @staticmethod
+    def span(name: str):
+        """
+        Return a context manager recording the block as a span.
+
+        Args:
+            name: The span name, used as the 'span' label.
+
+        Returns:
+            A context manager. While metrics are disabled it does nothing.
+        """
+        return _Span(name) if Metrics.enabled else _NO_SPAN
+
+    @staticmethod
+    def timed(span: str) -> Callable:
+        """
+        Decorate a function so every call is recorded as a span.
+
+        The duration goes to the `span_seconds` histogram. An exception is
+        counted in `errors_total` by its type and then re-raised.
+
+        Args:
+            span: The span name, used as the 'span' label.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not Metrics.enabled:
+                    return function(*args, **kwargs)
+
+                started = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                except Exception as e:
+                    Metrics.increment("errors_total", {"span": span, "type": type(e).__name__})
+                    raise
+                finally:
+                    Metrics.observe("span_seconds", time.perf_counter() - started, {"span": span})
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def increment(name: str, labels: Optional[dict[str, str]] = None, value: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: The counter name, ideally ending in '_total'.
+            labels: Optional labels of the series.
+            value: The amount to add.
+        """
+        if not Metrics.enabled:
+            return
+        key = (name, _labels(labels))
+        with Metrics._lock:
+            Metrics._counters[key] = Metrics._counters.get(key, 0) + value
+
+    @staticmethod
+    def observe(name: str, seconds: float, labels: Optional[dict[str, str]] = None) -> None:
+        """
+        Record a duration in a latency histogram.
+
+        Args:
+            name: The histogram name, ideally ending in '_seconds'.
+            seconds: The observed duration.
+            labels: Optional labels of the series.
+        """
+        if not Metrics.enabled:
+            return
+        key = (name, _labels(labels))
+        with Metrics._lock:
+            histogram = Metrics._histograms.get(key)
+            if histogram is None:
+                histogram = Metrics._histograms[key] = _Histogram()
+            histogram.observe(seconds)
+
+    @staticmethod
+    def register_collector(collector: Collector) -> None:
+        """
+        Add a function that reports gauges at export time.
+
+        Args:
+            collector: Returns (name, labels, value) triples. It is called from
+                       the exporter thread, so it must be thread-safe.
+        """
+        with Metrics._lock:
+            Metrics._collectors.append(collector)
+
+    @staticmethod
+    def snapshot() -> dict[str, Any]:
+        """
+        Return the current value of every series.
+
+        Returns:
+            dict[str, Any]: 'counters', 'gauges' and 'histograms', each a list of
+                            series with their name, labels and values.
+        """
+        with Metrics._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in Metrics._counters.items()
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "buckets": dict(zip(map(str, LATENCY_BUCKETS), histogram.buckets)),
+                    "count": histogram.count,
+                    "sum": histogram.total,
+                }
+                for (name, labels), histogram in Metrics._histograms.items()
+            ]
+            collectors = list(Metrics._collectors)
+
+        gauges = []
+        for collector in collectors:
+            try:
+                for name, labels, value in collector():
+                    gauges.append({"name": name, "labels": labels, "value": value})
+            except Exception as e:
+                Metrics.increment("errors_total", {"span": "collector", "type": type(e).__name__})
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+    @staticmethod
+    def to_prometheus(snapshot: dict[str, Any]) -> str:
+        """
+        Format a snapshot in the Prometheus text exposition format.
+
+        Args:
+            snapshot: A snapshot from `Metrics.snapshot`.
+
+        Returns:
+            str: The formatted metrics.
+        """
+        def series(name: str, labels: dict[str, Any], value: float) -> str:
+            if not labels:
+                return f"{METRIC_PREFIX}{name} {value}"
+            label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            return f"{METRIC_PREFIX}{name}{{{label_text}}} {value}"
+
+        lines: list[str] = []
+        typed: set[str] = set()
+
+        def declare(name: str, kind: str) -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {METRIC_PREFIX}{name} {kind}")
+
+        for entry in snapshot["counters"]:
+            declare(entry["name"], "counter")
+            lines.append(series(entry["name"], entry["labels"], entry["value"]))
+        for entry in snapshot["gauges"]:
+            declare(entry["name"], "gauge")
+            lines.append(series(entry["name"], entry["labels"], entry["value"]))
+        for entry in snapshot["histograms"]:
+            name = entry["name"]
+            declare(name, "histogram")
+            cumulative = 0
+            for bound, count in entry["buckets"].items():
+                cumulative += count
+                lines.append(series(f"{name}_bucket", {**entry["labels"], "le": bound}, cumulative))
+            lines.append(series(f"{name}_bucket", {**entry["labels"], "le": "+Inf"}, entry["count"]))
+            lines.append(series(f"{name}_sum", entry["labels"], entry["sum"]))
+            lines.append(series(f"{name}_count", entry["labels"], entry["count"]))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def export(path: Path) -> None:
+        """
+        Write a snapshot to a file, replacing it atomically.
+
+        Args:
+            path: Destination file. '.json' files get JSON, others Prometheus text.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        snapshot = Metrics.snapshot()
+        if path.suffix == ".json":
+            content = json.dumps({"timestamp": time.time(), **snapshot}, indent=2)
+        else:
+            content = Metrics.to_prometheus(snapshot)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def start_exporter(path: Path, interval: float) -> None:
+        """
+        Enable recording and export a snapshot every `interval` seconds.
+
+        A final snapshot is written when the process exits.
+
+        Args:
+            path: Destination file.
+            interval: Seconds between exports.
+        """
+        Metrics.enable()
+        with Metrics._lock:
+            if Metrics._exporter is not None:
+                return
+            Metrics._exporter = threading.Thread(
+                target=Metrics._export_loop, args=(path, interval), name="metrics-exporter", daemon=True
+            )
+            Metrics._exporter.start()
+        atexit.register(Metrics.stop_exporter, path)
+
+    @staticmethod
+    def stop_exporter(path: Optional[Path] = None) -> None:
+        """
+        Stop the periodic export, writing a last snapshot to `path` if given.
+        """
+        Metrics._stop.set()
+        if path is not None:
+            try:
+                Metrics.export(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _export_loop(path: Path, interval: float) -> None:
+        """Exporter thread body."""
+        while not Metrics._stop.wait(interval):
+            try:
+                Metrics.export(path)
+            except OSError:
+                Metrics.increment("errors_total", {"span": "export", "type": "OSError"})
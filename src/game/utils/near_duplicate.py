@@ -0,0 +1,187 @@
+"""
+Near-duplicate detection for articles.
+
+Two articles count as duplicates when their normalized titles are equal or
+when the word-bigram sets of their title and summary are similar enough. The
+similarity is estimated with one-permutation MinHash: every shingle is
+hashed once into one of SIGNATURE_SIZE bins, so a signature costs a single
+pass over the text. Candidates are found with LSH banding, so a lookup stays
+well under a millisecond no matter how many articles are indexed.
+"""
+
+import re
+import threading
+from typing import Optional
+
+from src.config.settings import NEAR_DUPLICATE_THRESHOLD
+from src.game.models.article import ArticleModel
+
+SIGNATURE_SIZE = 32  # MinHash bins, must be a power of two
+BAND_ROWS = 2        # signature values per LSH band
+
+_WORD = re.compile(r"\w+")
+_HASH_MASK = (1 << 64) - 1
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_EMPTY = 1 << 64
+
+
+class NearDuplicateIndex:
+    """
+    A MinHash/LSH index of article titles and summaries.
+
+    The index is thread-safe. Signatures use Python's string hash, so they
+    are only comparable within one process and are not persisted.
+
+    Attributes:
+        threshold: Estimated Jaccard similarity at or above which two articles
+                   are near-duplicates.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        """
+        Initialize an empty index.
+
+        Args:
+            threshold: Similarity (0-1) at or above which articles are duplicates.
+        """
+        self.threshold = threshold
+        self._titles: dict[str, str] = {}
+        self._signatures: list[list[int]] = []
+        self._article_titles: list[str] = []
+        self._bands: dict[tuple[int, int, int], list[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """Lowercase a title and drop punctuation and extra spaces."""
+        return " ".join(_WORD.findall(title.lower()))
+
+    @staticmethod
+    def signature(text: str) -> list[int]:
+        """
+        Compute the one-permutation MinHash signature of a text.
+
+        Args:
+            text: The text to sign.
+
+        Returns:
+            list[int]: SIGNATURE_SIZE minimum hash values, one per bin.
+        """
+        words = _WORD.findall(text.lower())
+        shingles = {f"{first} {second}" for first, second in zip(words, words[1:])}
+        if not shingles:
+            shingles = set(words) or {text}
+
+        signature = [_EMPTY] * SIGNATURE_SIZE
+        for shingle in shingles:
+            value = hash(shingle) & _HASH_MASK
+            position = value & (SIGNATURE_SIZE - 1)
+            value >>= _BIN_BITS
+            if value < signature[position]:
+                signature[position] = value
+
+        # Fill empty bins from the next non-empty one (rotation densification)
+        if _EMPTY in signature:
+            for position in range(SIGNATURE_SIZE):
+                if signature[position] != _EMPTY:
+                    continue
+                for distance in range(1, SIGNATURE_SIZE):
+                    value = signature[(position + distance) % SIGNATURE_SIZE]
+                    if value < _EMPTY:
+                        signature[position] = value + distance * _EMPTY
+                        break
+        return signature
+
+    @staticmethod
+    def similarity(first: list[int], second: list[int]) -> float:
+        """
+        Estimate the Jaccard similarity of two signatures.
+
+        Returns:
+            float: The fraction of bins with equal values.
+        """
+        return sum(a == b for a, b in zip(first, second)) / SIGNATURE_SIZE
+
+    @staticmethod
+    def _band_keys(signature: list[int]) -> list[tuple[int, int, int]]:
+        """Return the LSH bucket keys of a signature."""
+        return [
+            (band, signature[band * BAND_ROWS], signature[band * BAND_ROWS + 1])
+            for band in range(SIGNATURE_SIZE // BAND_ROWS)
+        ]
+
+    def find_duplicate(self, article: ArticleModel) -> Optional[str]:
+        """
+        Look for an indexed article that is a near-duplicate of `article`.
+
+        Args:
+            article: The article to check.
+
+        Returns:
+            Optional[str]: The title of the matching article, or None.
+        """
+        normalized = self._normalize_title(article.title)
+        signature = self.signature(f"{article.title} {article.summary}")
+        with self._lock:
+            return self._find(normalized, signature)
+
+    def _find(self, normalized_title: str, signature: list[int]) -> Optional[str]:
+        """Find a duplicate. Must be called with the lock held."""
+        if normalized_title in self._titles:
+            return self._titles[normalized_title]
+
+        checked: set[int] = set()
+        for key in self._band_keys(signature):
+            for candidate in self._bands.get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if self.similarity(signature, self._signatures[candidate]) >= self.threshold:
+                    return self._article_titles[candidate]
+        return None
+
+    def add(self, article: ArticleModel) -> None:
+        """
+        Add an article to the index.
+
+        Args:
+            article: The article to add.
+        """
+        normalized = self._normalize_title(article.title)
+        signature = self.signature(f"{article.title} {article.summary}")
+        with self._lock:
+            self._add(normalized, signature, article.title)
+
+    def _add(self, normalized_title: str, signature: list[int], title: str) -> None:
+        """Add a signed article. Must be called with the lock held."""
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        self._article_titles.append(title)
+        self._titles.setdefault(normalized_title, title)
+        for key in self._band_keys(signature):
+            self._bands.setdefault(key, []).append(position)
+
+    def add_if_unique(self, article: ArticleModel) -> Optional[str]:
+        """
+        Add an article unless it is a near-duplicate of an indexed one.
+
+        The check and the insertion are atomic, so two threads cannot both add
+        near-identical articles.
+
+        Args:
+            article: The article to add.
+
+        Returns:
+            Optional[str]: None if the article was added, otherwise the title of
+                           the article it duplicates.
+        """
+        normalized = self._normalize_title(article.title)
+        signature = self.signature(f"{article.title} {article.summary}")
+        with self._lock:
+            duplicate = self._find(normalized, signature)
+            if duplicate is None:
+                self._add(normalized, signature, article.title)
+            return duplicate
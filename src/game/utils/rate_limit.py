@@ -0,0 +1,91 @@
+"""
+Rate limiting and retry backoff for provider calls.
+
+This module provides a thread-safe token bucket used to keep concurrent
+workers under a provider's request rate, and an exponential backoff with
+jitter used between retries.
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter.
+
+    Tokens are added continuously at `rate` per second up to `capacity`.
+    Every request takes one token and waits when none is available.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens, i.e. the allowed burst size.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second. Must be positive.
+            capacity: Maximum burst size. Defaults to `rate` (at least 1).
+
+        Raises:
+            ValueError: If the rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update. Must hold the lock."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available, without waiting.
+
+        Returns:
+            bool: True if a token was taken.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Take a token, waiting until one is available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Return the delay before a retry using exponential backoff with full jitter.
+
+    Args:
+        attempt: The number of failed attempts so far, starting at 1.
+        base: The delay ceiling after the first failure, in seconds.
+        cap: The maximum delay ceiling, in seconds.
+
+    Returns:
+        float: A random delay between 0 and min(cap, base * 2 ** (attempt - 1)).
+    """
+    ceiling = min(cap, base * (2 ** max(0, attempt - 1)))
+    return random.uniform(0, ceiling)
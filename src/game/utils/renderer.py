@@ -0,0 +1,83 @@
+"""
+Buffered terminal rendering for the console UI.
+
+Printing a screen line by line, after 100 blank lines to "clear" it, makes
+page flips stutter on slow terminals and over SSH. A Screen collects all of
+its lines in memory, starts with a single ANSI clear sequence and is written
+to the terminal in one call. Wrapped text is cached per (text, width), so
+flipping back and forth between articles does not wrap them again.
+"""
+
+import shutil
+import sys
+import textwrap
+from functools import lru_cache
+
+from colorama import Style
+
+from src.config.settings import CONSOLE_WIDTH, CONSOLE_MIN_WIDTH, WRAP_CACHE_SIZE
+
+# Erase the whole display and move the cursor to the top-left corner
+CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
+
+
+def terminal_width() -> int:
+    """
+    Return the width of the terminal in columns.
+
+    Returns:
+        int: The current width, or CONSOLE_WIDTH if it cannot be determined.
+             Never less than CONSOLE_MIN_WIDTH.
+    """
+    columns = shutil.get_terminal_size((CONSOLE_WIDTH, 24)).columns
+    return max(columns, CONSOLE_MIN_WIDTH)
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_text(text: str, width: int) -> str:
+    """
+    Wrap text to a width, leaving room for indentation. Results are cached.
+
+    Args:
+        text: The text to wrap.
+        width: The width of the console.
+
+    Returns:
+        str: The wrapped text.
+    """
+    return textwrap.fill(text, width=width - 4)  # -4 for indentation
+
+
+class Screen:
+    """
+    A screen of text that is written to the terminal in a single call.
+
+    Each line ends with a style reset, so colors never leak into the next line.
+    """
+
+    def __init__(self, clear: bool = True):
+        """
+        Start an empty screen.
+
+        Args:
+            clear: Whether showing the screen clears the terminal first.
+        """
+        self._parts: list[str] = [CLEAR_SEQUENCE] if clear else []
+
+    def add(self, text: str = "") -> "Screen":
+        """
+        Append text followed by a newline.
+
+        Args:
+            text: The text to append. It may span several lines.
+
+        Returns:
+            Screen: This screen, so calls can be chained.
+        """
+        self._parts.append(f"{text}{Style.RESET_ALL}\n")
+        return self
+
+    def show(self) -> None:
+        """Write the whole screen to stdout and flush it."""
+        sys.stdout.write("".join(self._parts))
+        sys.stdout.flush()
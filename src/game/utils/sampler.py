@@ -0,0 +1,352 @@
+"""
+Non-repeating article sampling.
+
+Picking every article with `random.choice` lets a player get the same
+article twice in one game, and again in the next one. This module provides:
+
+- `ShuffleBag`: draws the positions of a population in random order without
+  repetition, refilling once all were drawn. It is a lazy Fisher-Yates
+  shuffle: a draw takes O(1) time and only the swapped positions are stored,
+  so a bag over a corpus of millions of articles costs nothing until used
+  and never copies the population.
+- `BloomFilter`: a compact set of seen article titles. It can answer "seen"
+  for an unseen title with probability SAMPLER_FALSE_POSITIVE_RATE, but
+  never the other way round.
+- `ArticleSampler`: one player's shuffle bags, one per population (e.g. per
+  category and truth status), and their seen filter, which is persisted
+  under SAMPLER_SEEN_DIR so it carries over to the player's next games.
+  Callers without a player share one sampler that has bags but no filter.
+
+Seen filter file layout (integers little-endian):
+
+    header  magic "TPBLOOM1", u32 bit count, u32 hash count, u32 item count
+    bits    the bit array
+"""
+
+import hashlib
+import os
+import random
+import struct
+import threading
+from math import ceil, log
+from pathlib import Path
+from typing import Callable, Hashable, Optional, TypeVar
+
+from colorama import Fore
+
+from src.config.settings import (
+    SAMPLER_SEEN_DIR,
+    SAMPLER_SEEN_CAPACITY,
+    SAMPLER_FALSE_POSITIVE_RATE,
+    SAMPLER_MAX_SKIPS,
+)
+
+T = TypeVar("T")
+
+MAGIC = b"TPBLOOM1"
+
+_HEADER = struct.Struct("<8sIII")
+
+
+class ShuffleBag:
+    """
+    Draws 0 .. size - 1 in random order, each once per cycle.
+
+    Attributes:
+        size: The number of positions.
+    """
+
+    __slots__ = ("size", "_drawn", "_swaps", "_random")
+
+    def __init__(self, size: int, rng: Optional[random.Random] = None):
+        """
+        Create a full bag.
+
+        Args:
+            size: The number of positions.
+            rng: Optional random generator, for reproducible draws.
+        """
+        self.size = size
+        self._drawn = 0
+        # Position -> value for the positions moved by earlier draws
+        self._swaps: dict[int, int] = {}
+        self._random = rng or random
+
+    def __len__(self) -> int:
+        """Return the number of positions left in the current cycle."""
+        return self.size - self._drawn
+
+    def draw(self) -> int:
+        """
+        Draw the next position, starting a new cycle if the bag is empty.
+
+        Raises:
+            IndexError: If the bag has no positions at all.
+        """
+        if self.size <= 0:
+            raise IndexError("draw from an empty shuffle bag")
+        if self._drawn == self.size:
+            self._drawn = 0
+            self._swaps.clear()
+
+        position = self._random.randrange(self._drawn, self.size)
+        value = self._swaps.get(position, position)
+        self._swaps[position] = self._swaps.pop(self._drawn, self._drawn)
+        self._drawn += 1
+        return value
+
+
+class BloomFilter:
+    """
+    A fixed-size probabilistic set of strings.
+
+    Attributes:
+        bit_count: Size of the bit array.
+        hash_count: Bits set per item.
+        count: Number of items added.
+    """
+
+    def __init__(self, bit_count: int, hash_count: int, bits: Optional[bytearray] = None, count: int = 0):
+        """
+        Create a filter.
+
+        Args:
+            bit_count: Size of the bit array.
+            hash_count: Bits set per item.
+            bits: Existing bit array, e.g. read from a file.
+            count: Number of items in `bits`.
+        """
+        self.bit_count = max(8, bit_count)
+        self.hash_count = max(1, hash_count)
+        self.count = count
+        self._bits = bits if bits is not None else bytearray((self.bit_count + 7) // 8)
+
+    @staticmethod
+    def for_capacity(capacity: int, false_positive_rate: float) -> "BloomFilter":
+        """
+        Create a filter sized for `capacity` items at a false positive rate.
+
+        Args:
+            capacity: Expected number of items.
+            false_positive_rate: Wanted false positive rate at that size (0-1).
+
+        Returns:
+            BloomFilter: An empty filter.
+        """
+        capacity = max(1, capacity)
+        bit_count = ceil(-capacity * log(false_positive_rate) / log(2) ** 2)
+        return BloomFilter(bit_count, round(bit_count / capacity * log(2)))
+
+    def _positions(self, item: str) -> list[int]:
+        """Bit positions of an item, by double hashing one digest."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.bit_count for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter."""
+        return _HEADER.pack(MAGIC, self.bit_count, self.hash_count, self.count) + bytes(self._bits)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "BloomFilter":
+        """
+        Deserialize a filter written by `to_bytes`.
+
+        Raises:
+            ValueError: If the data is not a serialized filter.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Seen filter is truncated")
+        magic, bit_count, hash_count, count = _HEADER.unpack_from(data)
+        bits = bytearray(data[_HEADER.size:])
+        if magic != MAGIC or len(bits) != (bit_count + 7) // 8:
+            raise ValueError("Not a seen filter")
+        return BloomFilter(bit_count, hash_count, bits, count)
+
+
+class ArticleSampler:
+    """
+    Picks articles for one player without repeating them.
+
+    Within a game every population is drawn through its own shuffle bag, so
+    nothing repeats until the population is used up. Articles the player saw
+    in earlier games are skipped, up to SAMPLER_MAX_SKIPS times per picked
+    article, so a player who has seen most of a category still gets a round.
+
+    The sampler is thread-safe; rounds are assembled on worker threads.
+
+    Class Attributes:
+        seen_dir: Directory of the players' seen filter files.
+
+    Attributes:
+        player: The player's name, or None for a sampler that is not persisted.
+        seen: Titles handed out to the player, in this and earlier games, or
+              None if seen articles are not tracked.
+    """
+
+    seen_dir: Path = SAMPLER_SEEN_DIR
+
+    _shared: Optional["ArticleSampler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, player: Optional[str] = None, seen: Optional[BloomFilter] = None):
+        """
+        Create a sampler. Use `for_player` to continue a player's seen filter.
+
+        Args:
+            player: The player's name, or None for a sampler that is not persisted.
+            seen: The player's seen filter. If omitted, a sampler with a player
+                  gets an empty one and a sampler without does not track seen articles.
+        """
+        self.player = player
+        if seen is None and player is not None:
+            seen = BloomFilter.for_capacity(SAMPLER_SEEN_CAPACITY, SAMPLER_FALSE_POSITIVE_RATE)
+        self.seen = seen
+        self._bags: dict[Hashable, ShuffleBag] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(player: str) -> Path:
+        """Return the seen filter file of a player. Names are hashed into file names."""
+        digest = hashlib.blake2b(player.encode("utf-8"), digest_size=12).hexdigest()
+        return ArticleSampler.seen_dir / f"{digest}.bloom"
+
+    @staticmethod
+    def for_player(player: str) -> "ArticleSampler":
+        """
+        Create a sampler continuing a player's seen filter from disk.
+
+        A missing or unreadable file starts an empty filter.
+
+        Args:
+            player: The player's name.
+
+        Returns:
+            ArticleSampler: The player's sampler.
+        """
+        seen = None
+        try:
+            seen = BloomFilter.from_bytes(ArticleSampler.path_for(player).read_bytes())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"{Fore.YELLOW}Warning: Could not read the seen articles of {player}: {e}")
+        return ArticleSampler(player, seen)
+
+    @staticmethod
+    def shared() -> "ArticleSampler":
+        """Return the process-wide sampler used when no player's sampler is given."""
+        with ArticleSampler._shared_lock:
+            if ArticleSampler._shared is None:
+                ArticleSampler._shared = ArticleSampler()
+            return ArticleSampler._shared
+
+    def sample(
+        self,
+        key: Hashable,
+        size: int,
+        get: Callable[[int], T],
+        count: int,
+        title: Callable[[T], str] = str,
+        mark: bool = True,
+    ) -> list[T]:
+        """
+        Pick up to `count` distinct items of a population.
+
+        Args:
+            key: Identifies the population, e.g. ("local", category, is_truth).
+                 Each key has its own shuffle bag.
+            size: The size of the population. A bag is restarted when it changes.
+            get: Returns the item at a position, so the population is never copied.
+            count: How many items to pick.
+            title: Returns the title the seen filter tracks for an item.
+            mark: Whether to mark the picked items as seen. Callers that pick
+                  spare items pass False and call `mark_seen` for the ones they use.
+
+        Returns:
+            list[T]: min(count, size) items, in random order.
+        """
+        picked: list[T] = []
+        with self._lock:
+            bag = self._bags.get(key)
+            if bag is None or bag.size != size:
+                bag = self._bags[key] = ShuffleBag(size)
+
+            positions: set[int] = set()
+            skips = 0
+            while len(picked) < min(count, size):
+                position = bag.draw()
+                if position in positions:
+                    # The bag started a new cycle during this pick
+                    continue
+                item = get(position)
+                if self.seen is not None:
+                    item_title = title(item)
+                    if item_title in self.seen and skips < SAMPLER_MAX_SKIPS and len(bag):
+                        skips += 1
+                        continue
+                    if mark:
+                        self._mark(item_title)
+                positions.add(position)
+                picked.append(item)
+                skips = 0
+        return picked
+
+    def has_seen(self, item_title: str) -> bool:
+        """Return whether the player has probably seen a title before."""
+        if self.seen is None:
+            return False
+        with self._lock:
+            return item_title in self.seen
+
+    def mark_seen(self, item_title: str) -> None:
+        """Mark a title as seen by the player."""
+        if self.seen is None:
+            return
+        with self._lock:
+            self._mark(item_title)
+
+    def _mark(self, item_title: str) -> None:
+        """Add a title to the seen filter. Must be called with the lock held."""
+        if self.seen.count >= SAMPLER_SEEN_CAPACITY:
+            # A full filter answers "seen" too often; start over
+            self.seen.clear()
+        self.seen.add(item_title)
+
+    def save(self) -> None:
+        """
+        Write the seen filter of the player, replacing the old one atomically.
+
+        Does nothing for samplers without a player. Write errors are reported.
+        """
+        if self.player is None or self.seen is None:
+            return
+
+        path = ArticleSampler.path_for(self.player)
+        with self._lock:
+            data = self.seen.to_bytes()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(temp_path, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"{Fore.YELLOW}Warning: Could not save the seen articles of {self.player}: {e}")
@@ -0,0 +1,77 @@
+"""
+Request coalescing for concurrent identical calls.
+
+When several threads ask for the same thing at the same time (the same
+category member listing or the same page summary), only the first one
+performs the call; the others wait for it and share its result.
+"""
+
+import threading
+from typing import Any, Callable, Hashable
+
+
+class _Call:
+    """An in-flight call and its eventual outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single call.
+
+    Attributes:
+        shared: Number of calls that were answered by another caller's request.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identifies identical requests.
+            fn: The function performing the request.
+
+        Returns:
+            Any: The result of `fn`, possibly computed by another thread.
+
+        Raises:
+            Exception: Whatever `fn` raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
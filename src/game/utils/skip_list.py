@@ -0,0 +1,163 @@
+"""
+Indexable skip list.
+
+A sorted collection where every link also stores how many positions it
+skips. Summing the widths along a search path gives the position of a key,
+so insertion, removal, "what is the rank of this key" and "which key is at
+this position" all take O(log n) expected time, where a sorted Python list
+would need O(n) moves per insertion or removal.
+"""
+
+import random
+from itertools import islice
+from typing import Any, Iterator, Optional
+
+MAX_LEVEL = 32
+# Probability that a node is promoted to the next level
+PROMOTION_PROBABILITY = 0.25
+
+
+class _Node:
+    """A skip list node with one forward link and link width per level."""
+
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Any, level: int):
+        self.key = key
+        self.next: list[Optional["_Node"]] = [None] * level
+        self.width: list[int] = [1] * level
+
+
+class RankedSkipList:
+    """
+    A sorted multiset of comparable keys with O(log n) rank queries.
+
+    Ranks are 1-based: the smallest key has rank 1.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Create an empty skip list.
+
+        Args:
+            seed: Optional seed for the level generator, for reproducible layouts.
+        """
+        self._head = _Node(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self._head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < PROMOTION_PROBABILITY:
+            level += 1
+        return level
+
+    def insert(self, key: Any) -> None:
+        """Add a key."""
+        update: list[_Node] = [self._head] * MAX_LEVEL
+        update_rank = [0] * MAX_LEVEL
+        node, rank = self._head, 0
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                rank += node.width[level]
+                node = node.next[level]
+            update[level], update_rank[level] = node, rank
+
+        new_level = self._random_level()
+        if new_level > self._level:
+            for level in range(self._level, new_level):
+                # An unused head link spans the whole list
+                self._head.width[level] = self._size + 1
+            self._level = new_level
+
+        new_node = _Node(key, new_level)
+        for level in range(new_level):
+            previous = update[level]
+            skipped = rank - update_rank[level]
+            new_node.next[level] = previous.next[level]
+            new_node.width[level] = previous.width[level] - skipped
+            previous.next[level] = new_node
+            previous.width[level] = skipped + 1
+        for level in range(new_level, self._level):
+            update[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key: Any) -> None:
+        """
+        Remove one occurrence of a key.
+
+        Raises:
+            KeyError: If the key is not in the list.
+        """
+        update: list[_Node] = [self._head] * MAX_LEVEL
+        node = self._head
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                node = node.next[level]
+            update[level] = node
+
+        target = node.next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+
+        for level in range(self._level):
+            previous = update[level]
+            if previous.next[level] is target:
+                previous.width[level] += target.width[level] - 1
+                previous.next[level] = target.next[level]
+            else:
+                previous.width[level] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    def rank(self, key: Any) -> Optional[int]:
+        """
+        Return the 1-based position of a key.
+
+        Returns:
+            Optional[int]: The position of the key's first occurrence, or None
+                           if the key is not in the list.
+        """
+        node, rank = self._head, 0
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                rank += node.width[level]
+                node = node.next[level]
+        node = node.next[0]
+        if node is None or node.key != key:
+            return None
+        return rank + 1
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Return the key at a 0-based position.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("skip list index out of range")
+
+        node, remaining = self._head, index + 1
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node.key
+
+    def first(self, count: int) -> list[Any]:
+        """Return the `count` smallest keys, in order."""
+        return list(islice(self, max(0, count)))
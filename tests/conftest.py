@@ -0,0 +1,21 @@
+"""Fixtures shared by the test modules."""
+
+import time
+
+import pytest
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    """Poll until `condition()` is true or the timeout passes."""
+    ends_at = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > ends_at:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def wait_for():
+    """A helper polling a condition, for work finishing on other threads."""
+    return _wait_for
@@ -0,0 +1,83 @@
+"""Tests of the compiled binary corpus and its loading by ArticlesLocal."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from src.game.classes import local_article
+from src.game.classes.local_article import ArticlesLocal
+from src.game.models.article import ArticleModel
+from src.game.utils.binary_corpus import BinaryCorpus, compile_corpus
+
+ARTICLES = [
+    ArticleModel("Cardiff Giant", "A 10-foot \"petrified man\".", "Hoaxes", True),
+    ArticleModel("Moon Bridge", "A bridge seen on the Moon.", "Hoaxes", False),
+    ArticleModel("Piltdown Man", "Fossil fragments presented as an early human.", "Hoaxes", True),
+    ArticleModel("Mokèlé-mbèmbé", "A creature said to live in the Congo River basin.", "Cryptids", True),
+]
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A JSON corpus and a binary corpus compiled from it."""
+    source_path = tmp_path / "responses.json"
+    source_path.write_text(json.dumps([a.to_dict() for a in ARTICLES]), encoding="utf-8")
+    binary_path = tmp_path / "responses.bin"
+    compile_corpus(ARTICLES, binary_path, source_path)
+    return source_path, binary_path
+
+
+def test_compiled_corpus_reads_back_per_category(source):
+    source_path, binary_path = source
+    corpus = BinaryCorpus.open_if_fresh(binary_path, source_path)
+
+    try:
+        assert sorted(corpus.keys()) == [("Cryptids", True), ("Hoaxes", False), ("Hoaxes", True)]
+        assert corpus.count("Hoaxes", True) == 2
+        assert corpus.count("Cryptids", False) == 0
+        read = [
+            corpus.get(category, is_truth, index)
+            for category, is_truth in corpus.keys()
+            for index in range(corpus.count(category, is_truth))
+        ]
+        assert sorted(read, key=lambda a: a.title) == sorted(ARTICLES, key=lambda a: a.title)
+        with pytest.raises(IndexError):
+            corpus.get("Hoaxes", False, 1)
+    finally:
+        corpus.close()
+
+
+def test_corpus_older_than_its_source_is_not_opened(source):
+    source_path, binary_path = source
+    source_path.write_text(json.dumps([ARTICLES[0].to_dict()]), encoding="utf-8")
+
+    assert BinaryCorpus.open_if_fresh(binary_path, source_path) is None
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [lambda data: b"NOTCORP!" + data[8:], lambda data: data[:20], lambda data: data[:60]],
+    ids=["bad magic", "truncated header", "truncated bucket table"],
+)
+def test_corrupt_corpus_is_not_opened(source, damage):
+    source_path, binary_path = source
+    binary_path.write_bytes(damage(binary_path.read_bytes()))
+
+    assert BinaryCorpus.open_if_fresh(binary_path, source_path) is None
+
+
+def test_stale_corpus_falls_back_to_the_json_source(source):
+    source_path, binary_path = source
+    source_path.write_text(json.dumps([a.to_dict() for a in ARTICLES[:2]]), encoding="utf-8")
+
+    with mock.patch.object(local_article, "LOCAL_CORPUS_PATH", source_path), \
+            mock.patch.object(local_article, "LOCAL_CORPUS_BINARY_PATH", binary_path), \
+            mock.patch.object(ArticlesLocal, "local_articles", []), \
+            mock.patch.object(ArticlesLocal, "_index", {}), \
+            mock.patch.object(ArticlesLocal, "_loaded", False), \
+            mock.patch.object(ArticlesLocal, "_corpus", None):
+        assert ArticlesLocal.load_articles()
+
+        assert ArticlesLocal._corpus is None
+        assert [article.title for article in ArticlesLocal.local_articles] == ["Cardiff Giant", "Moon Bridge"]
@@ -0,0 +1,63 @@
+"""Tests of the two-tier provider cache."""
+
+from unittest import mock
+
+import pytest
+
+from src.game.utils import cache as cache_module
+from src.game.utils.cache import TwoTierCache
+
+
+@pytest.fixture
+def clock():
+    """A controllable time.time for the cache module."""
+    with mock.patch.object(cache_module.time, "time", return_value=1000.0) as now:
+        yield now
+
+
+def test_memory_tier_evicts_the_least_recently_used():
+    cache = TwoTierCache(None, max_memory_entries=2)
+    cache.set("page", "a", 1)
+    cache.set("page", "b", 2)
+    assert cache.get("page", "a") == 1
+
+    cache.set("page", "c", 3)
+
+    assert cache.get("page", "b") is None
+    assert cache.get("page", "a") == 1
+    assert cache.get("page", "c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_entries_expire(clock):
+    cache = TwoTierCache(None)
+    cache.set("page", "a", 1, ttl=10)
+
+    clock.return_value = 1009.0
+    assert cache.get("page", "a") == 1
+    clock.return_value = 1010.0
+    assert cache.get("page", "a") is None
+    assert cache.stats()["memory_entries"] == 0
+
+
+def test_disk_entries_expire(tmp_path, clock):
+    TwoTierCache(tmp_path / "cache.sqlite3").set("page", "a", 1, ttl=10)
+    cache = TwoTierCache(tmp_path / "cache.sqlite3")
+
+    clock.return_value = 1010.0
+    assert cache.get("page", "a") is None
+    assert cache._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+
+
+def test_disk_hit_is_promoted_into_memory(tmp_path, clock):
+    TwoTierCache(tmp_path / "cache.sqlite3").set("page", "a", {"summary": "text"}, ttl=10)
+    cache = TwoTierCache(tmp_path / "cache.sqlite3")
+
+    assert cache.get("page", "a") == {"summary": "text"}
+    assert cache.get("page", "a") == {"summary": "text"}
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["memory_entries"]) == (1, 1, 1)
+
+    # The promoted entry keeps its disk expiry rather than a fresh TTL
+    clock.return_value = 1010.0
+    assert cache.get("page", "a") is None
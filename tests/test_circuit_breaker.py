@@ -0,0 +1,68 @@
+"""Tests of the provider circuit breaker."""
+
+import gc
+
+from src.game.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def open_breaker() -> tuple[CircuitBreaker, object]:
+    """A breaker that just opened, plus a call admitted while it was closed."""
+    breaker = CircuitBreaker("test", 5, min_calls=1, open_seconds=0)
+    straggler = breaker.allow_request()
+    breaker.record_failure(breaker.allow_request())
+    return breaker, straggler
+
+
+def test_breaker_opens_and_probes():
+    breaker, _ = open_breaker()
+    assert breaker.state == HALF_OPEN
+
+    probe = breaker.allow_request()
+    assert probe is not None
+    assert breaker.allow_request() is None
+
+    breaker.record_success(probe, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_slow_success_reopens_a_half_open_breaker():
+    breaker, _ = open_breaker()
+
+    breaker.record_success(breaker.allow_request(), 10)
+
+    assert breaker._state == OPEN
+
+
+def test_straggler_does_not_settle_the_probe():
+    breaker, straggler = open_breaker()
+    probe = breaker.allow_request()
+
+    breaker.record_success(straggler, 0.1)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is None
+
+    breaker.record_failure(straggler)
+    breaker.release(straggler)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is None
+
+    breaker.record_success(probe, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_released_probe_lets_the_next_call_probe():
+    breaker, _ = open_breaker()
+
+    breaker.release(breaker.allow_request())
+
+    assert breaker.allow_request() is not None
+
+
+def test_unused_breakers_leave_the_registry():
+    breaker = CircuitBreaker("test", 5)
+    assert breaker in CircuitBreaker._breakers
+
+    del breaker
+    gc.collect()
+
+    assert all(breaker.name != "test" for breaker in CircuitBreaker._breakers)
@@ -0,0 +1,105 @@
+"""Tests of the per-category corpus shards and their loading by ArticlesLocal."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from src.game.classes import local_article
+from src.game.classes.local_article import ArticlesLocal
+from src.game.models.article import ArticleModel
+from src.game.utils import helpers
+from src.game.utils.corpus_shards import fresh_shard_categories, iter_shard, shard_path, write_shards
+
+
+def articles(category: str, count: int) -> list[ArticleModel]:
+    return [
+        ArticleModel(f"{category} {i}", f"Summary {i}.", category, i % 2 == 0)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A JSON corpus with shards, and an ArticlesLocal that has loaded nothing."""
+    source_path = tmp_path / "responses.json"
+    shard_dir = tmp_path / "shards"
+    corpus_articles = articles("Hoaxes", 4) + articles("Cryptids", 2)
+    source_path.write_text(json.dumps([a.to_dict() for a in corpus_articles]), encoding="utf-8")
+    write_shards(corpus_articles, shard_dir, source_path)
+
+    with mock.patch.object(local_article, "LOCAL_CORPUS_PATH", source_path), \
+            mock.patch.object(local_article, "LOCAL_CORPUS_SHARD_DIR", shard_dir), \
+            mock.patch.object(local_article, "LOCAL_CORPUS_BINARY_PATH", tmp_path / "missing.bin"), \
+            mock.patch.object(ArticlesLocal, "local_articles", []), \
+            mock.patch.object(ArticlesLocal, "_index", {}), \
+            mock.patch.object(ArticlesLocal, "_loaded", False), \
+            mock.patch.object(ArticlesLocal, "_corpus", None), \
+            mock.patch.object(ArticlesLocal, "_loaded_categories", set()), \
+            mock.patch.object(ArticlesLocal, "_use_shards", None), \
+            mock.patch.object(ArticlesLocal, "_shard_categories", set()):
+        yield source_path, shard_dir
+
+
+def test_shards_read_back_through_the_manifest(corpus):
+    source_path, shard_dir = corpus
+
+    assert fresh_shard_categories(shard_dir, source_path) == {"Hoaxes": 4, "Cryptids": 2}
+    for category, count in [("Hoaxes", 4), ("Cryptids", 2)]:
+        entries = [ArticleModel.from_dict(entry) for entry in iter_shard(shard_dir, category)]
+        assert entries == articles(category, count)
+
+    source_path.write_text("[]", encoding="utf-8")
+    assert fresh_shard_categories(shard_dir, source_path) is None
+
+
+def test_finished_corpus_writes_shards_only_without_a_binary_corpus(tmp_path):
+    source_path = tmp_path / "responses.json"
+    source_path.write_text("[]", encoding="utf-8")
+    corpus_articles = articles("Hoaxes", 2)
+
+    with mock.patch.object(helpers, "JSON_FILE_PATH", source_path), \
+            mock.patch.object(helpers, "_save_articles"), \
+            mock.patch.object(helpers, "_save_status_snapshot"):
+        helpers._finish_corpus(corpus_articles, None, [])
+        assert (tmp_path / "responses.bin").exists()
+        assert not (tmp_path / "shards").exists()
+
+        with mock.patch.object(helpers, "compile_corpus", side_effect=OSError("disk full")):
+            helpers._finish_corpus(corpus_articles, None, [])
+        assert fresh_shard_categories(tmp_path / "shards", source_path) == {"Hoaxes": 2}
+
+
+def test_rewriting_shards_deletes_removed_categories(corpus):
+    source_path, shard_dir = corpus
+    write_shards(articles("Hoaxes", 4), shard_dir, source_path)
+
+    assert shard_path(shard_dir, "Hoaxes").exists()
+    assert not shard_path(shard_dir, "Cryptids").exists()
+
+
+def test_categories_missing_from_the_manifest_are_not_served(corpus):
+    source_path, shard_dir = corpus
+    # A shard left behind by an older build, e.g. before the cleanup existed
+    stale = shard_path(shard_dir, "Ghosts")
+    stale.write_text(json.dumps(articles("Ghosts", 1)[0].to_dict()) + "\n", encoding="utf-8")
+
+    assert ArticlesLocal.load_category("Ghosts")
+    assert ArticlesLocal.local_articles == []
+
+
+def test_fallback_after_a_failed_shard_does_not_duplicate_articles(corpus):
+    assert ArticlesLocal.load_category("Cryptids")
+    assert len(ArticlesLocal.local_articles) == 2
+
+    def failing_shard(shard_dir, category):
+        yield articles(category, 1)[0].to_dict()
+        raise OSError("disk error")
+
+    with mock.patch.object(local_article, "iter_shard", failing_shard):
+        assert ArticlesLocal.load_category("Hoaxes")
+
+    titles = [article.title for article in ArticlesLocal.local_articles]
+    assert sorted(titles) == sorted(set(titles))
+    assert len(titles) == 6
+    assert len(ArticlesLocal._index[("Cryptids", True)]) == 1
@@ -0,0 +1,118 @@
+"""Tests of FakeArticlePool fill bookkeeping."""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.game.classes import ai_gen
+from src.game.classes.ai_gen import FakeArticlePool, FakeNewsGenerator
+from src.game.models.article import ArticleModel
+
+
+@pytest.fixture
+def pool():
+    """An empty pool whose fills never reach the OpenAI API."""
+    with mock.patch.object(ai_gen, "OPENAI_API_KEY", "test"), \
+            mock.patch.object(FakeArticlePool, "_buffers", {}), \
+            mock.patch.object(FakeArticlePool, "_filling", set()), \
+            mock.patch.object(FakeArticlePool, "_fills", {}), \
+            mock.patch.object(ai_gen.FakeNewsGenerator, "_generate_from_api_async",
+                              staticmethod(mock.AsyncMock(return_value=None))), \
+            mock.patch.object(ai_gen.ClientRegistry, "get_async_openai", staticmethod(lambda: None)):
+        yield FakeArticlePool
+
+
+def test_cancel_before_the_fill_starts_allows_a_new_offer(pool, wait_for):
+    loop = pool._get_loop()
+    blocked, release = threading.Event(), threading.Event()
+
+    def block():
+        blocked.set()
+        release.wait(5)
+
+    # Keep the loop busy, so the fill task is cancelled before it first runs
+    loop.call_soon_threadsafe(block)
+    blocked.wait(5)
+    pool.offer("Hoaxes")
+    fill = pool._fills["Hoaxes"]
+    pool.cancel("Hoaxes")
+    release.set()
+
+    assert fill.cancelled()
+    assert "Hoaxes" not in pool._filling
+
+    generate = ai_gen.FakeNewsGenerator._generate_from_api_async
+    assert generate.await_count == 0
+    pool.offer("Hoaxes")
+    assert wait_for(lambda: generate.await_count > 0)
+
+
+def test_finished_fill_clears_its_category(pool, wait_for):
+    pool.offer("Hoaxes")
+    assert wait_for(lambda: "Hoaxes" not in pool._filling)
+    assert "Hoaxes" not in pool._fills
+
+
+def test_give_back_stops_at_the_high_watermark(pool):
+    articles = [ArticleModel(f"Fake {i}", "A summary.", "Hoaxes", False) for i in range(5)]
+    for article in articles:
+        pool.give_back(article)
+
+    assert len(pool._buffers["Hoaxes"]) == pool.high_watermark
+
+
+def test_generate_without_the_pool_leaves_it_alone(pool):
+    article = ArticleModel("Fake", "A summary.", "Hoaxes", False)
+    pool.give_back(article)
+
+    with mock.patch.object(ai_gen.ClientRegistry, "get_openai", staticmethod(lambda: None)), \
+            mock.patch.object(FakeNewsGenerator, "_generate_from_api", staticmethod(lambda client, category: None)), \
+            mock.patch.object(pool, "offer") as offer:
+        assert FakeNewsGenerator.generate("Hoaxes", use_pool=False) is None
+
+    assert list(pool._buffers["Hoaxes"]) == [article]
+    offer.assert_not_called()
+
+
+def test_duplicate_check_runs_off_the_pool_loop(pool, wait_for):
+    article = ArticleModel("Fake", "A summary.", "Hoaxes", False)
+    threads = []
+
+    def is_new(checked, background=False):
+        threads.append(threading.current_thread().name)
+        return True
+
+    with mock.patch.object(FakeNewsGenerator, "_generate_from_api_async",
+                           staticmethod(mock.AsyncMock(return_value=article))), \
+            mock.patch.object(FakeNewsGenerator, "_is_new", staticmethod(is_new)):
+        pool.offer("Hoaxes")
+        assert wait_for(lambda: "Hoaxes" not in pool._filling)
+
+    assert threads and "fake-article-pool" not in threads
+
+
+def test_indexing_a_category_does_not_hold_up_others():
+    indexing, release = threading.Event(), threading.Event()
+
+    def iter_articles(category):
+        if category == "Slow":
+            indexing.set()
+            release.wait(5)
+        return iter(())
+
+    with mock.patch.object(FakeNewsGenerator, "_indexed_categories", set()), \
+            mock.patch.object(FakeNewsGenerator, "_category_index_locks", {}), \
+            mock.patch.object(FakeNewsGenerator, "duplicate_index", ai_gen.NearDuplicateIndex()), \
+            mock.patch.object(ai_gen.ArticlesLocal, "iter_articles", staticmethod(iter_articles)):
+        slow = threading.Thread(target=FakeNewsGenerator._index_category, args=("Slow",))
+        slow.start()
+        try:
+            assert indexing.wait(5)
+            started = time.monotonic()
+            assert FakeNewsGenerator._is_new(ArticleModel("Fast", "A summary.", "Fast", False))
+            assert time.monotonic() - started < 1
+        finally:
+            release.set()
+            slow.join(5)
@@ -0,0 +1,52 @@
+"""Tests of hedged provider calls."""
+
+import threading
+import time
+from unittest import mock
+
+from src.config.settings import ROUND_DEADLINE
+from src.game.utils import hedging
+from src.game.utils.hedging import Hedger
+
+
+def test_hedge_starts_within_a_round():
+    hedger = Hedger("test")
+    assert hedger.hedge_delay() < ROUND_DEADLINE
+
+    for _ in range(50):
+        hedger.latencies.record(10.0)
+    assert hedger.hedge_delay() < ROUND_DEADLINE
+
+
+def test_slow_call_is_answered_by_the_hedge():
+    hedger = Hedger("test")
+    release = threading.Event()
+
+    def stuck():
+        release.wait(5)
+        return "primary"
+
+    started = time.perf_counter()
+    try:
+        assert hedger.call(stuck, lambda: "hedge") == "hedge"
+    finally:
+        release.set()
+    assert time.perf_counter() - started < ROUND_DEADLINE
+    assert hedger.hedge_wins == 1
+
+
+def test_call_runs_unhedged_when_all_workers_are_busy():
+    hedger = Hedger("test")
+    caller = threading.current_thread()
+    threads = []
+
+    def primary():
+        threads.append(threading.current_thread())
+        return "primary"
+
+    with mock.patch.object(hedging, "_slots", threading.BoundedSemaphore(1)) as slots:
+        slots.acquire()
+        assert hedger.call(primary, lambda: "hedge") == "primary"
+
+    assert threads == [caller]
+    assert hedger.hedges == 0
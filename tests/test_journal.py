@@ -0,0 +1,62 @@
+"""Tests of the article journal and corpus compaction."""
+
+import json
+from unittest import mock
+
+from src.game.models.article import ArticleModel
+from src.game.utils import helpers
+from src.game.utils.journal import ArticleJournal
+
+
+def article(title: str, is_truth: bool = True) -> ArticleModel:
+    return ArticleModel(title, f"Summary of {title}.", "Hoaxes", is_truth)
+
+
+def test_compaction_keeps_invalid_entries(tmp_path):
+    corpus_path = tmp_path / "responses.json"
+    legacy = {"title": "Legacy", "summary": "No truth flag.", "category": "Hoaxes"}
+    corpus_path.write_text(json.dumps([article("Old").to_dict(), legacy]), encoding="utf-8")
+    journal = ArticleJournal(tmp_path / "responses.journal.jsonl")
+
+    with mock.patch.object(helpers, "JSON_FILE_PATH", corpus_path):
+        articles, invalid_entries = helpers._load_existing_articles()
+        assert articles == [article("Old")]
+        assert invalid_entries == [legacy]
+
+        journal.append(article("New"))
+        helpers._save_articles(articles + journal.replay(), journal, invalid_entries)
+
+    data = json.loads(corpus_path.read_text(encoding="utf-8"))
+    assert legacy in data
+    assert [entry["title"] for entry in data] == ["Old", "New", "Legacy"]
+    assert not journal.path.exists()
+
+
+def test_append_after_a_torn_line_starts_a_new_line(tmp_path):
+    journal = ArticleJournal(tmp_path / "responses.journal.jsonl")
+    journal.append(article("First"))
+    with open(journal.path, "a", encoding="utf-8") as file:
+        file.write('{"title": "Torn", "summ')
+
+    journal.append(article("Second"))
+
+    assert [entry.title for entry in journal.replay()] == ["First", "Second"]
+
+
+def test_resume_counts_come_from_the_snapshot_and_the_journal(tmp_path):
+    corpus_path = tmp_path / "responses.json"
+    corpus = [article("Real"), article("Fake", is_truth=False)]
+    corpus_path.write_text(json.dumps([entry.to_dict() for entry in corpus]), encoding="utf-8")
+
+    with mock.patch.object(helpers, "JSON_FILE_PATH", corpus_path), \
+            mock.patch.object(helpers, "STATUS_FILE_PATH", tmp_path / "responses.status.json"):
+        assert helpers._resume_status([]) is None
+        helpers._save_status_snapshot(helpers._category_status(corpus))
+
+        with mock.patch.object(helpers, "_load_existing_articles", side_effect=AssertionError):
+            status = helpers._resume_status([article("Journaled"), article("Journaled")])
+        assert status == {"Hoaxes": (2, 1)}
+
+        # Saved counts of an older corpus are not used
+        corpus_path.write_text(json.dumps([entry.to_dict() for entry in corpus * 2]), encoding="utf-8")
+        assert helpers._resume_status([]) is None
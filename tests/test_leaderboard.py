@@ -0,0 +1,72 @@
+"""Tests of the leaderboard ranking, log replay and compaction."""
+
+from unittest import mock
+
+import pytest
+
+from src.game.classes import leaderboard
+from src.game.classes.leaderboard import Leaderboard
+
+
+@pytest.fixture
+def board(tmp_path):
+    """A Leaderboard logging to a temporary file, without the background writer."""
+    with mock.patch.object(Leaderboard, "path", tmp_path / "leaderboard.jsonl"), \
+            mock.patch.object(Leaderboard, "_totals", {}), \
+            mock.patch.object(Leaderboard, "_ranking", None), \
+            mock.patch.object(Leaderboard, "_pending", []), \
+            mock.patch.object(Leaderboard, "_log_lines", 0), \
+            mock.patch.object(Leaderboard, "_start_writer", staticmethod(lambda: None)):
+        yield Leaderboard
+
+
+def reload(board) -> None:
+    """Forget the in-memory board, so the next query replays the log."""
+    board._ranking = None
+    board._totals = {}
+
+
+def test_players_are_ranked_by_total_then_name(board):
+    board.add_score("carol", 5)
+    board.add_score("alice", 3)
+    board.add_score("bob", 5)
+    assert board.add_score("alice", 4) == 7
+
+    assert board.top(10) == [("alice", 7), ("bob", 5), ("carol", 5)]
+    assert [board.rank(name) for name in ("alice", "bob", "carol")] == [1, 2, 3]
+    assert board.rank("dave") is None
+    assert board.size() == 3
+
+
+def test_log_replay_restores_the_totals(board):
+    board.add_score("alice", 3)
+    board.add_score("bob", 5)
+    board.add_score("alice", 4)
+    board.flush()
+    # A torn last line, as left by a crash during a write
+    with open(board.path, "a", encoding="utf-8") as file:
+        file.write('{"name": "bob", "poi')
+
+    reload(board)
+
+    assert board.top(10) == [("alice", 7), ("bob", 5)]
+    assert board._log_lines == 4
+
+
+def test_long_log_is_compacted_to_one_line_per_player(board):
+    with mock.patch.object(leaderboard, "LEADERBOARD_COMPACT_FACTOR", 2):
+        for points in range(1, 6):
+            board.add_score("alice", points)
+        board.add_score("bob", 1)
+        board.flush()
+
+    assert board.path.read_text(encoding="utf-8").splitlines() == [
+        '{"name": "alice", "points": 15}',
+        '{"name": "bob", "points": 1}',
+    ]
+    assert board._log_lines == 2
+
+    board.add_score("bob", 2)
+    board.flush()
+    reload(board)
+    assert board.top(10) == [("alice", 15), ("bob", 3)]
@@ -0,0 +1,103 @@
+"""Tests of the MediaWiki client against the local stand-in server."""
+
+from unittest import mock
+
+import pytest
+import requests
+
+from src.game.benchmarks.stub_wiki_server import StubWikiServer, make_categories, make_extract
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.models.category import CategoryModel
+from src.game.utils.mediawiki import (
+    _query,
+    fetch_category_listing,
+    fetch_category_members,
+    fetch_extracts,
+)
+from src.game.utils.sampler import ArticleSampler
+
+
+@pytest.fixture(scope="module")
+def stub():
+    """A stand-in server answering 3 members or extracts per response."""
+    server = StubWikiServer(make_categories(["Hoaxes"], members_per_category=7), page_size=3).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def server(stub):
+    stub.reset_count()
+    return stub
+
+
+@pytest.fixture
+def session():
+    with requests.Session() as http:
+        yield http
+
+
+def test_query_returns_the_response(server, session):
+    data = _query(session, server.url, {"titles": "Hoaxes topic 0"})
+
+    assert data["query"]["pages"] == [{"ns": 0, "title": "Hoaxes topic 0"}]
+
+
+def test_query_raises_api_errors(server, session):
+    with pytest.raises(ConnectionError, match="Only action=query"):
+        _query(session, server.url, {"action": "parse"})
+
+
+def test_query_raises_request_errors(session):
+    stopped = StubWikiServer({}).start()
+    url = stopped.url
+    stopped.stop()
+
+    with pytest.raises(ConnectionError):
+        _query(session, url, {"titles": "Hoaxes topic 0"})
+
+
+def test_category_members_follow_continuation(server, session):
+    members = fetch_category_members(session, server.url, "Hoaxes")
+
+    assert members == [f"Hoaxes topic {i}" for i in range(7)] + ["List of hoaxes topics"]
+    assert server.request_count == 3
+
+
+def test_missing_category_has_no_members(server, session):
+    assert fetch_category_members(session, server.url, "Unknown") is None
+
+
+def test_category_listing_splits_articles_and_subcategories(server, session):
+    listing = fetch_category_listing(session, server.url, "Hoaxes")
+
+    assert listing["articles"] == [f"Hoaxes topic {i}" for i in range(7)] + ["List of hoaxes topics"]
+    assert listing["subcategories"] == ["Hoaxes subtopics"]
+    assert server.request_count == 3
+    assert fetch_category_listing(session, server.url, "Unknown") is None
+
+
+def test_extracts_follow_continuation(server, session):
+    titles = [f"Hoaxes topic {i}" for i in range(7)] + ["Not a page"]
+
+    extracts = fetch_extracts(session, server.url, titles, sentences=2)
+
+    assert server.request_count == 3
+    for title in titles[:-1]:
+        assert extracts[title] == {"exists": True, "title": title, "summary": make_extract(title, 2)}
+    assert extracts["Not a page"] == {"exists": False, "title": "Not a page", "summary": ""}
+
+
+def test_articles_missing_from_the_response_are_skipped():
+    titles = ["Dropped", "Kept 1", "Kept 2"]
+    pages = {
+        title: {"exists": True, "title": title, "summary": make_extract(title, 2)}
+        for title in titles[1:]
+    }
+
+    with mock.patch.object(ArticleWiki, "_article_titles", staticmethod(lambda category: titles)), \
+            mock.patch.object(ArticleWiki, "_get_pages", staticmethod(lambda requested: pages)), \
+            mock.patch.object(ArticleWiki, "warm_titles", {}):
+        articles = ArticleWiki.get_random_articles(CategoryModel("Hoaxes"), 3, sampler=ArticleSampler())
+
+    assert sorted(article.title for article in articles) == ["Kept 1", "Kept 2"]
@@ -0,0 +1,52 @@
+"""Tests of the MinHash/LSH near-duplicate index."""
+
+from src.config.settings import NEAR_DUPLICATE_THRESHOLD
+from src.game.models.article import ArticleModel
+from src.game.utils.near_duplicate import NearDuplicateIndex
+
+SUMMARY = (
+    "The Cottingley Fairies appear in a series of five photographs taken by two young "
+    "cousins living in Cottingley near Bradford in England. The pictures came to the "
+    "attention of the writer Arthur Conan Doyle, who used them to illustrate an article "
+    "on fairies he had been commissioned to write for the Christmas edition of a magazine."
+)
+
+
+def article(title: str, summary: str = SUMMARY) -> ArticleModel:
+    return ArticleModel(title, summary, "Hoaxes", True)
+
+
+def test_reworded_article_is_a_near_duplicate():
+    index = NearDuplicateIndex()
+    original = article("Cottingley Fairies")
+    reworded = article("The Cottingley fairy photographs", SUMMARY.replace("two young", "two"))
+
+    assert NearDuplicateIndex.similarity(
+        NearDuplicateIndex.signature(f"{original.title} {original.summary}"),
+        NearDuplicateIndex.signature(f"{reworded.title} {reworded.summary}"),
+    ) >= NEAR_DUPLICATE_THRESHOLD
+    assert index.add_if_unique(original) is None
+    assert index.add_if_unique(reworded) == "Cottingley Fairies"
+    assert len(index) == 1
+
+
+def test_same_title_is_a_duplicate_whatever_the_summary():
+    index = NearDuplicateIndex()
+    index.add(article("Cottingley Fairies"))
+
+    assert index.find_duplicate(article("cottingley  fairies!", "Something else entirely.")) == "Cottingley Fairies"
+
+
+def test_distinct_articles_pass():
+    index = NearDuplicateIndex()
+    index.add(article("Cottingley Fairies"))
+    distinct = article(
+        "Piltdown Man",
+        "Piltdown Man was a paleoanthropological fraud in which bone fragments were presented "
+        "as the fossilised remains of a previously unknown early human. The fragments consisted "
+        "of parts of a skull and jawbone, said to have been collected in 1912 from a gravel pit "
+        "at Piltdown in East Sussex, England.",
+    )
+
+    assert index.add_if_unique(distinct) is None
+    assert len(index) == 2
@@ -0,0 +1,128 @@
+"""Tests of round assembly under the round deadline."""
+
+import time
+from unittest import mock
+
+import httpx
+import openai
+import pytest
+
+from src.game.benchmarks.stub_wiki_server import StubWikiServer, make_categories
+from src.game.classes import ai_gen
+from src.game.classes.ai_gen import FakeArticlePool, FakeNewsGenerator
+from src.game.classes.round_builder import RoundBuilder
+from src.game.classes.wiki_article import ArticleWiki
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+from src.game.utils import mediawiki
+from src.game.utils.cache import TwoTierCache
+from src.game.utils.circuit_breaker import OPEN, CircuitBreaker
+from src.game.utils.hedging import Hedger
+from src.game.utils.sampler import ArticleSampler
+from src.game.utils.single_flight import SingleFlight
+
+CATEGORY = CategoryModel("Hoaxes")
+
+
+def local_article(category: CategoryModel, is_truth: bool, sampler=None, background=False) -> ArticleModel:
+    return ArticleModel("Local", "A local summary.", category.name, is_truth)
+
+
+@pytest.fixture
+def builder():
+    """A RoundBuilder with fresh hedgers and a local store that always answers."""
+    with mock.patch.object(RoundBuilder, "fake_hedger", Hedger("openai")), \
+            mock.patch.object(RoundBuilder, "wiki_hedger", Hedger("wikipedia")), \
+            mock.patch.object(RoundBuilder, "_get_local_article", staticmethod(local_article)), \
+            mock.patch.object(FakeArticlePool, "_buffers", {}), \
+            mock.patch.object(FakeArticlePool, "offer", staticmethod(lambda category: None)):
+        yield RoundBuilder
+
+
+@pytest.fixture
+def wiki(tmp_path):
+    """ArticleWiki talking to a slow stand-in server, with an empty cache and breaker."""
+    server = StubWikiServer(make_categories([CATEGORY.name]), latency=0.2).start()
+    cache = TwoTierCache(tmp_path / "wiki_cache.sqlite3")
+    with mock.patch.object(ArticleWiki, "api_url", server.url), \
+            mock.patch.object(ArticleWiki, "cache", cache), \
+            mock.patch.object(ArticleWiki, "requests_in_flight", SingleFlight()), \
+            mock.patch.object(ArticleWiki, "breaker", CircuitBreaker("wikipedia", 5, min_calls=1)), \
+            mock.patch.object(ArticleWiki, "warm_titles", {}):
+        yield server
+    server.stop()
+
+
+@pytest.mark.parametrize("latency", [0.2, 0.6], ids=["after the deadline", "after the hedge"])
+def test_late_fake_article_goes_to_the_pool(builder, wait_for, latency):
+    late = ArticleModel("Late", "A generated summary.", CATEGORY.name, False)
+
+    def generate(category: str) -> ArticleModel:
+        time.sleep(latency)
+        return late
+
+    with mock.patch.object(FakeNewsGenerator, "generate", staticmethod(generate)), \
+            mock.patch.object(RoundBuilder, "_fetch_real_articles",
+                              staticmethod(lambda category, deadline, sampler=None: [])):
+        articles = builder.build_round(CATEGORY, deadline_seconds=0.05)
+
+    assert late not in articles
+    assert wait_for(lambda: list(FakeArticlePool._buffers.get(CATEGORY.name, ())) == [late])
+
+
+def test_late_wikipedia_pages_reach_the_cache(builder, wiki, wait_for):
+    with mock.patch.object(FakeNewsGenerator, "generate", staticmethod(lambda category: None)):
+        articles = builder.build_round(CATEGORY, deadline_seconds=0.05, sampler=ArticleSampler())
+
+    assert all(article.title == "Local" for article in articles)
+    cache = ArticleWiki.get_cache()
+
+    def pages_cached() -> bool:
+        members = cache.get("category_members", CATEGORY.name)
+        return members is not None and any(cache.get("page", title) for title in members["members"])
+
+    assert wait_for(pages_cached)
+
+
+def test_round_without_deadline_waits_for_the_providers(builder, wiki):
+    with mock.patch.object(FakeNewsGenerator, "generate", staticmethod(lambda category: None)), \
+            mock.patch.object(RoundBuilder, "wiki_hedger", Hedger("wikipedia", percentile=None)):
+        articles = builder.build_round(CATEGORY, deadline_seconds=None, sampler=ArticleSampler())
+
+    assert sum(article.title != "Local" for article in articles) == 2
+
+
+def test_background_round_prints_nothing(builder, capsys):
+    def fail(category, count, sampler=None):
+        raise ConnectionError("Wikipedia is down")
+
+    with mock.patch.object(FakeNewsGenerator, "generate", staticmethod(lambda category: None)), \
+            mock.patch.object(ArticleWiki, "get_random_articles", staticmethod(fail)), \
+            mock.patch.object(ArticleWiki, "get_random_article", staticmethod(lambda category, sampler=None: fail(category, 1))):
+        background = builder.build_round(CATEGORY, deadline_seconds=None)
+        assert capsys.readouterr().out == ""
+        foreground = builder.build_round(CATEGORY, deadline_seconds=1)
+        assert "Using pre-fetched" in capsys.readouterr().out
+
+    assert len(background) == len(foreground) == 3
+
+
+def test_wikipedia_timeouts_count_as_failures(wiki):
+    with mock.patch.object(mediawiki, "WIKI_API_TIMEOUT", 0.05), pytest.raises(ConnectionError):
+        ArticleWiki._fetch_category_members(CATEGORY.name)
+
+    assert ArticleWiki.breaker.state == OPEN
+
+
+def test_openai_timeouts_count_as_failures():
+    client = mock.Mock()
+    client.chat.completions.create.side_effect = openai.APITimeoutError(
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    )
+    breaker = CircuitBreaker("openai", 20, min_calls=1)
+
+    with mock.patch.object(FakeNewsGenerator, "breaker", breaker), \
+            mock.patch.object(ai_gen.Metrics, "increment"):
+        assert FakeNewsGenerator._generate_from_api(client, CATEGORY.name) is None
+
+    assert breaker.state == OPEN
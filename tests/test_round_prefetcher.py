@@ -0,0 +1,25 @@
+"""Tests of the background round prefetcher."""
+
+import time
+from unittest import mock
+
+from src.game.classes.round_builder import RoundBuilder
+from src.game.classes.round_prefetcher import RoundPrefetcher
+from src.game.models.article import ArticleModel
+from src.game.models.category import CategoryModel
+
+CATEGORY = CategoryModel("Hoaxes")
+
+
+def test_failed_build_does_not_stop_the_prefetcher():
+    round_articles = [ArticleModel("Prefetched", "A summary.", CATEGORY.name, True)]
+    build = mock.Mock(side_effect=[OSError("corpus unreadable"), round_articles, round_articles])
+
+    with mock.patch.object(RoundBuilder, "build_round", build):
+        prefetcher = RoundPrefetcher(CATEGORY).start()
+        try:
+            started = time.monotonic()
+            assert prefetcher.next_round(timeout=10) == round_articles
+            assert time.monotonic() - started < 5
+        finally:
+            prefetcher.cancel()
@@ -0,0 +1,85 @@
+"""Tests of non-repeating article sampling and the persisted seen filter."""
+
+import random
+from unittest import mock
+
+import pytest
+
+from src.game.utils.sampler import ArticleSampler, BloomFilter, ShuffleBag
+
+
+@pytest.fixture
+def seen_dir(tmp_path):
+    with mock.patch.object(ArticleSampler, "seen_dir", tmp_path / "seen"):
+        yield tmp_path / "seen"
+
+
+def test_bag_draws_everything_before_repeating():
+    bag = ShuffleBag(50, random.Random(0))
+
+    for _ in range(3):
+        cycle = [bag.draw() for _ in range(50)]
+        assert sorted(cycle) == list(range(50))
+        assert len(bag) == 0
+
+
+def test_empty_bag_cannot_be_drawn():
+    with pytest.raises(IndexError):
+        ShuffleBag(0).draw()
+
+
+def test_sampler_does_not_repeat_until_the_population_is_used_up():
+    sampler = ArticleSampler()
+    titles = [f"Article {i}" for i in range(12)]
+
+    picked = [
+        title
+        for _ in range(4)
+        for title in sampler.sample("key", len(titles), titles.__getitem__, 3)
+    ]
+
+    assert sorted(picked) == sorted(titles)
+
+
+def test_sampler_skips_articles_seen_in_earlier_games(seen_dir):
+    titles = [f"Article {i}" for i in range(10)]
+    earlier = ArticleSampler.for_player("alice")
+    first = earlier.sample("key", len(titles), titles.__getitem__, 5)
+    earlier.save()
+
+    later = ArticleSampler.for_player("alice")
+    second = later.sample("key", len(titles), titles.__getitem__, 5)
+
+    assert set(first).isdisjoint(second)
+
+
+def test_bloom_filter_round_trips_through_bytes():
+    seen = BloomFilter.for_capacity(100, 0.01)
+    for i in range(50):
+        seen.add(f"Article {i}")
+
+    restored = BloomFilter.from_bytes(seen.to_bytes())
+
+    assert (restored.bit_count, restored.hash_count, restored.count) == (seen.bit_count, seen.hash_count, 50)
+    assert all(f"Article {i}" in restored for i in range(50))
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(seen.to_bytes()[:-1])
+
+
+def test_seen_filter_is_saved_per_player(seen_dir):
+    alice = ArticleSampler.for_player("alice")
+    alice.mark_seen("Cardiff Giant")
+    alice.save()
+
+    assert ArticleSampler.for_player("alice").has_seen("Cardiff Giant")
+    assert not ArticleSampler.for_player("bob").has_seen("Cardiff Giant")
+    assert list(seen_dir.iterdir()) == [ArticleSampler.path_for("alice")]
+
+
+def test_unreadable_seen_filter_starts_empty(seen_dir):
+    seen_dir.mkdir()
+    ArticleSampler.path_for("alice").write_bytes(b"not a filter")
+
+    sampler = ArticleSampler.for_player("alice")
+
+    assert sampler.seen is not None and sampler.seen.count == 0
@@ -0,0 +1,50 @@
+"""Tests of the indexable skip list against a sorted Python list."""
+
+import bisect
+import random
+
+import pytest
+
+from src.game.utils.skip_list import RankedSkipList
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rank_and_select_match_a_sorted_list(seed):
+    generator = random.Random(seed)
+    ranking = RankedSkipList(seed=seed)
+    expected: list[int] = []
+
+    for _ in range(2000):
+        if expected and generator.random() < 0.4:
+            key = generator.choice(expected)
+            ranking.remove(key)
+            expected.remove(key)
+        else:
+            # A small key range, so duplicates are common
+            key = generator.randrange(300)
+            ranking.insert(key)
+            bisect.insort(expected, key)
+
+    assert len(ranking) == len(expected)
+    assert list(ranking) == expected
+    assert [ranking[i] for i in range(len(expected))] == expected
+    assert ranking[-1] == expected[-1]
+    assert ranking.first(10) == expected[:10]
+    for key in range(300):
+        position = bisect.bisect_left(expected, key)
+        present = position < len(expected) and expected[position] == key
+        assert ranking.rank(key) == (position + 1 if present else None)
+
+
+def test_missing_keys_and_positions_raise():
+    ranking = RankedSkipList(seed=0)
+    ranking.insert(1)
+
+    with pytest.raises(KeyError):
+        ranking.remove(2)
+    with pytest.raises(IndexError):
+        ranking[1]
+    ranking.remove(1)
+    with pytest.raises(IndexError):
+        ranking[0]
+    assert ranking.first(3) == []